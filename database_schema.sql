@@ -41,6 +41,7 @@ CREATE TABLE IF NOT EXISTS `Users` (
   `updatedAt` DATETIME(3) NOT NULL DEFAULT CURRENT_TIMESTAMP(3) ON UPDATE CURRENT_TIMESTAMP(3),
   PRIMARY KEY (`id`),
   INDEX `Users_idAngkatan_fkey` (`idAngkatan`),
+  INDEX `Users_nomorWa_idx` (`nomorWa`),
   CONSTRAINT `Users_idAngkatan_fkey` FOREIGN KEY (`idAngkatan`) REFERENCES `Angkatan` (`id`) ON DELETE SET NULL ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
@@ -64,6 +65,8 @@ CREATE TABLE IF NOT EXISTS `Communal` (
   INDEX `idx_communal_waktuMulai` (`waktuMulai`),
   INDEX `idx_communal_waktuBerakhir` (`waktuBerakhir`),
   INDEX `idx_communal_waktuMulai_waktuBerakhir` (`waktuMulai`, `waktuBerakhir`),
+  INDEX `idx_communal_lantai_waktuMulai` (`lantai`, `waktuMulai`),
+  INDEX `idx_communal_isDone_waktuBerakhir` (`isDone`, `waktuBerakhir`),
   INDEX `Communal_idPenanggungJawab_fkey` (`idPenanggungJawab`),
   CONSTRAINT `Communal_idPenanggungJawab_fkey` FOREIGN KEY (`idPenanggungJawab`) REFERENCES `Users` (`id`) ON DELETE RESTRICT ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -93,6 +96,8 @@ CREATE TABLE IF NOT EXISTS `Serbaguna` (
   INDEX `idx_serbaguna_waktuMulai` (`waktuMulai`),
   INDEX `idx_serbaguna_waktuBerakhir` (`waktuBerakhir`),
   INDEX `idx_serbaguna_waktuMulai_waktuBerakhir` (`waktuMulai`, `waktuBerakhir`),
+  INDEX `idx_serbaguna_idArea_waktuMulai` (`idArea`, `waktuMulai`),
+  INDEX `idx_serbaguna_isDone_waktuBerakhir` (`isDone`, `waktuBerakhir`),
   INDEX `Serbaguna_idArea_fkey` (`idArea`),
   INDEX `Serbaguna_idPenanggungJawab_fkey` (`idPenanggungJawab`),
   CONSTRAINT `Serbaguna_idArea_fkey` FOREIGN KEY (`idArea`) REFERENCES `AreaSerbaguna` (`id`) ON DELETE RESTRICT ON UPDATE CASCADE,
@@ -114,6 +119,7 @@ CREATE TABLE IF NOT EXISTS `Theater` (
   INDEX `idx_theater_waktuMulai` (`waktuMulai`),
   INDEX `idx_theater_waktuBerakhir` (`waktuBerakhir`),
   INDEX `idx_theater_waktuMulai_waktuBerakhir` (`waktuMulai`, `waktuBerakhir`),
+  INDEX `idx_theater_isDone_waktuBerakhir` (`isDone`, `waktuBerakhir`),
   INDEX `Theater_idPenanggungJawab_fkey` (`idPenanggungJawab`),
   CONSTRAINT `Theater_idPenanggungJawab_fkey` FOREIGN KEY (`idPenanggungJawab`) REFERENCES `Users` (`id`) ON DELETE RESTRICT ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -134,6 +140,7 @@ CREATE TABLE IF NOT EXISTS `CWS` (
   INDEX `idx_cws_waktuMulai` (`waktuMulai`),
   INDEX `idx_cws_waktuBerakhir` (`waktuBerakhir`),
   INDEX `idx_cws_waktuMulai_waktuBerakhir` (`waktuMulai`, `waktuBerakhir`),
+  INDEX `idx_cws_isDone_waktuBerakhir` (`isDone`, `waktuBerakhir`),
   INDEX `CWS_idPenanggungJawab_fkey` (`idPenanggungJawab`),
   CONSTRAINT `CWS_idPenanggungJawab_fkey` FOREIGN KEY (`idPenanggungJawab`) REFERENCES `Users` (`id`) ON DELETE RESTRICT ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -165,6 +172,7 @@ CREATE TABLE IF NOT EXISTS `Dapur` (
   INDEX `idx_dapur_waktuMulai` (`waktuMulai`),
   INDEX `idx_dapur_waktuBerakhir` (`waktuBerakhir`),
   INDEX `idx_dapur_waktuMulai_waktuBerakhir` (`waktuMulai`, `waktuBerakhir`),
+  INDEX `idx_dapur_idFasilitas_waktuMulai` (`idFasilitas`, `waktuMulai`),
   INDEX `Dapur_idFasilitas_fkey` (`idFasilitas`),
   INDEX `Dapur_idPeminjam_fkey` (`idPeminjam`),
   CONSTRAINT `Dapur_idFasilitas_fkey` FOREIGN KEY (`idFasilitas`) REFERENCES `FasilitasDapur` (`id`) ON DELETE RESTRICT ON UPDATE CASCADE,
@@ -197,6 +205,7 @@ CREATE TABLE IF NOT EXISTS `MesinCuciCewe` (
   INDEX `idx_mesin_cuci_cewe_waktuMulai` (`waktuMulai`),
   INDEX `idx_mesin_cuci_cewe_waktuBerakhir` (`waktuBerakhir`),
   INDEX `idx_mesin_cuci_cewe_waktuMulai_waktuBerakhir` (`waktuMulai`, `waktuBerakhir`),
+  INDEX `idx_mesin_cuci_cewe_idFasilitas_waktuMulai` (`idFasilitas`, `waktuMulai`),
   INDEX `MesinCuciCewe_idFasilitas_fkey` (`idFasilitas`),
   INDEX `MesinCuciCewe_idPeminjam_fkey` (`idPeminjam`),
   CONSTRAINT `MesinCuciCewe_idFasilitas_fkey` FOREIGN KEY (`idFasilitas`) REFERENCES `FasilitasMcCewe` (`id`) ON DELETE RESTRICT ON UPDATE CASCADE,
@@ -225,6 +234,7 @@ CREATE TABLE IF NOT EXISTS `MesinCuciCowo` (
   INDEX `idx_mesin_cuci_cowo_waktuMulai` (`waktuMulai`),
   INDEX `idx_mesin_cuci_cowo_waktuBerakhir` (`waktuBerakhir`),
   INDEX `idx_mesin_cuci_cowo_waktuMulai_waktuBerakhir` (`waktuMulai`, `waktuBerakhir`),
+  INDEX `idx_mesin_cuci_cowo_idFasilitas_waktuMulai` (`idFasilitas`, `waktuMulai`),
   INDEX `MesinCuciCowo_idFasilitas_fkey` (`idFasilitas`),
   INDEX `MesinCuciCowo_idPeminjam_fkey` (`idPeminjam`),
   CONSTRAINT `MesinCuciCowo_idFasilitas_fkey` FOREIGN KEY (`idFasilitas`) REFERENCES `FasilitasMcCowo` (`id`) ON DELETE RESTRICT ON UPDATE CASCADE,
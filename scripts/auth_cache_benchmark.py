@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from latency_stats import LatencyHistogram
+from measure_response_times import BASE_URL, DATE_SAMPLE, LOAD_USERS, login, measure, run_load
+from phase_timing import timed_session
+from query_stats import route_lookup
+from server_metrics import Samples, route_latency, scrape
+
+OUTPUT_PATH = Path(os.environ.get("KAIZEN_AUTH_CACHE_PATH", "screenshots/auth_cache_results.json"))
+DURATION_S = float(os.environ.get("KAIZEN_AUTH_CACHE_DURATION", "10"))
+ROUNDS = int(os.environ.get("KAIZEN_AUTH_CACHE_ROUNDS", "4"))
+# Tokens logged out by the revocation check; 0 skips it. Past AUTH_REVOKED_MAX_ENTRIES
+# on the server, this checks that a full revocation set still refuses every one of them.
+REVOKE_TOKENS = int(os.environ.get("KAIZEN_AUTH_REVOKE_TOKENS", "0"))
+# A cached slot grid: what polling clients hit, and cheap enough that auth is a visible share.
+PATH = os.environ.get("KAIZEN_AUTH_CACHE_TARGET", f"/api/v1/theater/time-slots?date={DATE_SAMPLE}")
+AUTH_CACHE_COUNTER = "kaizen_auth_token_cache_total"
+# X-Auth-Cache: bypass makes the API run jwt.verify as if the cache were off.
+MODES = {"cache": {}, "no-cache": {"X-Auth-Cache": "bypass"}}
+
+
+def auth_counts(before: Samples, after: Samples) -> Dict[str, int]:
+    counts = {}
+    for result in ("hit", "miss", "bypass"):
+        key = (AUTH_CACHE_COUNTER, (("result", result),))
+        counts[result] = int(after.get(key, 0.0) - before.get(key, 0.0))
+    return counts
+
+
+def run_mode(mode: str, users: int, duration_s: float) -> Dict[str, Any]:
+    """One load run with or without the bypass header; the target's row plus server numbers."""
+    session = timed_session()
+    before = scrape(session, BASE_URL)
+    target = {"method": "GET", "path": PATH, "name": mode, "headers": MODES[mode]}
+    report = run_load([target], users=users, duration_s=duration_s)
+    row = next(entry for entry in report["endpoints"] if entry["name"] == mode)
+    row["elapsed_s"] = report["elapsed_s"]
+    after = scrape(session, BASE_URL) if before is not None else None
+    if before is not None and after is not None:
+        routes = route_latency(before, after)
+        route = route_lookup(routes)("GET", PATH)
+        row["server"] = routes.get(route) if route else None
+        row["auth_cache"] = auth_counts(before, after)
+    return row
+
+
+def distinct_tokens(session: Any, count: int) -> List[str]:
+    """Log in until `count` different tokens are in hand; a JWT repeats within one second."""
+    tokens: List[str] = []
+    while len(tokens) < count:
+        result, token = login(session)
+        if token is None:
+            raise RuntimeError(f"Login failed: {result.get('message') or result.get('error')}")
+        if token in tokens:
+            time.sleep(0.25)
+            continue
+        tokens.append(token)
+    return tokens
+
+
+def revocation_check(count: int) -> Dict[str, Any]:
+    """Cache `count` tokens, log each out, then count the ones the target still accepts."""
+    session = timed_session()
+    tokens = distinct_tokens(session, count)
+    for token in tokens:
+        # A verified, cached token is the one a dropped revocation would let back in.
+        measure(session, "GET", PATH, "warm", token=token)
+        result, _ = measure(session, "POST", "/api/v1/auth/logout", "logout", token=token)
+        if result["status_code"] != 200:
+            raise RuntimeError(f"Logout failed with status {result['status_code']}")
+    accepted = []
+    # Oldest first: those are the revocations a full set would have evicted.
+    for index, token in enumerate(tokens):
+        result, _ = measure(session, "GET", PATH, "revoked", token=token)
+        if result["status_code"] != 401:
+            accepted.append({"index": index, "status_code": result["status_code"]})
+    return {"tokens": count, "accepted_after_logout": accepted}
+
+
+def combine(mode: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    histogram = LatencyHistogram()
+    for row in rows:
+        histogram.merge(LatencyHistogram.from_dict(row["histogram"]))
+    requests_made = sum(row["requests"] for row in rows)
+    elapsed_s = sum(row["elapsed_s"] for row in rows)
+    combined: Dict[str, Any] = {
+        "mode": mode,
+        "requests": requests_made,
+        "errors": sum(row["errors"] for row in rows),
+        "throughput_rps": round(requests_made / elapsed_s, 2) if elapsed_s else 0.0,
+        "per_round_rps": [row["throughput_rps"] for row in rows],
+        "stats": histogram.summary(),
+    }
+    servers = [row["server"] for row in rows if row.get("server")]
+    if servers:
+        # Request-weighted mean of each round's server-side mean.
+        count = sum(server["requests"] for server in servers)
+        combined["server_mean_ms"] = round(
+            sum(server["mean_ms"] * server["requests"] for server in servers) / count, 3
+        )
+    counts = [row["auth_cache"] for row in rows if row.get("auth_cache")]
+    if counts:
+        combined["auth_cache"] = {
+            result: sum(count[result] for count in counts) for result in counts[0]
+        }
+    return combined
+
+
+def print_modes(report: Dict[str, Any]) -> None:
+    print(
+        f"{'MODE':<9} {'REQUESTS':>9} {'ERR':>5} {'RPS':>9} {'P50 ms':>8} {'P99 ms':>8}"
+        f" {'SRV MEAN ms':>12}  AUTH CACHE"
+    )
+    for row in report["modes"].values():
+        stats = row["stats"]
+        counts = row.get("auth_cache")
+        print(
+            f"{row['mode']:<9} {row['requests']:>9} {row['errors']:>5}"
+            f" {row['throughput_rps']:>9.1f} {stats['p50_ms'] or 0:>8.2f}"
+            f" {stats['p99_ms'] or 0:>8.2f} {row.get('server_mean_ms', 0):>12.3f}"
+            f"  {' '.join(f'{key}={value}' for key, value in counts.items()) if counts else '-'}"
+        )
+    cached, bypassed = report["modes"]["cache"], report["modes"]["no-cache"]
+    if bypassed["throughput_rps"]:
+        print(
+            f"Throughput with the cache: {cached['throughput_rps'] / bypassed['throughput_rps']:.2f}x"
+            f" ({report['rounds']} rounds of {report['duration_s']:.0f}s per mode,"
+            f" {report['users']} users)"
+        )
+    if "auth_cache" in cached and cached["auth_cache"]["hit"] == 0:
+        print("  no cache hits: is the API running with AUTH_CACHE=false?")
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    if report["rounds"]:
+        print_modes(report)
+    revocation = report.get("revocation")
+    if revocation:
+        accepted = revocation["accepted_after_logout"]
+        first = f" (oldest: #{accepted[0]['index']})" if accepted else ""
+        print(
+            f"Revocation: {len(accepted)} of {revocation['tokens']} logged-out tokens"
+            f" still accepted{first}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Load one authenticated endpoint with the verified-token cache and with "
+            "X-Auth-Cache: bypass, in alternating rounds, and compare throughput."
+        )
+    )
+    parser.add_argument("--users", type=int, default=LOAD_USERS, help="concurrent virtual users")
+    parser.add_argument(
+        "--duration", type=float, default=DURATION_S, help="seconds per mode per round"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=ROUNDS, help="rounds of both modes; even counts balance order"
+    )
+    parser.add_argument(
+        "--revoke-tokens",
+        type=int,
+        default=REVOKE_TOKENS,
+        help=(
+            "log out this many tokens and check each is refused afterwards; start the API"
+            " with AUTH_REVOKED_MAX_ENTRIES below it to fill the revocation set"
+        ),
+    )
+    args = parser.parse_args()
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+    if args.duration <= 0:
+        parser.error("--duration must be positive")
+    if args.rounds < 0:
+        parser.error("--rounds must not be negative")
+    if args.revoke_tokens < 0:
+        parser.error("--revoke-tokens must not be negative")
+    if args.rounds == 0 and args.revoke_tokens == 0:
+        parser.error("--rounds 0 needs --revoke-tokens")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    rows: Dict[str, List[Dict[str, Any]]] = {mode: [] for mode in MODES}
+    # Modes take turns, first one then the other leading, so drift on the server and
+    # whatever the first run of a round pays (connections, logins) hits both alike.
+    for round_index in range(args.rounds):
+        order = list(MODES) if round_index % 2 == 0 else list(MODES)[::-1]
+        for mode in order:
+            row = run_mode(mode, args.users, args.duration)
+            rows[mode].append(row)
+            print(
+                f"round {round_index + 1} {mode:<9} {row['throughput_rps']:>9.1f} req/s"
+                f" ({row['errors']} errors)"
+            )
+
+    report: Dict[str, Any] = {
+        "mode": "auth-cache",
+        "base_url": BASE_URL,
+        "path": PATH,
+        "users": args.users,
+        "duration_s": args.duration,
+        "rounds": args.rounds,
+        "modes": {mode: combine(mode, mode_rows) for mode, mode_rows in rows.items()},
+    }
+    if args.revoke_tokens:
+        report["revocation"] = revocation_check(args.revoke_tokens)
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print_report(report)
+    print(f"Saved auth cache benchmark to {OUTPUT_PATH}")
+    if report.get("revocation", {}).get("accepted_after_logout"):
+        return 1
+    return 1 if any(row["errors"] for row in report["modes"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import kaizen_db
+from measure_response_times import (
+    BASE_URL,
+    flush_cache,
+    is_error,
+    login,
+    measure,
+    measure_repeated,
+)
+from phase_timing import timed_session
+
+OUTPUT_PATH = Path(
+    os.environ.get("KAIZEN_AVAILABILITY_PATH", "screenshots/availability_results.json")
+)
+SAMPLES = int(os.environ.get("KAIZEN_AVAILABILITY_SAMPLES", "30"))
+WARMUP = int(os.environ.get("KAIZEN_AVAILABILITY_WARMUP", "3"))
+FLOORS = int(os.environ.get("KAIZEN_AVAILABILITY_FLOORS", "10"))
+
+# Availability endpoint, booking table and the column that splits a module into
+# independently bookable units (floor, area, machine). `groups` lists those units.
+MODULES: Dict[str, Dict[str, Any]] = {
+    "communal": {
+        "table": "Communal",
+        "path": "/api/v1/communal/available-slots/{date}/{group}",
+        "group": "lantai",
+        "owner": "idPenanggungJawab",
+        "extra": {"jumlahPengguna": 1},
+    },
+    "serbaguna": {
+        "table": "Serbaguna",
+        "path": "/api/v1/serbaguna/available-slots/{date}/{group}",
+        "group": "idArea",
+        "groups": "AreaSerbaguna",
+        "owner": "idPenanggungJawab",
+        "extra": {"jumlahPengguna": 1},
+    },
+    "theater": {
+        "table": "Theater",
+        "path": "/api/v1/theater/time-slots?date={date}",
+        "owner": "idPenanggungJawab",
+        "extra": {"jumlahPengguna": 1},
+    },
+    "cws": {
+        "table": "CWS",
+        "path": "/api/v1/cws/time-slots?date={date}",
+        "owner": "idPenanggungJawab",
+        "extra": {"jumlahPengguna": 1},
+    },
+    "dapur": {
+        "table": "Dapur",
+        "path": "/api/v1/dapur/time-slots?date={date}&facilityId={group}",
+        "group": "idFasilitas",
+        "groups": "FasilitasDapur",
+        "owner": "idPeminjam",
+        "extra": {},
+    },
+    "mesin-cuci-cewe": {
+        "table": "MesinCuciCewe",
+        "path": "/api/v1/mesin-cuci-cewe/time-slots?date={date}&facilityId={group}",
+        "group": "idFasilitas",
+        "groups": "FasilitasMcCewe",
+        "owner": "idPeminjam",
+        "extra": {},
+    },
+    "mesin-cuci-cowo": {
+        "table": "MesinCuciCowo",
+        "path": "/api/v1/mesin-cuci-cowo/time-slots?date={date}&facilityId={group}",
+        "group": "idFasilitas",
+        "groups": "FasilitasMcCowo",
+        "owner": "idPeminjam",
+        "extra": {},
+    },
+}
+
+
+def parse_iso(value: str) -> datetime:
+    """API timestamp -> naive UTC datetime, as Prisma stores DATETIME columns."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).replace(tzinfo=None)
+
+
+def groups_of(conn: Any, name: str, floors: int) -> List[Optional[int]]:
+    module = MODULES[name]
+    if "group" not in module:
+        return [None]
+    if "groups" not in module:
+        return list(range(1, floors + 1))
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT id FROM `{module['groups']}` ORDER BY id")
+        return [row[0] for row in cursor.fetchall()]
+
+
+def endpoint(name: str, day: date, group: Optional[int]) -> str:
+    return MODULES[name]["path"].format(date=day.isoformat(), group=group or "")
+
+
+def slot_times(session: Any, token: str, path: str) -> List[Tuple[datetime, datetime]]:
+    """The day's slots as the API computes them, so seeded bookings line up exactly."""
+    result, body = measure(session=session, method="GET", path=path, name=path, token=token)
+    if is_error(result) or not isinstance(body, dict):
+        raise RuntimeError(f"GET {path} failed: {result.get('message') or result.get('error')}")
+    return [
+        (parse_iso(slot["waktuMulai"]), parse_iso(slot["waktuBerakhir"])) for slot in body["data"]
+    ]
+
+
+def bookings_between(conn: Any, table: str, start: datetime, end: datetime) -> int:
+    return kaizen_db.scalar(
+        conn,
+        f"SELECT COUNT(*) FROM `{table}` WHERE waktuMulai >= %s AND waktuMulai < %s",
+        (start, end),
+    )
+
+
+def seed_dense_day(
+    conn: Any,
+    name: str,
+    slots: Sequence[Tuple[datetime, datetime]],
+    groups: Sequence[Optional[int]],
+    owner_id: int,
+) -> int:
+    """Book every slot of the day on every floor/area/machine."""
+    module = MODULES[name]
+    columns = [module["owner"], "waktuMulai", "waktuBerakhir", *module["extra"]]
+    if "group" in module:
+        columns.append(module["group"])
+    rows = []
+    for group in groups:
+        for start, end in slots:
+            row = [owner_id, start, end, *module["extra"].values()]
+            if "group" in module:
+                row.append(group)
+            rows.append(row)
+    return kaizen_db.insert_many(conn, module["table"], columns, rows)
+
+
+def run_case(
+    session: Any, token: str, name: str, path: str, case: str, samples: int, warmup: int
+) -> Dict[str, Any]:
+    # Flush before every sample so each one pays for the booking lookup rather than reading
+    # the cached grid. This also drops grids cached before seeding, which went straight to the
+    # database past the API's invalidation.
+    result, body = measure_repeated(
+        session,
+        samples=samples,
+        warmup=warmup,
+        before_sample=lambda _: flush_cache(session, token),
+        method="GET",
+        path=path,
+        name=f"{name} {case}",
+        token=token,
+    )
+    slots = body.get("data") if isinstance(body, dict) else None
+    return {
+        "case": case,
+        "path": path,
+        "errors": result["errors"],
+        "slots": len(slots) if isinstance(slots, list) else None,
+        "available": (
+            sum(bool(slot.get("available")) for slot in slots) if isinstance(slots, list) else None
+        ),
+        "stats": result["stats"],
+        "server_timing": result["server_timing"],
+    }
+
+
+def run_module(
+    conn: Any,
+    session: Any,
+    token: str,
+    name: str,
+    *,
+    day: date,
+    owner_id: int,
+    floors: int,
+    samples: int,
+    warmup: int,
+    keep: bool,
+) -> Dict[str, Any]:
+    module = MODULES[name]
+    groups = groups_of(conn, name, floors)
+    if not groups:
+        return {"name": name, "skipped": f"no rows in {module['groups']} to book"}
+    empty_day = day - timedelta(days=1)
+    probe = groups[0]
+    slots = slot_times(session, token, endpoint(name, day, probe))
+    window = (slots[0][0], slots[-1][1])
+    existing = bookings_between(conn, module["table"], *window)
+    if existing:
+        return {"name": name, "skipped": f"{existing} booking(s) already on {day}; pick --date"}
+
+    row: Dict[str, Any] = {"name": name, "groups": len(groups), "slots_per_day": len(slots)}
+    # Whatever is already booked the day before is the baseline the dense day is compared to.
+    row["baseline_bookings"] = bookings_between(
+        conn, module["table"], window[0] - timedelta(days=1), window[1] - timedelta(days=1)
+    )
+    row["cases"] = [
+        run_case(session, token, name, endpoint(name, empty_day, probe), "empty", samples, warmup)
+    ]
+    row["seeded"] = seed_dense_day(conn, name, slots, groups, owner_id)
+    try:
+        dense = run_case(session, token, name, endpoint(name, day, probe), "dense", samples, warmup)
+        row["cases"].append(dense)
+        # Every slot of a fully booked day must come back unavailable.
+        row["wrong_slots"] = dense["available"]
+    finally:
+        if not keep:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    f"DELETE FROM `{module['table']}` WHERE waktuMulai >= %s AND waktuMulai < %s",
+                    window,
+                )
+            flush_cache(session, token)
+    return row
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'MODULE':<16} {'CASE':<6} {'ROWS':>6} {'FREE':>5} {'P50 ms':>9} {'P99 ms':>9}"
+        f" {'DB ms':>8}"
+    )
+    for row in report["modules"]:
+        if "skipped" in row:
+            print(f"{row['name']:<16} skipped: {row['skipped']}")
+            continue
+        for case in row["cases"]:
+            stats = case["stats"]
+            db = (case["server_timing"].get("db") or {}).get("dur")
+            print(
+                f"{row['name']:<16} {case['case']:<6}"
+                f" {row['seeded'] if case['case'] == 'dense' else row['baseline_bookings']:>6}"
+                f" {case['available'] if case['available'] is not None else '-':>5}"
+                f" {stats['p50_ms'] or 0:>9.2f} {stats['p99_ms'] or 0:>9.2f}"
+                f" {db if db is not None else '-':>8}"
+            )
+        if row.get("wrong_slots"):
+            print(f"  {row['wrong_slots']} slot(s) reported free on a fully booked day")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time the /time-slots and /available-slots endpoints on an empty day and on a "
+            "day where every slot of every floor, area and machine is booked."
+        )
+    )
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        choices=sorted(MODULES),
+        default=list(MODULES),
+        help="facility modules to benchmark",
+    )
+    parser.add_argument(
+        "--date",
+        type=date.fromisoformat,
+        default=None,
+        help="day to fill (default: 200 days from today, clear of real bookings)",
+    )
+    parser.add_argument(
+        "--floors", type=int, default=FLOORS, help="communal floors booked on the dense day"
+    )
+    parser.add_argument("--samples", type=int, default=SAMPLES, help="timed requests per case")
+    parser.add_argument("--warmup", type=int, default=WARMUP, help="untimed requests per case")
+    parser.add_argument("--keep", action="store_true", help="leave the seeded bookings in place")
+    args = parser.parse_args()
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+    if args.date is None:
+        args.date = date.today() + timedelta(days=200)
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        conn = kaizen_db.connect()
+    except (RuntimeError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    session = timed_session()
+    _, token = login(session)
+    if not token:
+        print("Login failed; cannot continue", file=sys.stderr)
+        return 1
+    if not flush_cache(session, token):
+        print("Flushing the API cache needs an admin login", file=sys.stderr)
+        return 1
+    owner_id = kaizen_db.scalar(conn, "SELECT id FROM `Users` ORDER BY id LIMIT 1")
+    if owner_id is None:
+        print("No users in the database to own the seeded bookings", file=sys.stderr)
+        return 1
+
+    rows = []
+    try:
+        for name in args.modules:
+            rows.append(
+                run_module(
+                    conn,
+                    session,
+                    token,
+                    name,
+                    day=args.date,
+                    owner_id=owner_id,
+                    floors=args.floors,
+                    samples=args.samples,
+                    warmup=args.warmup,
+                    keep=args.keep,
+                )
+            )
+    finally:
+        conn.close()
+
+    report = {
+        "mode": "availability",
+        "base_url": BASE_URL,
+        "date": args.date.isoformat(),
+        "samples": args.samples,
+        "warmup": args.warmup,
+        "modules": rows,
+    }
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print_report(report)
+    print(f"Saved availability benchmark to {OUTPUT_PATH}")
+    return 1 if any(row.get("wrong_slots") for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from latency_stats import LatencyHistogram
+from measure_response_times import BASE_URL, DATE_SAMPLE, flush_cache, is_error, login, measure
+from phase_timing import timed_session
+
+OUTPUT_PATH = Path(
+    os.environ.get("KAIZEN_BATCH_AVAILABILITY_PATH", "screenshots/batch_availability_results.json")
+)
+SAMPLES = int(os.environ.get("KAIZEN_BATCH_AVAILABILITY_SAMPLES", "30"))
+WARMUP = int(os.environ.get("KAIZEN_BATCH_AVAILABILITY_WARMUP", "3"))
+# What a day view shows: one floor, one area and every other facility in full.
+FACILITIES = os.environ.get(
+    "KAIZEN_BATCH_AVAILABILITY_FACILITIES",
+    "communal:1,serbaguna:1,theater,cws,dapur,mesin-cuci-cewe,mesin-cuci-cowo",
+)
+BATCH_PATH = "/api/v1/availability"
+# Browsers open at most six connections per host, so a page's fan-out can't go wider.
+BROWSER_CONNECTIONS = 6
+
+Entry = Tuple[str, Optional[str]]
+
+
+def parse_facilities(value: str) -> List[Entry]:
+    entries = []
+    for item in value.split(","):
+        name, _, unit = item.strip().partition(":")
+        entries.append((name, unit or None))
+    return entries
+
+
+def single_request(day: str, entry: Entry) -> Tuple[str, Dict[str, Any]]:
+    """The per-module endpoint a client calls today for one facility."""
+    name, unit = entry
+    if name in ("communal", "serbaguna"):
+        return f"/api/v1/{name}/available-slots/{day}/{unit}", {}
+    params = {"date": day}
+    if unit:
+        params["facilityId"] = unit
+    return f"/api/v1/{name}/time-slots", params
+
+
+def entry_label(entry: Entry) -> str:
+    name, unit = entry
+    return f"{name}:{unit}" if unit else name
+
+
+def run_fanout(
+    session: Callable[[], requests.Session],
+    token: str,
+    day: str,
+    entries: List[Entry],
+    pool: Optional[ThreadPoolExecutor],
+) -> Tuple[float, Dict[str, Any]]:
+    """One request per facility, one after another or over the pool; wall time and payloads."""
+
+    def fetch(index: int) -> Tuple[Dict[str, Any], Any]:
+        path, params = single_request(day, entries[index])
+        return measure(
+            session=session(),
+            method="GET",
+            path=path,
+            name=entry_label(entries[index]),
+            token=token,
+            params=params,
+        )
+
+    started = time.perf_counter()
+    if pool is None:
+        responses = [fetch(index) for index in range(len(entries))]
+    else:
+        responses = list(pool.map(fetch, range(len(entries))))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    slots: Dict[str, Any] = {}
+    for entry, (result, body) in zip(entries, responses):
+        if is_error(result) or not isinstance(body, dict):
+            raise RuntimeError(
+                f"{result['path']} failed: {result.get('message') or result.get('error')}"
+            )
+        slots[entry_label(entry)] = body["data"]
+    return elapsed_ms, slots
+
+
+def run_batch(
+    session: requests.Session, token: str, day: str, entries: List[Entry]
+) -> Tuple[float, Dict[str, Any]]:
+    result, body = measure(
+        session=session,
+        method="GET",
+        path=BATCH_PATH,
+        name="availability batch",
+        token=token,
+        params={"date": day, "facilities": ",".join(entry_label(entry) for entry in entries)},
+    )
+    if is_error(result) or not isinstance(body, dict):
+        raise RuntimeError(f"{BATCH_PATH} failed: {result.get('message') or result.get('error')}")
+    slots = {
+        entry_label((item["facility"], item["unit"])): item["slots"]
+        for item in body["data"]["facilities"]
+    }
+    return result["elapsed_ms"], slots
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    batch_p50 = report["modes"]["batch"]["stats"]["p50_ms"]
+    print(
+        f"{'MODE':<18} {'REQ/VIEW':>8} {'P50 ms':>8} {'P90 ms':>8} {'P99 ms':>8}"
+        f" {'MAX ms':>8} {'VS BATCH':>9}"
+    )
+    for mode, row in report["modes"].items():
+        stats = row["stats"]
+        ratio = stats["p50_ms"] / batch_p50 if batch_p50 and stats["p50_ms"] else None
+        print(
+            f"{mode:<18} {row['requests_per_view']:>8} {stats['p50_ms'] or 0:>8.2f}"
+            f" {stats['p90_ms'] or 0:>8.2f} {stats['p99_ms'] or 0:>8.2f}"
+            f" {stats['max_ms'] or 0:>8.2f} {f'{ratio:.2f}x' if ratio else '-':>9}"
+        )
+    print(
+        f"({'cold' if report['cold_cache'] else 'warm'} cache, {report['samples']} views per mode)"
+    )
+    for mismatch in report["mismatches"]:
+        print(f"  batch differs from the single endpoint for {mismatch}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time a day view's slot grids fetched one endpoint per facility (in series and "
+            f"over {BROWSER_CONNECTIONS} connections) against one {BATCH_PATH} request."
+        )
+    )
+    parser.add_argument("--date", default=DATE_SAMPLE, help="day to look up (YYYY-MM-DD)")
+    parser.add_argument(
+        "--facilities",
+        default=FACILITIES,
+        help="facility[:unit] list as the batch endpoint takes it",
+    )
+    parser.add_argument("--samples", type=int, default=SAMPLES, help="timed views per mode")
+    parser.add_argument("--warmup", type=int, default=WARMUP, help="untimed views per mode")
+    parser.add_argument(
+        "--warm",
+        action="store_true",
+        help="keep the API's slot cache between views instead of flushing it before each one "
+        "(flushing needs an admin login)",
+    )
+    args = parser.parse_args()
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup must not be negative")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    entries = parse_facilities(args.facilities)
+    session = timed_session()
+    _, token = login(session)
+    if not token:
+        print("Login failed; cannot continue", file=sys.stderr)
+        return 1
+    if not args.warm and not flush_cache(session, token):
+        print("Flushing the cache needs an admin login; use --warm otherwise", file=sys.stderr)
+        return 1
+
+    local = threading.local()
+
+    def thread_session() -> requests.Session:
+        # One keep-alive connection per worker, like a browser's per-host pool.
+        if not hasattr(local, "session"):
+            local.session = timed_session()
+        return local.session
+
+    pool = ThreadPoolExecutor(max_workers=min(len(entries), BROWSER_CONNECTIONS))
+    modes: Dict[str, Tuple[int, Callable[[], Tuple[float, Dict[str, Any]]]]] = {
+        "fanout-sequential": (
+            len(entries),
+            lambda: run_fanout(thread_session, token, args.date, entries, None),
+        ),
+        "fanout-parallel": (
+            len(entries),
+            lambda: run_fanout(thread_session, token, args.date, entries, pool),
+        ),
+        "batch": (1, lambda: run_batch(session, token, args.date, entries)),
+    }
+    histograms = {mode: LatencyHistogram() for mode in modes}
+    payloads: Dict[str, Dict[str, Any]] = {}
+    try:
+        # Modes take turns within each round, so drift on the server hits them all alike.
+        for round_index in range(args.warmup + args.samples):
+            for mode, (_, run) in modes.items():
+                if not args.warm:
+                    flush_cache(session, token)
+                elapsed_ms, slots = run()
+                if round_index >= args.warmup:
+                    histograms[mode].record(elapsed_ms)
+                payloads[mode] = slots
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    finally:
+        pool.shutdown()
+
+    report: Dict[str, Any] = {
+        "mode": "batch-availability",
+        "base_url": BASE_URL,
+        "date": args.date,
+        "facilities": [entry_label(entry) for entry in entries],
+        "cold_cache": not args.warm,
+        "samples": args.samples,
+        "modes": {
+            mode: {"requests_per_view": requests_per_view, "stats": histograms[mode].summary()}
+            for mode, (requests_per_view, _) in modes.items()
+        },
+        # The batch must return exactly what each facility's own endpoint does.
+        "mismatches": [
+            label
+            for label, slots in payloads["fanout-sequential"].items()
+            if payloads["batch"].get(label) != slots
+        ],
+    }
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print_report(report)
+    print(f"Saved batch availability benchmark to {OUTPUT_PATH}")
+    return 1 if report["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
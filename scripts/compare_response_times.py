@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+import argparse
+import math
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from latency_stats import LatencyHistogram
+from results_history import HISTORY_PATH, load_runs
+
+ALPHA = float(os.environ.get("KAIZEN_REGRESSION_ALPHA", "0.01"))
+MIN_RATIO = float(os.environ.get("KAIZEN_REGRESSION_MIN_RATIO", "1.10"))
+MIN_DELTA_MS = float(os.environ.get("KAIZEN_REGRESSION_MIN_DELTA_MS", "2.0"))
+MIN_SAMPLES = int(os.environ.get("KAIZEN_REGRESSION_MIN_SAMPLES", "5"))
+# Run metadata (build_run) that changes latency on its own: different data, or more
+# parallel requests contending for the server, reads as a regression of every endpoint.
+RUN_SETTINGS = ("dataset", "scenario", "samples", "warmup", "parallel")
+
+
+def mann_whitney_greater(
+    baseline: LatencyHistogram, candidate: LatencyHistogram
+) -> float:
+    """One-sided Mann-Whitney U p-value for "candidate is slower than baseline".
+
+    Works on histogram buckets rather than raw samples: values sharing a bucket count as
+    ties, handled with mid-ranks and the usual tie-corrected normal approximation.
+    """
+    if baseline.precision != candidate.precision:
+        raise ValueError("Histograms must share the same precision")
+    n_base, n_cand = baseline.count, candidate.count
+    total = n_base + n_cand
+    rank_sum = 0.0
+    tie_term = 0.0
+    seen = 0
+    for index in sorted(set(baseline.counts) | set(candidate.counts)):
+        in_base = baseline.counts.get(index, 0)
+        in_cand = candidate.counts.get(index, 0)
+        tied = in_base + in_cand
+        rank_sum += in_cand * (seen + (tied + 1) / 2)
+        tie_term += tied**3 - tied
+        seen += tied
+
+    u_cand = rank_sum - n_cand * (n_cand + 1) / 2
+    mean = n_base * n_cand / 2
+    variance = n_base * n_cand / 12 * ((total + 1) - tie_term / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u_cand - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def select_run(runs: List[Dict[str, Any]], ref: str, before: Optional[int] = None) -> int:
+    limit = len(runs) if before is None else before
+    if ref in ("latest", "previous"):
+        index = limit - 1
+        if index < 0:
+            raise LookupError(f"No run available for {ref!r}")
+        return index
+    for index in range(limit - 1, -1, -1):
+        if (runs[index].get("commit") or "").startswith(ref):
+            return index
+    raise LookupError(f"No run recorded for commit {ref!r}")
+
+
+def setting_differences(baseline: Dict[str, Any], candidate: Dict[str, Any]) -> List[str]:
+    """The RUN_SETTINGS the two runs were measured with differently, as "key a vs b"."""
+    differences = []
+    for key in RUN_SETTINGS:
+        # A setting an older run didn't record is unknown, not different; a run from before
+        # datasets existed measured none, though.
+        if key != "dataset" and (key not in baseline or key not in candidate):
+            continue
+        if baseline.get(key) != candidate.get(key):
+            differences.append(f"{key} {baseline.get(key)} vs {candidate.get(key)}")
+    return differences
+
+
+def compare_endpoint(
+    baseline: Dict[str, Any], candidate: Dict[str, Any], args: argparse.Namespace
+) -> Tuple[str, Dict[str, Any]]:
+    row: Dict[str, Any] = {
+        "name": candidate["name"],
+        "base_p50": baseline.get("stats", {}).get("p50_ms", baseline.get("elapsed_ms")),
+        "cand_p50": candidate.get("stats", {}).get("p50_ms", candidate.get("elapsed_ms")),
+        "p_value": None,
+    }
+    base_status = baseline.get("status_code")
+    cand_status = candidate.get("status_code")
+    if (base_status is not None and base_status < 400) and (
+        cand_status is None or cand_status >= 400
+    ):
+        row["reason"] = f"status {base_status} -> {cand_status}"
+        return "regression", row
+
+    if "histogram" not in baseline or "histogram" not in candidate:
+        row["reason"] = "no samples recorded"
+        return "skipped", row
+    base_hist = LatencyHistogram.from_dict(baseline["histogram"])
+    cand_hist = LatencyHistogram.from_dict(candidate["histogram"])
+    if min(base_hist.count, cand_hist.count) < args.min_samples:
+        row["reason"] = f"fewer than {args.min_samples} samples"
+        return "skipped", row
+
+    p_value = mann_whitney_greater(base_hist, cand_hist)
+    row["p_value"] = p_value
+    base_p50 = base_hist.percentile(50) or 0.0
+    cand_p50 = cand_hist.percentile(50) or 0.0
+    ratio = cand_p50 / base_p50 if base_p50 else math.inf
+    if (
+        p_value < args.alpha
+        and ratio >= args.min_ratio
+        and cand_p50 - base_p50 >= args.min_delta_ms
+    ):
+        row["reason"] = f"p50 x{ratio:.2f}"
+        return "regression", row
+    row["reason"] = ""
+    return "ok", row
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Flag per-endpoint latency regressions between two recorded runs."
+    )
+    parser.add_argument("--history", type=Path, default=HISTORY_PATH)
+    parser.add_argument(
+        "--baseline",
+        default="previous",
+        help="commit (prefix) of the baseline run, or 'previous' for the run before the candidate",
+    )
+    parser.add_argument(
+        "--candidate", default="latest", help="commit (prefix) of the candidate run, or 'latest'"
+    )
+    parser.add_argument(
+        "--alpha", type=float, default=ALPHA, help="significance level of the Mann-Whitney test"
+    )
+    parser.add_argument(
+        "--min-ratio",
+        type=float,
+        default=MIN_RATIO,
+        help="candidate p50 must be at least this many times the baseline p50",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=MIN_DELTA_MS,
+        help="and at least this many milliseconds slower",
+    )
+    parser.add_argument(
+        "--min-samples",
+        type=int,
+        default=MIN_SAMPLES,
+        help="endpoints with fewer samples on either side are skipped",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help=f"compare runs even if their settings ({', '.join(RUN_SETTINGS)}) differ",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.history.exists():
+        print(f"Missing history file: {args.history}", file=sys.stderr)
+        return 2
+    runs = list(load_runs(args.history))
+    try:
+        candidate_index = select_run(runs, args.candidate)
+        baseline_index = select_run(runs, args.baseline, before=candidate_index)
+    except LookupError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    baseline_run, candidate_run = runs[baseline_index], runs[candidate_index]
+    print(
+        f"Baseline  {baseline_run.get('commit') or '?'} at {baseline_run.get('timestamp')}\n"
+        f"Candidate {candidate_run.get('commit') or '?'} at {candidate_run.get('timestamp')}"
+    )
+    differences = setting_differences(baseline_run, candidate_run)
+    if differences:
+        if not args.force:
+            print(
+                f"Runs were measured with different settings ({'; '.join(differences)});"
+                " their latencies do not compare. Re-run with matching settings, or pass"
+                " --force to compare anyway",
+                file=sys.stderr,
+            )
+            return 2
+        print(
+            f"Warning: runs were measured with different settings ({'; '.join(differences)});"
+            " latencies may not compare"
+        )
+    baseline_results = {result["name"]: result for result in baseline_run["results"]}
+
+    regressions = 0
+    print(f"{'ENDPOINT':<36} {'BASE p50':>9} {'CAND p50':>9} {'p-value':>9}  VERDICT")
+    for candidate in candidate_run["results"]:
+        baseline = baseline_results.get(candidate["name"])
+        if baseline is None:
+            continue
+        verdict, row = compare_endpoint(baseline, candidate, args)
+        regressions += verdict == "regression"
+        base_p50 = f"{row['base_p50']:.2f}" if row["base_p50"] is not None else "-"
+        cand_p50 = f"{row['cand_p50']:.2f}" if row["cand_p50"] is not None else "-"
+        p_value = f"{row['p_value']:.4f}" if row["p_value"] is not None else "-"
+        print(
+            f"{row['name']:<36} {base_p50:>9} {cand_p50:>9} {p_value:>9}"
+            f"  {verdict.upper()} {row['reason']}".rstrip()
+        )
+
+    if regressions:
+        print(f"{regressions} endpoint(s) regressed", file=sys.stderr)
+        return 1
+    print("No latency regressions detected")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
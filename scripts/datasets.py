@@ -0,0 +1,60 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Named dataset sizes: total bookings across the seven facility tables.
+PRESETS = {
+    "small": 10_000,
+    "medium": 100_000,
+    "large": 1_000_000,
+    "xl": 10_000_000,
+}
+DATASETS_DIR = Path(os.environ.get("KAIZEN_DATASETS_DIR", "screenshots/datasets"))
+# The dataset the measurement scripts run against; its manifest supplies their sample window.
+ACTIVE_NAME = os.environ.get("KAIZEN_DATASET", "")
+
+
+def manifest_path(name: str) -> Path:
+    return DATASETS_DIR / f"{name}.json"
+
+
+def load_manifest(name: str) -> Dict[str, Any]:
+    path = manifest_path(name)
+    if not path.exists():
+        raise RuntimeError(
+            f"No dataset named {name!r} at {path}; create it with generate_dataset.py {name}"
+        )
+    with path.open(encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def save_manifest(manifest: Dict[str, Any]) -> Path:
+    path = manifest_path(manifest["name"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2)
+    return path
+
+
+def active() -> Optional[Dict[str, Any]]:
+    """The KAIZEN_DATASET manifest, or None when no dataset is named."""
+    if not ACTIVE_NAME:
+        return None
+    try:
+        return load_manifest(ACTIVE_NAME)
+    except RuntimeError as exc:
+        # Read at import by the measurement scripts: measuring the wrong data is worse.
+        raise SystemExit(str(exc)) from None
+
+
+def summary(manifest: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """What a results file records about the dataset it was measured against."""
+    if manifest is None:
+        return None
+    return {
+        "name": manifest["name"],
+        "bookings": manifest["bookings"],
+        "users": manifest["users"]["rows"],
+        "span": [manifest["start"], manifest["end"]],
+    }
@@ -0,0 +1,510 @@
+#!/usr/bin/env python3
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+from calendar import monthrange
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import datasets
+import kaizen_db
+from measure_response_times import LOGIN_PAYLOAD
+
+SEED = int(os.environ.get("KAIZEN_DATASET_SEED", "2025"))
+SPAN_START = os.environ.get("KAIZEN_DATASET_START", "2023-01-01")
+SPAN_END = os.environ.get("KAIZEN_DATASET_END", "2025-12-31")
+# Bookings follow the residents' clock: WIB, as the availability grid does.
+UTC_OFFSET = timedelta(hours=7)
+USERS_PER_BOOKING = 1 / 40
+MIN_USERS, MAX_USERS = 100, 250_000
+# Frequent bookers dominate: the user at rank r books in proportion to 1 / r**SKEW.
+USER_SKEW = 0.7
+
+# Relative demand per local hour, 00..23.
+STUDY_HOURS = [0, 0, 0, 0, 0, 0, 1, 2, 4, 6, 7, 7, 5, 6, 8, 9, 9, 8, 7, 9, 10, 9, 6, 2]
+EVENT_HOURS = [0, 0, 0, 0, 0, 0, 0, 1, 2, 3, 4, 4, 3, 4, 5, 6, 7, 8, 10, 10, 9, 6, 3, 1]
+KITCHEN_HOURS = [0, 0, 0, 0, 1, 3, 6, 7, 4, 2, 3, 6, 8, 6, 2, 2, 3, 6, 9, 10, 7, 4, 2, 1]
+LAUNDRY_HOURS = [0, 0, 0, 0, 0, 1, 4, 7, 8, 7, 5, 4, 3, 3, 4, 5, 6, 8, 9, 9, 8, 6, 3, 1]
+# Monday..Sunday.
+WEEKDAYS = [1.0, 1.0, 1.0, 1.0, 0.9, 0.6, 0.7]
+WEEKENDS = [0.7, 0.7, 0.8, 0.8, 1.0, 1.3, 1.2]
+EVERY_DAY = [1.0, 1.0, 1.0, 1.0, 1.0, 1.1, 1.1]
+# January..December; semester breaks are quiet.
+MONTHS = [0.7, 1.0, 1.0, 1.0, 1.0, 0.8, 0.4, 0.6, 1.0, 1.0, 1.0, 0.7]
+
+NOTES = ["Belajar kelompok", "Rapat organisasi", "Latihan presentasi", "Nonton bareng"]
+FIRST_NAMES = ["Adi", "Budi", "Citra", "Dewi", "Eko", "Fitri", "Gilang", "Hana", "Indra", "Joko"]
+LAST_NAMES = ["Pratama", "Saputra", "Wijaya", "Lestari", "Hidayat", "Kusuma", "Nugroho", "Sari"]
+
+# share: fraction of all bookings; hours: slot length; resource: the column spreading
+# bookings over areas, floors or machines, with the lookup table and the names to create
+# when it is empty; people: jumlahPengguna range; gender: whose machines these are.
+TABLES: Dict[str, Dict[str, Any]] = {
+    "Communal": {
+        "share": 0.18,
+        "owner": "idPenanggungJawab",
+        "profile": (STUDY_HOURS, WEEKDAYS),
+        "hours": 1,
+        "resource": ("lantai", None, None, [1, 2, 3, 4, 5]),
+        "people": (1, 8),
+    },
+    "Serbaguna": {
+        "share": 0.08,
+        "owner": "idPenanggungJawab",
+        "profile": (EVENT_HOURS, WEEKENDS),
+        "hours": 2,
+        "resource": (
+            "idArea",
+            "AreaSerbaguna",
+            "namaArea",
+            ["Ruang Meeting A", "Ruang Meeting B", "Ruang Diskusi 1", "Ruang Diskusi 2"],
+        ),
+        "people": (5, 40),
+    },
+    "CWS": {
+        "share": 0.12,
+        "owner": "idPenanggungJawab",
+        "profile": (STUDY_HOURS, WEEKDAYS),
+        "hours": 2,
+        "people": (1, 6),
+    },
+    "Theater": {
+        "share": 0.06,
+        "owner": "idPenanggungJawab",
+        "profile": (EVENT_HOURS, WEEKENDS),
+        "hours": 1,
+        "people": (5, 60),
+    },
+    "Dapur": {
+        "share": 0.20,
+        "owner": "idPeminjam",
+        "profile": (KITCHEN_HOURS, EVERY_DAY),
+        "hours": 1,
+        "resource": (
+            "idFasilitas",
+            "FasilitasDapur",
+            "fasilitas",
+            ["Kompor Gas", "Microwave", "Kulkas", "Blender"],
+        ),
+        # Share of kitchen bookings that borrow the equipment too.
+        "equipment": 0.35,
+    },
+    "MesinCuciCewe": {
+        "share": 0.18,
+        "owner": "idPeminjam",
+        "profile": (LAUNDRY_HOURS, WEEKENDS),
+        "hours": 1,
+        "resource": (
+            "idFasilitas",
+            "FasilitasMcCewe",
+            "nama",
+            [f"Mesin Cuci {letter} - Cewe" for letter in "ABCDEF"],
+        ),
+        "gender": "female",
+    },
+    "MesinCuciCowo": {
+        "share": 0.18,
+        "owner": "idPeminjam",
+        "profile": (LAUNDRY_HOURS, WEEKENDS),
+        "hours": 1,
+        "resource": (
+            "idFasilitas",
+            "FasilitasMcCowo",
+            "nama",
+            [f"Mesin Cuci {letter} - Cowo" for letter in "ABCDEF"],
+        ),
+        "gender": "male",
+    },
+}
+# Longest lead time between making a booking and its start.
+MAX_LEAD_HOURS = 7 * 24
+
+
+class Clock:
+    """Hour-aligned UTC timestamps as LOAD DATA text, formatted once per hour of the span.
+
+    Bookings start on the hour, so every timestamp the generator writes is one of these.
+    """
+
+    def __init__(self, start: date, end: date) -> None:
+        # Local midnight of the first day, in UTC; lead times reach back before it.
+        self.origin = datetime(start.year, start.month, start.day) - UTC_OFFSET
+        self.local_origin = datetime(start.year, start.month, start.day)
+        self.hours = ((end - start).days + 1) * 24
+        self.first = -MAX_LEAD_HOURS
+        self.stamps = [
+            kaizen_db.tsv_field(self.origin + timedelta(hours=offset))
+            for offset in range(self.first, self.hours + 3)
+        ]
+
+    def stamp(self, offset: int) -> str:
+        return self.stamps[offset - self.first]
+
+    def utc(self, offset: int) -> datetime:
+        return self.origin + timedelta(hours=offset)
+
+    def weights(self, hourly: Sequence[float], daily: Sequence[float]) -> List[float]:
+        """Demand for each hour of the span: hour of day x day of week x month."""
+        weights = []
+        for day in range(self.hours // 24):
+            local = self.local_origin + timedelta(days=day)
+            scale = daily[local.weekday()] * MONTHS[local.month - 1]
+            weights.extend(weight * scale for weight in hourly)
+        return weights
+
+
+def next_id(conn: Any, table: str) -> int:
+    return int(kaizen_db.scalar(conn, f"SELECT COALESCE(MAX(id), 0) FROM `{table}`")) + 1
+
+
+def load(
+    conn: Any, method: str, table: str, columns: Sequence[str], rows: Iterator[Sequence[Any]]
+) -> int:
+    if method == "insert":
+        return kaizen_db.insert_many(conn, table, columns, rows)
+    return kaizen_db.load_rows(conn, table, columns, rows)
+
+
+def id_range(first_id: int, rows: int, **extra: Any) -> Dict[str, Any]:
+    return {"rows": rows, "first_id": first_id, "last_id": first_id + rows - 1, **extra}
+
+
+def user_count(bookings: int) -> int:
+    return max(MIN_USERS, min(MAX_USERS, int(bookings * USERS_PER_BOOKING)))
+
+
+def sample_window(end: date) -> Dict[str, str]:
+    """The span's last full month, for the scripts' sample date and time-range window."""
+    year, month = end.year, end.month
+    if end.day != monthrange(year, month)[1]:
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    last_day = monthrange(year, month)[1]
+    return {
+        "date": f"{year:04d}-{month:02d}-{min(20, last_day):02d}",
+        "start": f"{year:04d}-{month:02d}-01T00:00:00.000Z",
+        "end": f"{year:04d}-{month:02d}-{last_day:02d}T23:59:59.999Z",
+    }
+
+
+def create_angkatan(
+    conn: Any, method: str, start: date, end: date, now: str
+) -> Tuple[Dict[str, Any], List[Tuple[int, int]]]:
+    """One cohort per intake year, from the seniors living in at the start to the last."""
+    first_id = next_id(conn, "Angkatan")
+    years = list(range(start.year - 3, end.year + 1))
+    rows = [(first_id + index, str(year), now, now) for index, year in enumerate(years)]
+    load(conn, method, "Angkatan", ["id", "namaAngkatan", "createdAt", "updatedAt"], iter(rows))
+    return id_range(first_id, len(rows)), [(row[0], year) for row, year in zip(rows, years)]
+
+
+def user_password(conn: Any) -> str:
+    # The benchmark account's hash, so any generated user can log in with its password.
+    password = kaizen_db.scalar(
+        conn, "SELECT password FROM `Users` WHERE nomorWa = %s LIMIT 1", (LOGIN_PAYLOAD["nomorWa"],)
+    )
+    return password or "!"
+
+
+def create_users(
+    conn: Any, method: str, rng: random.Random, count: int, cohorts: List[Tuple[int, int]]
+) -> Tuple[Dict[str, Any], Dict[str, List[int]]]:
+    first_id = next_id(conn, "Users")
+    password = user_password(conn)
+    by_gender: Dict[str, List[int]] = {"male": [], "female": []}
+    rows = []
+    for user_id in range(first_id, first_id + count):
+        cohort_id, year = rng.choice(cohorts)
+        is_male = rng.random() < 0.5
+        by_gender["male" if is_male else "female"].append(user_id)
+        first_name = rng.choice(FIRST_NAMES)
+        joined = kaizen_db.tsv_field(datetime(year, 8, 1) + timedelta(days=rng.randrange(60)))
+        rows.append(
+            (
+                user_id,
+                cohort_id,
+                f"{first_name} {rng.choice(LAST_NAMES)}",
+                first_name,
+                # 0800 is no operator's prefix, so these never collide with real numbers.
+                f"0800{user_id:08d}",
+                password,
+                is_male,
+                joined,
+                joined,
+            )
+        )
+    columns = [
+        "id",
+        "idAngkatan",
+        "namaLengkap",
+        "namaPanggilan",
+        "nomorWa",
+        "password",
+        "isMale",
+        "createdAt",
+        "updatedAt",
+    ]
+    load(conn, method, "Users", columns, iter(rows))
+    return id_range(first_id, count), by_gender
+
+
+def resource_ids(
+    conn: Any, method: str, spec: Tuple[str, Optional[str], Optional[str], List[Any]], now: str
+) -> Tuple[List[Any], Optional[Dict[str, Any]]]:
+    """Existing areas or machines, or the default set created (and recorded) when empty."""
+    _, lookup, name_column, defaults = spec
+    if lookup is None:
+        return defaults, None
+    with conn.cursor() as cursor:
+        cursor.execute(f"SELECT id FROM `{lookup}` ORDER BY id")
+        existing = [row[0] for row in cursor.fetchall()]
+    if existing:
+        return existing, None
+    first_id = next_id(conn, lookup)
+    rows = [(first_id + index, name, now, now) for index, name in enumerate(defaults)]
+    load(conn, method, lookup, ["id", name_column, "createdAt", "updatedAt"], iter(rows))
+    return [row[0] for row in rows], id_range(first_id, len(rows))
+
+
+def owner_picker(rng: random.Random, user_ids: List[int]) -> Iterator[int]:
+    """An endless stream of booking owners, skewed towards a few frequent bookers."""
+    order = user_ids[:]
+    rng.shuffle(order)
+    cum_weights = list(
+        itertools.accumulate(1 / (rank + 1) ** USER_SKEW for rank in range(len(order)))
+    )
+    while True:
+        yield from rng.choices(order, cum_weights=cum_weights, k=10_000)
+
+
+def booking_rows(
+    spec: Dict[str, Any],
+    count: int,
+    first_id: int,
+    rng: random.Random,
+    clock: Clock,
+    owners: Iterator[int],
+    resources: Optional[List[Any]],
+    now: datetime,
+) -> Iterator[Tuple[Any, ...]]:
+    """count bookings in start order (ids rise with time, as on the live system)."""
+    population = list(range(clock.hours))
+    cum_weights = list(itertools.accumulate(clock.weights(*spec["profile"])))
+    starts = rng.choices(population, cum_weights=cum_weights, k=count)
+    starts.sort()
+    has_details = "people" in spec
+    for index, start in enumerate(starts):
+        end = start + spec["hours"]
+        created = start - rng.randint(1, MAX_LEAD_HOURS)
+        done = clock.utc(end) <= now
+        updated = end if done else created
+        row: List[Any] = [first_id + index, next(owners)]
+        if resources is not None:
+            row.append(rng.choice(resources))
+        row += [clock.stamp(start), clock.stamp(end)]
+        if has_details:
+            low, high = spec["people"]
+            note = rng.choice(NOTES) if rng.random() < 0.3 else None
+            row += [rng.randint(low, high), note, done]
+        elif "equipment" in spec:
+            row.append(rng.random() < spec["equipment"])
+        row += [clock.stamp(created), clock.stamp(updated)]
+        yield tuple(row)
+
+
+def booking_columns(spec: Dict[str, Any]) -> List[str]:
+    columns = ["id", spec["owner"]]
+    if "resource" in spec:
+        columns.append(spec["resource"][0])
+    columns += ["waktuMulai", "waktuBerakhir"]
+    if "people" in spec:
+        columns += ["jumlahPengguna", "keterangan", "isDone"]
+    elif "equipment" in spec:
+        columns.append("pinjamPeralatan")
+    return columns + ["createdAt", "updatedAt"]
+
+
+def table_counts(bookings: int) -> Dict[str, int]:
+    counts = {table: int(bookings * spec["share"]) for table, spec in TABLES.items()}
+    # Rounding leftovers go to the busiest table, so the total is exact.
+    busiest = max(TABLES, key=lambda table: TABLES[table]["share"])
+    counts[busiest] += bookings - sum(counts.values())
+    return counts
+
+
+def generate(conn: Any, args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    now_stamp = kaizen_db.tsv_field(now.replace(microsecond=0))
+    clock = Clock(args.start, args.end)
+    manifest: Dict[str, Any] = {
+        "name": args.name,
+        "bookings": args.bookings,
+        "seed": args.seed,
+        "start": args.start.isoformat(),
+        "end": args.end.isoformat(),
+        "method": args.method,
+        "created_at": now.isoformat(timespec="seconds") + "Z",
+        "sample": sample_window(args.end),
+        "facilities": {},
+        "tables": {},
+    }
+    if args.method == "load":
+        # Ids are written explicitly and are consistent by construction; skipping the
+        # per-row checks is most of what makes a bulk load fast.
+        with conn.cursor() as cursor:
+            cursor.execute("SET unique_checks = 0, foreign_key_checks = 0")
+
+    manifest["angkatan"], cohorts = create_angkatan(
+        conn, args.method, args.start, args.end, now_stamp
+    )
+    manifest["users"], by_gender = create_users(
+        conn, args.method, rng, user_count(args.bookings), cohorts
+    )
+    datasets.save_manifest(manifest)
+    print(f"Users: {manifest['users']['rows']} in {len(cohorts)} cohorts")
+    everyone = by_gender["male"] + by_gender["female"]
+
+    for table, count in table_counts(args.bookings).items():
+        spec = TABLES[table]
+        resources = None
+        if "resource" in spec:
+            resources, created = resource_ids(conn, args.method, spec["resource"], now_stamp)
+            if created:
+                manifest["facilities"][spec["resource"][1]] = created
+        owners = owner_picker(rng, by_gender[spec["gender"]] if "gender" in spec else everyone)
+        first_id = next_id(conn, table)
+        table_started = time.perf_counter()
+        loaded = load(
+            conn,
+            args.method,
+            table,
+            booking_columns(spec),
+            booking_rows(spec, count, first_id, rng, clock, owners, resources, now),
+        )
+        elapsed_s = time.perf_counter() - table_started
+        manifest["tables"][table] = id_range(
+            first_id,
+            loaded,
+            seconds=round(elapsed_s, 2),
+            rows_per_s=round(loaded / elapsed_s) if elapsed_s else None,
+        )
+        print(f"{table:<14} {loaded:>10} rows in {elapsed_s:7.1f}s")
+        # Saved as it goes, so --drop can clean up after an interrupted run.
+        datasets.save_manifest(manifest)
+
+    manifest["seconds"] = round(time.perf_counter() - started, 2)
+    return manifest
+
+
+def drop(conn: Any, manifest: Dict[str, Any]) -> None:
+    """Delete a dataset's rows, bookings before the users and lookups they point at."""
+    ranges = list(manifest.get("tables", {}).items())
+    ranges.append(("Users", manifest.get("users")))
+    ranges.append(("Angkatan", manifest.get("angkatan")))
+    ranges += list(manifest.get("facilities", {}).items())
+    for table, span in ranges:
+        if span and span["rows"]:
+            deleted = kaizen_db.delete_id_range(conn, table, span["first_id"], span["last_id"])
+            print(f"{table:<16} {deleted:>10} rows deleted")
+
+
+def print_datasets() -> None:
+    manifests = sorted(datasets.DATASETS_DIR.glob("*.json"))
+    if not manifests:
+        print(f"No datasets in {datasets.DATASETS_DIR}")
+    for path in manifests:
+        manifest = datasets.load_manifest(path.stem)
+        print(
+            f"{manifest['name']:<12} {manifest['bookings']:>10} bookings"
+            f" {manifest['users']['rows']:>8} users  {manifest['start']}..{manifest['end']}"
+            f"  sample {manifest['sample']['date']}"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Bulk-load a synthetic multi-year dataset (cohorts, users and bookings in all "
+            "seven facility tables, following hourly, weekly and seasonal demand) and record "
+            "it under a name. Measurement scripts run against it with KAIZEN_DATASET=NAME. "
+            f"Presets: {', '.join(f'{name}={rows:,}' for name, rows in datasets.PRESETS.items())}."
+        )
+    )
+    parser.add_argument("name", nargs="?", help="dataset name; a preset name sets --bookings")
+    parser.add_argument("--bookings", type=int, help="total bookings (10k to 10M)")
+    parser.add_argument("--start", type=date.fromisoformat, default=date.fromisoformat(SPAN_START))
+    parser.add_argument("--end", type=date.fromisoformat, default=date.fromisoformat(SPAN_END))
+    parser.add_argument("--seed", type=int, default=SEED, help="same seed, same dataset")
+    parser.add_argument(
+        "--method",
+        choices=["load", "insert"],
+        default="load",
+        help="LOAD DATA LOCAL INFILE, or batched INSERTs where local_infile is off",
+    )
+    parser.add_argument("--drop", action="store_true", help="delete the named dataset instead")
+    parser.add_argument("--list", action="store_true", help="list recorded datasets")
+    args = parser.parse_args()
+    if args.list:
+        return args
+    if not args.name:
+        parser.error("name a dataset, e.g. one of the presets")
+    if args.bookings is None:
+        args.bookings = datasets.PRESETS.get(args.name)
+    if not args.drop:
+        if args.bookings is None:
+            parser.error(f"{args.name!r} is not a preset; pass --bookings")
+        if args.bookings < 1:
+            parser.error("--bookings must be at least 1")
+        if args.end < args.start:
+            parser.error("--end must not be before --start")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    if args.list:
+        print_datasets()
+        return 0
+    path = datasets.manifest_path(args.name)
+    if args.drop != path.exists():
+        print(
+            f"Dataset {args.name!r} {'is not' if args.drop else 'is already'} recorded at {path}"
+            + ("" if args.drop else "; drop it first with --drop"),
+            file=sys.stderr,
+        )
+        return 1
+    try:
+        conn = kaizen_db.connect(local_infile=args.method == "load")
+    except (RuntimeError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    try:
+        if args.drop:
+            drop(conn, datasets.load_manifest(args.name))
+            path.unlink()
+            print(f"Dropped dataset {args.name!r}")
+            return 0
+        manifest = generate(conn, args)
+    except RuntimeError as exc:
+        print(exc, file=sys.stderr)
+        if path.exists():
+            print(f"Partly loaded; clean up with --drop {args.name}", file=sys.stderr)
+        return 1
+    finally:
+        conn.close()
+
+    saved = datasets.save_manifest(manifest)
+    print(
+        f"Loaded {manifest['bookings']} bookings in {manifest['seconds']:.1f}s;"
+        f" saved {saved}. Run the measurement scripts with KAIZEN_DATASET={args.name}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+import math
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# Relative width of a histogram bucket: every recorded value lands in a bucket whose bounds
+# are within 1% of it, so percentiles carry at most ~1% error whatever the sample count.
+DEFAULT_PRECISION = 0.01
+# Latencies are stored in milliseconds; anything faster than a microsecond shares one bucket.
+MIN_TRACKABLE_MS = 0.001
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with constant memory per distinct bucket.
+
+    Only bucket counts, min/max and a running mean/variance (Welford) are kept, so millions
+    of samples cost the same as a few hundred.
+    """
+
+    def __init__(self, precision: float = DEFAULT_PRECISION) -> None:
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _bucket(self, value_ms: float) -> int:
+        return int(math.floor(math.log(max(value_ms, MIN_TRACKABLE_MS)) / self._log_base))
+
+    def bucket_value(self, index: int) -> float:
+        # Geometric midpoint of [base^index, base^(index + 1)).
+        return math.exp((index + 0.5) * self._log_base)
+
+    def record(self, value_ms: float, count: int = 1) -> None:
+        index = self._bucket(value_ms)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.min = value_ms if self.min is None else min(self.min, value_ms)
+        self.max = value_ms if self.max is None else max(self.max, value_ms)
+        total = self.count + count
+        delta = value_ms - self._mean
+        self._m2 += delta * delta * self.count * count / total
+        self._mean += delta * count / total
+        self.count = total
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge histograms with different precision")
+        if not other.count:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        total = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self._mean += delta * other.count / total
+        self.count = total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def buckets(self) -> Iterator[Tuple[float, int]]:
+        for index in sorted(self.counts):
+            yield self.bucket_value(index), self.counts[index]
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._mean if self.count else None
+
+    @property
+    def stddev(self) -> Optional[float]:
+        if not self.count:
+            return None
+        if self.count == 1:
+            return 0.0
+        return math.sqrt(self._m2 / (self.count - 1))
+
+    def percentile(self, pct: float) -> Optional[float]:
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for value, count in self.buckets():
+            seen += count
+            if seen >= rank:
+                # Bucket midpoints can overshoot the real extremes; clamp to what was observed.
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return round(value, 2) if value is not None else None
+
+        return {
+            "count": self.count,
+            "min_ms": rounded(self.min),
+            "mean_ms": rounded(self.mean),
+            "p50_ms": rounded(self.percentile(50)),
+            "p90_ms": rounded(self.percentile(90)),
+            "p99_ms": rounded(self.percentile(99)),
+            "max_ms": rounded(self.max),
+            "stddev_ms": rounded(self.stddev),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "precision": self.precision,
+            "count": self.count,
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "mean_ms": self._mean,
+            "m2": self._m2,
+            "buckets": {str(index): self.counts[index] for index in sorted(self.counts)},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(precision=data.get("precision", DEFAULT_PRECISION))
+        histogram.counts = {int(index): count for index, count in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.min = data.get("min_ms")
+        histogram.max = data.get("max_ms")
+        histogram._mean = data.get("mean_ms") or 0.0
+        histogram._m2 = data.get("m2") or 0.0
+        return histogram
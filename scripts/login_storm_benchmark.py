@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from latency_stats import LatencyHistogram
+from measure_response_times import BASE_URL, DATE_SAMPLE, is_error, login, measure
+from phase_timing import timed_session
+from server_metrics import process_summary, scrape
+
+OUTPUT_PATH = Path(
+    os.environ.get("KAIZEN_LOGIN_STORM_PATH", "screenshots/login_storm_results.json")
+)
+DURATION_S = float(os.environ.get("KAIZEN_LOGIN_STORM_DURATION", "20"))
+READERS = int(os.environ.get("KAIZEN_LOGIN_STORM_READERS", "4"))
+LOGINS = int(os.environ.get("KAIZEN_LOGIN_STORM_LOGINS", "8"))
+# A cached slot grid: cheap on its own, so time spent waiting behind logins stands out.
+READ_PATH = os.environ.get(
+    "KAIZEN_LOGIN_STORM_READ_PATH", f"/api/v1/theater/time-slots?date={DATE_SAMPLE}"
+)
+
+
+def run_phase(
+    name: str, readers: int, logins: int, duration_s: float, read_tokens: List[str]
+) -> Dict[str, Any]:
+    """Slot readers, plus `logins` clients logging in back to back, for duration_s."""
+    histograms = {"read": LatencyHistogram(), "login": LatencyHistogram()}
+    counts = {"read": [0, 0], "login": [0, 0]}
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def record(kind: str, result: Dict[str, Any]) -> None:
+        with lock:
+            histograms[kind].record(result["elapsed_ms"])
+            counts[kind][0] += 1
+            if is_error(result):
+                counts[kind][1] += 1
+
+    def reader(token: str) -> None:
+        session = timed_session()
+        while not stop.is_set():
+            result, _ = measure(
+                session=session, method="GET", path=READ_PATH, name="read", token=token
+            )
+            record("read", result)
+
+    def login_client() -> None:
+        session = timed_session()
+        while not stop.is_set():
+            result, _ = login(session)
+            record("login", result)
+
+    scrape_session = timed_session()
+    before = scrape(scrape_session, BASE_URL)
+    threads = [threading.Thread(target=reader, args=(token,)) for token in read_tokens[:readers]]
+    threads += [threading.Thread(target=login_client) for _ in range(logins)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    time.sleep(duration_s)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    elapsed_s = time.perf_counter() - started
+    after = scrape(scrape_session, BASE_URL) if before is not None else None
+
+    phase: Dict[str, Any] = {"phase": name, "readers": readers, "logins": logins}
+    for kind, histogram in histograms.items():
+        requests_made, errors = counts[kind]
+        if requests_made:
+            phase[kind] = {
+                "requests": requests_made,
+                "errors": errors,
+                "throughput_rps": round(requests_made / elapsed_s, 2),
+                "stats": histogram.summary(),
+            }
+    if before is not None and after is not None:
+        # Event-loop lag is what a blocking bcrypt compare shows up as on the server.
+        phase["server"] = process_summary(before, after)
+    return phase
+
+
+def slowdown(baseline: Dict[str, Any], storm: Dict[str, Any], key: str) -> Optional[float]:
+    if "read" not in baseline or "read" not in storm:
+        return None
+    base, under = baseline["read"]["stats"][key], storm["read"]["stats"][key]
+    return round(under / base, 2) if base and under else None
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'PHASE':<9} {'KIND':<6} {'REQUESTS':>9} {'ERR':>5} {'RPS':>8} {'P50 ms':>9}"
+        f" {'P90 ms':>9} {'P99 ms':>9} {'LOOP LAG P99 ms':>16}"
+    )
+    for phase in report["phases"]:
+        lag = (phase.get("server") or {}).get("event_loop_lag_p99_ms")
+        for kind in ("read", "login"):
+            row = phase.get(kind)
+            if not row:
+                continue
+            stats = row["stats"]
+            print(
+                f"{phase['phase']:<9} {kind:<6} {row['requests']:>9} {row['errors']:>5}"
+                f" {row['throughput_rps']:>8.1f} {stats['p50_ms'] or 0:>9.2f}"
+                f" {stats['p90_ms'] or 0:>9.2f} {stats['p99_ms'] or 0:>9.2f}"
+                f" {lag if lag is not None else '-':>16}"
+            )
+    impact = report["read_slowdown"]
+    print(
+        f"Slot reads during the storm: p50 {impact['p50'] or '-'}x, p99 {impact['p99'] or '-'}x"
+        f" of baseline; login p99 {report['login_p99_ms'] or '-'} ms"
+    )
+
+
+def print_comparison(runs: Dict[str, Dict[str, Any]], label: str) -> None:
+    current = runs[label]
+    for other, run in runs.items():
+        if other == label:
+            continue
+        print(
+            f"{label} vs {other}: login p99 {run['login_p99_ms']} -> {current['login_p99_ms']} ms,"
+            f" read p99 slowdown {run['read_slowdown']['p99']}x"
+            f" -> {current['read_slowdown']['p99']}x"
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time slot reads alone, then while clients log in back to back: login latency "
+            "and how much the storm slows the reads. Run once per server configuration "
+            "(e.g. PASSWORD_WORKERS=0 and the default pool) with its own --label to compare."
+        )
+    )
+    parser.add_argument("--readers", type=int, default=READERS, help="concurrent slot readers")
+    parser.add_argument(
+        "--logins", type=int, default=LOGINS, help="clients logging in back to back"
+    )
+    parser.add_argument("--duration", type=float, default=DURATION_S, help="seconds per phase")
+    parser.add_argument(
+        "--label", default="default", help="name this run is stored under, e.g. inline or pool"
+    )
+    args = parser.parse_args()
+    if args.readers < 1 or args.logins < 1:
+        parser.error("--readers and --logins must be at least 1")
+    if args.duration <= 0:
+        parser.error("--duration must be positive")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    session = timed_session()
+    read_tokens = []
+    for _ in range(args.readers):
+        _, token = login(session)
+        if not token:
+            print("Login failed; cannot continue", file=sys.stderr)
+            return 1
+        read_tokens.append(token)
+
+    baseline = run_phase("baseline", args.readers, 0, args.duration, read_tokens)
+    storm = run_phase("storm", args.readers, args.logins, args.duration, read_tokens)
+    report: Dict[str, Any] = {
+        "mode": "login-storm",
+        "base_url": BASE_URL,
+        "label": args.label,
+        "read_path": READ_PATH,
+        "duration_s": args.duration,
+        "phases": [baseline, storm],
+        "login_p99_ms": storm.get("login", {}).get("stats", {}).get("p99_ms"),
+        "read_slowdown": {
+            "p50": slowdown(baseline, storm, "p50_ms"),
+            "p99": slowdown(baseline, storm, "p99_ms"),
+        },
+    }
+
+    # Earlier runs stay in the file under their own labels, for the comparison below.
+    runs: Dict[str, Any] = {}
+    if OUTPUT_PATH.exists():
+        with OUTPUT_PATH.open(encoding="utf-8") as fh:
+            runs = json.load(fh).get("runs", {})
+    runs[args.label] = report
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump({"runs": runs}, fh, indent=2)
+    print_report(report)
+    print_comparison(runs, args.label)
+    print(f"Saved login storm benchmark to {OUTPUT_PATH} as {args.label!r}")
+    errors = sum(
+        phase[kind]["errors"]
+        for phase in report["phases"]
+        for kind in ("read", "login")
+        if kind in phase
+    )
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+import kaizen_db
+from latency_stats import LatencyHistogram
+from measure_response_times import BASE_URL, is_error, login, measure
+from phase_timing import timed_session
+
+OUTPUT_PATH = Path(os.environ.get("KAIZEN_MARK_DONE_PATH", "screenshots/mark_done_results.json"))
+BOOKINGS = int(os.environ.get("KAIZEN_MARK_DONE_BOOKINGS", "5000"))
+REPEATS = int(os.environ.get("KAIZEN_MARK_DONE_REPEATS", "5"))
+PAST_DAYS = 365
+
+# Modules whose table has isDone; Dapur and the washing machines have nothing to mark.
+MODULES: Dict[str, Dict[str, Any]] = {
+    "communal": {"table": "Communal", "extra": {"lantai": 1}},
+    "serbaguna": {"table": "Serbaguna", "extra": {"idArea": None}},
+    "theater": {"table": "Theater", "extra": {}},
+    "cws": {"table": "CWS", "extra": {}},
+}
+
+
+def past_bookings(
+    count: int, owner_id: int, extra: Dict[str, Any], seed: int
+) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+    """Undone one-hour bookings spread over the past year (UTC, as Prisma stores them)."""
+    columns = [
+        "idPenanggungJawab",
+        "waktuMulai",
+        "waktuBerakhir",
+        "jumlahPengguna",
+        "keterangan",
+        "isDone",
+        *extra,
+    ]
+    now = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    rng = random.Random(seed)
+
+    def rows() -> Iterator[Tuple[Any, ...]]:
+        for _ in range(count):
+            start = now - timedelta(hours=rng.randint(2, PAST_DAYS * 24))
+            end = start + timedelta(hours=1)
+            yield (owner_id, start, end, 1, kaizen_db.BENCH_MARKER, False, *extra.values())
+
+    return columns, rows()
+
+
+def pending(conn: Any, table: str, marker_only: bool = False) -> int:
+    sql = f"SELECT COUNT(*) FROM `{table}` WHERE isDone = false"
+    sql += " AND waktuBerakhir <= UTC_TIMESTAMP(3)"
+    if marker_only:
+        sql += " AND keterangan = %s"
+        return kaizen_db.scalar(conn, sql, (kaizen_db.BENCH_MARKER,))
+    return kaizen_db.scalar(conn, sql)
+
+
+def sweep(session: Any, token: str, name: str) -> Tuple[Dict[str, Any], Any]:
+    return measure(
+        session=session,
+        method="POST",
+        path=f"/api/v1/{name}/mark-past-done",
+        name=f"{name} mark-past-done",
+        token=token,
+    )
+
+
+def run_module(
+    conn: Any,
+    session: Any,
+    token: str,
+    name: str,
+    *,
+    owner_id: int,
+    area_id: int,
+    bookings: int,
+    repeats: int,
+    seed: int,
+) -> Dict[str, Any]:
+    module = MODULES[name]
+    table = module["table"]
+    extra = {key: area_id if key == "idArea" else value for key, value in module["extra"].items()}
+    columns, rows = past_bookings(bookings, owner_id, extra, seed)
+
+    started = time.perf_counter()
+    seeded = kaizen_db.insert_many(conn, table, columns, rows)
+    seed_s = time.perf_counter() - started
+    # Real past bookings nobody marked yet get swept too; report them so `updated` adds up.
+    pending_before = pending(conn, table)
+
+    row: Dict[str, Any] = {
+        "name": name,
+        "seeded": seeded,
+        "seed_s": round(seed_s, 3),
+        "pending_before": pending_before,
+        "updated": None,
+        "errors": 0,
+    }
+    result, body = sweep(session, token, name)
+    row["sweep_ms"] = result["elapsed_ms"]
+    if is_error(result):
+        row["errors"] += 1
+        row["first_error"] = result.get("message") or result.get("error")
+    elif isinstance(body, dict):
+        row["updated"] = (body.get("data") or {}).get("updated")
+    if row["sweep_ms"] and row["updated"]:
+        row["rows_per_s"] = round(row["updated"] / (row["sweep_ms"] / 1000), 1)
+
+    # Nothing is left to mark on the repeats, so these time the sweep's fixed cost.
+    idle = LatencyHistogram()
+    for _ in range(repeats):
+        result, _ = sweep(session, token, name)
+        if is_error(result):
+            row["errors"] += 1
+            row.setdefault("first_error", result.get("message") or result.get("error"))
+        else:
+            idle.record(result["elapsed_ms"])
+    row["idle"] = idle.summary()
+    row["left_undone"] = pending(conn, table, marker_only=True)
+    return row
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'MODULE':<10} {'SEEDED':>7} {'PENDING':>8} {'UPDATED':>8} {'SWEEP ms':>9}"
+        f" {'ROWS/S':>9} {'IDLE p50':>9} {'LEFT':>5}"
+    )
+    for row in report["modules"]:
+        idle_p50 = row["idle"]["p50_ms"]
+        print(
+            f"{row['name']:<10} {row['seeded']:>7} {row['pending_before']:>8}"
+            f" {row['updated'] if row['updated'] is not None else '-':>8}"
+            f" {row['sweep_ms']:>9.2f} {row.get('rows_per_s', 0):>9.1f}"
+            f" {idle_p50 if idle_p50 is not None else 0:>9.2f} {row['left_undone']:>5}"
+        )
+        if row.get("first_error"):
+            print(f"  first error: {row['first_error']}")
+        if row["left_undone"]:
+            print(f"  {row['left_undone']} seeded booking(s) are still not done")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seed thousands of past, undone bookings straight into the database and time "
+            "POST /mark-past-done sweeping them, then the idle sweep with nothing to mark."
+        )
+    )
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        choices=sorted(MODULES),
+        default=list(MODULES),
+        help="facility modules to benchmark (only those with an isDone column)",
+    )
+    parser.add_argument(
+        "--bookings", type=int, default=BOOKINGS, help="past bookings seeded per module"
+    )
+    parser.add_argument(
+        "--repeats", type=int, default=REPEATS, help="idle sweeps timed after the first one"
+    )
+    parser.add_argument("--seed", type=int, default=1, help="random seed for booking times")
+    parser.add_argument("--keep", action="store_true", help="leave the seeded bookings in place")
+    args = parser.parse_args()
+    if args.bookings < 1:
+        parser.error("--bookings must be at least 1")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        conn = kaizen_db.connect()
+    except (RuntimeError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    session = timed_session()
+    _, token = login(session)
+    if not token:
+        print("Login failed; cannot continue", file=sys.stderr)
+        return 1
+    owner_id = kaizen_db.scalar(conn, "SELECT id FROM `Users` ORDER BY id LIMIT 1")
+    area_id = kaizen_db.scalar(conn, "SELECT id FROM `AreaSerbaguna` ORDER BY id LIMIT 1")
+    if owner_id is None:
+        print("No users in the database to own the seeded bookings", file=sys.stderr)
+        return 1
+
+    rows = []
+    try:
+        for name in args.modules:
+            if name == "serbaguna" and area_id is None:
+                print("Skipping serbaguna: no AreaSerbaguna rows to book", file=sys.stderr)
+                continue
+            rows.append(
+                run_module(
+                    conn,
+                    session,
+                    token,
+                    name,
+                    owner_id=owner_id,
+                    area_id=area_id,
+                    bookings=args.bookings,
+                    repeats=args.repeats,
+                    seed=args.seed,
+                )
+            )
+    finally:
+        if not args.keep:
+            for name in args.modules:
+                kaizen_db.delete_marked(conn, MODULES[name]["table"])
+        conn.close()
+
+    report = {
+        "mode": "mark-done",
+        "base_url": BASE_URL,
+        "bookings": args.bookings,
+        "repeats": args.repeats,
+        "modules": rows,
+    }
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2, default=str)
+    print_report(report)
+    print(f"Saved mark-done benchmark to {OUTPUT_PATH}")
+    return 1 if any(row["errors"] or row["left_undone"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,110 @@
 #!/usr/bin/env python3
+import argparse
+import asyncio
+import itertools
 import json
 import os
+import random
 import sys
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 import requests
 
+from datasets import active as active_dataset
+from datasets import summary as dataset_summary
+from latency_stats import LatencyHistogram
+from open_model import drive_arrivals
+from phase_timing import (
+    PHASES,
+    PhaseTimer,
+    parse_server_timing,
+    summarize_phases,
+    summarize_server_timing,
+    timed_session,
+)
+from query_stats import QUERY_STATS_PATH, merge_query_stats, print_query_report
+from results_history import HISTORY_PATH, append_run, build_run
+from results_sink import JsonlSink
+from server_metrics import (
+    Samples,
+    merge_server_metrics,
+    print_server_report,
+    process_summary,
+    route_latency,
+    scrape,
+)
+from scenario import (
+    DEFAULT_SCENARIO,
+    REQUEST,
+    Node,
+    apply_extracts,
+    critical_path_length,
+    dependency_graph,
+    load_scenario,
+    resolve_step,
+    step_note,
+)
+from soak import ProcessSampler, WindowRecorder, drift
+
 BASE_URL = os.environ.get("KAIZEN_BASE_URL", "http://localhost:3000")
 LOGIN_PAYLOAD = {
     "nomorWa": os.environ.get("KAIZEN_USER_WA", "+6285790826168"),
     "password": os.environ.get("KAIZEN_USER_PASSWORD", "12345678"),
 }
-OUTPUT_PATH = Path(os.environ.get("KAIZEN_METRICS_PATH", "screenshots/response_times.json"))
-DATE_SAMPLE = os.environ.get("KAIZEN_SAMPLE_DATE", "2025-09-20")
-START_TIME = os.environ.get("KAIZEN_SAMPLE_START", "2025-09-01T00:00:00.000Z")
-END_TIME = os.environ.get("KAIZEN_SAMPLE_END", "2025-09-30T23:59:59.999Z")
+OUTPUT_PATH = Path(os.environ.get("KAIZEN_METRICS_PATH", "screenshots/response_times.jsonl"))
+# KAIZEN_DATASET=NAME samples inside a generated dataset (generate_dataset.py);
+# KAIZEN_SAMPLE_* still override its window.
+DATASET = active_dataset()
+DATASET_SAMPLE = DATASET["sample"] if DATASET else {}
+DATE_SAMPLE = os.environ.get("KAIZEN_SAMPLE_DATE", DATASET_SAMPLE.get("date", "2025-09-20"))
+START_TIME = os.environ.get(
+    "KAIZEN_SAMPLE_START", DATASET_SAMPLE.get("start", "2025-09-01T00:00:00.000Z")
+)
+END_TIME = os.environ.get(
+    "KAIZEN_SAMPLE_END", DATASET_SAMPLE.get("end", "2025-09-30T23:59:59.999Z")
+)
+LOAD_OUTPUT_PATH = Path(os.environ.get("KAIZEN_LOAD_METRICS_PATH", "screenshots/load_results.json"))
+LOAD_USERS = int(os.environ.get("KAIZEN_LOAD_USERS", "10"))
+LOAD_DURATION_S = float(os.environ.get("KAIZEN_LOAD_DURATION", "60"))
+LOAD_RATE = os.environ.get("KAIZEN_LOAD_RATE")
+OPEN_OUTPUT_PATH = Path(
+    os.environ.get("KAIZEN_OPEN_METRICS_PATH", "screenshots/open_load_results.json")
+)
+OPEN_ARRIVAL = os.environ.get("KAIZEN_OPEN_ARRIVAL", "poisson")
+OPEN_CONNECTIONS = int(os.environ.get("KAIZEN_OPEN_CONNECTIONS", "256"))
+# Past this many unanswered requests new arrivals are dropped (and counted) rather than
+# letting a dead server grow the backlog without bound.
+OPEN_MAX_IN_FLIGHT = int(os.environ.get("KAIZEN_OPEN_MAX_IN_FLIGHT", "20000"))
+OPEN_TIMEOUT_S = float(os.environ.get("KAIZEN_OPEN_TIMEOUT", "30"))
+# Arrivals starting this late mean the generator, not the server, was the bottleneck.
+OPEN_LAG_WARN_MS = 10.0
+SOAK_OUTPUT_PATH = Path(
+    os.environ.get("KAIZEN_SOAK_WINDOWS_PATH", "screenshots/soak_windows.jsonl")
+)
+SOAK_REPORT_PATH = Path(os.environ.get("KAIZEN_SOAK_REPORT_PATH", "screenshots/soak_report.json"))
+SOAK_DURATION_S = float(os.environ.get("KAIZEN_SOAK_DURATION", str(4 * 3600)))
+SOAK_WINDOW_S = float(os.environ.get("KAIZEN_SOAK_WINDOW", "60"))
+SOAK_PID = os.environ.get("KAIZEN_SOAK_PID")
+SCENARIO_PATH = Path(os.environ.get("KAIZEN_SCENARIO", str(DEFAULT_SCENARIO)))
+QUERY_STATS_OUTPUT_PATH = Path(
+    os.environ.get("KAIZEN_QUERY_STATS_PATH", "screenshots/query_stats.json")
+)
+SERVER_METRICS_OUTPUT_PATH = Path(
+    os.environ.get("KAIZEN_SERVER_METRICS_PATH", "screenshots/server_metrics.json")
+)
+SWEEP_PARALLELISM = int(os.environ.get("KAIZEN_SWEEP_PARALLELISM", "8"))
+SAMPLES = int(os.environ.get("KAIZEN_SAMPLES", "10"))
+WARMUP = int(os.environ.get("KAIZEN_WARMUP", "2"))
+
+LOGIN_TARGET = {"method": "POST", "path": "/api/v1/auth/login", "name": "Auth Login"}
+CACHE_FLUSH_PATH = "/api/v1/cache/flush"
+
 
 def measure(
     session: requests.Session,
@@ -28,387 +115,983 @@ def measure(
     requires_auth: bool = True,
     params: Optional[Dict[str, Any]] = None,
     json_data: Optional[Dict[str, Any]] = None,
+    headers: Optional[Dict[str, str]] = None,
 ) -> Tuple[Dict[str, Any], Union[Dict[str, Any], str, None]]:
     url = f"{BASE_URL}{path}"
-    headers = {}
+    headers = dict(headers or {})
     if requires_auth:
         if not token:
             raise RuntimeError(f"Token is required for {method} {path}")
         headers["Authorization"] = f"Bearer {token}"
     start = time.perf_counter()
-    try:
-        response = session.request(
-            method=method,
-            url=url,
-            headers=headers,
-            params=params,
-            json=json_data,
-            timeout=30,
-        )
-        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
-        body: Union[Dict[str, Any], str, None]
+    with PhaseTimer() as timer:
         try:
-            body = response.json()
-        except ValueError:
-            body = response.text
-        result = {
-            "name": name,
-            "method": method,
-            "path": path,
-            "status_code": response.status_code,
-            "elapsed_ms": elapsed_ms,
-            "message": body.get("message") if isinstance(body, dict) else None,
-        }
-        return result, body
-    except requests.RequestException as exc:
-        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
-        result = {
-            "name": name,
-            "method": method,
-            "path": path,
-            "status_code": None,
-            "elapsed_ms": elapsed_ms,
-            "message": None,
-            "error": str(exc),
-        }
-        return result, None
+            # stream=True returns once the headers are in, splitting TTFB from the download.
+            response = session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=json_data,
+                timeout=30,
+                stream=True,
+            )
+            headers_at = time.perf_counter()
+            response.content
+            downloaded_at = time.perf_counter()
+            elapsed_ms = round((downloaded_at - start) * 1000, 2)
+            body: Union[Dict[str, Any], str, None]
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            parsed_at = time.perf_counter()
+            result = {
+                "name": name,
+                "method": method,
+                "path": path,
+                "status_code": response.status_code,
+                "elapsed_ms": elapsed_ms,
+                "message": body.get("message") if isinstance(body, dict) else None,
+                "phases": timer.breakdown(start, headers_at, downloaded_at, parsed_at),
+                "server_timing": parse_server_timing(response.headers.get("Server-Timing")),
+            }
+            return result, body
+        except requests.RequestException as exc:
+            elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+            result = {
+                "name": name,
+                "method": method,
+                "path": path,
+                "status_code": None,
+                "elapsed_ms": elapsed_ms,
+                "message": None,
+                "error": str(exc),
+            }
+            return result, None
 
-def main() -> int:
-    session = requests.Session()
-    results: List[Dict[str, Any]] = []
 
-    login_result, login_body = measure(
+def measure_repeated(
+    session: requests.Session,
+    *,
+    samples: int,
+    warmup: int,
+    before_sample: Optional[Callable[[int], None]] = None,
+    **kwargs: Any,
+) -> Tuple[Dict[str, Any], Union[Dict[str, Any], str, None]]:
+    histogram = LatencyHistogram()
+    # Split by what the server says it did (Server-Timing "cache"), not by what we asked for.
+    by_cache = {"cold": LatencyHistogram(), "warm": LatencyHistogram()}
+    errors = 0
+    phases: List[Dict[str, Any]] = []
+    server_timings: List[Dict[str, Dict[str, Any]]] = []
+    for iteration in range(warmup + samples):
+        if before_sample is not None:
+            before_sample(iteration)
+        result, body = measure(session=session, **kwargs)
+        if iteration < warmup:
+            continue
+        histogram.record(result["elapsed_ms"])
+        if is_error(result):
+            errors += 1
+        if "phases" in result:
+            phases.append(result["phases"])
+            server_timings.append(result["server_timing"])
+            cache = result["server_timing"].get("cache")
+            if cache is not None and not is_error(result):
+                by_cache["cold" if cache["desc"] == "miss" else "warm"].record(result["elapsed_ms"])
+    # Report the median as elapsed_ms so a single slow sample can't decide it.
+    result["elapsed_ms"] = round(histogram.percentile(50), 2)
+    result["samples"] = samples
+    result["warmup"] = warmup
+    result["errors"] = errors
+    result["stats"] = histogram.summary()
+    result["histogram"] = histogram.to_dict()
+    result["phases"] = summarize_phases(phases)
+    result["server_timing"] = summarize_server_timing(server_timings)
+    if any(cached.count for cached in by_cache.values()):
+        result["cache"] = {state: cached.summary() for state, cached in by_cache.items()}
+    return result, body
+
+
+def flush_cache(session: requests.Session, token: str) -> bool:
+    """Empty the API's read cache (admin only), so the next cacheable read is cold."""
+    result, _ = measure(
+        session=session, method="POST", path=CACHE_FLUSH_PATH, name="Cache Flush", token=token
+    )
+    return not is_error(result)
+
+
+def reset_query_stats(session: requests.Session, token: str) -> bool:
+    """Zero the API's per-route query totals (admin only), so they cover just this run."""
+    result, _ = measure(
         session=session,
         method="POST",
-        path="/api/v1/auth/login",
-        name="Auth Login",
+        path=f"{QUERY_STATS_PATH}/reset",
+        name="Query Stats Reset",
+        token=token,
+    )
+    return not is_error(result)
+
+
+def fetch_query_stats(session: requests.Session, token: str) -> Optional[Dict[str, Any]]:
+    result, body = measure(
+        session=session, method="GET", path=QUERY_STATS_PATH, name="Query Stats", token=token
+    )
+    if is_error(result) or not isinstance(body, dict):
+        print(f"Could not fetch {QUERY_STATS_PATH}: {result.get('message')}", file=sys.stderr)
+        return None
+    return body.get("data")
+
+
+def server_side(session: requests.Session, before: Optional[Samples]) -> Optional[Dict[str, Any]]:
+    """Route latency and process numbers for the run, from /metrics scraped before and now."""
+    if before is None:
+        return None
+    after = scrape(session, BASE_URL)
+    if after is None:
+        print("Could not scrape /metrics after the run", file=sys.stderr)
+        return None
+    return {"routes": route_latency(before, after), "process": process_summary(before, after)}
+
+
+def login(
+    session: requests.Session, *, samples: int = 1, warmup: int = 0
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    login_result, login_body = measure_repeated(
+        session,
+        samples=samples,
+        warmup=warmup,
+        **LOGIN_TARGET,
         token=None,
         requires_auth=False,
         json_data=LOGIN_PAYLOAD,
     )
-    results.append(login_result)
-
     if not isinstance(login_body, dict) or not login_body.get("success"):
-        print("Login failed; cannot continue", file=sys.stderr)
-        write_results(results)
-        return 1
-
-    token = login_body["data"]["token"]
-
-    def add_result(
-        method: str,
-        path: str,
-        name: str,
-        *,
-        requires_auth: bool = True,
-        params: Optional[Dict[str, Any]] = None,
-        json_data: Optional[Dict[str, Any]] = None,
-        note: Optional[str] = None,
-    ) -> Tuple[Dict[str, Any], Union[Dict[str, Any], str, None]]:
-        result, body = measure(
-            session=session,
-            method=method,
-            path=path,
-            name=name,
+        return login_result, None
+    return login_result, login_body["data"]["token"]
+
+
+def scenario_builtins() -> Dict[str, str]:
+    return {
+        "sample_date": DATE_SAMPLE,
+        "sample_start": START_TIME,
+        "sample_end": END_TIME,
+    }
+
+
+def run_sweep(
+    token: str,
+    scenario: Dict[str, Any],
+    results: List[Dict[str, Any]],
+    targets: List[Dict[str, Any]],
+    *,
+    samples: int = 1,
+    warmup: int = 0,
+    parallelism: int = 1,
+    cold_cache: bool = False,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
+    steps = {step["name"]: step for step in scenario["steps"]}
+    order = list(steps)
+    emitted = 0
+    pending = dependency_graph(scenario)
+    dependents: Dict[Node, List[Node]] = {node: [] for node in pending}
+    for node, depends in pending.items():
+        for dependency in depends:
+            dependents[dependency].append(node)
+
+    variables = {**scenario_builtins(), **scenario.get("variables", {})}
+    fallbacks: Set[str] = set()
+    local = threading.local()
+    bodies: Dict[str, Any] = {}
+    finished: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+    def flush_every_other(iteration: int) -> None:
+        # Even samples start from an empty cache; odd ones reuse what the even one loaded.
+        if iteration % 2 == 0:
+            flush_cache(local.session, token)
+
+    def send(step: Dict[str, Any], target: Dict[str, Any], note: Optional[str]) -> None:
+        # requests.Session isn't thread-safe, so every worker keeps its own connection pool.
+        if not hasattr(local, "session"):
+            local.session = timed_session()
+        result, body = measure_repeated(
+            local.session,
+            samples=samples,
+            warmup=warmup,
+            before_sample=flush_every_other if cold_cache else None,
             token=token,
-            requires_auth=requires_auth,
-            params=params,
-            json_data=json_data,
+            **target,
         )
         if note and note.strip():
             result["note"] = note
-        results.append(result)
-        return result, body
-
-    add_result("GET", "/health", "Health Check", requires_auth=False)
-    add_result("GET", "/api/v1", "API Info", requires_auth=False)
-    add_result("GET", "/api/v1/auth/profile", "Profile")
-
-    users_result, users_body = add_result("GET", "/api/v1/users", "Users List")
-    user_id = None
-    angkatan_id = None
-    nomor_wa = None
-    if isinstance(users_body, dict) and users_body.get("data"):
-        first_user = users_body["data"][0]
-        user_id = first_user.get("id")
-        angkatan_id = first_user.get("idAngkatan") or (
-            first_user.get("angkatan", {}).get("id") if first_user.get("angkatan") else None
+        bodies[step["name"]] = body
+        finished[step["name"]] = (result, {**target, "weight": step.get("weight", 1)})
+
+    # Requests go to the pool; extracts are cheap and run here, so all shared state
+    # (variables, fallbacks) is only touched from this thread.
+    ready = [node for node, depends in pending.items() if not depends]
+    running: Dict[Any, Node] = {}
+    with ThreadPoolExecutor(max_workers=parallelism) as pool:
+        while ready or running:
+            while ready:
+                node = ready.pop(0)
+                name, phase = node
+                step = steps[name]
+                if phase == REQUEST:
+                    target = resolve_step(step, variables)
+                    note = step_note(step, fallbacks)
+                    running[pool.submit(send, step, target, note)] = node
+                    continue
+                apply_extracts(step, bodies.pop(name), variables, fallbacks)
+                ready.extend(release(node, pending, dependents))
+            if running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    future.result()
+                    ready.extend(release(node, pending, dependents))
+                # Keep the scenario's order in the output whatever order the steps finished
+                # in, handing each result on as soon as every step before it is done.
+                while emitted < len(order) and order[emitted] in finished:
+                    result, target = finished.pop(order[emitted])
+                    results.append(result)
+                    targets.append(target)
+                    if on_result is not None:
+                        on_result(result)
+                    emitted += 1
+
+
+def release(
+    node: Node, pending: Dict[Node, Set[Node]], dependents: Dict[Node, List[Node]]
+) -> List[Node]:
+    unblocked = []
+    for dependent in dependents[node]:
+        pending[dependent].discard(node)
+        if not pending[dependent]:
+            unblocked.append(dependent)
+    return unblocked
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        scenario = load_scenario(args.scenario, builtins=scenario_builtins())
+    except (OSError, ValueError) as exc:
+        print(f"Cannot load scenario {args.scenario}: {exc}", file=sys.stderr)
+        return 2
+
+    session = timed_session()
+    results: List[Dict[str, Any]] = []
+    # Sweep results are streamed to disk as they come in; load mode only writes its report.
+    with JsonlSink(OUTPUT_PATH) if args.mode == "sweep" else nullcontext() as sink:
+        login_result, token = login(session, samples=args.samples, warmup=args.warmup)
+        results.append(login_result)
+        if sink is not None:
+            sink.write(login_result)
+
+        if not token:
+            print("Login failed; cannot continue", file=sys.stderr)
+            return 1
+        if args.cold_cache and not flush_cache(session, token):
+            print("--cold-cache needs an admin login to flush the cache", file=sys.stderr)
+            return 1
+        if args.query_stats and not reset_query_stats(session, token):
+            print("--query-stats needs an admin login", file=sys.stderr)
+            return 1
+        metrics_before = scrape(session, BASE_URL) if args.server_metrics else None
+        if args.server_metrics and metrics_before is None:
+            print("--server-metrics needs the API's /metrics endpoint", file=sys.stderr)
+            return 1
+
+        targets: List[Dict[str, Any]] = []
+        sweep_started = time.perf_counter()
+        if args.mode in ("load", "soak", "open"):
+            # Discovery only: the load phase below produces the numbers.
+            run_sweep(token, scenario, results, targets, parallelism=args.parallel)
+        else:
+            run_sweep(
+                token,
+                scenario,
+                results,
+                targets,
+                samples=args.samples,
+                warmup=args.warmup,
+                parallelism=args.parallel,
+                cold_cache=args.cold_cache,
+                on_result=sink.write if sink is not None else None,
+            )
+        print(
+            f"Swept {len(targets)} endpoints in {time.perf_counter() - sweep_started:.2f}s"
+            f" ({args.parallel} workers, longest dependency chain"
+            f" {critical_path_length(dependency_graph(scenario))} steps)"
         )
-        nomor_wa = first_user.get("nomorWa")
 
-    add_result(
-        "GET",
-        f"/api/v1/users/{user_id or '1'}",
-        "User Detail",
-        note="Fallback ID used" if not user_id else None,
-    )
-    add_result(
-        "GET",
-        f"/api/v1/users/angkatan/{angkatan_id or '1'}",
-        "Users By Angkatan",
-        note="Fallback angkatanId used" if not angkatan_id else None,
-    )
-    add_result(
-        "GET",
-        f"/api/v1/users/wa/{(nomor_wa or '+6281234567890').replace('+', '%2B')}",
-        "User By WhatsApp",
-        note="Fallback nomorWa used" if not nomor_wa else None,
-    )
+        if args.mode == "load":
+            report = run_load(
+                targets,
+                users=args.users,
+                duration_s=args.duration,
+                rate=args.rate,
+            )
+            if args.query_stats:
+                stats = fetch_query_stats(session, token)
+                if stats is not None:
+                    report["query_stats"] = stats
+                    merge_query_stats(report["endpoints"], stats)
+            server = server_side(session, metrics_before)
+            if server is not None:
+                report["server_process"] = server["process"]
+                merge_server_metrics(report["endpoints"], server["routes"])
+            write_report(report, LOAD_OUTPUT_PATH)
+            print_load_report(report)
+            if "query_stats" in report:
+                print_query_report(report["endpoints"], report["query_stats"].get("slowQueryMs"))
+            if server is not None:
+                print_server_report(report["endpoints"], server["process"])
+            print(f"Saved load report to {LOAD_OUTPUT_PATH}")
+            return 0 if report["totals"]["requests"] else 1
 
-    communal_result, communal_body = add_result("GET", "/api/v1/communal", "Communal List")
-    communal_id = None
-    if isinstance(communal_body, dict) and communal_body.get("data"):
-        first_communal = communal_body["data"][0]
-        communal_id = first_communal.get("id")
-        communal_penanggung = first_communal.get("idPenanggungJawab")
-        communal_lantai = first_communal.get("lantai")
-    else:
-        communal_penanggung = user_id or "1"
-        communal_lantai = "1"
-
-    add_result(
-        "GET",
-        f"/api/v1/communal/{communal_id or '1'}",
-        "Communal Detail",
-        note="Fallback ID used" if not communal_id else None,
-    )
-    add_result(
-        "GET",
-        f"/api/v1/communal/penanggung-jawab/{communal_penanggung}",
-        "Communal By Penanggung Jawab",
-    )
-    add_result(
-        "GET",
-        f"/api/v1/communal/lantai/{communal_lantai}",
-        "Communal By Lantai",
-    )
-    add_result(
-        "GET",
-        f"/api/v1/communal/available-slots/{DATE_SAMPLE}/{communal_lantai}",
-        "Communal Available Slots",
-    )
-    add_result(
-        "GET",
-        "/api/v1/communal/time-slots",
-        "Communal Time Slots",
-        params={"date": DATE_SAMPLE},
-    )
+        if args.mode == "open":
+            report = run_open(
+                targets,
+                token=token,
+                rate=args.rate,
+                duration_s=args.duration,
+                arrival=args.arrival,
+                connections=args.connections,
+            )
+            server = server_side(session, metrics_before)
+            if server is not None:
+                report["server_process"] = server["process"]
+                merge_server_metrics(report["endpoints"], server["routes"])
+            write_report(report, OPEN_OUTPUT_PATH)
+            print_open_report(report)
+            if server is not None:
+                print_server_report(report["endpoints"], server["process"])
+            print(f"Saved open-model report to {OPEN_OUTPUT_PATH}")
+            return 0 if report["totals"]["requests"] else 1
 
-    serbaguna_result, serbaguna_body = add_result(
-        "GET", "/api/v1/serbaguna", "Serbaguna List"
-    )
-    serbaguna_id = None
-    serbaguna_penanggung = None
-    serbaguna_area = None
-    if isinstance(serbaguna_body, dict) and serbaguna_body.get("data"):
-        first_serbaguna = serbaguna_body["data"][0]
-        serbaguna_id = first_serbaguna.get("id")
-        serbaguna_penanggung = first_serbaguna.get("idPenanggungJawab")
-        serbaguna_area = first_serbaguna.get("idArea")
-    if not serbaguna_penanggung:
-        serbaguna_penanggung = user_id or "1"
-    if not serbaguna_area:
-        serbaguna_area = "1"
-
-    add_result(
-        "GET",
-        f"/api/v1/serbaguna/{serbaguna_id or '1'}",
-        "Serbaguna Detail",
-        note="Fallback ID used" if not serbaguna_id else None,
-    )
-    add_result(
-        "GET",
-        f"/api/v1/serbaguna/penanggung-jawab/{serbaguna_penanggung}",
-        "Serbaguna By Penanggung Jawab",
+        if args.mode == "soak":
+            report = run_soak(
+                targets,
+                users=args.users,
+                duration_s=args.duration,
+                window_s=args.window,
+                rate=args.rate,
+                pid=args.pid,
+            )
+            if args.query_stats:
+                report["query_stats"] = fetch_query_stats(session, token)
+            server = server_side(session, metrics_before)
+            if server is not None:
+                # Per-window client numbers are already in the report; the server adds totals.
+                report["server"] = server
+            write_report(report, SOAK_REPORT_PATH)
+            print_drift_report(report)
+            print(f"Saved soak windows to {SOAK_OUTPUT_PATH} and report to {SOAK_REPORT_PATH}")
+            return 0 if report["totals"]["requests"] else 1
+
+        if args.phases:
+            print_phase_report(results)
+        if args.cold_cache:
+            print_cache_report(results)
+        if args.query_stats:
+            stats = fetch_query_stats(session, token)
+            if stats is not None:
+                # The JSONL rows are already on disk; the merged totals go to their own file.
+                merge_query_stats(results, stats)
+                write_report(
+                    {
+                        "base_url": BASE_URL,
+                        "server": stats,
+                        "endpoints": [
+                            {"name": result["name"], **result["db"]}
+                            for result in results
+                            if "db" in result
+                        ],
+                    },
+                    QUERY_STATS_OUTPUT_PATH,
+                )
+                print_query_report(results, stats.get("slowQueryMs"))
+                print(f"Saved per-route query stats to {QUERY_STATS_OUTPUT_PATH}")
+        server = server_side(session, metrics_before)
+        if server is not None:
+            merge_server_metrics(results, server["routes"])
+            write_report(
+                {
+                    "base_url": BASE_URL,
+                    "process": server["process"],
+                    "endpoints": [
+                        {
+                            "name": result["name"],
+                            "client": result.get("stats"),
+                            "server": result["server"],
+                        }
+                        for result in results
+                        if "server" in result
+                    ],
+                },
+                SERVER_METRICS_OUTPUT_PATH,
+            )
+            print_server_report(results, server["process"])
+            print(f"Saved server-side metrics to {SERVER_METRICS_OUTPUT_PATH}")
+        print(f"Saved results for {len(results)} endpoints to {OUTPUT_PATH}")
+        if not args.no_history:
+            append_run(
+                build_run(
+                    results,
+                    base_url=BASE_URL,
+                    dataset=DATASET["name"] if DATASET else None,
+                    scenario=scenario.get("name"),
+                    samples=args.samples,
+                    warmup=args.warmup,
+                    parallel=args.parallel,
+                )
+            )
+            print(f"Appended run to {HISTORY_PATH}")
+        return 0
+
+
+# Hands out send slots shared by every virtual user so the combined rate stays at `rate`/s.
+class RequestPacer:
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate
+        self.next_at = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def wait(self, deadline: float) -> bool:
+        with self.lock:
+            now = time.perf_counter()
+            slot = max(self.next_at, now)
+            self.next_at = slot + self.interval
+        if slot >= deadline:
+            return False
+        delay = slot - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        return True
+
+
+def is_error(result: Dict[str, Any]) -> bool:
+    status = result.get("status_code")
+    return status is None or status >= 400
+
+
+def drive_users(
+    targets: List[Dict[str, Any]],
+    *,
+    users: int,
+    duration_s: float,
+    rate: Optional[float],
+    record: Callable[[Dict[str, Any]], None],
+) -> None:
+    """Run `users` virtual users against the targets until duration_s has passed."""
+    # Virtual users pick endpoints at random in proportion to each scenario step's weight.
+    requests_to_send = [
+        {key: value for key, value in target.items() if key != "weight"} for target in targets
+    ]
+    cum_weights = list(itertools.accumulate(target.get("weight", 1) for target in targets))
+    pacer = RequestPacer(rate) if rate else None
+
+    def virtual_user(index: int) -> None:
+        session = timed_session()
+        login_result, token = login(session)
+        record(login_result)
+        if not token:
+            return
+        rng = random.Random(index)
+        while True:
+            if pacer is not None:
+                if not pacer.wait(deadline):
+                    return
+            elif time.perf_counter() >= deadline:
+                return
+            target = rng.choices(requests_to_send, cum_weights=cum_weights)[0]
+            result, _ = measure(session=session, token=token, **target)
+            record(result)
+
+    deadline = time.perf_counter() + duration_s
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        list(pool.map(virtual_user, range(users)))
+
+
+def run_load(
+    targets: List[Dict[str, Any]],
+    *,
+    users: int,
+    duration_s: float,
+    rate: Optional[float] = None,
+) -> Dict[str, Any]:
+    endpoints: Dict[str, Dict[str, Any]] = {}
+    for target in [LOGIN_TARGET, *targets]:
+        endpoints[target["name"]] = {
+            "name": target["name"],
+            "method": target["method"],
+            "path": target["path"],
+            "requests": 0,
+            "errors": 0,
+            "histogram": LatencyHistogram(),
+        }
+    lock = threading.Lock()
+
+    def record(result: Dict[str, Any]) -> None:
+        with lock:
+            entry = endpoints[result["name"]]
+            entry["requests"] += 1
+            entry["histogram"].record(result["elapsed_ms"])
+            if is_error(result):
+                entry["errors"] += 1
+
+    started = time.perf_counter()
+    drive_users(targets, users=users, duration_s=duration_s, rate=rate, record=record)
+    elapsed_s = time.perf_counter() - started
+
+    rows = []
+    total_requests = 0
+    total_errors = 0
+    for entry in endpoints.values():
+        histogram = entry.pop("histogram")
+        requests_made = entry["requests"]
+        total_requests += requests_made
+        total_errors += entry["errors"]
+        entry["error_rate"] = round(entry["errors"] / requests_made, 4) if requests_made else 0.0
+        entry["throughput_rps"] = round(requests_made / elapsed_s, 2)
+        entry["stats"] = histogram.summary()
+        entry["histogram"] = histogram.to_dict()
+        rows.append(entry)
+
+    return {
+        "mode": "load",
+        "base_url": BASE_URL,
+        "dataset": dataset_summary(DATASET),
+        "users": users,
+        "duration_s": duration_s,
+        "target_rate": rate,
+        "elapsed_s": round(elapsed_s, 2),
+        "totals": {
+            "requests": total_requests,
+            "errors": total_errors,
+            "error_rate": round(total_errors / total_requests, 4) if total_requests else 0.0,
+            "throughput_rps": round(total_requests / elapsed_s, 2),
+        },
+        "endpoints": rows,
+    }
+
+
+def run_open(
+    targets: List[Dict[str, Any]],
+    *,
+    token: str,
+    rate: float,
+    duration_s: float,
+    arrival: str = OPEN_ARRIVAL,
+    connections: int = OPEN_CONNECTIONS,
+) -> Dict[str, Any]:
+    """Open-model load: arrivals at `rate`/s whatever the responses do (see open_model)."""
+    run = asyncio.run(
+        drive_arrivals(
+            BASE_URL,
+            targets,
+            token=token,
+            rate=rate,
+            duration_s=duration_s,
+            arrival=arrival,
+            connections=connections,
+            timeout_s=OPEN_TIMEOUT_S,
+            max_in_flight=OPEN_MAX_IN_FLIGHT,
+        )
     )
-    add_result(
-        "GET",
-        f"/api/v1/serbaguna/area/{serbaguna_area}",
-        "Serbaguna By Area",
+    elapsed_s = run["elapsed_s"]
+    rows = []
+    total_requests = 0
+    total_errors = 0
+    for target in targets:
+        entry = run["endpoints"].pop(target["name"], None)
+        if entry is None:
+            continue
+        requests_made = entry["requests"]
+        total_requests += requests_made
+        total_errors += entry["errors"]
+        rows.append(
+            {
+                "name": target["name"],
+                "method": target["method"],
+                "path": target["path"],
+                "requests": requests_made,
+                "errors": entry["errors"],
+                "error_rate": round(entry["errors"] / requests_made, 4) if requests_made else 0.0,
+                "throughput_rps": round(requests_made / elapsed_s, 2),
+                # From the intended start: what a user arriving then would have waited.
+                "stats": entry["response"].summary(),
+                # From the moment the request went out: what a closed loop would report.
+                "service": entry["service"].summary(),
+                "histogram": entry["response"].to_dict(),
+            }
+        )
+
+    return {
+        "mode": "open",
+        "base_url": BASE_URL,
+        "dataset": dataset_summary(DATASET),
+        "arrival": arrival,
+        "target_rate": rate,
+        "connections": connections,
+        "duration_s": duration_s,
+        "elapsed_s": round(elapsed_s, 2),
+        "totals": {
+            "requests": total_requests,
+            "errors": total_errors,
+            "error_rate": round(total_errors / total_requests, 4) if total_requests else 0.0,
+            "throughput_rps": round(total_requests / elapsed_s, 2),
+            "dropped": run["dropped"],
+            "connections_opened": run["connections_opened"],
+        },
+        "scheduler_lag": run["scheduler_lag"].summary(),
+        "endpoints": rows,
+    }
+
+
+def run_soak(
+    targets: List[Dict[str, Any]],
+    *,
+    users: int,
+    duration_s: float,
+    window_s: float,
+    rate: Optional[float] = None,
+    pid: Optional[int] = None,
+) -> Dict[str, Any]:
+    recorder = WindowRecorder(ProcessSampler(pid) if pid else None)
+    windows: List[Dict[str, Any]] = []
+    driver = threading.Thread(
+        target=drive_users,
+        args=(targets,),
+        kwargs={
+            "users": users,
+            "duration_s": duration_s,
+            "rate": rate,
+            "record": lambda result: recorder.record(result["elapsed_ms"], is_error(result)),
+        },
+        daemon=True,
     )
-    add_result("GET", "/api/v1/serbaguna/areas", "Serbaguna Areas")
-    add_result(
-        "GET",
-        "/api/v1/serbaguna/time-slots",
-        "Serbaguna Time Slots",
-        params={"date": DATE_SAMPLE, "areaId": serbaguna_area},
+
+    # Windows stream to disk as they close; only their summary rows stay in memory,
+    # for the drift fit, not the requests behind them.
+    with JsonlSink(SOAK_OUTPUT_PATH) as sink:
+
+        def close_window() -> None:
+            window = recorder.roll()
+            windows.append(window)
+            sink.write(window)
+            print_soak_window(window)
+
+        driver.start()
+        next_roll = recorder.started + window_s
+        while True:
+            driver.join(max(next_roll - time.perf_counter(), 0))
+            if not driver.is_alive():
+                break
+            close_window()
+            next_roll += window_s
+        # The last, partial window; skipped when the run ended right on a boundary.
+        # It is kept in the JSONL, but drift() leaves a short one out of the fit.
+        if recorder.requests:
+            close_window()
+
+    elapsed_s = time.perf_counter() - recorder.started
+    total_requests = recorder.total_requests
+    return {
+        "mode": "soak",
+        "base_url": BASE_URL,
+        "dataset": dataset_summary(DATASET),
+        "users": users,
+        "duration_s": duration_s,
+        "window_s": window_s,
+        "target_rate": rate,
+        "pid": pid,
+        "elapsed_s": round(elapsed_s, 2),
+        "windows": len(windows),
+        "windows_path": str(SOAK_OUTPUT_PATH),
+        "totals": {
+            "requests": total_requests,
+            "errors": recorder.total_errors,
+            "error_rate": (
+                round(recorder.total_errors / total_requests, 4) if total_requests else 0.0
+            ),
+            "throughput_rps": round(total_requests / elapsed_s, 2),
+            "stats": recorder.total.summary(),
+        },
+        "drift": drift(windows, window_s),
+    }
+
+
+def print_soak_window(window: Dict[str, Any]) -> None:
+    process = window["process"] or {}
+    resources = ""
+    if process:
+        cpu = f"{process['cpu_pct']:.1f}%" if process["cpu_pct"] is not None else "-"
+        resources = f"  rss {process['rss_mb']:.1f} MB  cpu {cpu}"
+    percentiles = " ".join(
+        f"{label} {window[key]:.2f}" if window[key] is not None else f"{label} -"
+        for label, key in (("p50", "p50_ms"), ("p90", "p90_ms"), ("p99", "p99_ms"))
     )
-    add_result(
-        "GET",
-        f"/api/v1/serbaguna/available-slots/{DATE_SAMPLE}/{serbaguna_area}",
-        "Serbaguna Available Slots",
+    minutes, seconds = divmod(int(window["offset_s"]), 60)
+    print(
+        f"[+{minutes // 60:d}:{minutes % 60:02d}:{seconds:02d}] {window['requests']:>7} req"
+        f" {window['throughput_rps']:>8.2f} req/s  {percentiles} ms"
+        f"  err {window['error_rate'] * 100:.2f}%{resources}",
+        flush=True,
     )
 
-    dapur_result, dapur_body = add_result("GET", "/api/v1/dapur", "Dapur List")
-    dapur_id = None
-    dapur_peminjam = user_id or "1"
-    dapur_fasilitas = "1"
-    if isinstance(dapur_body, dict) and dapur_body.get("data"):
-        first_dapur = dapur_body["data"][0]
-        dapur_id = first_dapur.get("id")
-        dapur_peminjam = first_dapur.get("idPeminjam", dapur_peminjam)
-        dapur_fasilitas = first_dapur.get("idFasilitas", dapur_fasilitas)
-
-    add_result(
-        "GET",
-        f"/api/v1/dapur/{dapur_id or '1'}",
-        "Dapur Detail",
-        note="Fallback ID used" if not dapur_id else None,
+
+def print_drift_report(report: Dict[str, Any]) -> None:
+    print(f"{'METRIC':<16} {'START':>12} {'END':>12} {'PER HOUR':>12} {'CHANGE':>9}")
+    for metric, trend in report["drift"].items():
+        change = f"{trend['change_pct']:+.2f}%" if trend["change_pct"] is not None else "-"
+        print(
+            f"{metric:<16} {trend['start']:>12.3f} {trend['end']:>12.3f}"
+            f" {trend['slope_per_hour']:>+12.4f} {change:>9}"
+        )
+
+
+def print_load_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'ENDPOINT':<36} {'REQS':>7} {'ERR%':>7} {'REQ/S':>9}"
+        f" {'P50 ms':>9} {'P90 ms':>9} {'P99 ms':>9}"
     )
-    add_result(
-        "GET",
-        f"/api/v1/dapur/peminjam/{dapur_peminjam}",
-        "Dapur By Peminjam",
+    for row in report["endpoints"]:
+        stats = row["stats"]
+        percentiles = " ".join(
+            f"{stats[key]:>9.2f}" if stats[key] is not None else f"{'-':>9}"
+            for key in ("p50_ms", "p90_ms", "p99_ms")
+        )
+        print(
+            f"{row['name']:<36} {row['requests']:>7} {row['error_rate'] * 100:>6.2f}%"
+            f" {row['throughput_rps']:>9.2f} {percentiles}"
+        )
+    totals = report["totals"]
+    print(
+        f"{'TOTAL':<36} {totals['requests']:>7} {totals['error_rate'] * 100:>6.2f}%"
+        f" {totals['throughput_rps']:>9.2f}"
     )
-    add_result(
-        "GET",
-        f"/api/v1/dapur/fasilitas/{dapur_fasilitas}",
-        "Dapur By Fasilitas",
+
+
+def print_open_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'ENDPOINT':<36} {'REQS':>7} {'ERR%':>7} {'REQ/S':>9}"
+        f" {'P50 ms':>9} {'P99 ms':>9} {'SVC P50':>9} {'SVC P99':>9}"
     )
-    add_result("GET", "/api/v1/dapur/facilities", "Dapur Facilities")
-    add_result(
-        "GET",
-        "/api/v1/dapur/time-range",
-        "Dapur By Time Range",
-        params={"startTime": START_TIME, "endTime": END_TIME},
+    for row in report["endpoints"]:
+        values = " ".join(
+            f"{stats[key]:>9.2f}" if stats[key] is not None else f"{'-':>9}"
+            for stats in (row["stats"], row["service"])
+            for key in ("p50_ms", "p99_ms")
+        )
+        print(
+            f"{row['name']:<36} {row['requests']:>7} {row['error_rate'] * 100:>6.2f}%"
+            f" {row['throughput_rps']:>9.2f} {values}"
+        )
+    totals = report["totals"]
+    print(
+        f"{'TOTAL':<36} {totals['requests']:>7} {totals['error_rate'] * 100:>6.2f}%"
+        f" {totals['throughput_rps']:>9.2f}"
+        f"  ({report['arrival']} arrivals at {report['target_rate']:g}/s,"
+        f" {totals['connections_opened']} connections)"
     )
-    add_result(
-        "GET",
-        "/api/v1/dapur/time-slots",
-        "Dapur Time Slots",
-        params={"date": DATE_SAMPLE, "facilityId": dapur_fasilitas},
+    print("P50/P99 run from each request's intended start; SVC from when it was sent.")
+    if totals["dropped"]:
+        print(
+            f"  {totals['dropped']} arrivals dropped with {OPEN_MAX_IN_FLIGHT} requests"
+            " unanswered: the server fell this far behind the offered rate"
+        )
+    lag_p99 = report["scheduler_lag"]["p99_ms"]
+    if lag_p99 is not None and lag_p99 > OPEN_LAG_WARN_MS:
+        print(
+            f"  arrivals started up to {lag_p99:.1f} ms late (p99): the generator could not"
+            " keep up, so part of the latency above is client-side; lower --rate"
+        )
+
+
+def print_phase_report(results: List[Dict[str, Any]]) -> None:
+    columns = " ".join(f"{phase[:-3].upper() + ' ms':>11}" for phase in PHASES)
+    print(f"{'ENDPOINT':<36} {'NEW':>4} {columns}  SERVER-TIMING")
+    for result in results:
+        phases = result.get("phases")
+        if not phases:
+            continue
+        values = " ".join(f"{phases[phase]:>11.2f}" for phase in PHASES)
+        server = " ".join(
+            f"{name}={metric['dur']:.2f}" if metric["dur"] is not None else name
+            for name, metric in result.get("server_timing", {}).items()
+        )
+        print(f"{result['name']:<36} {phases['new_connections']:>4} {values}  {server or '-'}")
+
+
+def print_cache_report(results: List[Dict[str, Any]]) -> None:
+    print(
+        f"{'ENDPOINT':<36} {'COLD':>5} {'COLD P50':>9} {'WARM':>5} {'WARM P50':>9} {'SPEEDUP':>8}"
     )
+    for result in results:
+        cache = result.get("cache")
+        if not cache:
+            continue
+        empty = {"count": 0, "p50_ms": None}
+        cold, warm = cache.get("cold", empty), cache.get("warm", empty)
+        speedup = (
+            f"{cold['p50_ms'] / warm['p50_ms']:.1f}x" if cold["p50_ms"] and warm["p50_ms"] else "-"
+        )
+        print(
+            f"{result['name']:<36} {cold['count']:>5} {cold['p50_ms'] or 0:>9.2f}"
+            f" {warm['count']:>5} {warm['p50_ms'] or 0:>9.2f} {speedup:>8}"
+        )
+
 
-    cewe_result, cewe_body = add_result(
-        "GET", "/api/v1/mesin-cuci-cewe", "Mesin Cuci Cewe List"
+def write_report(report: Dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Measure Kaizen API response times.")
+    parser.add_argument(
+        "--mode",
+        choices=["sweep", "load", "soak", "open"],
+        default="sweep",
+        help=(
+            "sweep hits every endpoint once; load replays them with concurrent virtual users;"
+            " soak keeps a steady load running for hours and tracks drift per time window;"
+            " open starts requests at --rate per second however slowly earlier ones finish"
+        ),
     )
-    cewe_id = None
-    cewe_peminjam = user_id or "1"
-    cewe_fasilitas = "1"
-    if isinstance(cewe_body, dict) and cewe_body.get("data"):
-        first_cewe = cewe_body["data"][0]
-        cewe_id = first_cewe.get("id")
-        cewe_peminjam = first_cewe.get("idPeminjam", cewe_peminjam)
-        cewe_fasilitas = first_cewe.get("idFasilitas", cewe_fasilitas)
-
-    add_result(
-        "GET",
-        f"/api/v1/mesin-cuci-cewe/{cewe_id or '1'}",
-        "Mesin Cuci Cewe Detail",
-        note="Fallback ID used" if not cewe_id else None,
+    parser.add_argument(
+        "--users", type=int, default=LOAD_USERS, help="concurrent virtual users (load/soak mode)"
     )
-    add_result(
-        "GET",
-        f"/api/v1/mesin-cuci-cewe/peminjam/{cewe_peminjam}",
-        "Mesin Cuci Cewe By Peminjam",
+    parser.add_argument(
+        "--duration",
+        type=float,
+        default=None,
+        help=(
+            f"seconds to keep generating load (default {LOAD_DURATION_S:g} in load mode,"
+            f" {SOAK_DURATION_S:g} in soak mode)"
+        ),
     )
-    add_result(
-        "GET",
-        f"/api/v1/mesin-cuci-cewe/fasilitas/{cewe_fasilitas}",
-        "Mesin Cuci Cewe By Fasilitas",
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=float(LOAD_RATE) if LOAD_RATE else None,
+        help=(
+            "target requests per second across all users; unpaced when omitted (load/soak"
+            " mode). Required in open mode: the arrival rate"
+        ),
     )
-    add_result("GET", "/api/v1/mesin-cuci-cewe/facilities", "Mesin Cuci Cewe Facilities")
-    add_result(
-        "GET",
-        "/api/v1/mesin-cuci-cewe/time-range",
-        "Mesin Cuci Cewe By Time Range",
-        params={"startTime": START_TIME, "endTime": END_TIME},
+    parser.add_argument(
+        "--arrival",
+        choices=["poisson", "fixed"],
+        default=OPEN_ARRIVAL,
+        help="Poisson (exponential gaps) or evenly spaced arrivals (open mode)",
     )
-    add_result(
-        "GET",
-        "/api/v1/mesin-cuci-cewe/time-slots",
-        "Mesin Cuci Cewe Time Slots",
-        params={"date": DATE_SAMPLE, "facilityId": cewe_fasilitas},
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=OPEN_CONNECTIONS,
+        help="keep-alive connections the arrivals share (open mode)",
     )
-
-    cowo_result, cowo_body = add_result(
-        "GET", "/api/v1/mesin-cuci-cowo", "Mesin Cuci Cowo List"
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=SOAK_WINDOW_S,
+        help="seconds per latency/throughput window (soak mode)",
     )
-    cowo_id = None
-    cowo_peminjam = user_id or "1"
-    cowo_fasilitas = "1"
-    if isinstance(cowo_body, dict) and cowo_body.get("data"):
-        first_cowo = cowo_body["data"][0]
-        cowo_id = first_cowo.get("id")
-        cowo_peminjam = first_cowo.get("idPeminjam", cowo_peminjam)
-        cowo_fasilitas = first_cowo.get("idFasilitas", cowo_fasilitas)
-
-    add_result(
-        "GET",
-        f"/api/v1/mesin-cuci-cowo/{cowo_id or '1'}",
-        "Mesin Cuci Cowo Detail",
-        note="Fallback ID used" if not cowo_id else None,
+    parser.add_argument(
+        "--pid",
+        type=int,
+        default=int(SOAK_PID) if SOAK_PID else None,
+        help="local API server process whose RSS and CPU are sampled every window (soak mode)",
     )
-    add_result(
-        "GET",
-        f"/api/v1/mesin-cuci-cowo/peminjam/{cowo_peminjam}",
-        "Mesin Cuci Cowo By Peminjam",
+    parser.add_argument(
+        "--scenario",
+        type=Path,
+        default=SCENARIO_PATH,
+        help="JSON scenario listing the endpoints to hit (default: scenarios/baseline.json)",
     )
-    add_result(
-        "GET",
-        f"/api/v1/mesin-cuci-cowo/fasilitas/{cowo_fasilitas}",
-        "Mesin Cuci Cowo By Fasilitas",
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=SAMPLES,
+        help="timed requests per endpoint (sweep mode)",
     )
-    add_result("GET", "/api/v1/mesin-cuci-cowo/facilities", "Mesin Cuci Cowo Facilities")
-    add_result(
-        "GET",
-        "/api/v1/mesin-cuci-cowo/time-range",
-        "Mesin Cuci Cowo By Time Range",
-        params={"startTime": START_TIME, "endTime": END_TIME},
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=WARMUP,
+        help="untimed requests sent to each endpoint before sampling (sweep mode)",
     )
-    add_result(
-        "GET",
-        "/api/v1/mesin-cuci-cowo/time-slots",
-        "Mesin Cuci Cowo Time Slots",
-        params={"date": DATE_SAMPLE, "facilityId": cowo_fasilitas},
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=SWEEP_PARALLELISM,
+        help=(
+            "workers running independent scenario steps at once; use 1 for a strictly "
+            "sequential sweep with no cross-request contention"
+        ),
     )
-
-    cws_result, cws_body = add_result("GET", "/api/v1/cws", "CWS List")
-    cws_id = None
-    cws_penanggung = user_id or "1"
-    if isinstance(cws_body, dict) and cws_body.get("data"):
-        first_cws = cws_body["data"][0]
-        cws_id = first_cws.get("id")
-        cws_penanggung = first_cws.get("idPenanggungJawab", cws_penanggung)
-
-    add_result(
-        "GET",
-        f"/api/v1/cws/{cws_id or '1'}",
-        "CWS Detail",
-        note="Fallback ID used" if not cws_id else None,
+    parser.add_argument(
+        "--phases",
+        action="store_true",
+        help="print each endpoint's median connection, TTFB, download and parse times (sweep mode)",
     )
-    add_result(
-        "GET",
-        f"/api/v1/cws/penanggung-jawab/{cws_penanggung}",
-        "CWS By Penanggung Jawab",
+    parser.add_argument(
+        "--cold-cache",
+        action="store_true",
+        help="flush the API read cache before every other sample and report cold and warm "
+        "latency separately (needs an admin login; runs the sweep sequentially)",
     )
-    add_result(
-        "GET",
-        f"/api/v1/cws/date/{DATE_SAMPLE}",
-        "CWS By Date",
+    parser.add_argument(
+        "--query-stats",
+        action="store_true",
+        help="reset the API's per-route query totals first and merge them into the report "
+        "afterwards (needs an admin login)",
     )
-    add_result(
-        "GET",
-        "/api/v1/cws/time-slots",
-        "CWS Time Slots",
-        params={"date": DATE_SAMPLE},
+    parser.add_argument(
+        "--server-metrics",
+        action="store_true",
+        help="scrape the API's /metrics before and after the run and report server-side "
+        "latency next to the client-side numbers",
     )
-    add_result(
-        "GET",
-        "/api/v1/cws/time-suggestions",
-        "CWS Time Suggestions",
-        params={"date": DATE_SAMPLE},
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="don't append this sweep to the history used by compare_response_times.py",
     )
-
-    write_results(results)
-    print(f"Saved results for {len(results)} endpoints to {OUTPUT_PATH}")
-    return 0
-
-
-def write_results(results: List[Dict[str, Any]]) -> None:
-    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
-        json.dump(results, fh, indent=2)
+    args = parser.parse_args()
+    if args.cold_cache:
+        # A flush empties the whole cache, so parallel workers would cool each other's warm samples.
+        args.parallel = 1
+    if args.duration is None:
+        args.duration = SOAK_DURATION_S if args.mode == "soak" else LOAD_DURATION_S
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup must not be negative")
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+    if args.duration <= 0:
+        parser.error("--duration must be positive")
+    if args.rate is not None and args.rate <= 0:
+        parser.error("--rate must be positive")
+    if args.mode == "open" and args.rate is None:
+        parser.error("open mode needs --rate (or KAIZEN_LOAD_RATE)")
+    if args.connections < 1:
+        parser.error("--connections must be at least 1")
+    if args.window <= 0:
+        parser.error("--window must be positive")
+    if args.pid is not None and not Path(f"/proc/{args.pid}/stat").exists():
+        parser.error(f"--pid {args.pid}: no such process in /proc")
+    return args
 
 
 if __name__ == "__main__":
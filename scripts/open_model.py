@@ -0,0 +1,215 @@
+import asyncio
+import itertools
+import json
+import random
+import ssl
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from latency_stats import LatencyHistogram
+
+Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+class HttpPool:
+    """Keep-alive HTTP/1.1 connections to one server, at most `size` in use at a time.
+
+    Just enough HTTP for the API (Content-Length and chunked bodies), on asyncio streams
+    like stub_server.py, so one process can keep thousands of requests a second in flight.
+    """
+
+    def __init__(self, base_url: str, size: int) -> None:
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.prefix = parts.path.rstrip("/")
+        self.idle: Deque[Connection] = deque()
+        self.slots = asyncio.Semaphore(size)
+        self.opened = 0
+
+    def encode(
+        self,
+        method: str,
+        path: str,
+        *,
+        token: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        """A complete request, built once and written as-is for every arrival."""
+        target = self.prefix + path
+        if params:
+            target += ("&" if "?" in target else "?") + urlencode(params)
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {self.host}:{self.port}"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        if token:
+            lines.append(f"Authorization: Bearer {token}")
+        body = b""
+        if json_data is not None:
+            body = json.dumps(json_data).encode("utf-8")
+            lines += ["Content-Type: application/json", f"Content-Length: {len(body)}"]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+    async def request(self, payload: bytes) -> Tuple[int, float]:
+        """Send one encoded request: status code and when it went out (after any wait)."""
+        async with self.slots:
+            sent_at = time.perf_counter()
+            reused = bool(self.idle)
+            connection = self.idle.pop() if reused else await self.open()
+            try:
+                status, keep_alive = await self.exchange(connection, payload)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                connection[1].close()
+                if not reused:
+                    raise
+                # The server closed an idle connection under us; once more on a fresh one.
+                connection = await self.open()
+                status, keep_alive = await self.exchange(connection, payload)
+            except BaseException:
+                # Timed out or cancelled mid-response: the connection is in an unknown state.
+                connection[1].close()
+                raise
+            if keep_alive:
+                self.idle.append(connection)
+            else:
+                connection[1].close()
+            return status, sent_at
+
+    async def open(self) -> Connection:
+        self.opened += 1
+        return await asyncio.open_connection(self.host, self.port, ssl=self.ssl)
+
+    async def exchange(self, connection: Connection, payload: bytes) -> Tuple[int, bool]:
+        reader, writer = connection
+        writer.write(payload)
+        await writer.drain()
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed before the response")
+        status = int(status_line.split()[1])
+        length, chunked, keep_alive = None, False, True
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip().lower()
+            if name == "content-length":
+                length = int(value)
+            elif name == "transfer-encoding":
+                chunked = "chunked" in value
+            elif name == "connection":
+                keep_alive = value != "close"
+        if chunked:
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                await reader.readexactly(size + 2)
+        elif length is not None:
+            await reader.readexactly(length)
+        elif status not in (204, 304):
+            # No framing: the body runs to the end of the connection.
+            await reader.read()
+            keep_alive = False
+        return status, keep_alive
+
+
+async def drive_arrivals(
+    base_url: str,
+    targets: List[Dict[str, Any]],
+    *,
+    token: Optional[str],
+    rate: float,
+    duration_s: float,
+    arrival: str,
+    connections: int,
+    timeout_s: float,
+    max_in_flight: int,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Start requests on an arrival clock, whatever happened to the ones before.
+
+    Arrivals are Poisson (exponential gaps) or evenly spaced at `rate` per second. Each
+    request's latency runs from its intended start, not from when a connection was free
+    or the previous response came back, so a stalled server shows up as the queueing
+    delay its users would see (no coordinated omission).
+    """
+    pool = HttpPool(base_url, connections)
+    rng = random.Random(seed)
+    encoded = [
+        pool.encode(
+            target["method"],
+            target["path"],
+            token=token if target.get("requires_auth", True) else None,
+            params=target.get("params"),
+            json_data=target.get("json_data"),
+            headers=target.get("headers"),
+        )
+        for target in targets
+    ]
+    cum_weights = list(itertools.accumulate(target.get("weight", 1) for target in targets))
+    endpoints = {
+        target["name"]: {
+            "requests": 0,
+            "errors": 0,
+            "response": LatencyHistogram(),
+            "service": LatencyHistogram(),
+        }
+        for target in targets
+    }
+    # How late each arrival actually started: the generator's own lag.
+    lag = LatencyHistogram()
+    in_flight: set = set()
+    dropped = 0
+
+    async def send(index: int, intended: float) -> None:
+        entry = endpoints[targets[index]["name"]]
+        try:
+            status, sent_at = await asyncio.wait_for(pool.request(encoded[index]), timeout_s)
+        except (OSError, ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            status, sent_at = None, None
+        done = time.perf_counter()
+        entry["requests"] += 1
+        entry["response"].record((done - intended) * 1000)
+        if sent_at is not None:
+            entry["service"].record((done - sent_at) * 1000)
+        if status is None or status >= 400:
+            entry["errors"] += 1
+
+    started = time.perf_counter()
+    deadline = started + duration_s
+    intended = started
+    while True:
+        intended += rng.expovariate(rate) if arrival == "poisson" else 1 / rate
+        if intended >= deadline:
+            break
+        # Always yields, so requests already started make progress even when behind.
+        await asyncio.sleep(max(intended - time.perf_counter(), 0))
+        lag.record((time.perf_counter() - intended) * 1000)
+        if len(in_flight) >= max_in_flight:
+            dropped += 1
+            continue
+        index = rng.choices(range(len(targets)), cum_weights=cum_weights)[0]
+        task = asyncio.create_task(send(index, intended))
+        in_flight.add(task)
+        task.add_done_callback(in_flight.discard)
+    if in_flight:
+        await asyncio.wait(in_flight)
+    elapsed_s = time.perf_counter() - started
+
+    for _, writer in pool.idle:
+        writer.close()
+    return {
+        "elapsed_s": elapsed_s,
+        "dropped": dropped,
+        "connections_opened": pool.opened,
+        "scheduler_lag": lag,
+        "endpoints": endpoints,
+    }
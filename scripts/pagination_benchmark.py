@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import kaizen_db
+from latency_stats import LatencyHistogram
+from measure_response_times import BASE_URL, is_error, login, measure
+from phase_timing import timed_session
+
+OUTPUT_PATH = Path(os.environ.get("KAIZEN_PAGINATION_PATH", "screenshots/pagination_results.json"))
+ROWS = int(os.environ.get("KAIZEN_PAGINATION_ROWS", "1000000"))
+PAGE_SIZE = int(os.environ.get("KAIZEN_PAGINATION_LIMIT", "100"))
+MAX_SECONDS = float(os.environ.get("KAIZEN_PAGINATION_MAX_SECONDS", "900"))
+DEPTH_BUCKETS = 10
+PAST_DAYS = 10 * 365
+
+# List endpoints whose table has keterangan, so the seeded rows can be found and removed.
+MODULES: Dict[str, Dict[str, Any]] = {
+    "communal": {"table": "Communal", "extra": {"lantai": 10}},
+    "serbaguna": {"table": "Serbaguna", "extra": {"idArea": None}},
+    "theater": {"table": "Theater", "extra": {}},
+    "cws": {"table": "CWS", "extra": {}},
+}
+
+
+def seeded_rows(
+    count: int, owner_id: int, extra: Dict[str, Any], seed: int
+) -> Tuple[List[str], Iterator[Tuple[Any, ...]]]:
+    """Finished one-hour bookings spread over the past ten years, so nothing sweeps them."""
+    columns = [
+        "idPenanggungJawab",
+        "waktuMulai",
+        "waktuBerakhir",
+        "jumlahPengguna",
+        "keterangan",
+        "isDone",
+        *extra,
+    ]
+    now = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
+    rng = random.Random(seed)
+
+    def rows() -> Iterator[Tuple[Any, ...]]:
+        for _ in range(count):
+            start = now - timedelta(hours=rng.randint(24, PAST_DAYS * 24))
+            # Communal spreads over floors; other extras are fixed ids.
+            values = [
+                rng.randint(1, value) if key == "lantai" else value for key, value in extra.items()
+            ]
+            yield (
+                owner_id,
+                start,
+                start + timedelta(hours=1),
+                1,
+                kaizen_db.BENCH_MARKER,
+                True,
+                *values,
+            )
+
+    return columns, rows()
+
+
+def by_depth(latencies: List[float]) -> List[Optional[float]]:
+    """Median page latency in each tenth of the walk, first pages to last."""
+    size = len(latencies) / DEPTH_BUCKETS
+    medians = []
+    for bucket in range(DEPTH_BUCKETS):
+        chunk = latencies[int(bucket * size) : int((bucket + 1) * size)]
+        medians.append(round(statistics.median(chunk), 2) if chunk else None)
+    return medians
+
+
+def walk(
+    session: Any,
+    token: str,
+    name: str,
+    mode: str,
+    *,
+    limit: int,
+    sort_by: str,
+    total: str,
+    max_seconds: float,
+) -> Dict[str, Any]:
+    """Request every page in order until the last one, an error or the time budget."""
+    path = f"/api/v1/{name}"
+    params: Dict[str, Any] = {"limit": limit, "sortBy": sort_by, "total": total}
+    if mode == "cursor":
+        params["cursor"] = ""
+    else:
+        params["page"] = 1
+
+    histogram = LatencyHistogram()
+    latencies: List[float] = []
+    seen = set()
+    rows = 0
+    reported_total = None
+    row: Dict[str, Any] = {"mode": mode, "complete": False, "errors": 0}
+    started = time.perf_counter()
+    while time.perf_counter() - started < max_seconds:
+        result, body = measure(
+            session=session,
+            method="GET",
+            path=path,
+            name=f"{name} {mode}",
+            token=token,
+            params=params,
+        )
+        if is_error(result) or not isinstance(body, dict):
+            row["errors"] += 1
+            row["first_error"] = result.get("message") or result.get("error")
+            break
+        histogram.record(result["elapsed_ms"])
+        latencies.append(result["elapsed_ms"])
+        data = body.get("data") or []
+        pagination = body.get("pagination") or {}
+        rows += len(data)
+        seen.update(item["id"] for item in data)
+        if reported_total is None:
+            reported_total = pagination.get("total")
+
+        if mode == "cursor":
+            if not pagination.get("nextCursor"):
+                row["complete"] = True
+                break
+            params["cursor"] = pagination["nextCursor"]
+        else:
+            if len(data) < limit:
+                row["complete"] = True
+                break
+            params["page"] += 1
+
+    row.update(
+        {
+            "pages": len(latencies),
+            "rows": rows,
+            # Rows an offset walk returns twice (or skips) when the table changes under it.
+            "duplicates": rows - len(seen),
+            "reported_total": reported_total,
+            "walk_s": round(time.perf_counter() - started, 3),
+            "first_page_ms": latencies[0] if latencies else None,
+            "last_page_ms": latencies[-1] if latencies else None,
+            "stats": histogram.summary(),
+            "by_depth_p50_ms": by_depth(latencies),
+        }
+    )
+    return row
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'MODE':<7} {'PAGES':>7} {'ROWS':>9} {'DUP':>5} {'WALK s':>8} {'FIRST ms':>9}"
+        f" {'LAST ms':>9} {'P50 ms':>8} {'P99 ms':>8}  DONE"
+    )
+    for row in report["walks"]:
+        stats = row["stats"]
+        print(
+            f"{row['mode']:<7} {row['pages']:>7} {row['rows']:>9} {row['duplicates']:>5}"
+            f" {row['walk_s']:>8.1f} {row['first_page_ms'] or 0:>9.2f}"
+            f" {row['last_page_ms'] or 0:>9.2f} {stats['p50_ms'] or 0:>8.2f}"
+            f" {stats['p99_ms'] or 0:>8.2f}  {'yes' if row['complete'] else 'no'}"
+        )
+    for row in report["walks"]:
+        depth = " ".join(
+            f"{value:.1f}" if value is not None else "-" for value in row["by_depth_p50_ms"]
+        )
+        print(f"  {row['mode']} p50 by depth (ms): {depth}")
+        if row.get("first_error"):
+            print(f"  {row['mode']} stopped on: {row['first_error']}")
+        elif not row["complete"]:
+            print(f"  {row['mode']} ran out of time after {row['pages']} pages")
+    if report.get("expected_rows") is not None:
+        for row in report["walks"]:
+            if row["complete"] and row["rows"] != report["expected_rows"]:
+                print(
+                    f"  {row['mode']} returned {row['rows']} rows,"
+                    f" the table has {report['expected_rows']}"
+                )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Seed a large booking table and walk every page of its list endpoint with "
+            "page/limit (OFFSET) and with keyset cursors, timing each page."
+        )
+    )
+    parser.add_argument("--module", choices=sorted(MODULES), default="communal")
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=ROWS,
+        help="bookings seeded before the walk; 0 walks the table as it is (no database needed)",
+    )
+    parser.add_argument("--limit", type=int, default=PAGE_SIZE, help="page size")
+    parser.add_argument("--sort-by", choices=["id", "waktuMulai"], default="id")
+    parser.add_argument(
+        "--modes", nargs="+", choices=["offset", "cursor"], default=["offset", "cursor"]
+    )
+    parser.add_argument(
+        "--offset-total",
+        choices=["exact", "approx", "none"],
+        default="exact",
+        help="total= for the offset walk; exact is what page/limit clients get by default",
+    )
+    parser.add_argument(
+        "--max-seconds",
+        type=float,
+        default=MAX_SECONDS,
+        help="time budget per walk; deep OFFSET pages on a big table can take very long",
+    )
+    parser.add_argument("--seed", type=int, default=1, help="random seed for booking times")
+    parser.add_argument("--keep", action="store_true", help="leave the seeded bookings in place")
+    args = parser.parse_args()
+    if args.rows < 0:
+        parser.error("--rows can't be negative")
+    if not 1 <= args.limit <= 100:
+        parser.error("--limit must be between 1 and 100")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    module = MODULES[args.module]
+    conn = None
+    if args.rows:
+        try:
+            conn = kaizen_db.connect()
+        except (RuntimeError, ValueError) as exc:
+            print(exc, file=sys.stderr)
+            return 2
+
+    session = timed_session()
+    _, token = login(session)
+    if not token:
+        print("Login failed; cannot continue", file=sys.stderr)
+        return 1
+
+    report: Dict[str, Any] = {
+        "mode": "pagination",
+        "base_url": BASE_URL,
+        "module": args.module,
+        "limit": args.limit,
+        "sort_by": args.sort_by,
+        "offset_total": args.offset_total,
+        "seeded": 0,
+        "expected_rows": None,
+        "walks": [],
+    }
+    try:
+        if conn is not None:
+            owner_id = kaizen_db.scalar(conn, "SELECT id FROM `Users` ORDER BY id LIMIT 1")
+            area_id = kaizen_db.scalar(conn, "SELECT id FROM `AreaSerbaguna` ORDER BY id LIMIT 1")
+            if owner_id is None or (args.module == "serbaguna" and area_id is None):
+                print("Need a user (and, for serbaguna, an area) to own the rows", file=sys.stderr)
+                return 1
+            extra = {
+                key: area_id if key == "idArea" else value for key, value in module["extra"].items()
+            }
+            columns, rows = seeded_rows(args.rows, owner_id, extra, args.seed)
+            started = time.perf_counter()
+            report["seeded"] = kaizen_db.insert_many(conn, module["table"], columns, rows)
+            report["seed_s"] = round(time.perf_counter() - started, 3)
+            print(f"Seeded {report['seeded']} rows in {report['seed_s']:.1f}s")
+            report["expected_rows"] = kaizen_db.scalar(
+                conn, f"SELECT COUNT(*) FROM `{module['table']}`"
+            )
+
+        for mode in args.modes:
+            report["walks"].append(
+                walk(
+                    session,
+                    token,
+                    args.module,
+                    mode,
+                    limit=args.limit,
+                    sort_by=args.sort_by,
+                    total=args.offset_total if mode == "offset" else "none",
+                    max_seconds=args.max_seconds,
+                )
+            )
+    finally:
+        if conn is not None:
+            if not args.keep:
+                kaizen_db.delete_marked(conn, module["table"])
+            conn.close()
+
+    if report["expected_rows"] is None:
+        # Without the database, the offset walk's first page says how big the table is.
+        report["expected_rows"] = next(
+            (row["reported_total"] for row in report["walks"] if row["reported_total"]), None
+        )
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print_report(report)
+    print(f"Saved pagination benchmark to {OUTPUT_PATH}")
+    wrong = [
+        row
+        for row in report["walks"]
+        if row["errors"]
+        or row["duplicates"]
+        or (row["complete"] and report["expected_rows"] not in (None, row["rows"]))
+    ]
+    return 1 if wrong else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
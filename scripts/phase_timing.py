@@ -0,0 +1,191 @@
+import re
+import socket
+import statistics
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+
+CONNECTION_PHASES = ("dns_ms", "connect_ms", "tls_ms")
+PHASES = (*CONNECTION_PHASES, "ttfb_ms", "download_ms", "parse_ms")
+
+# One metric of a Server-Timing header: `name;dur=12.3;desc="Prisma"`.
+SERVER_TIMING_METRIC = re.compile(r'\s*([^\s;,]+)((?:\s*;\s*[^\s;=,]+\s*=\s*(?:"[^"]*"|[^;,]*))*)')
+SERVER_TIMING_PARAM = re.compile(r'\s*;\s*([^\s;=,]+)\s*=\s*("[^"]*"|[^;,]*)')
+
+# Connection setup happens inside session.request on the calling thread, so the
+# connection classes report into whatever PhaseTimer is active on that thread.
+_local = threading.local()
+
+
+def _record(**phases: float) -> None:
+    current = getattr(_local, "phases", None)
+    if current is not None:
+        current.update(phases)
+
+
+class TimedConnectionMixin:
+    def _new_conn(self) -> socket.socket:
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, type=socket.SOCK_STREAM)
+        except socket.gaierror as exc:
+            raise NameResolutionError(self.host, self, exc) from exc
+        resolved = time.perf_counter()
+        # Connect to the resolved addresses ourselves so name resolution isn't repeated
+        # (and counted) inside urllib3's create_connection.
+        dns_host = self._dns_host
+        error: Optional[Exception] = None
+        try:
+            for *_, sockaddr in addresses:
+                self._dns_host = sockaddr[0]
+                try:
+                    sock = super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as exc:
+                    error = exc
+                    continue
+                _record(
+                    dns_ms=(resolved - started) * 1000,
+                    connect_ms=(time.perf_counter() - resolved) * 1000,
+                )
+                return sock
+        finally:
+            self._dns_host = dns_host
+        raise error or NewConnectionError(self, f"No addresses found for {dns_host}")
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        setup_ms = (time.perf_counter() - started) * 1000
+        phases = getattr(_local, "phases", None)
+        if phases is not None:
+            phases["tls_ms"] = setup_ms - phases.get("dns_ms", 0.0) - phases.get("connect_ms", 0.0)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+def timed_session() -> requests.Session:
+    session = requests.Session()
+    adapter = TimedHTTPAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class PhaseTimer:
+    """Collects the connection phases of the request sent while it is active.
+
+    Only sessions from timed_session() report DNS/connect/TLS; with any other session
+    every request looks like it reused a connection.
+    """
+
+    def __enter__(self) -> "PhaseTimer":
+        self.connection: Dict[str, float] = {}
+        _local.phases = self.connection
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _local.phases = None
+
+    def breakdown(
+        self, started: float, headers_at: float, downloaded_at: float, parsed_at: float
+    ) -> Dict[str, Any]:
+        phases: Dict[str, Any] = {
+            "reused": "connect_ms" not in self.connection,
+            "dns_ms": self.connection.get("dns_ms", 0.0),
+            "connect_ms": self.connection.get("connect_ms", 0.0),
+            "tls_ms": self.connection.get("tls_ms", 0.0),
+            # Includes connection setup, as browsers report it.
+            "ttfb_ms": (headers_at - started) * 1000,
+            "download_ms": (downloaded_at - headers_at) * 1000,
+            "parse_ms": (parsed_at - downloaded_at) * 1000,
+        }
+        return {
+            key: round(value, 3) if isinstance(value, float) else value
+            for key, value in phases.items()
+        }
+
+
+def parse_server_timing(header: Optional[str]) -> Dict[str, Dict[str, Any]]:
+    """Parse a Server-Timing header into {metric: {"dur": ms or None, "desc": str or None}}."""
+    metrics: Dict[str, Dict[str, Any]] = {}
+    position = 0
+    while header and position < len(header):
+        match = SERVER_TIMING_METRIC.match(header, position)
+        if not match:
+            break
+        params = {
+            key.lower(): value.strip().strip('"')
+            for key, value in SERVER_TIMING_PARAM.findall(match.group(2))
+        }
+        try:
+            duration: Optional[float] = float(params["dur"]) if "dur" in params else None
+        except ValueError:
+            duration = None
+        metrics[match.group(1)] = {"dur": duration, "desc": params.get("desc")}
+        position = header.find(",", match.end())
+        if position < 0:
+            break
+        position += 1
+    return metrics
+
+
+def summarize_phases(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Median of every phase across samples, plus how many samples opened a connection.
+
+    DNS/connect/TLS medians only cover the samples that opened a connection; over a mostly
+    reused keep-alive connection they would otherwise always be zero.
+    """
+    if not samples:
+        return {}
+    opened = [sample for sample in samples if not sample["reused"]]
+    summary: Dict[str, Any] = {}
+    for phase in PHASES:
+        pool = opened if phase in CONNECTION_PHASES else samples
+        summary[phase] = round(statistics.median(s[phase] for s in pool), 3) if pool else 0.0
+    summary["new_connections"] = len(opened)
+    return summary
+
+
+def summarize_server_timing(samples: List[Dict[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Median duration of every Server-Timing metric seen across samples."""
+    durations: Dict[str, List[float]] = {}
+    descriptions: Dict[str, Optional[str]] = {}
+    for sample in samples:
+        for name, metric in sample.items():
+            if metric["dur"] is not None:
+                durations.setdefault(name, []).append(metric["dur"])
+            descriptions[name] = metric["desc"] or descriptions.get(name)
+    return {
+        name: {
+            "dur": round(statistics.median(durations[name]), 3) if name in durations else None,
+            "desc": descriptions[name],
+        }
+        for name in descriptions
+    }
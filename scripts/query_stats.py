@@ -0,0 +1,78 @@
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
+
+QUERY_STATS_PATH = "/api/v1/query-stats"
+
+
+def route_matcher(route: str) -> Tuple[str, Pattern[str]]:
+    """Method and path regex of a route pattern; ":id"-style parameters match one segment."""
+    method, _, pattern = route.partition(" ")
+    return method, re.compile("^" + re.sub(r":\w+", "[^/]+", re.escape(pattern)) + "/?$")
+
+
+def summarize_route(route: Dict[str, Any]) -> Dict[str, Any]:
+    requests_seen = route["requests"] or 1
+    return {
+        "route": route["route"],
+        "requests": route["requests"],
+        "queries_per_request": round(route["queries"] / requests_seen, 2),
+        "max_queries": route["maxQueries"],
+        "db_ms_per_request": round(route["dbTimeMs"] / requests_seen, 2),
+        "db_share": (
+            round(route["dbTimeMs"] / route["totalTimeMs"], 3) if route["totalTimeMs"] else None
+        ),
+        "slow_queries": route["slowQueries"],
+    }
+
+
+def route_lookup(routes: Iterable[str]) -> Callable[[str, str], Optional[str]]:
+    """(method, path or URL) -> the route pattern it was served by, if any.
+
+    A path can fit several patterns (/communal/time-slots also fits /communal/:id), so literal
+    routes are tried before those with parameters.
+    """
+    matchers = sorted(
+        ((route_matcher(route), route) for route in routes), key=lambda item: item[1].count(":")
+    )
+
+    def lookup(method: str, path: str) -> Optional[str]:
+        path = urlsplit(path).path
+        return next(
+            (
+                route
+                for (route_method, regex), route in matchers
+                if route_method == method and regex.match(path)
+            ),
+            None,
+        )
+
+    return lookup
+
+
+def merge_query_stats(rows: List[Dict[str, Any]], stats: Dict[str, Any]) -> int:
+    """Attach the server's totals for each row's route as row["db"]; returns rows matched."""
+    by_route = {route["route"]: route for route in stats.get("routes", [])}
+    lookup = route_lookup(by_route)
+    matched = 0
+    for row in rows:
+        route = lookup(row["method"], row["path"])
+        if route is not None:
+            row["db"] = summarize_route(by_route[route])
+            matched += 1
+    return matched
+
+
+def print_query_report(rows: List[Dict[str, Any]], slow_query_ms: Optional[float]) -> None:
+    print(f"{'ENDPOINT':<36} {'Q/REQ':>6} {'MAX Q':>6} {'DB ms/REQ':>10} {'DB %':>6} {'SLOW':>5}")
+    for row in rows:
+        db = row.get("db")
+        if not db:
+            continue
+        share = f"{db['db_share'] * 100:.0f}%" if db["db_share"] is not None else "-"
+        print(
+            f"{row['name']:<36} {db['queries_per_request']:>6.1f} {db['max_queries']:>6}"
+            f" {db['db_ms_per_request']:>10.2f} {share:>6} {db['slow_queries']:>5}"
+        )
+    if slow_query_ms:
+        print(f"(SLOW counts queries of {slow_query_ms:g} ms or more; see {QUERY_STATS_PATH}/slow)")
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+import base64
+import html
+import io
+import json
+import math
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from PIL import Image, ImageDraw, ImageFont
+
+from scaling_sweep import OUTPUT_PATH as DATA_PATH
+from scaling_sweep import usl_throughput
+
+CHART_PATH = Path(os.environ.get("KAIZEN_SCALING_CHART", "screenshots/scaling_chart.png"))
+HTML_PATH = Path(os.environ.get("KAIZEN_SCALING_REPORT", "screenshots/scaling_report.html"))
+# The latency panel draws the endpoints growing fastest with dataset size.
+MAX_LINES = 8
+
+HD_WIDTH = 1920
+HD_HEIGHT = 1080
+PADDING_X = 80
+PADDING_Y = 80
+PANEL_GAP = 120
+HEADER_COLOR = (66, 133, 244)
+TEXT_PRIMARY = (230, 232, 235)
+TEXT_SECONDARY = (173, 181, 189)
+GRID = (40, 46, 58)
+BACKGROUND = (10, 14, 23)
+SERIES_COLORS = [
+    (66, 133, 244),
+    (234, 67, 53),
+    (251, 188, 4),
+    (52, 168, 83),
+    (171, 71, 188),
+    (0, 172, 193),
+    (255, 112, 67),
+    (158, 157, 36),
+]
+GROWTH_COLORS = {"superlinear": "#ea4335", "linear": "#fbbc04"}
+
+FONT_CANDIDATES = [
+    "/System/Library/Fonts/SFMono-Regular.otf",
+    "/System/Library/Fonts/SFNSMono.ttf",
+    "/System/Library/Fonts/Menlo.ttc",
+    "/Library/Fonts/Menlo.ttc",
+    "/System/Library/Fonts/Monaco.ttf",
+    "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+]
+DEFAULT_FONT_SIZE = 22
+
+Point = Tuple[float, float]
+
+
+def load_font(size: int = DEFAULT_FONT_SIZE) -> ImageFont.FreeTypeFont:
+    for path in FONT_CANDIDATES:
+        if Path(path).exists():
+            try:
+                return ImageFont.truetype(path, size)
+            except OSError:
+                continue
+    return ImageFont.load_default()
+
+
+def text_size(font: ImageFont.ImageFont, text: str) -> Tuple[int, int]:
+    bbox = font.getbbox(text)
+    width = bbox[2] - bbox[0]
+    height = bbox[3] - bbox[1]
+    return width, height
+
+
+def log_ticks(low: float, high: float) -> List[float]:
+    """1-2-5 ticks per decade when the range is narrow, powers of ten otherwise."""
+    first, last = math.floor(math.log10(low)), math.ceil(math.log10(high))
+    steps = (1, 2, 5) if last - first <= 3 else (1,)
+    ticks = [step * 10**power for power in range(first, last + 1) for step in steps]
+    return [tick for tick in ticks if low <= tick <= high] or [low, high]
+
+
+def linear_ticks(high: float, count: int = 5) -> List[float]:
+    raw = high / count
+    magnitude = 10 ** math.floor(math.log10(raw)) if raw > 0 else 1
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    return [step * index for index in range(int(high / step) + 1)]
+
+
+def short_number(value: float) -> str:
+    for divisor, suffix in ((1e6, "M"), (1e3, "k")):
+        if abs(value) >= divisor:
+            return f"{value / divisor:g}{suffix}"
+    return f"{value:g}"
+
+
+class Panel:
+    """One chart: a plot box with axes, mapping data to pixels (log or linear per axis)."""
+
+    def __init__(
+        self,
+        draw: ImageDraw.ImageDraw,
+        box: Tuple[int, int, int, int],
+        x_range: Tuple[float, float],
+        y_range: Tuple[float, float],
+        *,
+        log_x: bool,
+        log_y: bool,
+    ) -> None:
+        self.draw = draw
+        self.box = box
+        self.x_range, self.y_range = x_range, y_range
+        self.log_x, self.log_y = log_x, log_y
+
+    def scale(self, value: float, bounds: Tuple[float, float], log: bool) -> float:
+        low, high = bounds
+        if log:
+            value, low, high = math.log10(value), math.log10(low), math.log10(high)
+        return (value - low) / (high - low) if high != low else 0.5
+
+    def xy(self, x: float, y: float) -> Point:
+        left, top, right, bottom = self.box
+        return (
+            left + self.scale(x, self.x_range, self.log_x) * (right - left),
+            bottom - self.scale(y, self.y_range, self.log_y) * (bottom - top),
+        )
+
+    def axes(self, font: ImageFont.ImageFont, title: str, x_label: str, y_label: str) -> None:
+        left, top, right, bottom = self.box
+        x_ticks = log_ticks(*self.x_range) if self.log_x else linear_ticks(self.x_range[1])
+        y_ticks = log_ticks(*self.y_range) if self.log_y else linear_ticks(self.y_range[1])
+        for tick in x_ticks:
+            x, _ = self.xy(tick, self.y_range[0])
+            self.draw.line([(x, top), (x, bottom)], fill=GRID)
+            label = short_number(tick)
+            self.draw.text(
+                (x - text_size(font, label)[0] / 2, bottom + 10),
+                label,
+                font=font,
+                fill=TEXT_SECONDARY,
+            )
+        for tick in y_ticks:
+            _, y = self.xy(self.x_range[0], tick)
+            self.draw.line([(left, y), (right, y)], fill=GRID)
+            label = short_number(tick)
+            self.draw.text(
+                (left - text_size(font, label)[0] - 10, y - 10),
+                label,
+                font=font,
+                fill=TEXT_SECONDARY,
+            )
+        self.draw.rectangle(self.box, outline=TEXT_SECONDARY)
+        self.draw.text((left, top - 40), title, font=font, fill=HEADER_COLOR)
+        self.draw.text(
+            (right - text_size(font, x_label)[0], bottom + 40),
+            x_label,
+            font=font,
+            fill=TEXT_PRIMARY,
+        )
+        self.draw.text(
+            (left - text_size(font, y_label)[0] - 10, top - 40),
+            y_label,
+            font=font,
+            fill=TEXT_PRIMARY,
+        )
+
+    def series(
+        self,
+        points: Sequence[Point],
+        color: Tuple[int, int, int],
+        *,
+        line: bool = True,
+        markers: bool = True,
+    ) -> None:
+        pixels = [self.xy(x, y) for x, y in points]
+        if line and len(pixels) > 1:
+            self.draw.line(pixels, fill=color, width=3)
+        if markers:
+            for x, y in pixels:
+                self.draw.ellipse([x - 5, y - 5, x + 5, y + 5], fill=color)
+
+    def curve(
+        self, fn: Callable[[float], float], color: Tuple[int, int, int], start: float
+    ) -> None:
+        high = self.x_range[1]
+        steps = 60
+        xs = [start + (high - start) * index / steps for index in range(steps + 1)]
+        self.series([(x, fn(x)) for x in xs], color, markers=False)
+
+
+def padded(values: Sequence[float], log: bool) -> Tuple[float, float]:
+    low, high = min(values), max(values)
+    if log:
+        return low / 1.5, high * 1.5
+    return 0.0, high * 1.15 or 1.0
+
+
+def legend(
+    draw: ImageDraw.ImageDraw,
+    font: ImageFont.ImageFont,
+    origin: Point,
+    entries: Sequence[Tuple[str, Tuple[int, int, int]]],
+) -> None:
+    x, y = origin
+    for label, color in entries:
+        draw.rectangle([x, y + 4, x + 18, y + 18], fill=color)
+        draw.text((x + 28, y), label, font=font, fill=TEXT_PRIMARY)
+        y += 30
+
+
+def render_chart(report: Dict[str, Any]) -> Image.Image:
+    font = load_font()
+    image = Image.new("RGB", (HD_WIDTH, HD_HEIGHT), color=BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    draw.text(
+        (PADDING_X, PADDING_Y / 2),
+        f"Kaizen API scaling (captured {timestamp})",
+        font=load_font(30),
+        fill=HEADER_COLOR,
+    )
+    panel_width = (HD_WIDTH - 2 * PADDING_X - PANEL_GAP) // 2
+    top, bottom = PADDING_Y + 100, HD_HEIGHT - PADDING_Y - 280
+    sizes = {run["dataset"]["name"]: run["dataset"]["bookings"] for run in report["runs"]}
+
+    lines = [endpoint for endpoint in report["endpoints"] if endpoint["fit"]][:MAX_LINES]
+    latencies = [value for endpoint in lines for value in endpoint["p50_ms"].values() if value]
+    if lines and latencies and len(set(sizes.values())) > 1:
+        left = PADDING_X + 60
+        panel = Panel(
+            draw,
+            (left, top, left + panel_width - 60, bottom),
+            padded(list(sizes.values()), log=True),
+            padded(latencies, log=True),
+            log_x=True,
+            log_y=True,
+        )
+        panel.axes(font, "p50 latency vs dataset size (log-log)", "bookings", "ms")
+        entries = []
+        for index, endpoint in enumerate(lines):
+            color = SERIES_COLORS[index % len(SERIES_COLORS)]
+            points = sorted(
+                (sizes[name], value) for name, value in endpoint["p50_ms"].items() if value
+            )
+            panel.series(points, color)
+            entries.append(
+                (
+                    f"{endpoint['name']} (x^{endpoint['fit']['exponent']}, {endpoint['growth']})",
+                    color,
+                )
+            )
+        legend(draw, font, (left, bottom + 90), entries)
+
+    runs = [run for run in report["runs"] if run["levels"]]
+    if runs:
+        left = PADDING_X + panel_width + PANEL_GAP + 60
+        users = [int(level) for run in runs for level in run["levels"]]
+        rates = [level["throughput_rps"] for run in runs for level in run["levels"].values()]
+        panel = Panel(
+            draw,
+            (left, top, left + panel_width - 60, bottom),
+            (0.0, max(users) * 1.05),
+            padded(rates, log=False),
+            log_x=False,
+            log_y=False,
+        )
+        panel.axes(font, "throughput vs concurrency (USL fit)", "users", "req/s")
+        entries = []
+        for index, run in enumerate(runs):
+            color = SERIES_COLORS[index % len(SERIES_COLORS)]
+            points = sorted(
+                (int(level), row["throughput_rps"]) for level, row in run["levels"].items()
+            )
+            # Measured points, and the fitted curve through them.
+            panel.series(points, color, line=False)
+            label = run["dataset"]["name"]
+            if run["usl"]:
+                usl = run["usl"]
+                panel.curve(lambda n, fit=usl: usl_throughput(n, fit), color, start=1.0)
+                label += f" (sigma {usl['sigma']}, kappa {usl['kappa']})"
+            entries.append((label, color))
+        legend(draw, font, (left, bottom + 90), entries)
+    return image
+
+
+def render_html(report: Dict[str, Any], chart_png: bytes) -> str:
+    sizes = [run["dataset"]["name"] for run in report["runs"]]
+    head = "".join(f"<th>{html.escape(name)} p50 ms</th>" for name in sizes)
+    endpoint_rows = []
+    for endpoint in report["endpoints"]:
+        fit = endpoint["fit"] or {}
+        color = GROWTH_COLORS.get(endpoint["growth"])
+        style = f' style="color:{color};font-weight:bold"' if color else ""
+        cells = "".join(
+            f"<td>{endpoint['p50_ms'].get(name) if endpoint['p50_ms'].get(name) is not None else '-'}</td>"
+            for name in sizes
+        )
+        endpoint_rows.append(
+            f"<tr><td>{html.escape(endpoint['name'])}</td>"
+            f"<td><code>{html.escape(endpoint['method'] or '')} {html.escape(endpoint['path'] or '')}</code></td>"
+            f"{cells}<td>{fit.get('exponent', '-')}</td><td>{fit.get('r2', '-')}</td>"
+            f"<td{style}>{endpoint['growth']}</td></tr>"
+        )
+    run_rows = []
+    for run in report["runs"]:
+        usl = run["usl"] or {}
+        levels = ", ".join(
+            f"{users}: {row['throughput_rps']}" for users, row in run["levels"].items()
+        )
+        peak = (
+            f"{usl['peak_rps']} req/s at {usl['peak_users']} users" if "peak_users" in usl else "-"
+        )
+        run_rows.append(
+            f"<tr><td>{html.escape(run['dataset']['name'])}</td><td>{run['dataset']['bookings']}</td>"
+            f"<td>{levels}</td><td>{usl.get('lambda', '-')}</td><td>{usl.get('sigma', '-')}</td>"
+            f"<td>{usl.get('kappa', '-')}</td><td>{usl.get('r2', '-')}</td><td>{peak}</td></tr>"
+        )
+    thresholds = report["thresholds"]
+    flagged = sum(endpoint["growth"] in GROWTH_COLORS for endpoint in report["endpoints"])
+    chart = base64.b64encode(chart_png).decode("ascii")
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>Kaizen API scaling report</title>
+<style>
+body {{ background: #0a0e17; color: #e6e8eb; font-family: Menlo, "DejaVu Sans Mono", monospace; margin: 2em; }}
+h1, h2 {{ color: #4285f4; }}
+table {{ border-collapse: collapse; margin-bottom: 2em; }}
+th, td {{ border: 1px solid #2e3440; padding: 4px 10px; text-align: right; }}
+th {{ color: #adb5bd; }}
+td:first-child, td:nth-child(2) {{ text-align: left; }}
+img {{ max-width: 100%; }}
+</style>
+</head>
+<body>
+<h1>Kaizen API scaling report</h1>
+<p>{html.escape(report['base_url'])}, generated {datetime.now():%Y-%m-%d %H:%M:%S}.
+{report['samples']} sequential samples per endpoint per dataset; load runs of
+{report['duration_s']:g}s at {', '.join(str(level) for level in report['levels'])} users.</p>
+<img src="data:image/png;base64,{chart}" alt="scaling chart">
+<h2>Latency vs dataset size</h2>
+<p>p50 latency fitted as <code>a &middot; bookings<sup>b</sup></code>. b &lt; {thresholds['flat']} is flat;
+from {thresholds['linear']} an endpoint reads rows in proportion to the data (linear), past
+{thresholds['superlinear']} it grows faster than the data (superlinear).
+{flagged} endpoint(s) marked.</p>
+<table>
+<tr><th>Endpoint</th><th>Route</th>{head}<th>b</th><th>R&sup2;</th><th>Growth</th></tr>
+{''.join(endpoint_rows)}
+</table>
+<h2>Throughput vs concurrency</h2>
+<p>Universal Scalability Law: <code>X(N) = &lambda;N / (1 + &sigma;(N-1) + &kappa;N(N-1))</code>.
+&sigma; is contention (queueing on a shared resource), &kappa; coherency (cost that grows
+with every pair of users); the curve peaks at <code>N = &radic;((1-&sigma;)/&kappa;)</code>.</p>
+<table>
+<tr><th>Dataset</th><th>Bookings</th><th>req/s by users</th><th>&lambda;</th><th>&sigma;</th><th>&kappa;</th><th>R&sup2;</th><th>Peak</th></tr>
+{''.join(run_rows)}
+</table>
+</body>
+</html>
+"""
+
+
+def main() -> int:
+    if not DATA_PATH.exists():
+        print(f"Missing {DATA_PATH}; run scaling_sweep.py first", file=sys.stderr)
+        return 2
+    with DATA_PATH.open(encoding="utf-8") as fh:
+        report = json.load(fh)
+    image = render_chart(report)
+    CHART_PATH.parent.mkdir(parents=True, exist_ok=True)
+    image.save(CHART_PATH)
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    HTML_PATH.write_text(render_html(report, buffer.getvalue()), encoding="utf-8")
+    print(f"Saved chart to {CHART_PATH} and report to {HTML_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
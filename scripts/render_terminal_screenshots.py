@@ -1,14 +1,24 @@
 #!/usr/bin/env python3
+import argparse
+import hashlib
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
-DATA_PATH = Path("screenshots/response_times.json")
+from results_sink import iter_results, results_path
+
+DATA_PATH = Path("screenshots/response_times.jsonl")
+LEGACY_DATA_PATH = Path("screenshots/response_times.json")
 OUTPUT_DIR = Path("screenshots/terminal")
+MANIFEST_PATH = OUTPUT_DIR / "manifest.json"
+RENDER_JOBS = int(os.environ.get("KAIZEN_RENDER_JOBS", str(os.cpu_count() or 1)))
 BACKGROUND = (10, 14, 23)
 TEXT_PRIMARY = (219, 224, 230)
 TEXT_SECONDARY = (136, 146, 160)
@@ -30,7 +40,11 @@ FONT_CANDIDATES = [
 ]
 DEFAULT_FONT_SIZE = 40
 
+Line = Tuple[str, Tuple[int, int, int]]
+
 
+# Fonts can't be pickled, so every worker process loads (and caches) its own.
+@lru_cache(maxsize=None)
 def load_font(size: int = DEFAULT_FONT_SIZE) -> ImageFont.ImageFont:
     for path in FONT_CANDIDATES:
         font_path = Path(path)
@@ -42,6 +56,8 @@ def load_font(size: int = DEFAULT_FONT_SIZE) -> ImageFont.ImageFont:
     return ImageFont.load_default()
 
 
+# Keyed on the font object, so metrics are memoized per font.
+@lru_cache(maxsize=8192)
 def text_size(font: ImageFont.ImageFont, text: str) -> Tuple[int, int]:
     bbox = font.getbbox(text)
     width = bbox[2] - bbox[0]
@@ -55,13 +71,13 @@ def sanitize_filename(index: int, method: str, path: str) -> str:
     return cleaned or f"endpoint-{index:02d}"
 
 
-def format_lines(item: dict, timestamp: str) -> List[Tuple[str, Tuple[int, int, int]]]:
+def format_lines(item: dict, timestamp: str) -> List[Line]:
     key_width = 9
 
     def kv(key: str, value: str) -> str:
         return f"{key.ljust(key_width)}: {value}"
 
-    lines: List[Tuple[str, Tuple[int, int, int]]] = []
+    lines: List[Line] = []
     lines.append((f"$ kaizen-measure --name \"{item.get('name', 'Unknown')}\"", TEXT_COMMAND))
     lines.append((kv("method", item.get("method", "-")), TEXT_KEYS))
     lines.append((kv("path", item.get("path", "-")), TEXT_PRIMARY))
@@ -71,6 +87,28 @@ def format_lines(item: dict, timestamp: str) -> List[Tuple[str, Tuple[int, int,
     elapsed = item.get("elapsed_ms")
     elapsed_text = f"{elapsed:.2f} ms" if isinstance(elapsed, (int, float)) else "-"
     lines.append((kv("elapsed", elapsed_text), TEXT_PRIMARY))
+    stats = item.get("stats")
+    if stats and stats.get("count"):
+        spread = (
+            f"p50 {stats['p50_ms']:.2f} / p90 {stats['p90_ms']:.2f} / "
+            f"p99 {stats['p99_ms']:.2f} ms (n={stats['count']})"
+        )
+        lines.append((kv("latency", spread), TEXT_PRIMARY))
+    phases = item.get("phases")
+    if phases:
+        split = (
+            f"dns {phases['dns_ms']:.2f} / tcp {phases['connect_ms']:.2f} / "
+            f"tls {phases['tls_ms']:.2f} / ttfb {phases['ttfb_ms']:.2f} / "
+            f"body {phases['download_ms']:.2f} / parse {phases['parse_ms']:.2f} ms"
+        )
+        lines.append((kv("phases", split), TEXT_PRIMARY))
+    server_timing = item.get("server_timing")
+    if server_timing:
+        server = ", ".join(
+            f"{name} {metric['dur']:.2f} ms" if metric.get("dur") is not None else name
+            for name, metric in server_timing.items()
+        )
+        lines.append((kv("server", server), TEXT_PRIMARY))
     message = item.get("message") or "-"
     lines.append((kv("message", message), TEXT_SECONDARY))
     if item.get("note"):
@@ -81,9 +119,7 @@ def format_lines(item: dict, timestamp: str) -> List[Tuple[str, Tuple[int, int,
     return lines
 
 
-def compute_canvas_size(
-    lines: List[Tuple[str, Tuple[int, int, int]]], font: ImageFont.ImageFont
-) -> Tuple[int, int, int]:
+def compute_canvas_size(lines: List[Line], font: ImageFont.ImageFont) -> Tuple[int, int, int]:
     max_line_width = max(text_size(font, text)[0] for text, _ in lines)
     _, base_height = text_size(font, "Ag")
     line_height = base_height + LINE_SPACING_EXTRA
@@ -94,7 +130,7 @@ def compute_canvas_size(
 
 def draw_lines(
     image: Image.Image,
-    lines: List[Tuple[str, Tuple[int, int, int]]],
+    lines: List[Line],
     font: ImageFont.ImageFont,
     line_height: int,
 ) -> None:
@@ -105,29 +141,107 @@ def draw_lines(
         y += line_height
 
 
-def main() -> None:
-    if not DATA_PATH.exists():
-        raise FileNotFoundError(f"Missing data file: {DATA_PATH}")
+@lru_cache(maxsize=8)
+def blank_canvas(width: int, height: int) -> Image.Image:
+    return Image.new("RGB", (width, height), color=BACKGROUND)
 
-    with DATA_PATH.open("r", encoding="utf-8") as fh:
-        results = json.load(fh)
 
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    for image_file in OUTPUT_DIR.glob("*.png"):
-        image_file.unlink()
+def render_image(job: Tuple[List[Line], str]) -> str:
+    lines, output_path = job
+    font = load_font()
+    width, height, line_height = compute_canvas_size(lines, font)
+    image = blank_canvas(width, height).copy()
+    draw_lines(image, lines, font, line_height)
+    image.save(output_path)
+    return output_path
+
+
+def content_hash(lines: List[Line]) -> str:
+    # The trailing "captured" line is left out: a new timestamp alone shouldn't force a redraw.
+    font_path = getattr(load_font(), "path", None)
+    payload = {
+        "lines": [list(line) for line in lines[:-1]],
+        "style": [BACKGROUND, PADDING_X, PADDING_Y, LINE_SPACING_EXTRA, MIN_WIDTH, MIN_HEIGHT],
+        # The built-in font is loaded from memory and has no path.
+        "font": [font_path if isinstance(font_path, str) else None, DEFAULT_FONT_SIZE],
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_manifest() -> Dict[str, str]:
+    try:
+        with MANIFEST_PATH.open("r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(manifest: Dict[str, str]) -> None:
+    temporary = MANIFEST_PATH.with_suffix(".tmp")
+    with temporary.open("w", encoding="utf-8") as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+    temporary.replace(MANIFEST_PATH)
+
+
+def load_results() -> Iterator[dict]:
+    return iter_results(results_path(DATA_PATH, LEGACY_DATA_PATH))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Render one terminal-style PNG per endpoint.")
+    parser.add_argument(
+        "--jobs", type=int, default=RENDER_JOBS, help="worker processes used for rendering"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="redraw every image, even unchanged ones"
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
 
+def main() -> None:
+    args = parse_args()
+    data_path = results_path(DATA_PATH, LEGACY_DATA_PATH)
+    if not data_path.exists():
+        raise FileNotFoundError(f"Missing data file: {data_path}")
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    previous = {} if args.force else load_manifest()
+    manifest: Dict[str, str] = {}
+    jobs: List[Tuple[List[Line], str]] = []
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    font = load_font()
 
-    for index, item in enumerate(results, start=1):
+    for index, item in enumerate(load_results(), start=1):
         lines = format_lines(item, timestamp)
-        width, height, line_height = compute_canvas_size(lines, font)
-        image = Image.new("RGB", (width, height), color=BACKGROUND)
-        draw_lines(image, lines, font, line_height)
         filename = sanitize_filename(index, item.get("method", "GET"), item.get("path", "/"))
         output_path = OUTPUT_DIR / f"{filename}.png"
-        image.save(output_path)
+        digest = content_hash(lines)
+        manifest[output_path.name] = digest
+        if previous.get(output_path.name) != digest or not output_path.exists():
+            jobs.append((lines, str(output_path)))
+
+    # Only images that no longer belong to any endpoint are removed.
+    removed = 0
+    for image_file in OUTPUT_DIR.glob("*.png"):
+        if image_file.name not in manifest:
+            image_file.unlink()
+            removed += 1
+
+    if args.jobs > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(jobs))) as pool:
+            saved = list(pool.map(render_image, jobs, chunksize=4))
+    else:
+        saved = [render_image(job) for job in jobs]
+    for output_path in saved:
         print(f"Saved {output_path}")
+    write_manifest(manifest)
+    print(
+        f"Rendered {len(saved)} image(s), {len(manifest) - len(saved)} unchanged,"
+        f" {removed} stale removed"
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+HISTORY_PATH = Path(
+    os.environ.get("KAIZEN_HISTORY_PATH", "screenshots/response_times_history.jsonl")
+)
+# Fields copied from each endpoint result into the history; the rest (message, note) is noise.
+HISTORY_FIELDS = (
+    "name",
+    "method",
+    "path",
+    "status_code",
+    "elapsed_ms",
+    "errors",
+    "stats",
+    "histogram",
+    "phases",
+    "server_timing",
+    "cache",
+    "db",
+    "server",
+)
+
+
+def git_output(*args: str) -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return completed.stdout.strip()
+
+
+def current_commit() -> Dict[str, Any]:
+    commit = git_output("rev-parse", "HEAD")
+    status = git_output("status", "--porcelain", "--untracked-files=no")
+    return {"commit": commit, "dirty": bool(status) if status is not None else None}
+
+
+def build_run(results: List[Dict[str, Any]], **metadata: Any) -> Dict[str, Any]:
+    return {
+        **current_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **metadata,
+        "results": [
+            {field: result[field] for field in HISTORY_FIELDS if field in result}
+            for result in results
+        ],
+    }
+
+
+def append_run(run: Dict[str, Any], path: Path = HISTORY_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # One line per run, written with a single call in append mode so runs never interleave.
+    line = json.dumps(run, separators=(",", ":")) + "\n"
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write(line)
+
+
+def load_runs(path: Path = HISTORY_PATH) -> Iterator[Dict[str, Any]]:
+    with path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
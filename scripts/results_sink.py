@@ -0,0 +1,105 @@
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+BUFFER_SIZE = int(os.environ.get("KAIZEN_SINK_BUFFER", "64"))
+FLUSH_INTERVAL_S = float(os.environ.get("KAIZEN_SINK_FLUSH_INTERVAL", "1"))
+FSYNC_INTERVAL_S = float(os.environ.get("KAIZEN_SINK_FSYNC_INTERVAL", "5"))
+
+
+class JsonlSink:
+    """Appends one JSON document per line, keeping at most `buffer_size` records in memory.
+
+    The buffer is written out when it fills up or `flush_interval_s` after the previous
+    write, and fsync'd at most every `fsync_interval_s`, so a crash loses seconds of
+    results rather than the whole run. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        append: bool = False,
+        buffer_size: int = BUFFER_SIZE,
+        flush_interval_s: float = FLUSH_INTERVAL_S,
+        fsync_interval_s: float = FSYNC_INTERVAL_S,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.buffer_size = max(buffer_size, 1)
+        self.flush_interval_s = flush_interval_s
+        self.fsync_interval_s = fsync_interval_s
+        self.count = 0
+        self.buffer: List[str] = []
+        self.lock = threading.Lock()
+        self.fh = path.open("a" if append else "w", encoding="utf-8")
+        self.flushed_at = self.synced_at = time.monotonic()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self.lock:
+            self.buffer.append(line)
+            self.count += 1
+            now = time.monotonic()
+            if (
+                len(self.buffer) >= self.buffer_size
+                or now - self.flushed_at >= self.flush_interval_s
+            ):
+                self._flush(sync=now - self.synced_at >= self.fsync_interval_s)
+
+    def flush(self, sync: bool = True) -> None:
+        with self.lock:
+            self._flush(sync)
+
+    def _flush(self, sync: bool) -> None:
+        if self.buffer:
+            self.fh.write("".join(self.buffer))
+            self.buffer.clear()
+            self.fh.flush()
+        self.flushed_at = time.monotonic()
+        if sync:
+            os.fsync(self.fh.fileno())
+            self.synced_at = self.flushed_at
+
+    def close(self) -> None:
+        with self.lock:
+            if self.fh.closed:
+                return
+            self._flush(sync=True)
+            self.fh.close()
+
+    def __enter__(self) -> "JsonlSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def iter_results(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield result records from a .jsonl stream, or from a legacy JSON array file.
+
+    JSONL is read line by line. A truncated last line (the run died mid-write) is
+    reported and skipped.
+    """
+    if path.suffix != ".jsonl":
+        with path.open("r", encoding="utf-8") as fh:
+            yield from json.load(fh)
+        return
+    with path.open("r", encoding="utf-8") as fh:
+        for number, line in enumerate(fh, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                print(f"Skipping unreadable line {number} of {path}", file=sys.stderr)
+
+
+def results_path(preferred: Path, legacy: Path) -> Path:
+    """The streamed results if a run produced them, else the older JSON array file."""
+    return preferred if preferred.exists() or not legacy.exists() else legacy
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import datasets
+from measure_response_times import BASE_URL, SAMPLES, SCENARIO_PATH, WARMUP
+from results_sink import iter_results
+
+OUTPUT_PATH = Path(os.environ.get("KAIZEN_SCALING_PATH", "screenshots/scaling_results.json"))
+DATASETS = os.environ.get("KAIZEN_SCALING_DATASETS", "small,medium,large")
+LEVELS = os.environ.get("KAIZEN_SCALING_LEVELS", "1,2,4,8,16,32")
+DURATION_S = float(os.environ.get("KAIZEN_SCALING_DURATION", "20"))
+# Latency ~ bookings**exponent: below LINEAR an endpoint is (mostly) indifferent to table
+# size; from LINEAR on it reads rows in proportion to the data, past SUPERLINEAR worse.
+FLAT = 0.2
+LINEAR = float(os.environ.get("KAIZEN_SCALING_LINEAR", "0.8"))
+SUPERLINEAR = float(os.environ.get("KAIZEN_SCALING_SUPERLINEAR", "1.2"))
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def loglog_fit(xs: Sequence[float], ys: Sequence[float]) -> Optional[Dict[str, float]]:
+    """Least-squares fit of y = a * x**b on log-log axes; None with under two usable points."""
+    points = [(math.log(x), math.log(y)) for x, y in zip(xs, ys) if x and y and x > 0 and y > 0]
+    if len(points) < 2 or len({x for x, _ in points}) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+    ss_tot = sum((y - mean_y) ** 2 for _, y in points)
+    ss_res = sum((y - intercept - slope * x) ** 2 for x, y in points)
+    return {
+        "exponent": round(slope, 3),
+        "coefficient": math.exp(intercept),
+        "r2": round(1 - ss_res / ss_tot, 3) if ss_tot else 1.0,
+    }
+
+
+def growth_class(exponent: Optional[float]) -> str:
+    if exponent is None:
+        return "unknown"
+    if exponent < FLAT:
+        return "flat"
+    if exponent < LINEAR:
+        return "sublinear"
+    if exponent <= SUPERLINEAR:
+        return "linear"
+    return "superlinear"
+
+
+def usl_throughput(n: float, fit: Dict[str, float]) -> float:
+    return fit["lambda"] * n / (1 + fit["sigma"] * (n - 1) + fit["kappa"] * n * (n - 1))
+
+
+def usl_fit(levels: Sequence[int], throughputs: Sequence[float]) -> Optional[Dict[str, Any]]:
+    """Universal Scalability Law: X(N) = lambda*N / (1 + sigma*(N-1) + kappa*N*(N-1)).
+
+    lambda is the single-user rate (extrapolated linearly from the lowest level when 1 was
+    not measured). With C = X(N)/lambda, N/C - 1 = sigma*(N-1) + kappa*N*(N-1) is linear
+    in sigma and kappa, so both come from a two-variable least-squares fit through 0.
+    """
+    points = sorted((n, x) for n, x in zip(levels, throughputs) if x and x > 0)
+    if len(points) < 3:
+        return None
+    lowest, lowest_rate = points[0]
+    rate = lowest_rate / lowest
+    rows = [(n - 1, n * (n - 1), n / (x / rate) - 1) for n, x in points]
+    a11 = sum(u * u for u, _, _ in rows)
+    a12 = sum(u * v for u, v, _ in rows)
+    a22 = sum(v * v for _, v, _ in rows)
+    b1 = sum(u * y for u, _, y in rows)
+    b2 = sum(v * y for _, v, y in rows)
+    det = a11 * a22 - a12 * a12
+    if not det:
+        return None
+    # Contention and coherency can't be negative; a clamped term is refit without it.
+    sigma = (b1 * a22 - b2 * a12) / det
+    kappa = (a11 * b2 - a12 * b1) / det
+    if kappa < 0:
+        kappa = 0.0
+        sigma = b1 / a11 if a11 else 0.0
+    if sigma < 0:
+        sigma = 0.0
+        kappa = max(0.0, b2 / a22) if a22 else 0.0
+    fit: Dict[str, Any] = {"lambda": round(rate, 3), "sigma": sigma, "kappa": kappa}
+    mean = sum(x for _, x in points) / len(points)
+    ss_tot = sum((x - mean) ** 2 for _, x in points)
+    ss_res = sum((x - usl_throughput(n, fit)) ** 2 for n, x in points)
+    fit["r2"] = round(1 - ss_res / ss_tot, 3) if ss_tot else 1.0
+    fit["sigma"], fit["kappa"] = round(sigma, 5), round(kappa, 6)
+    if kappa > 0:
+        peak = math.sqrt((1 - sigma) / kappa) if sigma < 1 else 1.0
+        fit["peak_users"] = round(peak, 1)
+        fit["peak_rps"] = round(usl_throughput(peak, fit), 1)
+    return fit
+
+
+def run_script(script: str, args: List[str], env: Dict[str, str]) -> bool:
+    completed = subprocess.run(
+        [sys.executable, str(SCRIPTS_DIR / script), *args],
+        env={**os.environ, **env},
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        tail = (completed.stderr or completed.stdout).strip().splitlines()[-5:]
+        print(f"  {script} {' '.join(args)} failed:", *tail, sep="\n    ", file=sys.stderr)
+    return completed.returncode == 0
+
+
+def measure_dataset(
+    name: str, levels: List[int], args: argparse.Namespace, workdir: Path
+) -> Dict[str, Any]:
+    """One sequential latency sweep, then a load run per concurrency level."""
+    env = {"KAIZEN_DATASET": name, "KAIZEN_METRICS_PATH": str(workdir / f"{name}-sweep.jsonl")}
+    common = ["--scenario", str(args.scenario)]
+    entry: Dict[str, Any] = {"latency": {}, "levels": {}}
+    sweep_args = ["--mode", "sweep", "--parallel", "1", "--no-history"]
+    sweep_args += ["--samples", str(args.samples), "--warmup", str(args.warmup)]
+    if run_script("measure_response_times.py", common + sweep_args, env):
+        for result in iter_results(Path(env["KAIZEN_METRICS_PATH"])):
+            if result.get("stats"):
+                entry["latency"][result["name"]] = {
+                    "method": result.get("method"),
+                    "path": result.get("path"),
+                    "p50_ms": result["stats"]["p50_ms"],
+                    "p99_ms": result["stats"]["p99_ms"],
+                    "errors": result.get("errors", 0),
+                }
+    print(f"  latency sweep: {len(entry['latency'])} endpoints")
+
+    for users in levels:
+        report_path = workdir / f"{name}-load-{users}.json"
+        load_args = ["--mode", "load", "--users", str(users), "--duration", str(args.duration)]
+        if not run_script(
+            "measure_response_times.py",
+            common + load_args,
+            {**env, "KAIZEN_LOAD_METRICS_PATH": str(report_path)},
+        ):
+            continue
+        with report_path.open(encoding="utf-8") as fh:
+            report = json.load(fh)
+        entry["levels"][str(users)] = {
+            **report["totals"],
+            "endpoints": {
+                row["name"]: {"p50_ms": row["stats"]["p50_ms"], "p99_ms": row["stats"]["p99_ms"]}
+                for row in report["endpoints"]
+                if row["requests"]
+            },
+        }
+        totals = report["totals"]
+        print(
+            f"  {users:>4} users: {totals['throughput_rps']:>9.1f} req/s,"
+            f" {totals['errors']} errors"
+        )
+    return entry
+
+
+def analyse(runs: List[Dict[str, Any]], levels: List[int]) -> Dict[str, Any]:
+    """Latency-vs-size fit per endpoint and a USL fit per dataset."""
+    endpoints: Dict[str, Dict[str, Any]] = {}
+    for run in runs:
+        for name, row in run["latency"].items():
+            endpoint = endpoints.setdefault(
+                name, {"name": name, "method": row["method"], "path": row["path"], "p50_ms": {}}
+            )
+            endpoint["p50_ms"][run["dataset"]["name"]] = row["p50_ms"]
+    sizes = {run["dataset"]["name"]: run["dataset"]["bookings"] for run in runs}
+    for endpoint in endpoints.values():
+        names = list(endpoint["p50_ms"])
+        fit = loglog_fit(
+            [sizes[name] for name in names], [endpoint["p50_ms"][name] for name in names]
+        )
+        endpoint["fit"] = fit
+        endpoint["growth"] = growth_class(fit["exponent"] if fit else None)
+
+    for run in runs:
+        measured = [users for users in levels if str(users) in run["levels"]]
+        run["usl"] = usl_fit(
+            measured, [run["levels"][str(users)]["throughput_rps"] for users in measured]
+        )
+    return {
+        "endpoints": sorted(
+            endpoints.values(),
+            key=lambda endpoint: -(endpoint["fit"] or {}).get("exponent", -math.inf),
+        ),
+        "runs": runs,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"{'ENDPOINT':<36} {'EXPONENT':>9} {'R2':>6}  GROWTH")
+    for endpoint in report["endpoints"]:
+        fit = endpoint["fit"] or {}
+        marker = " <-" if endpoint["growth"] in ("linear", "superlinear") else ""
+        print(
+            f"{endpoint['name']:<36} {fit.get('exponent', '-'):>9} {fit.get('r2', '-'):>6}"
+            f"  {endpoint['growth']}{marker}"
+        )
+    print(f"{'DATASET':<10} {'BOOKINGS':>10} {'LAMBDA':>8} {'SIGMA':>8} {'KAPPA':>9}  PEAK")
+    for run in report["runs"]:
+        usl = run["usl"] or {}
+        peak = (
+            f"{usl['peak_rps']} req/s at {usl['peak_users']} users" if "peak_users" in usl else "-"
+        )
+        print(
+            f"{run['dataset']['name']:<10} {run['dataset']['bookings']:>10}"
+            f" {usl.get('lambda', '-'):>8} {usl.get('sigma', '-'):>8} {usl.get('kappa', '-'):>9}"
+            f"  {peak}"
+        )
+
+
+def parse_list(value: str) -> List[str]:
+    items = [item.strip() for item in value.split(",") if item.strip()]
+    if not items:
+        raise argparse.ArgumentTypeError("expected a comma-separated list")
+    return items
+
+
+def parse_levels(value: str) -> List[int]:
+    try:
+        levels = sorted({int(item) for item in parse_list(value)})
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected comma-separated user counts") from None
+    if levels[0] < 1:
+        raise argparse.ArgumentTypeError("user counts must be at least 1")
+    return levels
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Measure every scenario endpoint over a grid of dataset sizes and concurrency "
+            "levels; fit latency against dataset size and throughput against concurrency "
+            "(Universal Scalability Law). Datasets not yet recorded are generated before "
+            "their runs and dropped after. render_scaling_report.py turns the results into "
+            "a chart and an HTML report."
+        )
+    )
+    parser.add_argument(
+        "--datasets",
+        type=parse_list,
+        default=parse_list(DATASETS),
+        help="dataset names (presets are generated when missing)",
+    )
+    parser.add_argument(
+        "--levels",
+        type=parse_levels,
+        default=parse_levels(LEVELS),
+        help="concurrent users per load run",
+    )
+    parser.add_argument("--duration", type=float, default=DURATION_S, help="seconds per load run")
+    parser.add_argument("--samples", type=int, default=SAMPLES, help="latency samples per endpoint")
+    parser.add_argument("--warmup", type=int, default=WARMUP, help="untimed requests per endpoint")
+    parser.add_argument("--scenario", type=Path, default=SCENARIO_PATH)
+    parser.add_argument(
+        "--keep", action="store_true", help="leave the datasets this run generated loaded"
+    )
+    args = parser.parse_args()
+    if args.duration <= 0:
+        parser.error("--duration must be positive")
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    runs: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="kaizen-scaling-") as directory:
+        for name in args.datasets:
+            generated = not datasets.manifest_path(name).exists()
+            if generated:
+                print(f"Generating dataset {name!r}")
+                if not run_script("generate_dataset.py", [name], {}):
+                    return 1
+            # Every recorded dataset is in the database at once, and all of them are read.
+            others = [
+                path.stem for path in datasets.DATASETS_DIR.glob("*.json") if path.stem != name
+            ]
+            if others:
+                print(f"Note: {', '.join(others)} also loaded; sizes here count {name} alone")
+            manifest = datasets.load_manifest(name)
+            print(f"Dataset {name}: {manifest['bookings']} bookings")
+            try:
+                run = measure_dataset(name, args.levels, args, Path(directory))
+            finally:
+                if generated and not args.keep:
+                    run_script("generate_dataset.py", [name, "--drop"], {})
+            runs.append({"dataset": datasets.summary(manifest), "generated": generated, **run})
+
+    report = {
+        "mode": "scaling",
+        "base_url": BASE_URL,
+        "levels": args.levels,
+        "duration_s": args.duration,
+        "samples": args.samples,
+        "thresholds": {"flat": FLAT, "linear": LINEAR, "superlinear": SUPERLINEAR},
+        **analyse(runs, args.levels),
+    }
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print_report(report)
+    print(f"Saved scaling results to {OUTPUT_PATH}; render them with render_scaling_report.py")
+    return 0 if all(run["latency"] and run["levels"] for run in runs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
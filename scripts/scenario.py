@@ -0,0 +1,205 @@
+import json
+import re
+import urllib.parse
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+SCENARIO_DIR = Path(__file__).resolve().parent / "scenarios"
+DEFAULT_SCENARIO = SCENARIO_DIR / "baseline.json"
+HTTP_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
+
+# "{name}" or "{name|filter}" inside any string of a step.
+PLACEHOLDER = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)(?:\|([a-z]+))?\}")
+FILTERS = {
+    "url": lambda value: urllib.parse.quote(value, safe=""),
+}
+
+
+class ScenarioError(ValueError):
+    pass
+
+
+def placeholder_matches(value: Any) -> Iterator["re.Match[str]"]:
+    if isinstance(value, str):
+        yield from PLACEHOLDER.finditer(value)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from placeholder_matches(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from placeholder_matches(item)
+
+
+def placeholders(value: Any) -> Set[str]:
+    return {match.group(1) for match in placeholder_matches(value)}
+
+
+def render(value: Any, variables: Dict[str, str]) -> Any:
+    if isinstance(value, str):
+
+        def substitute(match: "re.Match[str]") -> str:
+            name, filter_name = match.group(1), match.group(2)
+            if name not in variables:
+                raise ScenarioError(f"Variable {name!r} has no value yet")
+            return FILTERS[filter_name](variables[name]) if filter_name else variables[name]
+
+        return PLACEHOLDER.sub(substitute, value)
+    if isinstance(value, dict):
+        return {key: render(item, variables) for key, item in value.items()}
+    if isinstance(value, list):
+        return [render(item, variables) for item in value]
+    return value
+
+
+def lookup(body: Any, path: str) -> Any:
+    current = body
+    for part in path.split("."):
+        if isinstance(current, list) and part.isdigit():
+            index = int(part)
+            current = current[index] if index < len(current) else None
+        elif isinstance(current, dict):
+            current = current.get(part)
+        else:
+            return None
+        if current is None:
+            return None
+    return current
+
+
+def extract_value(body: Any, paths: Union[str, List[str]]) -> Optional[str]:
+    for path in [paths] if isinstance(paths, str) else paths:
+        value = lookup(body, path)
+        if value not in (None, ""):
+            return str(value)
+    return None
+
+
+def step_produces(step: Dict[str, Any]) -> Set[str]:
+    return set(step.get("extract", {}))
+
+
+def step_requires(step: Dict[str, Any]) -> Set[str]:
+    return placeholders([step["path"], step.get("params"), step.get("json")])
+
+
+def default_requires(step: Dict[str, Any]) -> Set[str]:
+    return placeholders([spec.get("default") for spec in step.get("extract", {}).values()])
+
+
+REQUEST = "request"
+EXTRACT = "extract"
+Node = Tuple[str, str]
+
+
+def dependency_graph(scenario: Dict[str, Any]) -> Dict[Node, Set[Node]]:
+    """Map every (step name, phase) node to the nodes that must finish before it runs.
+
+    Each step has a REQUEST phase (send it) and an EXTRACT phase (pull variables from its
+    response). A request waits only for the extracts of the variables it uses. An extract
+    also waits for whatever its defaults reference. If it overwrites a variable, it waits
+    for the earlier readers first. Everything else may run concurrently.
+    """
+    producers: Dict[str, Node] = {}
+    readers: Dict[str, List[Node]] = {}
+    graph: Dict[Node, Set[Node]] = {}
+    for step in scenario["steps"]:
+        request, extract = (step["name"], REQUEST), (step["name"], EXTRACT)
+        graph[request] = {producers[var] for var in step_requires(step) if var in producers}
+        graph[extract] = {request}
+        graph[extract].update(
+            producers[var] for var in default_requires(step) if var in producers
+        )
+        for var in step_produces(step):
+            if var in producers:
+                graph[extract].add(producers[var])
+            graph[extract].update(readers.get(var, []))
+        graph[extract].discard(extract)
+        for var in step_requires(step):
+            readers.setdefault(var, []).append(request)
+        for var in default_requires(step):
+            readers.setdefault(var, []).append(extract)
+        for var in step_produces(step):
+            producers[var] = extract
+            readers[var] = []
+    return graph
+
+
+def critical_path_length(graph: Dict[Node, Set[Node]]) -> int:
+    """Number of requests on the longest dependency chain (extracts cost nothing)."""
+    depth: Dict[Node, int] = {}
+    for node, depends in graph.items():
+        own = 1 if node[1] == REQUEST else 0
+        depth[node] = own + max((depth[dep] for dep in depends), default=0)
+    return max(depth.values(), default=0)
+
+
+def validate(scenario: Dict[str, Any], builtins: Iterable[str]) -> None:
+    steps = scenario.get("steps")
+    if not isinstance(steps, list) or not steps:
+        raise ScenarioError("Scenario must declare a non-empty 'steps' list")
+
+    known = set(builtins) | set(scenario.get("variables", {}))
+    names: Set[str] = set()
+    for index, step in enumerate(steps, start=1):
+        label = step.get("name") or f"step {index}"
+        if not step.get("name") or not step.get("path"):
+            raise ScenarioError(f"{label}: 'name' and 'path' are required")
+        if step["name"] in names:
+            raise ScenarioError(f"{label}: duplicate step name")
+        names.add(step["name"])
+        if step.get("method", "GET").upper() not in HTTP_METHODS:
+            raise ScenarioError(f"{label}: unsupported method {step.get('method')!r}")
+        if step.get("weight", 1) <= 0:
+            raise ScenarioError(f"{label}: weight must be positive")
+        for spec in step.get("extract", {}).values():
+            if "from" not in spec:
+                raise ScenarioError(f"{label}: every extract needs a 'from' path")
+        missing = (step_requires(step) | default_requires(step)) - known
+        if missing:
+            raise ScenarioError(
+                f"{label}: uses {', '.join(sorted(missing))} before any step extracts it"
+            )
+        for match in placeholder_matches([step["path"], step.get("params"), step.get("json")]):
+            if match.group(2) and match.group(2) not in FILTERS:
+                raise ScenarioError(f"{label}: unknown filter {match.group(2)!r}")
+        known |= step_produces(step)
+
+
+def load_scenario(path: Path, builtins: Iterable[str] = ()) -> Dict[str, Any]:
+    with path.open("r", encoding="utf-8") as fh:
+        scenario = json.load(fh)
+    validate(scenario, builtins)
+    return scenario
+
+
+def resolve_step(step: Dict[str, Any], variables: Dict[str, str]) -> Dict[str, Any]:
+    return {
+        "method": step.get("method", "GET").upper(),
+        "path": render(step["path"], variables),
+        "name": step["name"],
+        "requires_auth": step.get("auth", True),
+        "params": render(step.get("params"), variables),
+        "json_data": render(step.get("json"), variables),
+    }
+
+
+def step_note(step: Dict[str, Any], fallbacks: Set[str]) -> Optional[str]:
+    if step.get("fallback_note") and step_requires(step) & fallbacks:
+        return step["fallback_note"]
+    return step.get("note")
+
+
+def apply_extracts(
+    step: Dict[str, Any],
+    body: Any,
+    variables: Dict[str, str],
+    fallbacks: Set[str],
+) -> None:
+    for name, spec in step.get("extract", {}).items():
+        value = extract_value(body, spec["from"])
+        if value is None:
+            value = render(str(spec.get("default", "")), variables)
+            fallbacks.add(name)
+        else:
+            fallbacks.discard(name)
+        variables[name] = value
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+import kaizen_db
+from latency_stats import LatencyHistogram
+from measure_response_times import BASE_URL, END_TIME, START_TIME, login
+from phase_timing import timed_session
+from streamed_lists import Runs, fetch, iso, paired_rows, store_run
+
+OUTPUT_PATH = Path(
+    os.environ.get("KAIZEN_SERIALIZATION_PATH", "screenshots/serialization_results.json")
+)
+SIZES = os.environ.get("KAIZEN_SERIALIZATION_SIZES", "1000,10000,100000")
+SAMPLES = int(os.environ.get("KAIZEN_SERIALIZATION_SAMPLES", "5"))
+WARMUP = int(os.environ.get("KAIZEN_SERIALIZATION_WARMUP", "1"))
+# Dapur's time-range list includes two relations per row and, up to the server's
+# TIME_RANGE_MAX_ROWS (raise it past the largest size), returns the whole window in one
+# response: the largest list response there is.
+TABLE = "Dapur"
+PATH = "/api/v1/dapur/time-range"
+# Hourly rows from here on; nothing real is booked this far back.
+WINDOW_START = datetime(2001, 1, 1)
+
+
+def window(rows: int) -> Tuple[datetime, datetime]:
+    """The seeded window holding exactly the first `rows` hourly bookings."""
+    return WINDOW_START, WINDOW_START + timedelta(hours=rows - 1, minutes=30)
+
+
+def size_label(rows: int) -> str:
+    return f"{rows // 1000}k" if rows % 1000 == 0 else str(rows)
+
+
+def seed(conn: Any, rows: int) -> int:
+    owner_id = kaizen_db.scalar(conn, "SELECT id FROM `Users` ORDER BY id LIMIT 1")
+    facility_id = kaizen_db.scalar(conn, "SELECT id FROM `FasilitasDapur` ORDER BY id LIMIT 1")
+    if owner_id is None or facility_id is None:
+        raise RuntimeError("Need a user and a FasilitasDapur row to own the seeded bookings")
+    return kaizen_db.insert_many(
+        conn,
+        TABLE,
+        ["idPeminjam", "idFasilitas", "waktuMulai", "waktuBerakhir"],
+        (
+            (
+                owner_id,
+                facility_id,
+                WINDOW_START + timedelta(hours=index),
+                WINDOW_START + timedelta(hours=index + 1),
+            )
+            for index in range(rows)
+        ),
+    )
+
+
+def clear(conn: Any, rows: int) -> int:
+    # Dapur has no keterangan to mark rows with; the window was empty before seeding.
+    with conn.cursor() as cursor:
+        return cursor.execute(
+            f"DELETE FROM `{TABLE}` WHERE waktuMulai >= %s AND waktuMulai < %s",
+            (WINDOW_START, WINDOW_START + timedelta(hours=rows)),
+        )
+
+
+def run_size(
+    session: requests.Session,
+    token: str,
+    label: str,
+    start: datetime,
+    end: datetime,
+    expected: Optional[int],
+    samples: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"startTime": iso(start), "endTime": iso(end)}
+    if expected:
+        params["limit"] = expected
+    ttfb = LatencyHistogram()
+    total = LatencyHistogram()
+    body = b""
+    result: Dict[str, Any] = {}
+    for index in range(warmup + samples):
+        result, body = fetch(session, token, PATH, params)
+        if result["status_code"] != 200:
+            return {"size": label, "error": f"HTTP {result['status_code']}: {body[:200]!r}"}
+        if index >= warmup:
+            ttfb.record(result["ttfb_ms"])
+            total.record(result["total_ms"])
+
+    # Parsed once, outside the timing: client-side JSON decoding isn't what's measured.
+    rows = len(json.loads(body)["data"])
+    total_p50 = total.summary()["p50_ms"]
+    row: Dict[str, Any] = {
+        "size": label,
+        "rows": rows,
+        "expected_rows": expected,
+        "bytes": len(body),
+        "bytes_per_row": round(len(body) / rows, 1) if rows else None,
+        "gzip_bytes": len(gzip.compress(body, compresslevel=6)),
+        "chunked": result["chunked"],
+        "ttfb": ttfb.summary(),
+        "total": total.summary(),
+    }
+    if total_p50:
+        row["mb_per_s"] = round(len(body) / total_p50 / 1000, 2)
+        row["rows_per_s"] = round(rows / total_p50 * 1000)
+    return row
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'SIZE':<8} {'ROWS':>7} {'MB':>8} {'B/ROW':>6} {'GZIP MB':>8} {'TTFB ms':>9}"
+        f" {'P50 ms':>9} {'P90 ms':>9} {'MB/s':>7} {'ROWS/s':>9}  CHUNKED"
+    )
+    for row in report["sizes"]:
+        if "error" in row:
+            print(f"{row['size']:<8} {row['error']}")
+            continue
+        print(
+            f"{row['size']:<8} {row['rows']:>7} {row['bytes'] / 1e6:>8.2f}"
+            f" {row['bytes_per_row'] or 0:>6.0f} {row['gzip_bytes'] / 1e6:>8.2f}"
+            f" {row['ttfb']['p50_ms'] or 0:>9.2f} {row['total']['p50_ms'] or 0:>9.2f}"
+            f" {row['total']['p90_ms'] or 0:>9.2f} {row.get('mb_per_s', 0):>7.1f}"
+            f" {row.get('rows_per_s', 0):>9}  {'yes' if row['chunked'] else 'no'}"
+        )
+        if row["expected_rows"] is not None and row["rows"] != row["expected_rows"]:
+            print(f"  returned {row['rows']} rows, the window holds {row['expected_rows']}")
+
+
+def print_comparison(runs: Runs, label: str) -> None:
+    """p50 total time of every other stored label against this run, size by size."""
+    for other, pairs in paired_rows(runs, label, "sizes", lambda row: row["size"]):
+        print(f"{label} vs {other}:")
+        for row, mine in pairs:
+            theirs_ms, mine_ms = row["total"]["p50_ms"], mine["total"]["p50_ms"]
+            if theirs_ms and mine_ms:
+                print(
+                    f"  {row['size']:<8} {theirs_ms:>9.2f} -> {mine_ms:>9.2f} ms"
+                    f" ({theirs_ms / mine_ms:.2f}x), TTFB {row['ttfb']['p50_ms']:.2f}"
+                    f" -> {mine['ttfb']['p50_ms']:.2f} ms"
+                )
+
+
+def parse_sizes(value: str) -> List[int]:
+    try:
+        sizes = sorted({int(item) for item in value.split(",") if item.strip()})
+    except ValueError:
+        raise argparse.ArgumentTypeError("expected a comma-separated list of row counts") from None
+    if not sizes or sizes[0] < 1:
+        raise argparse.ArgumentTypeError("row counts must be at least 1")
+    return sizes
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            f"Seed hourly {TABLE} bookings and time {PATH} responses of each size: payload "
+            "bytes, time to first byte, download time and throughput. Run once per server "
+            "configuration with its own --label to compare them."
+        )
+    )
+    parser.add_argument(
+        "--sizes", type=parse_sizes, default=parse_sizes(SIZES), help="rows per response"
+    )
+    parser.add_argument(
+        "--label",
+        default="default",
+        help="name this run is stored under, e.g. compiled or native (JSON_SERIALIZER)",
+    )
+    parser.add_argument(
+        "--no-seed",
+        action="store_true",
+        help="time one existing window (--start/--end) instead; no database needed",
+    )
+    parser.add_argument("--start", default=START_TIME, help="window start with --no-seed")
+    parser.add_argument("--end", default=END_TIME, help="window end with --no-seed")
+    parser.add_argument("--samples", type=int, default=SAMPLES, help="timed requests per size")
+    parser.add_argument("--warmup", type=int, default=WARMUP, help="untimed requests per size")
+    parser.add_argument("--keep", action="store_true", help="leave the seeded bookings in place")
+    args = parser.parse_args()
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup must not be negative")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    conn = None
+    if not args.no_seed:
+        try:
+            conn = kaizen_db.connect()
+        except (RuntimeError, ValueError) as exc:
+            print(exc, file=sys.stderr)
+            return 2
+        existing = kaizen_db.scalar(
+            conn,
+            f"SELECT COUNT(*) FROM `{TABLE}` WHERE waktuMulai >= %s AND waktuMulai < %s",
+            (WINDOW_START, WINDOW_START + timedelta(hours=args.sizes[-1])),
+        )
+        if existing:
+            print(
+                f"{existing} {TABLE} booking(s) already in the benchmark window from "
+                f"{WINDOW_START:%Y-%m-%d}; remove them first",
+                file=sys.stderr,
+            )
+            conn.close()
+            return 1
+
+    session = timed_session()
+    _, token = login(session)
+    if not token:
+        print("Login failed; cannot continue", file=sys.stderr)
+        return 1
+
+    report: Dict[str, Any] = {
+        "mode": "serialization",
+        "base_url": BASE_URL,
+        "label": args.label,
+        "path": PATH,
+        "samples": args.samples,
+        "seeded": 0,
+        "sizes": [],
+    }
+    try:
+        if conn is None:
+            start = datetime.fromisoformat(args.start.replace("Z", ""))
+            end = datetime.fromisoformat(args.end.replace("Z", ""))
+            cases = [("window", start, end, None)]
+        else:
+            started = time.perf_counter()
+            report["seeded"] = seed(conn, args.sizes[-1])
+            report["seed_s"] = round(time.perf_counter() - started, 3)
+            print(f"Seeded {report['seeded']} rows in {report['seed_s']:.1f}s")
+            cases = [(size_label(size), *window(size), size) for size in args.sizes]
+
+        for label, start, end, expected in cases:
+            report["sizes"].append(
+                run_size(session, token, label, start, end, expected, args.samples, args.warmup)
+            )
+    except (RuntimeError, requests.RequestException) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    finally:
+        if conn is not None:
+            if report["seeded"] and not args.keep:
+                clear(conn, args.sizes[-1])
+            conn.close()
+
+    runs = store_run(OUTPUT_PATH, args.label, report)
+    print_report(report)
+    print_comparison(runs, args.label)
+    print(f"Saved serialization benchmark to {OUTPUT_PATH} as {args.label!r}")
+    wrong = [
+        row
+        for row in report["sizes"]
+        if "error" in row or row["expected_rows"] not in (None, row["rows"])
+    ]
+    return 1 if wrong else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from query_stats import route_lookup
+
+METRICS_PATH = "/metrics"
+# Only needed when the API sets METRICS_TOKEN.
+METRICS_TOKEN = os.environ.get("KAIZEN_METRICS_TOKEN")
+REQUEST_HISTOGRAM = "kaizen_http_request_duration_seconds"
+LAG_HISTOGRAM = "kaizen_event_loop_lag_seconds"
+
+# (metric name, sorted label pairs) -> value
+Samples = Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]
+
+SAMPLE_LINE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)")
+LABEL_PAIR = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def parse_prometheus(text: str) -> Samples:
+    samples: Samples = {}
+    for line in text.splitlines():
+        match = SAMPLE_LINE.match(line)
+        if not match or line.startswith("#"):
+            continue
+        name, labels, value = match.groups()
+        pairs = tuple(
+            sorted(
+                (key, raw.replace('\\"', '"').replace("\\n", "\n").replace("\\\\", "\\"))
+                for key, raw in LABEL_PAIR.findall(labels or "")
+            )
+        )
+        samples[(name, pairs)] = float(value)
+    return samples
+
+
+def scrape(session: requests.Session, base_url: str) -> Optional[Samples]:
+    """GET /metrics; None if the API doesn't serve it (METRICS=false or an older build)."""
+    headers = {"Authorization": f"Bearer {METRICS_TOKEN}"} if METRICS_TOKEN else {}
+    try:
+        response = session.get(f"{base_url}{METRICS_PATH}", headers=headers, timeout=10)
+    except requests.RequestException:
+        return None
+    if response.status_code != 200:
+        return None
+    return parse_prometheus(response.text)
+
+
+def histogram_quantile(quantile: float, buckets: List[Tuple[float, float]]) -> Optional[float]:
+    """Prometheus-style estimate: interpolate linearly inside the bucket holding the quantile."""
+    if not buckets or buckets[-1][1] <= 0:
+        return None
+    rank = quantile * buckets[-1][1]
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if bound == float("inf"):
+                # Nothing to interpolate towards; the highest finite bound is the best guess.
+                return lower_bound
+            if count == lower_count:
+                return bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / (
+                count - lower_count
+            )
+        lower_bound, lower_count = bound, count
+    return None
+
+
+def route_latency(before: Samples, after: Samples) -> Dict[str, Dict[str, Any]]:
+    """Server-side latency per "METHOD route" over the run, from the histogram deltas."""
+    routes: Dict[str, Dict[str, Any]] = {}
+    for (name, labels), value in after.items():
+        if not name.startswith(REQUEST_HISTOGRAM):
+            continue
+        delta = value - before.get((name, labels), 0.0)
+        label = dict(labels)
+        entry = routes.setdefault(
+            f"{label['method']} {label['route']}",
+            {"buckets": {}, "sum": 0.0, "count": 0.0, "errors": 0.0},
+        )
+        if name.endswith("_bucket"):
+            bound = float(label["le"])
+            entry["buckets"][bound] = entry["buckets"].get(bound, 0.0) + delta
+        elif name.endswith("_sum"):
+            entry["sum"] += delta
+        elif name.endswith("_count"):
+            entry["count"] += delta
+            if int(label["status"]) >= 500:
+                entry["errors"] += delta
+
+    summaries = {}
+    for route, entry in routes.items():
+        if entry["count"] <= 0:
+            continue
+        buckets = sorted(entry["buckets"].items())
+
+        def ms(quantile: float) -> Optional[float]:
+            value = histogram_quantile(quantile, buckets)
+            return round(value * 1000, 2) if value is not None else None
+
+        summaries[route] = {
+            "route": route,
+            "requests": int(entry["count"]),
+            "server_errors": int(entry["errors"]),
+            "mean_ms": round(entry["sum"] / entry["count"] * 1000, 2),
+            "p50_ms": ms(0.5),
+            "p90_ms": ms(0.9),
+            "p99_ms": ms(0.99),
+        }
+    return summaries
+
+
+def bucket_deltas(before: Samples, after: Samples, name: str) -> List[Tuple[float, float]]:
+    """(le, cumulative count) of an unlabelled histogram, counted between the two scrapes."""
+    bucket = f"{name}_bucket"
+    return sorted(
+        (float(dict(labels)["le"]), value - before.get((metric, labels), 0.0))
+        for (metric, labels), value in after.items()
+        if metric == bucket
+    )
+
+
+def gauge(samples: Samples, name: str, **labels: str) -> Optional[float]:
+    return samples.get((name, tuple(sorted(labels.items()))))
+
+
+def process_summary(before: Samples, after: Samples) -> Dict[str, Any]:
+    def mb(value: Optional[float]) -> Optional[float]:
+        return round(value / 2**20, 1) if value is not None else None
+
+    # The lag histogram is cumulative, so the bucket deltas cover just the run.
+    lag = bucket_deltas(before, after, LAG_HISTOGRAM)
+
+    def lag_ms(quantile: float) -> Optional[float]:
+        value = histogram_quantile(quantile, lag)
+        return round(value * 1000, 2) if value is not None else None
+
+    return {
+        "event_loop_lag_p50_ms": lag_ms(0.5),
+        "event_loop_lag_p99_ms": lag_ms(0.99),
+        # The upper bound of the bucket the slowest sample fell in.
+        "event_loop_lag_max_ms": lag_ms(1.0),
+        "heap_used_mb_before": mb(gauge(before, "nodejs_heap_size_used_bytes")),
+        "heap_used_mb_after": mb(gauge(after, "nodejs_heap_size_used_bytes")),
+        "rss_mb_before": mb(gauge(before, "process_resident_memory_bytes")),
+        "rss_mb_after": mb(gauge(after, "process_resident_memory_bytes")),
+        "in_flight_after": gauge(after, "kaizen_http_requests_in_flight"),
+    }
+
+
+def merge_server_metrics(rows: List[Dict[str, Any]], routes: Dict[str, Dict[str, Any]]) -> int:
+    """Attach each row's server-side latency as row["server"]; returns rows matched."""
+    lookup = route_lookup(routes)
+    matched = 0
+    for row in rows:
+        route = lookup(row["method"], row["path"])
+        if route is not None:
+            row["server"] = routes[route]
+            matched += 1
+    return matched
+
+
+def print_server_report(rows: List[Dict[str, Any]], process: Dict[str, Any]) -> None:
+    print(
+        f"{'ENDPOINT':<36} {'CLIENT P50':>10} {'SERVER P50':>10} {'CLIENT P99':>10}"
+        f" {'SERVER P99':>10} {'OVERHEAD':>9}"
+    )
+    for row in rows:
+        server = row.get("server")
+        if not server:
+            continue
+        client = row["stats"]
+        # Client minus server time: network, TLS, proxies and anything before Express.
+        overhead = (
+            f"{client['p50_ms'] - server['p50_ms']:>9.2f}"
+            if client.get("p50_ms") is not None and server["p50_ms"] is not None
+            else f"{'-':>9}"
+        )
+        print(
+            f"{row['name']:<36} {client.get('p50_ms') or 0:>10.2f} {server['p50_ms'] or 0:>10.2f}"
+            f" {client.get('p99_ms') or 0:>10.2f} {server['p99_ms'] or 0:>10.2f} {overhead}"
+        )
+    print("(server percentiles are interpolated from histogram buckets)")
+    lag = process.get("event_loop_lag_p99_ms")
+    if lag is not None:
+        print(
+            f"event loop lag p50 {process['event_loop_lag_p50_ms']:.2f} ms,"
+            f" p99 {lag:.2f} ms, max {process['event_loop_lag_max_ms']:.2f} ms"
+        )
+    if process.get("heap_used_mb_before") is not None:
+        print(
+            f"heap used {process['heap_used_mb_before']} -> {process['heap_used_mb_after']} MB,"
+            f" rss {process['rss_mb_before']} -> {process['rss_mb_after']} MB"
+        )
@@ -0,0 +1,158 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from latency_stats import LatencyHistogram
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+# Series fitted for drift, in the order the report prints them.
+DRIFT_METRICS = ("p50_ms", "p99_ms", "throughput_rps", "error_rate", "rss_mb", "cpu_pct")
+
+
+class ProcessSampler:
+    """Reads RSS, CPU time, threads and open files of a local process from /proc."""
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self.proc = Path("/proc") / str(pid)
+        self.last_cpu_s: Optional[float] = None
+        self.last_at: Optional[float] = None
+
+    def read_stat(self) -> List[str]:
+        raw = (self.proc / "stat").read_text()
+        # The command name may contain spaces; every field after it is space-separated.
+        return raw[raw.rindex(")") + 2 :].split()
+
+    def sample(self) -> Optional[Dict[str, Any]]:
+        try:
+            fields = self.read_stat()
+        except OSError:
+            return None
+        now = time.monotonic()
+        # Fields are numbered from 1 in proc(5); `fields` starts at field 3 (state).
+        cpu_s = (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+        sample: Dict[str, Any] = {
+            "rss_mb": round(int(fields[21]) * PAGE_SIZE / 1024 / 1024, 2),
+            "threads": int(fields[17]),
+            "cpu_pct": None,
+            "open_fds": None,
+        }
+        if self.last_cpu_s is not None and self.last_at is not None and now > self.last_at:
+            sample["cpu_pct"] = round((cpu_s - self.last_cpu_s) / (now - self.last_at) * 100, 2)
+        self.last_cpu_s, self.last_at = cpu_s, now
+        try:
+            sample["open_fds"] = len(os.listdir(self.proc / "fd"))
+        except OSError:
+            pass  # Other users' fds need privileges; the rest is still useful.
+        return sample
+
+
+class WindowRecorder:
+    """Accumulates results into fixed time windows; roll() closes one and starts the next."""
+
+    def __init__(self, sampler: Optional[ProcessSampler] = None) -> None:
+        self.sampler = sampler
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.window_started = self.started
+        self.index = 0
+        self.total = LatencyHistogram()
+        self.total_requests = 0
+        self.total_errors = 0
+        self.reset()
+        if sampler is not None:
+            sampler.sample()  # Primes the CPU counter so the first window gets a rate.
+
+    def reset(self) -> None:
+        self.histogram = LatencyHistogram()
+        self.requests = 0
+        self.errors = 0
+
+    def record(self, elapsed_ms: float, error: bool) -> None:
+        with self.lock:
+            self.histogram.record(elapsed_ms)
+            self.requests += 1
+            self.errors += error
+
+    def roll(self) -> Dict[str, Any]:
+        now = time.perf_counter()
+        with self.lock:
+            histogram, requests_made, errors = self.histogram, self.requests, self.errors
+            self.reset()
+            started, self.window_started = self.window_started, now
+        self.total.merge(histogram)
+        self.total_requests += requests_made
+        self.total_errors += errors
+        length_s = now - started
+        stats = histogram.summary()
+        window: Dict[str, Any] = {
+            "window": self.index,
+            "offset_s": round(started - self.started, 2),
+            "length_s": round(length_s, 2),
+            "requests": requests_made,
+            "errors": errors,
+            "error_rate": round(errors / requests_made, 4) if requests_made else 0.0,
+            "throughput_rps": round(requests_made / length_s, 2) if length_s > 0 else 0.0,
+            "p50_ms": stats["p50_ms"],
+            "p90_ms": stats["p90_ms"],
+            "p99_ms": stats["p99_ms"],
+            "max_ms": stats["max_ms"],
+            "process": self.sampler.sample() if self.sampler is not None else None,
+        }
+        self.index += 1
+        return window
+
+
+def linear_fit(xs: Sequence[float], ys: Sequence[float]) -> Optional[Dict[str, float]]:
+    """Least-squares line through the points: {"slope", "intercept"}."""
+    n = len(xs)
+    if n < 2:
+        return None
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+    return {"slope": slope, "intercept": mean_y - slope * mean_x}
+
+
+def window_value(window: Dict[str, Any], metric: str) -> Optional[float]:
+    if metric in ("rss_mb", "cpu_pct"):
+        return (window.get("process") or {}).get(metric)
+    return window.get(metric)
+
+
+def drift(windows: List[Dict[str, Any]], window_s: float) -> Dict[str, Dict[str, Any]]:
+    """Per metric, the fitted trend across windows rather than first/last snapshots.
+
+    `start`/`end` are points on the fitted line at the first and last window, so one
+    noisy minute at either end can't fake (or hide) a trend. Windows shorter than half
+    of `window_s` (the tail left when the run stops) are too few requests to be a point.
+    """
+    full = [window for window in windows if window["length_s"] >= window_s / 2]
+    report: Dict[str, Dict[str, Any]] = {}
+    for metric in DRIFT_METRICS:
+        points = [
+            ((window["offset_s"] + window["length_s"] / 2) / 3600, value)
+            for window in full
+            if (value := window_value(window, metric)) is not None
+        ]
+        fit = linear_fit([x for x, _ in points], [y for _, y in points])
+        if fit is None:
+            continue
+        first_x, last_x = points[0][0], points[-1][0]
+        start = fit["intercept"] + fit["slope"] * first_x
+        end = fit["intercept"] + fit["slope"] * last_x
+        report[metric] = {
+            "windows": len(points),
+            "slope_per_hour": round(fit["slope"], 4),
+            "start": round(start, 3),
+            "end": round(end, 3),
+            "change_pct": round((end - start) / abs(start) * 100, 2) if start else None,
+        }
+    return report
@@ -0,0 +1,74 @@
+import json
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Tuple
+
+import requests
+
+from measure_response_times import BASE_URL
+
+READ_CHUNK = 64 * 1024
+
+Runs = Dict[str, Dict[str, Any]]
+
+
+def iso(value: datetime) -> str:
+    """The API's timestamp format: milliseconds and a Z suffix."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%f")[:-3] + "Z"
+
+
+def fetch(
+    session: requests.Session, token: str, path: str, params: Dict[str, Any]
+) -> Tuple[Dict[str, Any], bytes]:
+    """One list request read as it arrives: time to first byte, total time and the body."""
+    started = time.perf_counter()
+    response = session.get(
+        f"{BASE_URL}{path}",
+        params=params,
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=300,
+        stream=True,
+    )
+    first_byte_at = None
+    chunks: List[bytes] = []
+    for chunk in response.iter_content(READ_CHUNK):
+        if first_byte_at is None:
+            first_byte_at = time.perf_counter()
+        chunks.append(chunk)
+    finished_at = time.perf_counter()
+    result = {
+        "status_code": response.status_code,
+        "ttfb_ms": round(((first_byte_at or finished_at) - started) * 1000, 2),
+        "total_ms": round((finished_at - started) * 1000, 2),
+        "chunked": response.headers.get("Transfer-Encoding", "").lower() == "chunked",
+    }
+    return result, b"".join(chunks)
+
+
+def store_run(path: Path, label: str, report: Dict[str, Any]) -> Runs:
+    """Save `report` under `label`; earlier runs stay in the file under their own labels."""
+    runs: Runs = {}
+    if path.exists():
+        with path.open(encoding="utf-8") as fh:
+            runs = json.load(fh).get("runs", {})
+    runs[label] = report
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        json.dump({"runs": runs}, fh, indent=2)
+    return runs
+
+
+def paired_rows(
+    runs: Runs, label: str, section: str, key: Callable[[Dict[str, Any]], Hashable]
+) -> Iterator[Tuple[str, List[Tuple[Dict[str, Any], Dict[str, Any]]]]]:
+    """Per other stored label, its rows paired with this run's row for the same case."""
+    current = {key(row): row for row in runs[label][section] if "error" not in row}
+    for other, run in runs.items():
+        if other == label:
+            continue
+        yield other, [
+            (row, current[key(row)])
+            for row in run[section]
+            if "error" not in row and key(row) in current
+        ]
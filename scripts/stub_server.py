@@ -0,0 +1,983 @@
+#!/usr/bin/env python3
+import argparse
+import asyncio
+import base64
+import bisect
+import inspect
+import json
+import os
+import random
+import re
+import secrets
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, unquote, urlsplit
+
+HOST = os.environ.get("KAIZEN_STUB_HOST", "127.0.0.1")
+PORT = int(os.environ.get("KAIZEN_STUB_PORT", "3000"))
+LATENCY_MS = float(os.environ.get("KAIZEN_STUB_LATENCY_MS", "0"))
+JITTER_MS = float(os.environ.get("KAIZEN_STUB_JITTER_MS", "0"))
+ERROR_RATE = float(os.environ.get("KAIZEN_STUB_ERROR_RATE", "0"))
+BOOKINGS_PER_MODULE = int(os.environ.get("KAIZEN_STUB_BOOKINGS", "200"))
+CHECK_INSERT_GAP_MS = float(os.environ.get("KAIZEN_STUB_CHECK_INSERT_GAP_MS", "0"))
+CACHE_MISS_MS = float(os.environ.get("KAIZEN_STUB_CACHE_MISS_MS", "0"))
+CACHE_TTL_S = float(os.environ.get("KAIZEN_STUB_CACHE_TTL", "60"))
+ROW_SCAN_US = float(os.environ.get("KAIZEN_STUB_ROW_SCAN_US", "0"))
+AUTH_VERIFY_US = float(os.environ.get("KAIZEN_STUB_AUTH_VERIFY_US", "0"))
+LOGIN_HASH_MS = float(os.environ.get("KAIZEN_STUB_LOGIN_HASH_MS", "0"))
+PASSWORD_WORKERS = int(os.environ.get("KAIZEN_STUB_PASSWORD_WORKERS", "0"))
+# Same default cap as TIME_RANGE_MAX_ROWS in src/utils/time-range.ts.
+TIME_RANGE_MAX_ROWS = int(os.environ.get("KAIZEN_STUB_TIME_RANGE_MAX_ROWS", "5000"))
+SEED = int(os.environ.get("KAIZEN_STUB_SEED", "42"))
+USER_WA = os.environ.get("KAIZEN_USER_WA", "+6285790826168")
+USER_PASSWORD = os.environ.get("KAIZEN_USER_PASSWORD", "12345678")
+SAMPLE_MONTH = os.environ.get("KAIZEN_SAMPLE_DATE", "2025-09-20")[:7]
+
+MAX_HEADER_BYTES = 64 * 1024
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    404: "Not Found",
+    500: "Internal Server Error",
+}
+# Same bucket bounds (seconds) as src/utils/metrics.ts.
+METRIC_BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+# JSON payload, or plain text for /metrics
+Response = Tuple[int, Union[Dict[str, Any], str]]
+
+
+def iso(moment: datetime) -> str:
+    return moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
+def ok(data: Any, message: str = "Success") -> Response:
+    return 200, {"success": True, "data": data, "message": message}
+
+
+def fail(status: int, message: str) -> Response:
+    return status, {"success": False, "message": message}
+
+
+# Facility modules mirror the route layout of src/routes/*.routes.ts.
+MODULES: Dict[str, Dict[str, Any]] = {
+    "communal": {"owner": "idPenanggungJawab", "hours": 1, "group": "lantai", "done": True},
+    "serbaguna": {"owner": "idPenanggungJawab", "hours": 1, "group": "idArea", "done": True},
+    "cws": {"owner": "idPenanggungJawab", "hours": 2, "group": None, "done": True},
+    "theater": {"owner": "idPenanggungJawab", "hours": 1, "group": None, "done": True},
+    "dapur": {"owner": "idPeminjam", "hours": 1, "group": "idFasilitas", "done": False},
+    "mesin-cuci-cewe": {"owner": "idPeminjam", "hours": 1, "group": "idFasilitas", "done": False},
+    "mesin-cuci-cowo": {"owner": "idPeminjam", "hours": 1, "group": "idFasilitas", "done": False},
+}
+GROUP_SIZES = {"lantai": 4, "idArea": 3, "idFasilitas": 3}
+OWNER_ROUTES = {"idPenanggungJawab": "penanggung-jawab", "idPeminjam": "peminjam"}
+OWNER_RELATIONS = {"idPenanggungJawab": "penanggungJawab", "idPeminjam": "peminjam"}
+
+
+class StubState:
+    def __init__(self, seed: int, bookings_per_module: int) -> None:
+        rng = random.Random(seed)
+        now = iso(datetime.now(timezone.utc))
+        self.tokens: set = set()
+        self.users = [
+            {
+                "id": str(index),
+                "idAngkatan": str(1 + index % 3),
+                "namaLengkap": f"Penghuni {index}",
+                "namaPanggilan": f"P{index}",
+                "nomorWa": USER_WA if index == 1 else f"+62812000000{index:02d}",
+                "gender": "Male" if index % 2 else "Female",
+                "createdAt": now,
+                "updatedAt": now,
+            }
+            for index in range(1, 21)
+        ]
+        self.areas = [{"id": str(i), "namaArea": f"Area {i}"} for i in range(1, 4)]
+        self.facilities = [
+            {"id": str(i), "fasilitas": f"Fasilitas {i}", "nama": f"Mesin {i}"} for i in range(1, 4)
+        ]
+        self.next_id = 1
+        self.bookings: Dict[str, List[Dict[str, Any]]] = {name: [] for name in MODULES}
+        year, month = (int(part) for part in SAMPLE_MONTH.split("-"))
+        for name, module in MODULES.items():
+            taken = set()
+            for _ in range(bookings_per_module):
+                day = date(year, month, rng.randint(1, 28))
+                hour = 6 + rng.randrange(0, 16 // module["hours"]) * module["hours"]
+                start = datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc)
+                fields = {module["owner"]: str(rng.randint(1, len(self.users)))}
+                if module["group"]:
+                    fields[module["group"]] = str(rng.randint(1, GROUP_SIZES[module["group"]]))
+                key = (start, fields.get(module["group"]))
+                if key in taken:
+                    continue
+                taken.add(key)
+                self.insert(name, start, fields, is_done=rng.random() < 0.5)
+
+    def insert(
+        self, module_name: str, start: datetime, fields: Dict[str, Any], is_done: bool = False
+    ) -> Dict[str, Any]:
+        module = MODULES[module_name]
+        now = iso(datetime.now(timezone.utc))
+        booking = {
+            "id": str(self.next_id),
+            **fields,
+            "waktuMulai": iso(start),
+            "waktuBerakhir": iso(start + timedelta(hours=module["hours"])),
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        if module["done"]:
+            booking.update({"jumlahPengguna": "1", "keterangan": None, "isDone": is_done})
+        else:
+            booking["pinjamPeralatan"] = False
+        self.next_id += 1
+        self.bookings[module_name].append(booking)
+        return booking
+
+    def with_relations(self, module_name: str, booking: Dict[str, Any]) -> Dict[str, Any]:
+        owner_field = MODULES[module_name]["owner"]
+        user = self.users[int(booking[owner_field]) - 1]
+        relation = {key: user[key] for key in ("id", "namaLengkap", "namaPanggilan", "nomorWa")}
+        return {**booking, OWNER_RELATIONS[owner_field]: relation}
+
+    def slots(self, module_name: str, day: str, group_value: Optional[str]) -> List[Dict[str, Any]]:
+        module = MODULES[module_name]
+        base = datetime.fromisoformat(day[:10]).replace(tzinfo=timezone.utc)
+        booked = {
+            booking["waktuMulai"]
+            for booking in self.bookings[module_name]
+            if booking["waktuMulai"].startswith(day[:10])
+            and (group_value is None or booking.get(module["group"]) == group_value)
+        }
+        result = []
+        for hour in range(6, 22, module["hours"]):
+            start = base.replace(hour=hour)
+            end = start + timedelta(hours=module["hours"])
+            result.append(
+                {
+                    "waktuMulai": iso(start),
+                    "waktuBerakhir": iso(end),
+                    "display": f"{start:%H.%M} - {end:%H.%M}",
+                    "available": iso(start) not in booked,
+                }
+            )
+        return result
+
+
+class StubCache:
+    """Tracks which cacheable responses the real API would serve from its read cache.
+
+    Responses are still computed fresh; a miss only adds `miss_ms` of simulated load time.
+    """
+
+    def __init__(self, ttl_s: float) -> None:
+        self.ttl_s = ttl_s
+        self.expires: Dict[str, float] = {}
+        self.counters: Dict[str, Dict[str, int]] = {}
+        self.invalidations = 0
+
+    def lookup(self, key: str) -> bool:
+        hit = self.expires.get(key, 0) > time.monotonic()
+        counter = self.counters.setdefault(key.split("/")[3], {"hits": 0, "misses": 0})
+        counter["hits" if hit else "misses"] += 1
+        return hit
+
+    def store(self, key: str) -> None:
+        self.expires[key] = time.monotonic() + self.ttl_s
+
+    def invalidate(self, prefix: str = "") -> int:
+        self.invalidations += 1
+        keys = [key for key in self.expires if key.startswith(prefix)]
+        for key in keys:
+            del self.expires[key]
+        return len(keys)
+
+    def stats(self) -> Dict[str, Any]:
+        hits = sum(counter["hits"] for counter in self.counters.values())
+        misses = sum(counter["misses"] for counter in self.counters.values())
+        return {
+            "enabled": True,
+            "backend": "memory",
+            "entries": len(self.expires),
+            "hits": hits,
+            "misses": misses,
+            "hitRate": hits / (hits + misses) if hits + misses else 0,
+            "invalidations": self.invalidations,
+            "evictions": 0,
+            "namespaces": self.counters,
+        }
+
+
+class StubApp:
+    def __init__(self, state: StubState, args: argparse.Namespace) -> None:
+        self.state = state
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.routes: List[Tuple[str, "re.Pattern[str]", bool, Callable[..., Any]]] = []
+        self.cache = StubCache(args.cache_ttl)
+        # Per-route totals in the shape of GET /api/v1/query-stats. The stub has no database,
+        # so queries and dbTimeMs stay 0; requests and totalTimeMs are real.
+        self.route_stats: Dict[str, Dict[str, Any]] = {}
+        self.stats_since = iso(datetime.now(timezone.utc))
+        # Per (method, route, status) latency histograms for GET /metrics; bucket counts
+        # are not cumulative and the last slot is +Inf.
+        self.latency: Dict[Tuple[str, str, int], Dict[str, Any]] = {}
+        self.in_flight = 0
+        # Tokens the real API's verified-token cache would hold, and its hit/miss/bypass counts.
+        self.verified: set = set()
+        self.auth_cache = {"hit": 0, "miss": 0, "bypass": 0}
+        # Like PasswordHasher: bcrypt on the event loop, or on this many workers.
+        self.password_workers = asyncio.Semaphore(max(args.password_workers, 1))
+        # Reads the real API serves through CacheUtil: reference lists and slot grids.
+        self.cached: List["re.Pattern[str]"] = [
+            re.compile(r"^/api/v1/serbaguna/areas$"),
+            re.compile(r"^/api/v1/(dapur|mesin-cuci-cewe|mesin-cuci-cowo)/facilities$"),
+            re.compile(r"^/api/v1/(communal|serbaguna)/available-slots/"),
+            re.compile(r"^/api/v1/(theater|cws|dapur|mesin-cuci-cewe|mesin-cuci-cowo)/time-slots$"),
+        ]
+        self.build_routes()
+
+    def route(
+        self, method: str, pattern: str, handler: Callable[..., Any], auth: bool = True
+    ) -> None:
+        self.routes.append((method, re.compile(f"^{pattern}$"), auth, handler))
+
+    def build_routes(self) -> None:
+        state = self.state
+        self.route("GET", "/health", lambda **_: ok({}, "API is healthy"), auth=False)
+        self.route(
+            "GET", "/api/v1", lambda **_: ok({"version": "1.0.0"}, "Kaizen API v1"), auth=False
+        )
+        self.route("POST", "/api/v1/auth/login", self.login, auth=False)
+        self.route("POST", "/api/v1/auth/logout", self.logout)
+        self.route(
+            "GET",
+            "/api/v1/auth/profile",
+            lambda **_: ok(state.users[0], "Profile berhasil diambil"),
+        )
+        self.route("GET", "/api/v1/users", lambda query, **_: self.paginated(state.users, query))
+        self.route(
+            "GET",
+            r"/api/v1/users/angkatan/(?P<value>\d+)",
+            lambda value, **_: ok(
+                [user for user in state.users if user["idAngkatan"] == value],
+                "Users retrieved successfully",
+            ),
+        )
+        self.route("GET", r"/api/v1/users/wa/(?P<value>[^/]+)", self.user_by_wa)
+        self.route(
+            "GET", r"/api/v1/users/(?P<value>\d+)", lambda value, **_: self.find(state.users, value)
+        )
+        self.route(
+            "GET",
+            "/api/v1/serbaguna/areas",
+            lambda **_: ok(state.areas, "Data area serbaguna berhasil diambil"),
+        )
+        for name in ("dapur", "mesin-cuci-cewe", "mesin-cuci-cowo"):
+            self.route(
+                "GET",
+                f"/api/v1/{name}/facilities",
+                lambda **_: ok(state.facilities, "Data fasilitas berhasil diambil"),
+            )
+        self.route("GET", "/api/v1/cache/stats", lambda **_: ok(self.cache.stats()))
+        self.route("POST", "/api/v1/cache/flush", self.flush_cache)
+        self.route("GET", "/api/v1/query-stats", self.query_stats)
+        self.route("GET", "/api/v1/query-stats/slow", lambda **_: ok([]))
+        self.route("POST", "/api/v1/query-stats/reset", self.reset_query_stats)
+        self.route("GET", "/metrics", self.metrics, auth=False)
+        self.route("GET", "/api/v1/availability", self.availability)
+        for name, module in MODULES.items():
+            self.module_routes(name, module)
+
+    def module_routes(self, name: str, module: Dict[str, Any]) -> None:
+        state = self.state
+        prefix = f"/api/v1/{name}"
+        rows = lambda: state.bookings[name]
+        related = lambda items, message: ok(
+            [state.with_relations(name, item) for item in items], message
+        )
+        owner = module["owner"]
+        group = module["group"]
+
+        self.route(
+            "GET",
+            prefix,
+            lambda query, **_: self.paginated(
+                [state.with_relations(name, item) for item in rows()], query
+            ),
+        )
+        self.route("POST", prefix, lambda body, **_: self.create(name, body))
+        self.route("GET", f"{prefix}/time-slots", lambda query, **_: self.time_slots(name, query))
+        self.route(
+            "GET",
+            rf"{prefix}/{OWNER_ROUTES[owner]}/(?P<value>\d+)",
+            lambda value, **_: related(
+                [item for item in rows() if item[owner] == value], f"Data {name} berhasil diambil"
+            ),
+        )
+        if module["hours"] == 2 or name == "theater":
+            self.route(
+                "GET", f"{prefix}/time-suggestions", lambda query, **_: self.time_slots(name, query)
+            )
+        if name == "cws":
+            self.route(
+                "GET",
+                rf"{prefix}/date/(?P<value>\d{{4}}-\d{{2}}-\d{{2}})",
+                lambda value, **_: related(
+                    [item for item in rows() if item["waktuMulai"].startswith(value)],
+                    f"Data booking CWS untuk tanggal {value} berhasil diambil",
+                ),
+            )
+        if module["done"]:
+            self.route("POST", f"{prefix}/mark-past-done", lambda **_: self.mark_past_done(name))
+        if group == "lantai":
+            self.route(
+                "GET",
+                rf"{prefix}/lantai/(?P<value>\d+)",
+                lambda value, **_: related(
+                    [item for item in rows() if item["lantai"] == value],
+                    f"Data {name} berhasil diambil",
+                ),
+            )
+        if group == "idArea":
+            self.route(
+                "GET",
+                rf"{prefix}/area/(?P<value>\d+)",
+                lambda value, **_: related(
+                    [item for item in rows() if item["idArea"] == value],
+                    f"Data {name} berhasil diambil",
+                ),
+            )
+        if group in ("lantai", "idArea"):
+            self.route(
+                "GET",
+                rf"{prefix}/available-slots/(?P<day>[\d-]+)/(?P<value>\d+)",
+                lambda day, value, **_: ok(
+                    state.slots(name, day, value), "Slot waktu tersedia berhasil diambil"
+                ),
+            )
+        if group == "idFasilitas":
+            self.route(
+                "GET",
+                rf"{prefix}/fasilitas/(?P<value>\d+)",
+                lambda value, **_: related(
+                    [item for item in rows() if item["idFasilitas"] == value],
+                    "Data booking berdasarkan fasilitas berhasil diambil",
+                ),
+            )
+            self.route(
+                "GET", f"{prefix}/time-range", lambda query, **_: self.time_range(name, query)
+            )
+        self.route(
+            "GET",
+            rf"{prefix}/(?P<value>\d+)",
+            lambda value, **_: self.find(
+                [state.with_relations(name, item) for item in rows() if item["id"] == value], value
+            ),
+        )
+        self.route(
+            "DELETE", rf"{prefix}/(?P<value>\d+)", lambda value, **_: self.delete(name, value)
+        )
+
+    # Handlers
+
+    async def login(self, body: Dict[str, Any], **_: Any) -> Response:
+        if not body.get("nomorWa") or not body.get("password"):
+            return fail(400, "Nomor WhatsApp dan password harus diisi")
+        if body["nomorWa"] == USER_WA:
+            await self.compare_password()
+        if body["nomorWa"] != USER_WA or body["password"] != USER_PASSWORD:
+            return fail(401, "Nomor WhatsApp atau password tidak valid")
+        token = f"stub.{secrets.token_urlsafe(24)}"
+        self.state.tokens.add(token)
+        return ok(
+            {"user": self.state.users[0], "token": token, "expiresIn": "1h"}, "Login berhasil"
+        )
+
+    async def compare_password(self) -> None:
+        """The bcrypt compare of a login: blocking the loop, or waiting for a worker."""
+        seconds = self.args.login_hash_ms / 1000
+        if not seconds:
+            return
+        if self.args.password_workers:
+            async with self.password_workers:
+                await asyncio.sleep(seconds)
+            return
+        until = time.perf_counter() + seconds
+        while time.perf_counter() < until:
+            pass
+
+    def logout(self, token: str, **_: Any) -> Response:
+        self.state.tokens.discard(token)
+        self.verified.discard(token)
+        return ok(None, "Logout berhasil")
+
+    def user_by_wa(self, value: str, **_: Any) -> Response:
+        nomor_wa = unquote(value)
+        for user in self.state.users:
+            if user["nomorWa"] == nomor_wa:
+                return ok(user, "User retrieved successfully")
+        return fail(404, "User not found")
+
+    def find(self, items: List[Dict[str, Any]], value: str) -> Response:
+        for item in items:
+            if item["id"] == value:
+                return ok(item, "Success")
+        return fail(404, "Resource not found")
+
+    async def paginated(self, items: List[Dict[str, Any]], query: Dict[str, str]) -> Response:
+        limit = max(1, int(query.get("limit", 10)))
+        total_mode = query.get("total") or ("none" if "cursor" in query else "exact")
+        if total_mode not in ("exact", "approx", "none"):
+            return fail(400, "total harus salah satu dari: exact, approx, none")
+        pagination: Dict[str, Any] = {"limit": limit}
+        if "cursor" in query:
+            page = self.keyset_page(items, query, limit)
+            if page is None:
+                return fail(400, "Validation failed")
+            data, scanned, pagination["nextCursor"] = page
+        else:
+            page_number = max(1, int(query.get("page", 1)))
+            data = items[(page_number - 1) * limit : page_number * limit]
+            # OFFSET reads and throws away every row before the page.
+            scanned = page_number * limit
+            pagination["page"] = page_number
+        if total_mode != "none":
+            total = len(items)
+            pagination["total"] = total
+            if "page" in pagination:
+                pagination["totalPages"] = max(1, -(-total // limit))
+            if total_mode == "approx":
+                pagination["approximate"] = True
+            else:
+                scanned += total
+        if self.args.row_scan_us:
+            await asyncio.sleep(scanned * self.args.row_scan_us / 1e6)
+        return 200, {
+            "success": True,
+            "data": data,
+            "pagination": pagination,
+            "message": "Data retrieved successfully",
+        }
+
+    def keyset_page(
+        self, items: List[Dict[str, Any]], query: Dict[str, str], limit: int
+    ) -> Optional[Tuple[List[Dict[str, Any]], int, Optional[str]]]:
+        """Rows after the cursor in (sortBy, id) order, same token format as src/utils/cursor.ts."""
+        if query["cursor"]:
+            try:
+                padded = query["cursor"] + "=" * (-len(query["cursor"]) % 4)
+                position = json.loads(base64.urlsafe_b64decode(padded))
+                sort_by, order = position["sortBy"], position["sortOrder"]
+                after = (position["value"], int(position["id"]))
+            except (ValueError, KeyError, TypeError):
+                return None
+        else:
+            sort_by, order = query.get("sortBy", "id"), query.get("sortOrder", "asc")
+            after = None
+        if sort_by not in ("id", "waktuMulai") or order not in ("asc", "desc"):
+            return None
+
+        def key(item: Dict[str, Any]) -> Tuple[Any, int]:
+            value = int(item["id"]) if sort_by == "id" else item["waktuMulai"]
+            return value, int(item["id"])
+
+        if after is not None and sort_by == "id":
+            after = (int(after[0]), after[1])
+        descending = order == "desc"
+        ordered = sorted(items, key=key, reverse=descending)
+        if after is not None:
+            ordered = [
+                item for item in ordered if (key(item) < after if descending else key(item) > after)
+            ]
+        rows = ordered[: limit + 1]
+        data = rows[:limit]
+        next_cursor = None
+        if len(rows) > limit:
+            last = data[-1]
+            token = json.dumps(
+                {
+                    "sortBy": sort_by,
+                    "sortOrder": order,
+                    "value": last[sort_by] if sort_by != "id" else last["id"],
+                    "id": last["id"],
+                },
+                separators=(",", ":"),
+            )
+            next_cursor = base64.urlsafe_b64encode(token.encode()).decode().rstrip("=")
+        # An index seek only touches the rows it returns.
+        return data, len(rows), next_cursor
+
+    def time_slots(self, name: str, query: Dict[str, str]) -> Response:
+        if not query.get("date"):
+            return fail(400, "Parameter date harus diisi (format: YYYY-MM-DD)")
+        group_value = query.get("facilityId") if MODULES[name]["group"] == "idFasilitas" else None
+        return ok(
+            self.state.slots(name, query["date"], group_value), "Saran slot waktu berhasil diambil"
+        )
+
+    async def availability(self, query: Dict[str, str], **_: Any) -> Response:
+        """GET /api/v1/availability: each entry costs what its own endpoint would, concurrently."""
+        day = query.get("date")
+        if not day:
+            return fail(400, "Parameter date harus diisi (format: YYYY-MM-DD)")
+        if not query.get("facilities"):
+            return fail(400, "Parameter facilities harus diisi")
+        entries: Dict[str, Tuple[str, Optional[str]]] = {}
+        for entry in query["facilities"].split(","):
+            name, _, unit = entry.strip().partition(":")
+            if name not in MODULES or (unit and not unit.isdigit()):
+                return fail(400, "Parameter facilities tidak valid")
+            if not unit and MODULES[name]["group"] in ("lantai", "idArea"):
+                return fail(400, "Parameter facilities tidak valid")
+            if unit and MODULES[name]["group"] is None:
+                return fail(400, "Parameter facilities tidak valid")
+            entries[f"{name}:{unit}"] = (name, unit or None)
+        if len(entries) > 20:
+            return fail(400, "Maksimal 20 fasilitas per request")
+
+        async def lookup(name: str, unit: Optional[str]) -> Dict[str, Any]:
+            # The cache key the module's own endpoint uses, so both share warm entries.
+            if MODULES[name]["group"] in ("lantai", "idArea"):
+                key = f"/api/v1/{name}/available-slots/{day}/{unit}?"
+            else:
+                key = f"/api/v1/{name}/time-slots?date={day}"
+                key += f"&facilityId={unit}" if unit else ""
+            if not self.cache.lookup(key):
+                if self.args.cache_miss_ms:
+                    await asyncio.sleep(self.args.cache_miss_ms / 1000)
+                self.cache.store(key)
+            return {"facility": name, "unit": unit, "slots": self.state.slots(name, day, unit)}
+
+        facilities = await asyncio.gather(*(lookup(name, unit) for name, unit in entries.values()))
+        return ok({"date": day, "facilities": facilities}, "Slot waktu tersedia berhasil diambil")
+
+    async def time_range(self, name: str, query: Dict[str, str]) -> Response:
+        try:
+            start, end = parse_time(query["startTime"]), parse_time(query["endTime"])
+        except (KeyError, ValueError):
+            return fail(400, "startTime dan endTime harus diisi dengan format ISO")
+        try:
+            limit = min(
+                int(query.get("limit", self.args.time_range_max_rows)),
+                self.args.time_range_max_rows,
+            )
+        except ValueError:
+            limit = 0
+        if end < start or limit < 1:
+            return fail(400, "Validation failed")
+        items = [
+            item
+            for item in self.state.bookings[name]
+            if start <= parse_time(item["waktuMulai"]) <= end
+        ]
+        page = self.keyset_page(
+            items, {"cursor": query.get("cursor", ""), "sortBy": "waktuMulai"}, limit
+        )
+        if page is None:
+            return fail(400, "Validation failed")
+        rows, scanned, next_cursor = page
+        data = [self.state.with_relations(name, item) for item in rows]
+        if query.get("fields"):
+            # Like the select in BaseRepository.findRangeChunk: id and waktuMulai always.
+            fields = {"id", "waktuMulai", *(field.strip() for field in query["fields"].split(","))}
+            if data and not fields <= set(data[0]):
+                return fail(400, "Validation failed")
+            data = [{key: value for key, value in item.items() if key in fields} for item in data]
+        if self.args.row_scan_us:
+            await asyncio.sleep(scanned * self.args.row_scan_us / 1e6)
+        return 200, {
+            "success": True,
+            "data": data,
+            "pagination": {"limit": limit, "nextCursor": next_cursor},
+            "message": "Data booking berdasarkan rentang waktu berhasil diambil",
+        }
+
+    async def create(self, name: str, body: Dict[str, Any]) -> Response:
+        module = MODULES[name]
+        try:
+            start, end = parse_time(body["waktuMulai"]), parse_time(body["waktuBerakhir"])
+        except (KeyError, ValueError):
+            return fail(400, "waktuMulai dan waktuBerakhir harus diisi")
+        if end - start != timedelta(hours=module["hours"]) or start.minute or start.second:
+            return fail(400, f"Waktu booking harus dalam slot {module['hours']} jam penuh")
+        group = module["group"]
+        for booking in self.state.bookings[name]:
+            if group and str(booking.get(group)) != str(body.get(group)):
+                continue
+            if (
+                parse_time(booking["waktuMulai"]) < end
+                and parse_time(booking["waktuBerakhir"]) > start
+            ):
+                return fail(400, f"{name} sudah dibooking pada waktu tersebut")
+        if self.args.check_insert_gap_ms:
+            # Like the real services, the conflict check and the insert are separate awaits.
+            await asyncio.sleep(self.args.check_insert_gap_ms / 1000)
+        fields = {key: str(body[key]) for key in (module["owner"], group) if key and key in body}
+        booking = self.state.insert(name, start, fields)
+        self.invalidate_slots(name)
+        return ok(self.state.with_relations(name, booking), f"Booking {name} berhasil dibuat")
+
+    def delete(self, name: str, value: str) -> Response:
+        rows = self.state.bookings[name]
+        for index, booking in enumerate(rows):
+            if booking["id"] == value:
+                del rows[index]
+                self.invalidate_slots(name)
+                return ok(None, "Resource deleted successfully")
+        return fail(404, "Resource not found")
+
+    def mark_past_done(self, name: str) -> Response:
+        now = iso(datetime.now(timezone.utc))
+        updated = 0
+        for booking in self.state.bookings[name]:
+            if not booking["isDone"] and booking["waktuBerakhir"] <= now:
+                booking["isDone"] = True
+                updated += 1
+        return ok({"updated": updated}, "Past bookings berhasil di-mark sebagai done")
+
+    def invalidate_slots(self, name: str) -> None:
+        self.cache.invalidate(f"/api/v1/{name}/time-slots")
+        self.cache.invalidate(f"/api/v1/{name}/available-slots")
+
+    def flush_cache(self, query: Dict[str, str], **_: Any) -> Response:
+        if query.get("prefix"):
+            return ok({"removed": self.cache.invalidate(query["prefix"])}, "Cache berhasil dihapus")
+        self.cache.invalidate()
+        if query.get("resetStats") == "true":
+            self.cache.counters.clear()
+            self.cache.invalidations = 0
+        return ok(None, "Cache berhasil dihapus")
+
+    def query_stats(self, **_: Any) -> Response:
+        routes = sorted(self.route_stats.values(), key=lambda route: -route["totalTimeMs"])
+        return ok(
+            {"since": self.stats_since, "routes": routes, "slowQueryMs": 200},
+            "Statistik query berhasil diambil",
+        )
+
+    def reset_query_stats(self, **_: Any) -> Response:
+        self.route_stats.clear()
+        self.stats_since = iso(datetime.now(timezone.utc))
+        return ok(None, "Statistik query berhasil direset")
+
+    def verify_token(self, token: str, headers: Dict[str, str]) -> None:
+        """Charge a full JWT verification unless the verified-token cache has the token."""
+        if headers.get("x-auth-cache") == "bypass":
+            self.auth_cache["bypass"] += 1
+        elif token in self.verified:
+            self.auth_cache["hit"] += 1
+            return
+        else:
+            self.auth_cache["miss"] += 1
+            self.verified.add(token)
+        # Busy, not asyncio.sleep: the HMAC check holds the real API's event loop.
+        until = time.perf_counter() + self.args.auth_verify_us / 1e6
+        while time.perf_counter() < until:
+            pass
+
+    def metrics(self, **_: Any) -> Response:
+        """The real API's request histogram and in-flight gauge, in Prometheus text format."""
+        name = "kaizen_http_request_duration_seconds"
+        lines = [f"# TYPE {name} histogram"]
+        for (method, route, status), entry in self.latency.items():
+            labels = f'method="{method}",route="{route}",status="{status}"'
+            cumulative = 0
+            for bound, count in zip(METRIC_BUCKETS, entry["counts"]):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines += [
+                f'{name}_bucket{{{labels},le="+Inf"}} {entry["count"]}',
+                f"{name}_sum{{{labels}}} {entry['sum']}",
+                f"{name}_count{{{labels}}} {entry['count']}",
+            ]
+        lines += [
+            "# TYPE kaizen_http_requests_in_flight gauge",
+            # Minus this scrape itself.
+            f"kaizen_http_requests_in_flight {self.in_flight - 1}",
+            "# TYPE kaizen_auth_token_cache_total counter",
+            *(
+                f'kaizen_auth_token_cache_total{{result="{result}"}} {count}'
+                for result, count in self.auth_cache.items()
+            ),
+        ]
+        return 200, "\n".join(lines) + "\n"
+
+    def record_route(
+        self, method: str, pattern: "re.Pattern[str]", status: int, elapsed_ms: float
+    ) -> None:
+        # "^/api/v1/communal/(?P<value>\d+)$" -> "GET /api/v1/communal/:value"
+        path = re.sub(r"\(\?P<(\w+)>[^)]*\)", r":\1", pattern.pattern[1:-1])
+        route = f"{method} {path}"
+        histogram = self.latency.setdefault(
+            (method, path, status),
+            {"counts": [0] * (len(METRIC_BUCKETS) + 1), "sum": 0.0, "count": 0},
+        )
+        seconds = elapsed_ms / 1000
+        histogram["counts"][bisect.bisect_left(METRIC_BUCKETS, seconds)] += 1
+        histogram["sum"] += seconds
+        histogram["count"] += 1
+        stats = self.route_stats.setdefault(
+            route,
+            {
+                "route": route,
+                "requests": 0,
+                "queries": 0,
+                "maxQueries": 0,
+                "dbTimeMs": 0,
+                "totalTimeMs": 0.0,
+                "slowQueries": 0,
+            },
+        )
+        stats["requests"] += 1
+        stats["totalTimeMs"] = round(stats["totalTimeMs"] + elapsed_ms, 2)
+
+    # Dispatch
+
+    async def cached_dispatch(
+        self, method: str, target: str, headers: Dict[str, str], raw_body: bytes
+    ) -> Tuple[Response, Optional[str]]:
+        """dispatch(), plus "hit"/"miss" for reads the real API caches (None otherwise)."""
+        split = urlsplit(target)
+        if method != "GET" or not any(pattern.match(split.path) for pattern in self.cached):
+            return await self.dispatch(method, target, headers, raw_body), None
+        key = f"{split.path}?{split.query}"
+        hit = self.cache.lookup(key)
+        if not hit and self.args.cache_miss_ms:
+            await asyncio.sleep(self.args.cache_miss_ms / 1000)
+        status, payload = await self.dispatch(method, target, headers, raw_body)
+        if status == 200 and not hit:
+            self.cache.store(key)
+        return (status, payload), "hit" if hit else "miss"
+
+    def latency_for(self, path: str) -> float:
+        delay = self.args.latency_ms
+        for prefix, extra_ms in self.args.slow:
+            if path.startswith(prefix):
+                delay += extra_ms
+        if self.args.jitter_ms:
+            delay += self.rng.uniform(0, self.args.jitter_ms)
+        return delay / 1000
+
+    async def dispatch(
+        self, method: str, target: str, headers: Dict[str, str], raw_body: bytes
+    ) -> Response:
+        self.in_flight += 1
+        try:
+            return await self.routed(method, target, headers, raw_body)
+        finally:
+            self.in_flight -= 1
+
+    async def routed(
+        self, method: str, target: str, headers: Dict[str, str], raw_body: bytes
+    ) -> Response:
+        started = time.perf_counter()
+        split = urlsplit(target)
+        path = split.path.rstrip("/") or "/"
+        query = {
+            key: values[-1] for key, values in parse_qs(split.query, keep_blank_values=True).items()
+        }
+        delay = self.latency_for(path)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if self.args.error_rate and self.rng.random() < self.args.error_rate:
+            return fail(500, "Internal server error")
+
+        for route_method, pattern, needs_auth, handler in self.routes:
+            if route_method != method:
+                continue
+            match = pattern.match(path)
+            if not match:
+                continue
+            authorization = headers.get("authorization", "")
+            token = authorization[7:] if authorization.startswith("Bearer ") else authorization
+            if needs_auth:
+                if not token:
+                    return fail(401, "Access token is required")
+                if token not in self.state.tokens:
+                    return fail(401, "Invalid access token")
+                self.verify_token(token, headers)
+            try:
+                body = json.loads(raw_body) if raw_body else {}
+            except ValueError:
+                return fail(400, "Invalid JSON body")
+            response = handler(query=query, body=body, token=token, **match.groupdict())
+            if inspect.isawaitable(response):
+                response = await response
+            # Timed from the request's arrival, simulated latency included, like the real API.
+            self.record_route(method, pattern, response[0], (time.perf_counter() - started) * 1000)
+            return response
+        return fail(404, f"Route {target} not found")
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                request_line, *header_lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = request_line.split(" ", 2)
+                except ValueError:
+                    return
+                headers = {}
+                for line in header_lines:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", "0") or 0)
+                raw_body = await reader.readexactly(length) if length else b""
+
+                started = time.perf_counter()
+                (status, payload), cache = await self.cached_dispatch(
+                    method.upper(), target, headers, raw_body
+                )
+                # Same metric names as the real API's Server-Timing middleware.
+                total_ms = (time.perf_counter() - started) * 1000
+                server_timing = f"total;dur={total_ms:.2f}"
+                if cache:
+                    server_timing = f'cache;desc="{cache}", {server_timing}'
+                # Everything but /metrics answers JSON.
+                text = isinstance(payload, str)
+                body = (payload if text else json.dumps(payload)).encode("utf-8")
+                keep_alive = (
+                    version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                )
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}\r\n"
+                        f"Content-Type: {'text/plain' if text else 'application/json'};"
+                        " charset=utf-8\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Server-Timing: {server_timing}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+
+def parse_slow(value: str) -> Tuple[str, float]:
+    prefix, _, extra_ms = value.partition("=")
+    if not prefix.startswith("/") or not extra_ms:
+        raise argparse.ArgumentTypeError("expected PATH_PREFIX=MS, e.g. /api/v1/communal=25")
+    return prefix, float(extra_ms)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Offline stand-in for the Kaizen API, for benchmarking the measurement tooling."
+    )
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument(
+        "--latency-ms", type=float, default=LATENCY_MS, help="base delay added to every request"
+    )
+    parser.add_argument(
+        "--jitter-ms", type=float, default=JITTER_MS, help="extra uniform random delay, 0..N ms"
+    )
+    parser.add_argument(
+        "--slow",
+        type=parse_slow,
+        action="append",
+        default=[],
+        metavar="PREFIX=MS",
+        help="additional delay for paths starting with PREFIX (repeatable)",
+    )
+    parser.add_argument(
+        "--error-rate",
+        type=float,
+        default=ERROR_RATE,
+        help="fraction of requests answered with HTTP 500",
+    )
+    parser.add_argument(
+        "--bookings", type=int, default=BOOKINGS_PER_MODULE, help="seeded bookings per facility"
+    )
+    parser.add_argument(
+        "--check-insert-gap-ms",
+        type=float,
+        default=CHECK_INSERT_GAP_MS,
+        help="delay between a create's conflict check and its insert, opening the same race",
+    )
+    parser.add_argument(
+        "--cache-miss-ms",
+        type=float,
+        default=CACHE_MISS_MS,
+        help="extra delay on cacheable reads that miss the (simulated) read cache",
+    )
+    parser.add_argument(
+        "--cache-ttl", type=float, default=CACHE_TTL_S, help="seconds a cached read stays fresh"
+    )
+    parser.add_argument(
+        "--row-scan-us",
+        type=float,
+        default=ROW_SCAN_US,
+        help="delay per row a list page reads (OFFSET skips and exact COUNTs included)",
+    )
+    parser.add_argument(
+        "--auth-verify-us",
+        type=float,
+        default=AUTH_VERIFY_US,
+        help="CPU time of a full token verification, skipped on a verified-token cache hit",
+    )
+    parser.add_argument(
+        "--login-hash-ms",
+        type=float,
+        default=LOGIN_HASH_MS,
+        help="CPU time of a login's password compare",
+    )
+    parser.add_argument(
+        "--password-workers",
+        type=int,
+        default=PASSWORD_WORKERS,
+        help="run the password compare on this many workers instead of the event loop",
+    )
+    parser.add_argument(
+        "--time-range-max-rows",
+        type=int,
+        default=TIME_RANGE_MAX_ROWS,
+        help="most bookings one time-range response returns, the rest through nextCursor",
+    )
+    parser.add_argument("--seed", type=int, default=SEED)
+    args = parser.parse_args()
+    if not 0 <= args.error_rate <= 1:
+        parser.error("--error-rate must be between 0 and 1")
+    return args
+
+
+async def serve(args: argparse.Namespace) -> None:
+    app = StubApp(StubState(args.seed, args.bookings), args)
+    server = await asyncio.start_server(
+        app.handle_connection, args.host, args.port, limit=MAX_HEADER_BYTES
+    )
+    print(f"Kaizen stub API listening on http://{args.host}:{args.port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+
+from datasets import summary as dataset_summary
+from latency_stats import LatencyHistogram
+from measure_response_times import BASE_URL, DATASET, END_TIME, login
+from phase_timing import timed_session
+from streamed_lists import Runs, fetch, iso, paired_rows, store_run
+
+OUTPUT_PATH = Path(os.environ.get("KAIZEN_TIME_RANGE_PATH", "screenshots/time_range_results.json"))
+SAMPLES = int(os.environ.get("KAIZEN_TIME_RANGE_SAMPLES", "5"))
+WARMUP = int(os.environ.get("KAIZEN_TIME_RANGE_WARMUP", "1"))
+MAX_PAGES = int(os.environ.get("KAIZEN_TIME_RANGE_MAX_PAGES", "1000"))
+MODULES = ["dapur", "mesin-cuci-cewe", "mesin-cuci-cowo"]
+# Ranges end at the sample window's end (KAIZEN_SAMPLE_END or the dataset's sample month).
+SPANS = {"month": timedelta(days=30), "year": timedelta(days=365)}
+# What an availability check needs; id and waktuMulai always come back.
+PROJECTION = "idFasilitas,waktuBerakhir"
+
+
+def span_window(span: str, end: str) -> Tuple[str, str]:
+    end_at = datetime.fromisoformat(end.replace("Z", ""))
+    return iso(end_at - SPANS[span]), iso(end_at)
+
+
+def walk(
+    session: requests.Session,
+    token: str,
+    path: str,
+    params: Dict[str, Any],
+    max_pages: int,
+) -> Dict[str, Any]:
+    """Every page of one range, following nextCursor; a server without it stops after one."""
+    if max_pages < 1:
+        raise ValueError("max_pages must be at least 1")
+    params = dict(params)
+    next_cursor: Optional[str] = None
+    pages: List[Dict[str, Any]] = []
+    rows = 0
+    body_bytes = 0
+    gzip_bytes = 0
+    started = time.perf_counter()
+    while len(pages) < max_pages:
+        result, body = fetch(session, token, path, params)
+        if result["status_code"] != 200:
+            return {"error": f"HTTP {result['status_code']}: {body[:200]!r}"}
+        # Parsed outside the page timing: client-side JSON decoding isn't what's measured.
+        payload = json.loads(body)
+        rows += len(payload.get("data") or [])
+        body_bytes += len(body)
+        gzip_bytes += len(gzip.compress(body, compresslevel=6))
+        pages.append(result)
+        next_cursor = (payload.get("pagination") or {}).get("nextCursor")
+        if not next_cursor:
+            break
+        params["cursor"] = next_cursor
+    return {
+        "pages": len(pages),
+        "rows": rows,
+        "bytes": body_bytes,
+        "gzip_bytes": gzip_bytes,
+        "complete": len(pages) < max_pages or not next_cursor,
+        "chunked": any(page["chunked"] for page in pages),
+        "first_page_ttfb_ms": pages[0]["ttfb_ms"],
+        "first_page_ms": pages[0]["total_ms"],
+        "walk_ms": (time.perf_counter() - started) * 1000,
+        "page_ms": [page["total_ms"] for page in pages],
+    }
+
+
+def run_case(
+    session: requests.Session,
+    token: str,
+    module: str,
+    span: str,
+    fields: Optional[str],
+    *,
+    end: str,
+    limit: Optional[int],
+    samples: int,
+    warmup: int,
+    max_pages: int,
+) -> Dict[str, Any]:
+    start_time, end_time = span_window(span, end)
+    path = f"/api/v1/{module}/time-range"
+    params: Dict[str, Any] = {"startTime": start_time, "endTime": end_time}
+    if fields:
+        params["fields"] = fields
+    if limit:
+        params["limit"] = limit
+    row: Dict[str, Any] = {
+        "module": module,
+        "span": span,
+        "window": [start_time, end_time],
+        "fields": fields or "all",
+    }
+    ttfb = LatencyHistogram()
+    first_page = LatencyHistogram()
+    page = LatencyHistogram()
+    total = LatencyHistogram()
+    last: Dict[str, Any] = {}
+    for index in range(warmup + samples):
+        last = walk(session, token, path, params, max_pages)
+        if "error" in last:
+            row["error"] = last["error"]
+            return row
+        if index >= warmup:
+            ttfb.record(last["first_page_ttfb_ms"])
+            first_page.record(last["first_page_ms"])
+            total.record(last["walk_ms"])
+            for elapsed_ms in last["page_ms"]:
+                page.record(elapsed_ms)
+
+    rows = last["rows"]
+    row.update(
+        {
+            "rows": rows,
+            "pages": last["pages"],
+            "complete": last["complete"],
+            "chunked": last["chunked"],
+            "bytes": last["bytes"],
+            "bytes_per_row": round(last["bytes"] / rows, 1) if rows else None,
+            "gzip_bytes": last["gzip_bytes"],
+            "first_page_ttfb": ttfb.summary(),
+            "first_page": first_page.summary(),
+            "page": page.summary(),
+            "walk": total.summary(),
+        }
+    )
+    return row
+
+
+def case_key(row: Dict[str, Any]) -> Tuple[str, str, str]:
+    return row["module"], row["span"], row["fields"]
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'MODULE':<16} {'SPAN':<6} {'FIELDS':<26} {'ROWS':>8} {'PAGES':>6} {'MB':>8}"
+        f" {'B/ROW':>6} {'GZIP MB':>8} {'TTFB ms':>9} {'PAGE P50':>9} {'WALK P50':>10}"
+    )
+    for row in report["cases"]:
+        label = f"{row['module']:<16} {row['span']:<6} {row['fields']:<26}"
+        if "error" in row:
+            print(f"{label} {row['error']}")
+            continue
+        print(
+            f"{label} {row['rows']:>8} {row['pages']:>6} {row['bytes'] / 1e6:>8.2f}"
+            f" {row['bytes_per_row'] or 0:>6.0f} {row['gzip_bytes'] / 1e6:>8.2f}"
+            f" {row['first_page_ttfb']['p50_ms'] or 0:>9.2f} {row['page']['p50_ms'] or 0:>9.2f}"
+            f" {row['walk']['p50_ms'] or 0:>10.2f}"
+        )
+        if not row["complete"]:
+            print(f"  stopped after {row['pages']} pages (--max-pages)")
+    # What the projection saves on the same range.
+    cases = {case_key(row): row for row in report["cases"] if "error" not in row}
+    for (module, span, fields), row in cases.items():
+        full = cases.get((module, span, "all"))
+        if fields == "all" or full is None or not row["bytes"]:
+            continue
+        print(
+            f"  {module} {span}: fields={fields} sends {full['bytes'] / row['bytes']:.1f}x"
+            f" fewer bytes, walk p50 {full['walk']['p50_ms'] or 0:.2f}"
+            f" -> {row['walk']['p50_ms'] or 0:.2f} ms"
+        )
+
+
+def print_comparison(runs: Runs, label: str) -> None:
+    """Bytes and p50 walk time of every other stored label against this run, case by case."""
+    for other, pairs in paired_rows(runs, label, "cases", case_key):
+        print(f"{label} vs {other}:")
+        for row, mine in pairs:
+            theirs_ms, mine_ms = row["walk"]["p50_ms"], mine["walk"]["p50_ms"]
+            if theirs_ms and mine_ms:
+                print(
+                    f"  {row['module']:<16} {row['span']:<6} {row['fields']:<26}"
+                    f" {theirs_ms:>9.2f} -> {mine_ms:>9.2f} ms ({theirs_ms / mine_ms:.2f}x),"
+                    f" {row['bytes'] / 1e6:.2f} -> {mine['bytes'] / 1e6:.2f} MB,"
+                    f" first byte {row['first_page_ttfb']['p50_ms']:.2f}"
+                    f" -> {mine['first_page_ttfb']['p50_ms']:.2f} ms"
+                )
+
+
+def parse_list(choices: List[str]) -> Any:
+    def parse(value: str) -> List[str]:
+        items = [item.strip() for item in value.split(",") if item.strip()]
+        unknown = [item for item in items if item not in choices]
+        if not items or unknown:
+            raise argparse.ArgumentTypeError(f"expected a comma-separated subset of {choices}")
+        return items
+
+    return parse
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Time the time-range endpoints over month- and year-wide ranges, with whole "
+            "bookings and with a field projection: payload bytes, time to first byte, page "
+            "latency and the time to walk every page. Run once per server build with its "
+            "own --label to compare them."
+        )
+    )
+    parser.add_argument(
+        "--modules", type=parse_list(MODULES), default=MODULES, help="time-range endpoints"
+    )
+    parser.add_argument(
+        "--spans", type=parse_list(list(SPANS)), default=list(SPANS), help="range lengths"
+    )
+    parser.add_argument(
+        "--fields",
+        default=PROJECTION,
+        help="projection timed next to whole bookings; empty for whole bookings only",
+    )
+    parser.add_argument("--end", default=END_TIME, help="where every range ends")
+    parser.add_argument(
+        "--limit", type=int, help="rows per page (the server caps it; default: its cap)"
+    )
+    parser.add_argument(
+        "--label",
+        default="default",
+        help="name this run is stored under, e.g. unbounded or bounded",
+    )
+    parser.add_argument("--samples", type=int, default=SAMPLES, help="timed walks per case")
+    parser.add_argument("--warmup", type=int, default=WARMUP, help="untimed walks per case")
+    parser.add_argument(
+        "--max-pages", type=int, default=MAX_PAGES, help="pages followed per walk at most"
+    )
+    args = parser.parse_args()
+    if args.samples < 1:
+        parser.error("--samples must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup must not be negative")
+    if args.limit is not None and args.limit < 1:
+        parser.error("--limit must be at least 1")
+    if args.max_pages < 1:
+        parser.error("--max-pages must be at least 1")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    session = timed_session()
+    _, token = login(session)
+    if not token:
+        print("Login failed; cannot continue", file=sys.stderr)
+        return 1
+
+    report: Dict[str, Any] = {
+        "mode": "time_range",
+        "base_url": BASE_URL,
+        "label": args.label,
+        "dataset": dataset_summary(DATASET),
+        "limit": args.limit,
+        "samples": args.samples,
+        "cases": [],
+    }
+    projections = [None, args.fields] if args.fields else [None]
+    try:
+        for module in args.modules:
+            for span in args.spans:
+                for fields in projections:
+                    report["cases"].append(
+                        run_case(
+                            session,
+                            token,
+                            module,
+                            span,
+                            fields,
+                            end=args.end,
+                            limit=args.limit,
+                            samples=args.samples,
+                            warmup=args.warmup,
+                            max_pages=args.max_pages,
+                        )
+                    )
+    except requests.RequestException as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    runs = store_run(OUTPUT_PATH, args.label, report)
+    print_report(report)
+    print_comparison(runs, args.label)
+    print(f"Saved time-range benchmark to {OUTPUT_PATH} as {args.label!r}")
+    return 1 if any("error" in row for row in report["cases"]) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
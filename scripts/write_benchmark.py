@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from latency_stats import LatencyHistogram
+from measure_response_times import BASE_URL, is_error, login, measure
+from phase_timing import timed_session
+
+OUTPUT_PATH = Path(os.environ.get("KAIZEN_WRITE_METRICS_PATH", "screenshots/write_results.json"))
+# Bookings are validated on whole hours in the server's local time.
+UTC_OFFSET_H = int(os.environ.get("KAIZEN_TZ_OFFSET_HOURS", "7"))
+RUSH_HOUR = int(os.environ.get("KAIZEN_WRITE_HOUR", "20"))
+CONCURRENCY = int(os.environ.get("KAIZEN_WRITE_CONCURRENCY", "20"))
+ROUNDS = int(os.environ.get("KAIZEN_WRITE_ROUNDS", "5"))
+LANTAI = os.environ.get("KAIZEN_WRITE_LANTAI", "1")
+CONFLICT_MARKER = "sudah dibooking"
+THURSDAY = 3
+
+# Create payloads per module, as the controllers read them from req.body.
+MODULES: Dict[str, Dict[str, Any]] = {
+    "communal": {"hours": 1, "owner": "idPenanggungJawab", "extra": {"jumlahPengguna": 1}},
+    "cws": {
+        "hours": 2,
+        "owner": "idPenanggungJawab",
+        "extra": {"jumlahPengguna": 1},
+        "closed_weekdays": {THURSDAY},
+    },
+    "dapur": {"hours": 1, "owner": "idPeminjam", "extra": {"pinjamPeralatan": False}},
+    "mesin-cuci-cewe": {"hours": 1, "owner": "idPeminjam", "extra": {}},
+    "mesin-cuci-cowo": {"hours": 1, "owner": "idPeminjam", "extra": {}},
+}
+
+
+def slot_dates(first: date, rounds: int, closed_weekdays: Set[int]) -> List[date]:
+    """One date per round, skipping days the facility can't be booked."""
+    dates: List[date] = []
+    day = first
+    while len(dates) < rounds:
+        if day.weekday() not in closed_weekdays:
+            dates.append(day)
+        day += timedelta(days=1)
+    return dates
+
+
+def slot(day: date, hour: int, hours: int) -> Tuple[str, str]:
+    local = timezone(timedelta(hours=UTC_OFFSET_H))
+    start = datetime(day.year, day.month, day.day, hour, tzinfo=local)
+    end = start + timedelta(hours=hours)
+    return start.isoformat(), end.isoformat()
+
+
+def first_id(session: Any, token: str, path: str, fallback: str) -> str:
+    result, body = measure(session=session, method="GET", path=path, name=path, token=token)
+    data = body.get("data") if isinstance(body, dict) else None
+    if isinstance(data, list) and data and data[0].get("id") is not None:
+        return str(data[0]["id"])
+    print(f"Could not read an id from {path} ({result['status_code']}); using {fallback}")
+    return fallback
+
+
+def discover_ids(session: Any, token: str) -> Dict[str, str]:
+    _, profile = measure(
+        session=session, method="GET", path="/api/v1/auth/profile", name="Profile", token=token
+    )
+    user_id = str(profile["data"]["id"]) if isinstance(profile, dict) else "1"
+    return {
+        "user": user_id,
+        "dapur": first_id(session, token, "/api/v1/dapur/facilities", "1"),
+        "mesin-cuci-cewe": first_id(session, token, "/api/v1/mesin-cuci-cewe/facilities", "1"),
+        "mesin-cuci-cowo": first_id(session, token, "/api/v1/mesin-cuci-cowo/facilities", "1"),
+    }
+
+
+def booking_body(name: str, ids: Dict[str, str], start: str, end: str) -> Dict[str, Any]:
+    module = MODULES[name]
+    body: Dict[str, Any] = {
+        module["owner"]: ids["user"],
+        "waktuMulai": start,
+        "waktuBerakhir": end,
+        **module["extra"],
+    }
+    if name == "communal":
+        body["lantai"] = LANTAI
+    elif name in ids:
+        body["idFasilitas"] = ids[name]
+    return body
+
+
+def burst(
+    pool: ThreadPoolExecutor,
+    sessions: List[Any],
+    token: str,
+    name: str,
+    body: Dict[str, Any],
+) -> List[Tuple[Dict[str, Any], Any]]:
+    """Send the same create from every session at once, released together by a barrier."""
+    barrier = threading.Barrier(len(sessions))
+
+    def send(session: Any) -> Tuple[Dict[str, Any], Any]:
+        barrier.wait()
+        return measure(
+            session=session,
+            method="POST",
+            path=f"/api/v1/{name}",
+            name=name,
+            token=token,
+            json_data=body,
+        )
+
+    return list(pool.map(send, sessions))
+
+
+def run_module(
+    name: str,
+    ids: Dict[str, str],
+    token: str,
+    *,
+    first_day: date,
+    hour: int,
+    rounds: int,
+    concurrency: int,
+) -> Tuple[Dict[str, Any], List[str]]:
+    module = MODULES[name]
+    histogram = LatencyHistogram()
+    row: Dict[str, Any] = {
+        "name": name,
+        "bursts": rounds,
+        "requests": 0,
+        "created": 0,
+        "rejected": 0,
+        "errors": 0,
+        "double_bookings": 0,
+        "taken_slots": 0,
+    }
+    created_ids: List[str] = []
+    sessions = [timed_session() for _ in range(concurrency)]
+    busy_s = 0.0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        # Open every connection first so the bursts measure the create, not TCP setup.
+        list(pool.map(lambda s: s.get(f"{BASE_URL}/health", timeout=30), sessions))
+        for day in slot_dates(first_day, rounds, module.get("closed_weekdays", set())):
+            start, end = slot(day, hour, module["hours"])
+            body = booking_body(name, ids, start, end)
+            started = time.perf_counter()
+            outcomes = burst(pool, sessions, token, name, body)
+            busy_s += time.perf_counter() - started
+
+            winners = rejected = 0
+            for result, response in outcomes:
+                row["requests"] += 1
+                histogram.record(result["elapsed_ms"])
+                if not is_error(result):
+                    winners += 1
+                    created_ids.append(str(response["data"]["id"]))
+                elif CONFLICT_MARKER in (result.get("message") or ""):
+                    rejected += 1
+                else:
+                    row["errors"] += 1
+                    row.setdefault("first_error", result.get("message") or result.get("error"))
+            row["created"] += winners
+            row["rejected"] += rejected
+            # Exactly one request per burst should win; every extra winner is a double booking.
+            row["double_bookings"] += max(winners - 1, 0)
+            # Nobody won: the slot was booked before the run, so this burst proves nothing.
+            row["taken_slots"] += winners == 0 and rejected > 0
+
+    row["throughput_rps"] = round(row["requests"] / busy_s, 2) if busy_s else 0.0
+    row["stats"] = histogram.summary()
+    row["histogram"] = histogram.to_dict()
+    return row, created_ids
+
+
+def cleanup(session: Any, token: str, name: str, created_ids: List[str]) -> int:
+    failed = 0
+    for booking_id in created_ids:
+        result, _ = measure(
+            session=session,
+            method="DELETE",
+            path=f"/api/v1/{name}/{booking_id}",
+            name=f"{name} cleanup",
+            token=token,
+        )
+        failed += is_error(result)
+    return failed
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(
+        f"{'MODULE':<18} {'REQS':>6} {'CREATED':>8} {'REJECTED':>9} {'ERRORS':>7}"
+        f" {'DOUBLE':>7} {'REQ/S':>8} {'P50 ms':>9} {'P99 ms':>9}"
+    )
+    for row in report["modules"]:
+        stats = row["stats"]
+        print(
+            f"{row['name']:<18} {row['requests']:>6} {row['created']:>8} {row['rejected']:>9}"
+            f" {row['errors']:>7} {row['double_bookings']:>7} {row['throughput_rps']:>8.2f}"
+            f" {stats['p50_ms'] or 0:>9.2f} {stats['p99_ms'] or 0:>9.2f}"
+        )
+        if row.get("first_error"):
+            print(f"  first error: {row['first_error']}")
+        if row["taken_slots"]:
+            print(f"  {row['taken_slots']} slot(s) were already booked before the run")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Fire concurrent creates for the same booking slot and count how many "
+            "double bookings get past the check-then-insert in the services."
+        )
+    )
+    parser.add_argument(
+        "--modules",
+        nargs="+",
+        choices=sorted(MODULES),
+        default=list(MODULES),
+        help="facility modules to benchmark",
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=CONCURRENCY, help="simultaneous creates per slot"
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=ROUNDS, help="contended slots per module, one day apart"
+    )
+    parser.add_argument(
+        "--hour", type=int, default=RUSH_HOUR, help="local start hour of every slot (20:00 rush)"
+    )
+    parser.add_argument(
+        "--date",
+        type=date.fromisoformat,
+        default=None,
+        help="first booking day (default: 30 days from today, clear of real bookings)",
+    )
+    parser.add_argument("--keep", action="store_true", help="leave the created bookings in place")
+    args = parser.parse_args()
+    if args.concurrency < 2:
+        parser.error("--concurrency must be at least 2 to create contention")
+    if args.rounds < 1:
+        parser.error("--rounds must be at least 1")
+    if not 0 <= args.hour <= 22:
+        parser.error("--hour must be between 0 and 22")
+    if args.date is None:
+        args.date = date.today() + timedelta(days=30)
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    session = timed_session()
+    _, token = login(session)
+    if not token:
+        print("Login failed; cannot continue", file=sys.stderr)
+        return 1
+    ids = discover_ids(session, token)
+
+    rows = []
+    for name in args.modules:
+        row, created_ids = run_module(
+            name,
+            ids,
+            token,
+            first_day=args.date,
+            hour=args.hour,
+            rounds=args.rounds,
+            concurrency=args.concurrency,
+        )
+        if not args.keep:
+            row["cleanup_failures"] = cleanup(session, token, name, created_ids)
+        rows.append(row)
+
+    report = {
+        "mode": "write",
+        "base_url": BASE_URL,
+        "concurrency": args.concurrency,
+        "rounds": args.rounds,
+        "hour": args.hour,
+        "first_date": args.date.isoformat(),
+        "modules": rows,
+    }
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with OUTPUT_PATH.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, indent=2)
+    print_report(report)
+    print(f"Saved write benchmark to {OUTPUT_PATH}")
+    return 1 if any(row["double_bookings"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
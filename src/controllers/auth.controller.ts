@@ -1,5 +1,6 @@
 import { Request, Response, NextFunction } from "express";
 import { AuthService, LoginDTO, RegisterDTO } from "../services/auth.service";
+import { AuthMiddleware } from "../middleware/auth.middleware";
 import { ResponseUtil } from "../utils/response";
 
 export class AuthController {
@@ -219,7 +220,7 @@ export class AuthController {
   };
 
   /**
-   * Logout endpoint (client-side token removal)
+   * Logout endpoint: the token is refused from now on
    */
   logout = async (
     req: Request,
@@ -227,8 +228,10 @@ export class AuthController {
     next: NextFunction
   ): Promise<void> => {
     try {
-      // Since we're using stateless JWT, logout is handled on client-side
-      // This endpoint just confirms successful logout
+      const token = AuthMiddleware.bearerToken(req);
+      if (token) {
+        this.authService.logout(token);
+      }
       ResponseUtil.success(res, null, "Logout berhasil");
     } catch (error) {
       next(error);
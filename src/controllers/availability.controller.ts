@@ -0,0 +1,108 @@
+import { Request, Response, NextFunction } from "express";
+import {
+  AvailabilityService,
+  FACILITIES,
+  Facility,
+  FacilityRequest,
+  UNIT_LESS,
+  UNIT_REQUIRED,
+} from "../services/availability.service";
+import { ResponseUtil } from "../utils/response";
+
+// Enough for every unit of a day view; keeps one request from fanning out unbounded
+const MAX_FACILITIES = 20;
+
+const isFacility = (value: string): value is Facility =>
+  (FACILITIES as readonly string[]).includes(value);
+
+export class AvailabilityController {
+  private availabilityService: AvailabilityService;
+
+  constructor() {
+    this.availabilityService = new AvailabilityService();
+  }
+
+  /**
+   * Slot grids of several facilities for one day in a single request:
+   * ?date=2025-09-20&facilities=communal:3,serbaguna:1,dapur,cws
+   */
+  getDay = async (
+    req: Request,
+    res: Response,
+    next: NextFunction
+  ): Promise<void> => {
+    try {
+      const { date, facilities } = req.query;
+
+      if (typeof date !== "string" || !date) {
+        ResponseUtil.badRequest(
+          res,
+          "Parameter date harus diisi (format: YYYY-MM-DD)"
+        );
+        return;
+      }
+      if (isNaN(new Date(date).getTime())) {
+        ResponseUtil.badRequest(
+          res,
+          "Format tanggal tidak valid. Gunakan format YYYY-MM-DD"
+        );
+        return;
+      }
+      if (typeof facilities !== "string" || !facilities) {
+        ResponseUtil.badRequest(
+          res,
+          `Parameter facilities harus diisi, contoh: communal:3,dapur,cws (pilihan: ${FACILITIES.join(", ")})`
+        );
+        return;
+      }
+
+      const requests = new Map<string, FacilityRequest>();
+      const errors: string[] = [];
+      for (const entry of facilities.split(",")) {
+        const [facility = "", unit, ...rest] = entry.trim().split(":");
+        if (!isFacility(facility)) {
+          errors.push(`Fasilitas tidak dikenal: ${facility}`);
+        } else if (
+          rest.length > 0 ||
+          (unit !== undefined && !/^\d+$/.test(unit))
+        ) {
+          errors.push(`ID unit tidak valid: ${entry.trim()}`);
+        } else if (unit === undefined && UNIT_REQUIRED.has(facility)) {
+          errors.push(
+            `${facility} membutuhkan ID ${facility === "communal" ? "lantai" : "area"}, contoh: ${facility}:1`
+          );
+        } else if (unit !== undefined && UNIT_LESS.has(facility)) {
+          errors.push(`Fasilitas ${facility} tidak memiliki unit`);
+        } else {
+          const key = `${facility}:${unit ?? ""}`;
+          requests.set(
+            key,
+            unit === undefined ? { facility } : { facility, unit: BigInt(unit) }
+          );
+        }
+      }
+      if (errors.length > 0) {
+        ResponseUtil.badRequest(res, "Parameter facilities tidak valid", errors);
+        return;
+      }
+      if (requests.size > MAX_FACILITIES) {
+        ResponseUtil.badRequest(
+          res,
+          `Maksimal ${MAX_FACILITIES} fasilitas per request`
+        );
+        return;
+      }
+
+      const availability = await this.availabilityService.getDay(date, [
+        ...requests.values(),
+      ]);
+      ResponseUtil.success(
+        res,
+        { date, facilities: availability },
+        "Slot waktu tersedia berhasil diambil"
+      );
+    } catch (error) {
+      next(error);
+    }
+  };
+}
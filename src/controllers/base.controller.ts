@@ -1,7 +1,9 @@
 import { Request, Response, NextFunction } from "express";
 import { ResponseUtil } from "../utils/response";
 import { BaseService } from "../services/base.service";
-import { PaginationParams } from "../types";
+import { PaginationParams, TotalMode } from "../types";
+
+const TOTAL_MODES: TotalMode[] = ["exact", "approx", "none"];
 
 export abstract class BaseController<T, CreateDTO, UpdateDTO> {
   protected service: BaseService<T, CreateDTO, UpdateDTO, any, any>;
@@ -23,8 +25,21 @@ export abstract class BaseController<T, CreateDTO, UpdateDTO> {
         ...(req.query.sortOrder && {
           sortOrder: req.query.sortOrder as "asc" | "desc",
         }),
+        // Present (even empty) switches to keyset pagination
+        ...(typeof req.query.cursor === "string" && {
+          cursor: req.query.cursor,
+        }),
+        ...(req.query.total && { total: req.query.total as TotalMode }),
       };
 
+      if (params.total && !TOTAL_MODES.includes(params.total)) {
+        ResponseUtil.badRequest(
+          res,
+          `total harus salah satu dari: ${TOTAL_MODES.join(", ")}`
+        );
+        return;
+      }
+
       const result = await this.service.getAll(params);
       ResponseUtil.paginated(res, result);
     } catch (error) {
@@ -0,0 +1,54 @@
+import { Request, Response, NextFunction } from "express";
+import { CacheUtil } from "../utils/cache";
+import { ResponseUtil } from "../utils/response";
+import { TokenCache } from "../utils/token-cache";
+
+export class CacheController {
+  /**
+   * Hit/miss counters and size of the read cache and the verified-token cache
+   */
+  getStats = async (
+    req: Request,
+    res: Response,
+    next: NextFunction
+  ): Promise<void> => {
+    try {
+      const stats = await CacheUtil.stats();
+      ResponseUtil.success(
+        res,
+        { ...stats, auth: TokenCache.stats() },
+        "Statistik cache berhasil diambil"
+      );
+    } catch (error) {
+      next(error);
+    }
+  };
+
+  /**
+   * Drop cached entries: all of them, or only keys starting with ?prefix=
+   */
+  flush = async (
+    req: Request,
+    res: Response,
+    next: NextFunction
+  ): Promise<void> => {
+    try {
+      const { prefix } = req.query;
+
+      if (typeof prefix === "string" && prefix.length > 0) {
+        const removed = await CacheUtil.invalidate(prefix);
+        ResponseUtil.success(res, { removed }, "Cache berhasil dihapus");
+        return;
+      }
+
+      await CacheUtil.flush();
+      if (req.query.resetStats === "true") {
+        CacheUtil.resetStats();
+        TokenCache.resetStats();
+      }
+      ResponseUtil.success(res, null, "Cache berhasil dihapus");
+    } catch (error) {
+      next(error);
+    }
+  };
+}
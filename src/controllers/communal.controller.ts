@@ -208,6 +208,23 @@ export class CommunalController extends BaseController<
     }
   };
 
+  markPastBookingsAsDone = async (
+    req: Request,
+    res: Response,
+    next: NextFunction
+  ): Promise<void> => {
+    try {
+      const updated = await this.communalService.markPastBookingsAsDone();
+      ResponseUtil.success(
+        res,
+        { updated },
+        "Past bookings berhasil di-mark sebagai done"
+      );
+    } catch (error) {
+      next(error);
+    }
+  };
+
   // Override delete to enforce ownership/admin rules
   delete = async (
     req: Request,
@@ -277,10 +277,10 @@ export class CWSController extends BaseController<
     next: NextFunction
   ): Promise<void> => {
     try {
-      await this.cwsService.markPastBookingsAsDone();
+      const updated = await this.cwsService.markPastBookingsAsDone();
       ResponseUtil.success(
         res,
-        null,
+        { updated },
         "Past bookings berhasil di-mark sebagai done"
       );
     } catch (error) {
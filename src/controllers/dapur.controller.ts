@@ -9,6 +9,7 @@ import {
 import { ResponseUtil } from "../utils/response";
 import { TimeValidationUtil } from "../utils/time-validation";
 import { AccessControlUtil } from "../utils/access-control";
+import { TimeRangeUtil } from "../utils/time-range";
 
 export class DapurController extends BaseController<
   Dapur,
@@ -157,11 +158,13 @@ export class DapurController extends BaseController<
         return;
       }
 
-      const start = new Date(startTime as string);
-      const end = new Date(endTime as string);
-
-      const bookings = await this.dapurService.getDapurByTimeRange(start, end);
-      ResponseUtil.success(
+      const { start, end, params } = TimeRangeUtil.parse(req.query);
+      const bookings = this.dapurService.getDapurByTimeRange(
+        start,
+        end,
+        params
+      );
+      await ResponseUtil.timeRange(
         res,
         bookings,
         "Data booking berdasarkan rentang waktu berhasil diambil"
@@ -9,6 +9,7 @@ import {
 import { ResponseUtil } from "../utils/response";
 import { TimeValidationUtil } from "../utils/time-validation";
 import { AccessControlUtil } from "../utils/access-control";
+import { TimeRangeUtil } from "../utils/time-range";
 
 export class MesinCuciCowoController extends BaseController<
   MesinCuciCowo,
@@ -165,14 +166,13 @@ export class MesinCuciCowoController extends BaseController<
         return;
       }
 
-      const start = new Date(startTime as string);
-      const end = new Date(endTime as string);
-
-      const bookings = await this.mesinCuciCowoService.getMesinCuciByTimeRange(
+      const { start, end, params } = TimeRangeUtil.parse(req.query);
+      const bookings = this.mesinCuciCowoService.getMesinCuciByTimeRange(
         start,
-        end
+        end,
+        params
       );
-      ResponseUtil.success(
+      await ResponseUtil.timeRange(
         res,
         bookings,
         "Data booking berdasarkan rentang waktu berhasil diambil"
@@ -0,0 +1,33 @@
+import { Request, Response, NextFunction } from "express";
+import { MetricsUtil } from "../utils/metrics";
+import { ResponseUtil } from "../utils/response";
+
+export class MetricsController {
+  /**
+   * Prometheus scrape target. Public unless METRICS_TOKEN is set, in which
+   * case the scraper sends it as a bearer token
+   */
+  getMetrics = async (
+    req: Request,
+    res: Response,
+    next: NextFunction
+  ): Promise<void> => {
+    try {
+      if (!MetricsUtil.enabled) {
+        ResponseUtil.notFound(res, "Metrics are disabled");
+        return;
+      }
+      const token = process.env.METRICS_TOKEN;
+      if (token && req.headers.authorization !== `Bearer ${token}`) {
+        ResponseUtil.unauthorized(res, "Invalid metrics token");
+        return;
+      }
+
+      res
+        .type("text/plain; version=0.0.4; charset=utf-8")
+        .send(MetricsUtil.render());
+    } catch (error) {
+      next(error);
+    }
+  };
+}
@@ -0,0 +1,59 @@
+import { Request, Response, NextFunction } from "express";
+import { QueryLogUtil } from "../utils/query-log";
+import { ResponseUtil } from "../utils/response";
+
+export class QueryStatsController {
+  /**
+   * Query count and DB time per route since start-up (or the last reset)
+   */
+  getStats = async (
+    req: Request,
+    res: Response,
+    next: NextFunction
+  ): Promise<void> => {
+    try {
+      ResponseUtil.success(
+        res,
+        {
+          ...QueryLogUtil.stats(),
+          slowQueryMs: QueryLogUtil.slowQueryMs,
+        },
+        "Statistik query berhasil diambil"
+      );
+    } catch (error) {
+      next(error);
+    }
+  };
+
+  /**
+   * Most recent queries over SLOW_QUERY_MS, newest first
+   */
+  getSlowQueries = async (
+    req: Request,
+    res: Response,
+    next: NextFunction
+  ): Promise<void> => {
+    try {
+      ResponseUtil.success(
+        res,
+        QueryLogUtil.recentSlowQueries(),
+        "Query lambat berhasil diambil"
+      );
+    } catch (error) {
+      next(error);
+    }
+  };
+
+  reset = async (
+    req: Request,
+    res: Response,
+    next: NextFunction
+  ): Promise<void> => {
+    try {
+      QueryLogUtil.reset();
+      ResponseUtil.success(res, null, "Statistik query berhasil direset");
+    } catch (error) {
+      next(error);
+    }
+  };
+}
@@ -1,11 +1,14 @@
 import express from "express";
-import type { Request, Response, NextFunction } from "express";
+import type { Request, Response } from "express";
 import dotenv from "dotenv";
 import cors, { type CorsOptions } from "cors";
 
 // Import routes and middleware
 import routes from "./routes";
 import { ErrorMiddleware } from "./middleware/error.middleware";
+import { ServerTimingMiddleware } from "./middleware/server-timing.middleware";
+import { RequestLogMiddleware } from "./middleware/request-log.middleware";
+import { MetricsMiddleware } from "./middleware/metrics.middleware";
 import DatabaseConnection from "./utils/database";
 import { setupSwagger } from "./utils/swagger";
 import { BigIntSerializer } from "./utils/bigint-serializer";
@@ -46,11 +49,15 @@ app.use(cors(corsOptions));
 app.use(express.json());
 app.use(express.urlencoded({ extended: true }));
 
-// Request logging middleware
-app.use((req: Request, res: Response, next: NextFunction) => {
-  console.log(`${new Date().toISOString()} - ${req.method} ${req.path}`);
-  next();
-});
+// Server-Timing (DB and handler time); after the body parsers so the request
+// context isn't lost in their stream callbacks
+app.use(ServerTimingMiddleware.handle);
+
+// Per-route query totals, slow-query log and sampled request log
+app.use(RequestLogMiddleware.handle);
+
+// Per-route latency histograms and in-flight requests for GET /metrics
+app.use(MetricsMiddleware.handle);
 
 // Setup Swagger documentation
 setupSwagger(app);
@@ -0,0 +1,41 @@
+import { Request, Response, NextFunction } from "express";
+import { MetricsUtil } from "../utils/metrics";
+import { RequestLogMiddleware } from "./request-log.middleware";
+
+// nginx's "client closed request"; not a status any response is sent with
+const CLIENT_CLOSED_STATUS = 499;
+
+export class MetricsMiddleware {
+  /**
+   * Count the request as in flight until it's answered (or the client goes
+   * away), then add its duration to its route's histogram (disable with METRICS=false)
+   */
+  static handle = (req: Request, res: Response, next: NextFunction): void => {
+    if (!MetricsUtil.enabled) {
+      next();
+      return;
+    }
+
+    const startedAt = process.hrtime.bigint();
+    let finished = false;
+    const finish = () => {
+      if (finished) {
+        return;
+      }
+      finished = true;
+      MetricsUtil.requestFinished(
+        req.method,
+        RequestLogMiddleware.routePath(req),
+        // "close" before the response was written out: the client went away,
+        // recorded as 499 rather than whatever statusCode had been set so far
+        res.writableFinished ? res.statusCode : CLIENT_CLOSED_STATUS,
+        Number(process.hrtime.bigint() - startedAt) / 1e9
+      );
+    };
+
+    MetricsUtil.requestStarted();
+    res.on("finish", finish);
+    res.on("close", finish);
+    next();
+  };
+}
@@ -0,0 +1,48 @@
+import { Request, Response, NextFunction } from "express";
+import { RequestContextUtil } from "../utils/request-context";
+import { QueryLogUtil } from "../utils/query-log";
+
+export class RequestLogMiddleware {
+  /**
+   * Once the response is sent: add the request to its route's query totals,
+   * flush its slow queries and, if sampled (REQUEST_LOG), log one line
+   */
+  static handle = (req: Request, res: Response, next: NextFunction): void => {
+    const context = RequestContextUtil.current();
+
+    res.on("finish", () => {
+      if (!context) {
+        return;
+      }
+      const totalMs = RequestContextUtil.elapsedMs(context);
+      QueryLogUtil.finishRequest(
+        RequestLogMiddleware.routeOf(req),
+        context,
+        totalMs
+      );
+
+      if (QueryLogUtil.sampled(QueryLogUtil.requestLog)) {
+        console.log(
+          `${new Date().toISOString()} - ${req.method} ${req.path} ${res.statusCode}` +
+            ` ${totalMs.toFixed(1)}ms ${context.dbQueries} queries`
+        );
+      }
+    });
+
+    next();
+  };
+
+  // Method and matched route pattern (e.g. "GET /api/v1/communal/:id")
+  static routeOf(req: Request): string {
+    return `${req.method} ${RequestLogMiddleware.routePath(req)}`;
+  }
+
+  // The matched route pattern, so requests for different ids add up under
+  // one route; known once the router has matched, i.e. when the response ends
+  static routePath(req: Request): string {
+    if (!req.route) {
+      return "(unmatched)";
+    }
+    return `${req.baseUrl}${req.route.path === "/" ? "" : req.route.path}`;
+  }
+}
@@ -0,0 +1,43 @@
+import { Request, Response, NextFunction } from "express";
+import { RequestContext, RequestContextUtil } from "../utils/request-context";
+
+export class ServerTimingMiddleware {
+  /**
+   * Open the request context and report database and total handler time in a
+   * Server-Timing header (disable the header with SERVER_TIMING=false)
+   */
+  static handle = (req: Request, res: Response, next: NextFunction): void => {
+    RequestContextUtil.run(() => {
+      if (process.env.SERVER_TIMING === "false") {
+        next();
+        return;
+      }
+
+      const context = RequestContextUtil.current() as RequestContext;
+      const writeHead = res.writeHead;
+
+      // Headers are final once writeHead runs, so this is the last moment to add ours
+      res.writeHead = function (this: Response, ...args: any[]) {
+        if (!res.headersSent) {
+          res.setHeader("Server-Timing", ServerTimingMiddleware.format(context));
+        }
+        return (writeHead as (...params: any[]) => Response).apply(this, args);
+      } as typeof res.writeHead;
+
+      next();
+    });
+  };
+
+  static format(context: RequestContext): string {
+    const totalMs = RequestContextUtil.elapsedMs(context);
+    const metrics = [
+      `db;dur=${context.dbTimeMs.toFixed(2)};desc="${context.dbQueries} queries"`,
+    ];
+    // Only reads that went through the cache; "miss" if anything had to be loaded
+    if (context.cacheHits + context.cacheMisses > 0) {
+      metrics.push(`cache;desc="${context.cacheMisses > 0 ? "miss" : "hit"}"`);
+    }
+    metrics.push(`total;dur=${totalMs.toFixed(2)}`);
+    return metrics.join(", ");
+  }
+}
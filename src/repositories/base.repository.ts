@@ -1,12 +1,29 @@
 import { PrismaClient } from "@prisma/client";
 import { prisma } from "../utils/database";
-import { IRepository, PaginationParams } from "../types";
+import { CursorPosition, CursorUtil } from "../utils/cursor";
+import { IRepository, PaginationParams, TimeRangeParams } from "../types";
+
+// findMany arguments for one page, in either pagination mode
+export interface PageArgs {
+  skip?: number;
+  take: number;
+  where?: any;
+  orderBy?: Record<string, "asc" | "desc"> | Record<string, "asc" | "desc">[];
+}
 
 export abstract class BaseRepository<T, CreateInput, UpdateInput>
   implements IRepository<T, CreateInput, UpdateInput>
 {
   protected db: PrismaClient;
   protected modelName: string;
+  // Columns a keyset page can be ordered by. Each needs an index, which in
+  // InnoDB also ends in the primary key, so (column, id) is walked in order
+  protected cursorKeys: readonly string[] = ["id"];
+  // Columns a time-range listing can be projected to with `fields`, each with
+  // its Prisma select; relations select what the full listing includes
+  protected rangeFields: Readonly<
+    Record<string, true | { select: Record<string, true> }>
+  > = {};
 
   constructor(modelName: string) {
     this.db = prisma;
@@ -29,6 +46,69 @@ export abstract class BaseRepository<T, CreateInput, UpdateInput>
     return delegate.count();
   }
 
+  // InnoDB's row estimate from table statistics: no scan, but it can be off
+  // by tens of percent until the statistics are refreshed
+  async estimateCount(): Promise<number> {
+    // Tables are named after their models (e.g. cWS -> CWS)
+    const table =
+      this.modelName.charAt(0).toUpperCase() + this.modelName.slice(1);
+    const rows = await this.db.$queryRaw<{ TABLE_ROWS: bigint | null }[]>`
+      SELECT TABLE_ROWS FROM information_schema.TABLES
+      WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = ${table}`;
+    return Number(rows[0]?.TABLE_ROWS ?? 0);
+  }
+
+  // Cursor for the page after the given row, the last one of a keyset page
+  cursorAfter(row: T, params?: PaginationParams): string {
+    const { sortBy, sortOrder } = this.getCursorSort(params);
+    const value = (row as any)[sortBy];
+
+    return CursorUtil.encode({
+      sortBy,
+      sortOrder,
+      value: value instanceof Date ? value.toISOString() : String(value),
+      id: String((row as any).id),
+    });
+  }
+
+  // One chunk of a time-range listing: rows starting in [start, end] after the
+  // cursor, in (waktuMulai, id) order, plus one to tell whether more follow
+  protected async findRangeChunk(
+    start: Date,
+    end: Date,
+    params: TimeRangeParams
+  ): Promise<Partial<T>[]> {
+    const page = this.getPageArgs({
+      limit: params.limit || 10,
+      cursor: params.cursor ?? "",
+      sortBy: "waktuMulai",
+    });
+    const range = { waktuMulai: { gte: start, lte: end } };
+
+    return (this.db as any)[this.modelName].findMany({
+      take: page.take,
+      orderBy: page.orderBy,
+      where: page.where ? { AND: [range, page.where] } : range,
+      select: this.getRangeSelect(params.fields),
+    });
+  }
+
+  // Every range field by default. id and waktuMulai always come back: the
+  // next chunk's cursor is built from them
+  private getRangeSelect(fields?: string[]): Record<string, unknown> {
+    const select: Record<string, unknown> = { id: true, waktuMulai: true };
+    for (const field of fields ?? Object.keys(this.rangeFields)) {
+      const selection = this.rangeFields[field];
+      if (!selection) {
+        throw CursorUtil.invalid(
+          `fields hanya mendukung: ${Object.keys(this.rangeFields).join(", ")}`
+        );
+      }
+      select[field] = selection;
+    }
+    return select;
+  }
+
   // Helper method for pagination
   protected getPaginationParams(params?: PaginationParams) {
     const page = params?.page || 1;
@@ -51,4 +131,72 @@ export abstract class BaseRepository<T, CreateInput, UpdateInput>
       [params.sortBy]: params.sortOrder || "asc",
     };
   }
+
+  // findMany arguments for the requested page: skip/take by page number, or,
+  // when a cursor is given, the rows after the cursor plus one to tell
+  // whether another page follows
+  protected getPageArgs(params?: PaginationParams): PageArgs {
+    if (params?.cursor === undefined) {
+      const { skip, take } = this.getPaginationParams(params);
+      const orderBy = this.getSortParams(params);
+      return { skip, take, ...(orderBy && { orderBy }) };
+    }
+
+    const { sortBy, sortOrder } = this.getCursorSort(params);
+    const limit = params.limit || 10;
+
+    return {
+      take: limit + 1,
+      orderBy:
+        sortBy === "id"
+          ? { id: sortOrder }
+          : [{ [sortBy]: sortOrder }, { id: sortOrder }],
+      ...(params.cursor && {
+        where: this.getKeysetWhere(CursorUtil.decode(params.cursor)),
+      }),
+    };
+  }
+
+  // A cursor carries its own ordering, so later pages ignore sortBy/sortOrder
+  private getCursorSort(params?: PaginationParams): {
+    sortBy: string;
+    sortOrder: "asc" | "desc";
+  } {
+    if (params?.cursor) {
+      const { sortBy, sortOrder } = CursorUtil.decode(params.cursor);
+      if (!this.cursorKeys.includes(sortBy)) {
+        throw CursorUtil.invalid("Cursor tidak valid");
+      }
+      return { sortBy, sortOrder };
+    }
+
+    const sortBy = params?.sortBy || "id";
+    if (!this.cursorKeys.includes(sortBy)) {
+      throw CursorUtil.invalid(
+        `Pagination cursor hanya mendukung sortBy: ${this.cursorKeys.join(", ")}`
+      );
+    }
+    return { sortBy, sortOrder: params?.sortOrder || "asc" };
+  }
+
+  // Rows strictly after the cursor in (sortBy, id) order; every cursor key
+  // other than id is a DateTime column (waktuMulai)
+  private getKeysetWhere(position: CursorPosition): any {
+    const op = position.sortOrder === "asc" ? "gt" : "lt";
+    const id = BigInt(position.id);
+    if (position.sortBy === "id") {
+      return { id: { [op]: id } };
+    }
+
+    const value = new Date(position.value);
+    if (Number.isNaN(value.getTime())) {
+      throw CursorUtil.invalid("Cursor tidak valid");
+    }
+    return {
+      OR: [
+        { [position.sortBy]: { [op]: value } },
+        { [position.sortBy]: value, id: { [op]: id } },
+      ],
+    };
+  }
 }
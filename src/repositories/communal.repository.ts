@@ -7,18 +7,15 @@ export class CommunalRepository extends BaseRepository<
   Prisma.CommunalCreateInput,
   Prisma.CommunalUpdateInput
 > {
+  protected cursorKeys = ["id", "waktuMulai"];
+
   constructor() {
     super("communal");
   }
 
   async findMany(params?: PaginationParams): Promise<Communal[]> {
-    const { skip, take } = this.getPaginationParams(params);
-    const orderBy = this.getSortParams(params);
-
     return this.db.communal.findMany({
-      skip,
-      take,
-      ...(orderBy && { orderBy }),
+      ...this.getPageArgs(params),
       include: {
         penanggungJawab: {
           select: {
@@ -165,4 +162,34 @@ export class CommunalRepository extends BaseRepository<
       },
     });
   }
+
+  // Mark every booking that ended at or before `now` as done in one UPDATE
+  async markPastAsDone(now: Date): Promise<number> {
+    const { count } = await this.db.communal.updateMany({
+      where: {
+        isDone: false,
+        waktuBerakhir: {
+          lte: now,
+        },
+      },
+      data: { isDone: true },
+    });
+    return count;
+  }
+
+  // Start times of bookings in [start, end] on one floor
+  async findBookedStarts(
+    start: Date,
+    end: Date,
+    lantai: bigint
+  ): Promise<Date[]> {
+    const bookings = await this.db.communal.findMany({
+      where: {
+        waktuMulai: { gte: start, lte: end },
+        lantai,
+      },
+      select: { waktuMulai: true },
+    });
+    return bookings.map((booking) => booking.waktuMulai);
+  }
 }
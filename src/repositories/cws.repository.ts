@@ -16,18 +16,15 @@ export class CWSRepository extends BaseRepository<
   Prisma.CWSCreateInput,
   Prisma.CWSUpdateInput
 > {
+  protected cursorKeys = ["id", "waktuMulai"];
+
   constructor() {
     super("cWS");
   }
 
   async findMany(params?: PaginationParams): Promise<CWS[]> {
-    const { skip, take } = this.getPaginationParams(params);
-    const orderBy = this.getSortParams(params);
-
     return this.db.cWS.findMany({
-      skip,
-      take,
-      ...(orderBy && { orderBy }),
+      ...this.getPageArgs(params),
       include: {
         penanggungJawab: {
           select: {
@@ -181,4 +178,27 @@ export class CWSRepository extends BaseRepository<
       },
     });
   }
+
+  // Mark every booking that ended at or before `now` as done in one UPDATE
+  async markPastAsDone(now: Date): Promise<number> {
+    const { count } = await this.db.cWS.updateMany({
+      where: {
+        isDone: false,
+        waktuBerakhir: {
+          lte: now,
+        },
+      },
+      data: { isDone: true },
+    });
+    return count;
+  }
+
+  // Start times of bookings in [start, end], without loading relations
+  async findBookedStarts(start: Date, end: Date): Promise<Date[]> {
+    const bookings = await this.db.cWS.findMany({
+      where: { waktuMulai: { gte: start, lte: end } },
+      select: { waktuMulai: true },
+    });
+    return bookings.map((booking) => booking.waktuMulai);
+  }
 }
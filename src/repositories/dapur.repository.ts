@@ -1,12 +1,28 @@
 import { Dapur, Prisma, PrismaClient } from "@prisma/client";
 import { BaseRepository } from "./base.repository";
-import { PaginationParams } from "../types";
+import { PaginationParams, TimeRangeParams } from "../types";
 
 export class DapurRepository extends BaseRepository<
   Dapur,
   Prisma.DapurCreateInput,
   Prisma.DapurUpdateInput
 > {
+  protected cursorKeys = ["id", "waktuMulai"];
+  protected rangeFields = {
+    id: true,
+    idPeminjam: true,
+    idFasilitas: true,
+    waktuMulai: true,
+    waktuBerakhir: true,
+    pinjamPeralatan: true,
+    createdAt: true,
+    updatedAt: true,
+    peminjam: {
+      select: { id: true, namaLengkap: true, namaPanggilan: true },
+    },
+    fasilitas: { select: { id: true, fasilitas: true } },
+  } as const;
+
   constructor() {
     super("dapur");
   }
@@ -33,13 +49,8 @@ export class DapurRepository extends BaseRepository<
   }
 
   async findAll(params: PaginationParams): Promise<Dapur[]> {
-    const { skip, take } = this.getPaginationParams(params);
-    const orderBy = this.getSortParams(params);
-
     return this.db.dapur.findMany({
-      skip,
-      take,
-      ...(orderBy && { orderBy }),
+      ...this.getPageArgs(params),
       include: {
         peminjam: {
           select: {
@@ -123,30 +134,13 @@ export class DapurRepository extends BaseRepository<
     });
   }
 
-  async findByTimeRange(startTime: Date, endTime: Date): Promise<Dapur[]> {
-    return this.db.dapur.findMany({
-      where: {
-        waktuMulai: {
-          gte: startTime,
-          lte: endTime,
-        },
-      },
-      include: {
-        peminjam: {
-          select: {
-            id: true,
-            namaLengkap: true,
-            namaPanggilan: true,
-          },
-        },
-        fasilitas: {
-          select: {
-            id: true,
-            fasilitas: true,
-          },
-        },
-      },
-    });
+  // One chunk of the time-range listing, see BaseRepository.findRangeChunk
+  async findByTimeRange(
+    startTime: Date,
+    endTime: Date,
+    params: TimeRangeParams = {}
+  ): Promise<Partial<Dapur>[]> {
+    return this.findRangeChunk(startTime, endTime, params);
   }
 
   async findConflictingBookings(
@@ -178,6 +172,20 @@ export class DapurRepository extends BaseRepository<
       },
     });
   }
-}
-
 
+  // Start times of bookings in [start, end], optionally for one facility only
+  async findBookedStarts(
+    start: Date,
+    end: Date,
+    idFasilitas?: bigint
+  ): Promise<Date[]> {
+    const bookings = await this.db.dapur.findMany({
+      where: {
+        waktuMulai: { gte: start, lte: end },
+        ...(idFasilitas && { idFasilitas }),
+      },
+      select: { waktuMulai: true },
+    });
+    return bookings.map((booking) => booking.waktuMulai);
+  }
+}
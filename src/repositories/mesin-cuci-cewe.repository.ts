@@ -1,12 +1,27 @@
 import { MesinCuciCewe, Prisma, PrismaClient } from "@prisma/client";
 import { BaseRepository } from "./base.repository";
-import { PaginationParams } from "../types";
+import { PaginationParams, TimeRangeParams } from "../types";
 
 export class MesinCuciCeweRepository extends BaseRepository<
   MesinCuciCewe,
   Prisma.MesinCuciCeweCreateInput,
   Prisma.MesinCuciCeweUpdateInput
 > {
+  protected cursorKeys = ["id", "waktuMulai"];
+  protected rangeFields = {
+    id: true,
+    idFasilitas: true,
+    idPeminjam: true,
+    waktuMulai: true,
+    waktuBerakhir: true,
+    createdAt: true,
+    updatedAt: true,
+    peminjam: {
+      select: { id: true, namaLengkap: true, namaPanggilan: true },
+    },
+    fasilitas: { select: { id: true, nama: true } },
+  } as const;
+
   constructor() {
     super("mesinCuciCewe");
   }
@@ -36,13 +51,8 @@ export class MesinCuciCeweRepository extends BaseRepository<
   }
 
   async findAll(params: PaginationParams): Promise<MesinCuciCewe[]> {
-    const { skip, take } = this.getPaginationParams(params);
-    const orderBy = this.getSortParams(params);
-
     return this.db.mesinCuciCewe.findMany({
-      skip,
-      take,
-      ...(orderBy && { orderBy }),
+      ...this.getPageArgs(params),
       include: {
         peminjam: {
           select: {
@@ -126,33 +136,13 @@ export class MesinCuciCeweRepository extends BaseRepository<
     });
   }
 
+  // One chunk of the time-range listing, see BaseRepository.findRangeChunk
   async findByTimeRange(
     startTime: Date,
-    endTime: Date
-  ): Promise<MesinCuciCewe[]> {
-    return this.db.mesinCuciCewe.findMany({
-      where: {
-        waktuMulai: {
-          gte: startTime,
-          lte: endTime,
-        },
-      },
-      include: {
-        peminjam: {
-          select: {
-            id: true,
-            namaLengkap: true,
-            namaPanggilan: true,
-          },
-        },
-        fasilitas: {
-          select: {
-            id: true,
-            nama: true,
-          },
-        },
-      },
-    });
+    endTime: Date,
+    params: TimeRangeParams = {}
+  ): Promise<Partial<MesinCuciCewe>[]> {
+    return this.findRangeChunk(startTime, endTime, params);
   }
 
   async findConflictingBookings(
@@ -184,4 +174,20 @@ export class MesinCuciCeweRepository extends BaseRepository<
       },
     });
   }
+
+  // Start times of bookings in [start, end], optionally for one machine only
+  async findBookedStarts(
+    start: Date,
+    end: Date,
+    idFasilitas?: bigint
+  ): Promise<Date[]> {
+    const bookings = await this.db.mesinCuciCewe.findMany({
+      where: {
+        waktuMulai: { gte: start, lte: end },
+        ...(idFasilitas && { idFasilitas }),
+      },
+      select: { waktuMulai: true },
+    });
+    return bookings.map((booking) => booking.waktuMulai);
+  }
 }
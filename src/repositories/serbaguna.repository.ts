@@ -7,18 +7,15 @@ export class SerbagunaRepository extends BaseRepository<
   Prisma.SerbagunaCreateInput,
   Prisma.SerbagunaUpdateInput
 > {
+  protected cursorKeys = ["id", "waktuMulai"];
+
   constructor() {
     super("serbaguna");
   }
 
   async findMany(params?: PaginationParams): Promise<Serbaguna[]> {
-    const { skip, take } = this.getPaginationParams(params);
-    const orderBy = this.getSortParams(params);
-
     return this.db.serbaguna.findMany({
-      skip,
-      take,
-      ...(orderBy && { orderBy }),
+      ...this.getPageArgs(params),
       include: {
         penanggungJawab: {
           select: {
@@ -207,4 +204,34 @@ export class SerbagunaRepository extends BaseRepository<
       },
     });
   }
+
+  // Mark every booking that ended at or before `now` as done in one UPDATE
+  async markPastAsDone(now: Date): Promise<number> {
+    const { count } = await this.db.serbaguna.updateMany({
+      where: {
+        isDone: false,
+        waktuBerakhir: {
+          lte: now,
+        },
+      },
+      data: { isDone: true },
+    });
+    return count;
+  }
+
+  // Start times of bookings in [start, end] in one area
+  async findBookedStarts(
+    start: Date,
+    end: Date,
+    idArea: bigint
+  ): Promise<Date[]> {
+    const bookings = await this.db.serbaguna.findMany({
+      where: {
+        waktuMulai: { gte: start, lte: end },
+        idArea,
+      },
+      select: { waktuMulai: true },
+    });
+    return bookings.map((booking) => booking.waktuMulai);
+  }
 }
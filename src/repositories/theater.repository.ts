@@ -7,18 +7,15 @@ export class TheaterRepository extends BaseRepository<
   Prisma.TheaterCreateInput,
   Prisma.TheaterUpdateInput
 > {
+  protected cursorKeys = ["id", "waktuMulai"];
+
   constructor() {
     super("theater");
   }
 
   async findMany(params?: PaginationParams): Promise<Theater[]> {
-    const { skip, take } = this.getPaginationParams(params);
-    const orderBy = this.getSortParams(params);
-
     return this.db.theater.findMany({
-      skip,
-      take,
-      ...(orderBy && { orderBy }),
+      ...this.getPageArgs(params),
       include: {
         penanggungJawab: {
           select: {
@@ -141,4 +138,27 @@ export class TheaterRepository extends BaseRepository<
       },
     });
   }
+
+  // Mark every booking that ended at or before `now` as done in one UPDATE
+  async markPastAsDone(now: Date): Promise<number> {
+    const { count } = await this.db.theater.updateMany({
+      where: {
+        isDone: false,
+        waktuBerakhir: {
+          lte: now,
+        },
+      },
+      data: { isDone: true },
+    });
+    return count;
+  }
+
+  // Start times of bookings in [start, end], without loading relations
+  async findBookedStarts(start: Date, end: Date): Promise<Date[]> {
+    const bookings = await this.db.theater.findMany({
+      where: { waktuMulai: { gte: start, lte: end } },
+      select: { waktuMulai: true },
+    });
+    return bookings.map((booking) => booking.waktuMulai);
+  }
 }
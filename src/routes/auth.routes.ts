@@ -259,6 +259,7 @@ router.put(
  * /api/v1/auth/logout:
  *   post:
  *     summary: User logout
+ *     description: The token is refused from then on, until it expires
  *     tags: [Authentication]
  *     security:
  *       - bearerAuth: []
@@ -0,0 +1,89 @@
+import { Router } from "express";
+import { AvailabilityController } from "../controllers/availability.controller";
+
+const router = Router();
+const availabilityController = new AvailabilityController();
+
+/**
+ * @swagger
+ * tags:
+ *   name: Availability
+ *   description: Slot availability of several facilities in one request
+ */
+
+/**
+ * @swagger
+ * /api/v1/availability:
+ *   get:
+ *     summary: Slot grids of several facilities for one day
+ *     description: |
+ *       One request instead of one `/time-slots` or `/available-slots` call per facility.
+ *       The lookups run concurrently on the server and share the per-module slot cache,
+ *       so each facility's slots are exactly what its own endpoint returns.
+ *
+ *       `facilities` is a comma-separated list of `facility` or `facility:unit`, where
+ *       the unit is the floor (communal, required), area (serbaguna, required) or
+ *       facility id (dapur, mesin-cuci-cewe, mesin-cuci-cowo; all units when left out).
+ *       theater and cws have no units and reject one.
+ *       At most 20 entries; duplicates are dropped.
+ *     tags: [Availability]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - name: date
+ *         in: query
+ *         required: true
+ *         description: Date (YYYY-MM-DD format)
+ *         schema:
+ *           type: string
+ *           format: date
+ *           example: "2025-09-01"
+ *       - name: facilities
+ *         in: query
+ *         required: true
+ *         description: Facilities to look up, e.g. `communal:3,serbaguna:1,dapur,cws`
+ *         schema:
+ *           type: string
+ *           example: "communal:3,serbaguna:1,theater,cws,dapur,mesin-cuci-cewe,mesin-cuci-cowo"
+ *     responses:
+ *       200:
+ *         description: One slot grid per requested facility, in request order
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: object
+ *               properties:
+ *                 success:
+ *                   type: boolean
+ *                   example: true
+ *                 data:
+ *                   type: object
+ *                   properties:
+ *                     date:
+ *                       type: string
+ *                       example: "2025-09-01"
+ *                     facilities:
+ *                       type: array
+ *                       items:
+ *                         type: object
+ *                         properties:
+ *                           facility:
+ *                             type: string
+ *                             enum: [communal, serbaguna, theater, cws, dapur, mesin-cuci-cewe, mesin-cuci-cowo]
+ *                           unit:
+ *                             type: string
+ *                             nullable: true
+ *                             example: "3"
+ *                           slots:
+ *                             type: array
+ *                             items:
+ *                               $ref: '#/components/schemas/TimeSlot'
+ *                 message:
+ *                   type: string
+ *                   example: "Slot waktu tersedia berhasil diambil"
+ *       400:
+ *         description: Missing or invalid date, unknown facility, missing floor/area or too many entries
+ */
+router.get("/", availabilityController.getDay);
+
+export default router;
@@ -0,0 +1,108 @@
+import { Router } from "express";
+import { CacheController } from "../controllers/cache.controller";
+
+const router = Router();
+const cacheController = new CacheController();
+
+/**
+ * @swagger
+ * tags:
+ *   name: Cache
+ *   description: Read cache for facility lists and time-slot grids (admin only)
+ */
+
+/**
+ * @swagger
+ * /api/v1/cache/stats:
+ *   get:
+ *     summary: Cache hit/miss counters
+ *     description: Totals and per-module counters since start-up (or the last reset), plus the number of cached entries.
+ *     tags: [Cache]
+ *     security:
+ *       - bearerAuth: []
+ *     responses:
+ *       200:
+ *         description: Cache statistics
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: object
+ *               properties:
+ *                 success:
+ *                   type: boolean
+ *                   example: true
+ *                 data:
+ *                   type: object
+ *                   properties:
+ *                     enabled:
+ *                       type: boolean
+ *                       example: true
+ *                     backend:
+ *                       type: string
+ *                       example: memory
+ *                     entries:
+ *                       type: integer
+ *                       example: 42
+ *                     hits:
+ *                       type: integer
+ *                       example: 1200
+ *                     misses:
+ *                       type: integer
+ *                       example: 80
+ *                     hitRate:
+ *                       type: number
+ *                       example: 0.9375
+ *                     invalidations:
+ *                       type: integer
+ *                       example: 15
+ *                     evictions:
+ *                       type: integer
+ *                       example: 0
+ *                     namespaces:
+ *                       type: object
+ *                       additionalProperties:
+ *                         type: object
+ *                         properties:
+ *                           hits:
+ *                             type: integer
+ *                           misses:
+ *                             type: integer
+ *                 message:
+ *                   type: string
+ *                   example: Statistik cache berhasil diambil
+ *       403:
+ *         description: Admin access required
+ */
+router.get("/stats", cacheController.getStats);
+
+/**
+ * @swagger
+ * /api/v1/cache/flush:
+ *   post:
+ *     summary: Clear the cache
+ *     description: Drops every cached entry, or only the keys starting with `prefix` (e.g. `dapur:slots:2024-01-15:`).
+ *     tags: [Cache]
+ *     security:
+ *       - bearerAuth: []
+ *     parameters:
+ *       - name: prefix
+ *         in: query
+ *         required: false
+ *         description: Only drop keys starting with this prefix
+ *         schema:
+ *           type: string
+ *       - name: resetStats
+ *         in: query
+ *         required: false
+ *         description: Also reset the hit/miss counters (full flush only)
+ *         schema:
+ *           type: boolean
+ *     responses:
+ *       200:
+ *         description: Cache cleared
+ *       403:
+ *         description: Admin access required
+ */
+router.post("/flush", cacheController.flush);
+
+export default router;
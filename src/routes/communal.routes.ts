@@ -186,6 +186,8 @@ const communalController = new CommunalController();
  *       - $ref: '#/components/parameters/LimitParam'
  *       - $ref: '#/components/parameters/SortByParam'
  *       - $ref: '#/components/parameters/SortOrderParam'
+ *       - $ref: '#/components/parameters/CursorParam'
+ *       - $ref: '#/components/parameters/TotalParam'
  *     responses:
  *       200:
  *         description: Communal bookings retrieved successfully
@@ -212,6 +214,11 @@ const communalController = new CommunalController();
  *                       type: integer
  *                     totalPages:
  *                       type: integer
+ *                     approximate:
+ *                       type: boolean
+ *                     nextCursor:
+ *                       type: string
+ *                       nullable: true
  */
 router.get("/", communalController.getAll);
 
@@ -564,4 +571,45 @@ router.get(
   communalController.getAvailableTimeSlots
 );
 
+/**
+ * @swagger
+ * /api/v1/communal/mark-past-done:
+ *   post:
+ *     tags: [Communal]
+ *     summary: Mark past bookings as done
+ *     security:
+ *       - bearerAuth: []
+ *     description: |
+ *       Mark all Communal bookings that have ended as done in a single update
+ *
+ *       **✨ Features:**
+ *       - Updates bookings where waktuBerakhir <= current time and isDone = false
+ *       - Returns the number of bookings updated
+ *     responses:
+ *       200:
+ *         description: Past bookings marked as done successfully
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: object
+ *               properties:
+ *                 success:
+ *                   type: boolean
+ *                   example: true
+ *                 data:
+ *                   type: object
+ *                   properties:
+ *                     updated:
+ *                       type: integer
+ *                       example: 12
+ *                 message:
+ *                   type: string
+ *                   example: "Past bookings berhasil di-mark sebagai done"
+ *       401:
+ *         $ref: '#/components/responses/Unauthorized'
+ *       500:
+ *         $ref: '#/components/responses/InternalServerError'
+ */
+router.post("/mark-past-done", communalController.markPastBookingsAsDone);
+
 export default router;
@@ -186,6 +186,8 @@ const cwsController = new CWSController();
  *           minimum: 1
  *           maximum: 100
  *           default: 10
+ *       - $ref: '#/components/parameters/CursorParam'
+ *       - $ref: '#/components/parameters/TotalParam'
  *     responses:
  *       200:
  *         description: List of CWS bookings retrieved successfully
@@ -424,8 +426,9 @@ router.get("/date/:date", cwsController.getBookingsByDate);
  *       Automatically mark all CWS bookings that have ended as done
  *
  *       **✨ Features:**
- *       - Finds all bookings where waktuBerakhir < current time
- *       - Marks bookings with isDone = false as isDone = true
+ *       - Updates bookings where waktuBerakhir <= current time and isDone = false
+ *         in a single update
+ *       - Returns the number of bookings updated
  *       - Useful for cleanup and status management
  *     responses:
  *       200:
@@ -439,8 +442,11 @@ router.get("/date/:date", cwsController.getBookingsByDate);
  *                   type: boolean
  *                   example: true
  *                 data:
- *                   type: null
- *                   example: null
+ *                   type: object
+ *                   properties:
+ *                     updated:
+ *                       type: integer
+ *                       example: 12
  *                 message:
  *                   type: string
  *                   example: "Past bookings berhasil di-mark sebagai done"
@@ -190,6 +190,8 @@ const dapurController = new DapurController();
  *       - $ref: '#/components/parameters/LimitParam'
  *       - $ref: '#/components/parameters/SortByParam'
  *       - $ref: '#/components/parameters/SortOrderParam'
+ *       - $ref: '#/components/parameters/CursorParam'
+ *       - $ref: '#/components/parameters/TotalParam'
  *     responses:
  *       200:
  *         description: Successful response
@@ -585,7 +587,7 @@ router.get("/fasilitas/:fasilitasId", dapurController.getDapurByFasilitas);
  *     summary: Get kitchen bookings by time range
  *     security:
  *       - bearerAuth: []
- *     description: Retrieve all kitchen bookings within a specific time range
+ *     description: Retrieve kitchen bookings starting within a time range, at most limit per response in (waktuMulai, id) order; follow pagination.nextCursor for the rest
  *     parameters:
  *       - name: startTime
  *         in: query
@@ -603,6 +605,9 @@ router.get("/fasilitas/:fasilitasId", dapurController.getDapurByFasilitas);
  *           type: string
  *           format: date-time
  *           example: "2025-09-01T23:59:59.999Z"
+ *       - $ref: '#/components/parameters/RangeLimitParam'
+ *       - $ref: '#/components/parameters/RangeCursorParam'
+ *       - $ref: '#/components/parameters/FieldsParam'
  *     responses:
  *       200:
  *         description: Bookings by time range
@@ -618,6 +623,16 @@ router.get("/fasilitas/:fasilitasId", dapurController.getDapurByFasilitas);
  *                   type: array
  *                   items:
  *                     $ref: '#/components/schemas/Dapur'
+ *                 pagination:
+ *                   type: object
+ *                   properties:
+ *                     limit:
+ *                       type: integer
+ *                       example: 5000
+ *                     nextCursor:
+ *                       type: string
+ *                       nullable: true
+ *                       description: More bookings in the range follow; pass it as cursor
  *                 message:
  *                   type: string
  *                   example: "Data booking berdasarkan rentang waktu berhasil diambil"
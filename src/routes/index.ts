@@ -8,10 +8,15 @@ import mesinCuciCowoRoutes from "./mesin-cuci-cowo.routes";
 import dapurRoutes from "./dapur.routes";
 import cwsRoutes from "./cws.routes";
 import theaterRoutes from "./theater.routes";
+import availabilityRoutes from "./availability.routes";
+import cacheRoutes from "./cache.routes";
+import queryStatsRoutes from "./query-stats.routes";
+import { MetricsController } from "../controllers/metrics.controller";
 import { AuthMiddleware } from "../middleware/auth.middleware";
 import { AdminMiddleware } from "../middleware/admin.middleware";
 
 const router = Router();
+const metricsController = new MetricsController();
 
 // API versioning
 const API_VERSION = "/api/v1";
@@ -49,6 +54,23 @@ router.use(
 router.use(`${API_VERSION}/dapur`, AuthMiddleware.authenticate, dapurRoutes);
 router.use(`${API_VERSION}/cws`, AuthMiddleware.authenticate, cwsRoutes);
 router.use(`${API_VERSION}/theater`, AuthMiddleware.authenticate, theaterRoutes);
+router.use(
+  `${API_VERSION}/availability`,
+  AuthMiddleware.authenticate,
+  availabilityRoutes
+);
+router.use(
+  `${API_VERSION}/cache`,
+  AuthMiddleware.authenticate,
+  AdminMiddleware.requireAdmin,
+  cacheRoutes
+);
+router.use(
+  `${API_VERSION}/query-stats`,
+  AuthMiddleware.authenticate,
+  AdminMiddleware.requireAdmin,
+  queryStatsRoutes
+);
 
 // Health check
 router.get("/health", (req, res) => {
@@ -60,6 +82,25 @@ router.get("/health", (req, res) => {
   });
 });
 
+/**
+ * @swagger
+ * /metrics:
+ *   get:
+ *     summary: Prometheus metrics
+ *     description: Per-route, per-status latency histograms, in-flight requests, per-route DB queries and time, event-loop lag and memory, in Prometheus text format. Needs `Authorization: Bearer <METRICS_TOKEN>` when METRICS_TOKEN is set.
+ *     tags: [Metrics]
+ *     responses:
+ *       200:
+ *         description: Metrics in Prometheus text exposition format
+ *         content:
+ *           text/plain:
+ *             schema:
+ *               type: string
+ *       401:
+ *         description: Missing or wrong METRICS_TOKEN
+ */
+router.get("/metrics", metricsController.getMetrics);
+
 // API info
 router.get(`${API_VERSION}`, (req, res) => {
   res.json({
@@ -77,6 +118,10 @@ router.get(`${API_VERSION}`, (req, res) => {
       dapur: `${API_VERSION}/dapur`,
       cws: `${API_VERSION}/cws`,
       theater: `${API_VERSION}/theater`,
+      availability: `${API_VERSION}/availability`,
+      cache: `${API_VERSION}/cache`,
+      queryStats: `${API_VERSION}/query-stats`,
+      metrics: "/metrics",
       // Add other endpoints here
     },
     authentication: {
@@ -165,6 +165,8 @@ const mesinCuciCeweController = new MesinCuciCeweController();
  *       - $ref: '#/components/parameters/LimitParam'
  *       - $ref: '#/components/parameters/SortByParam'
  *       - $ref: '#/components/parameters/SortOrderParam'
+ *       - $ref: '#/components/parameters/CursorParam'
+ *       - $ref: '#/components/parameters/TotalParam'
  *     responses:
  *       200:
  *         description: Successful response
@@ -566,7 +568,7 @@ router.get(
  *     summary: Get women's washing machine bookings by time range
  *     security:
  *       - bearerAuth: []
- *     description: Retrieve all women's washing machine bookings within a specific time range
+ *     description: Retrieve women's washing machine bookings starting within a time range, at most limit per response in (waktuMulai, id) order; follow pagination.nextCursor for the rest
  *     parameters:
  *       - name: startTime
  *         in: query
@@ -584,6 +586,9 @@ router.get(
  *           type: string
  *           format: date-time
  *           example: "2025-09-01T23:59:59.999Z"
+ *       - $ref: '#/components/parameters/RangeLimitParam'
+ *       - $ref: '#/components/parameters/RangeCursorParam'
+ *       - $ref: '#/components/parameters/FieldsParam'
  *     responses:
  *       200:
  *         description: Bookings by time range
@@ -599,6 +604,16 @@ router.get(
  *                   type: array
  *                   items:
  *                     $ref: '#/components/schemas/MesinCuciCewe'
+ *                 pagination:
+ *                   type: object
+ *                   properties:
+ *                     limit:
+ *                       type: integer
+ *                       example: 5000
+ *                     nextCursor:
+ *                       type: string
+ *                       nullable: true
+ *                       description: More bookings in the range follow; pass it as cursor
  *                 message:
  *                   type: string
  *                   example: "Data booking berdasarkan rentang waktu berhasil diambil"
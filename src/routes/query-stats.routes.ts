@@ -0,0 +1,104 @@
+import { Router } from "express";
+import { QueryStatsController } from "../controllers/query-stats.controller";
+
+const router = Router();
+const queryStatsController = new QueryStatsController();
+
+/**
+ * @swagger
+ * tags:
+ *   name: Query Stats
+ *   description: Per-route database query totals and the slow-query log (admin only)
+ */
+
+/**
+ * @swagger
+ * /api/v1/query-stats:
+ *   get:
+ *     summary: Query count and DB time per route
+ *     description: Totals per route pattern (e.g. `GET /api/v1/communal/:id`) since start-up or the last reset, sorted by DB time.
+ *     tags: [Query Stats]
+ *     security:
+ *       - bearerAuth: []
+ *     responses:
+ *       200:
+ *         description: Per-route query statistics
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: object
+ *               properties:
+ *                 success:
+ *                   type: boolean
+ *                   example: true
+ *                 data:
+ *                   type: object
+ *                   properties:
+ *                     since:
+ *                       type: string
+ *                       format: date-time
+ *                     slowQueryMs:
+ *                       type: number
+ *                       example: 200
+ *                     routes:
+ *                       type: array
+ *                       items:
+ *                         type: object
+ *                         properties:
+ *                           route:
+ *                             type: string
+ *                             example: GET /api/v1/communal/:id
+ *                           requests:
+ *                             type: integer
+ *                           queries:
+ *                             type: integer
+ *                           maxQueries:
+ *                             type: integer
+ *                           dbTimeMs:
+ *                             type: number
+ *                           totalTimeMs:
+ *                             type: number
+ *                           slowQueries:
+ *                             type: integer
+ *                 message:
+ *                   type: string
+ *                   example: Statistik query berhasil diambil
+ *       403:
+ *         description: Admin access required
+ */
+router.get("/", queryStatsController.getStats);
+
+/**
+ * @swagger
+ * /api/v1/query-stats/slow:
+ *   get:
+ *     summary: Recent slow queries
+ *     description: The latest queries that took at least SLOW_QUERY_MS, newest first, with their route. Argument values are replaced by "?".
+ *     tags: [Query Stats]
+ *     security:
+ *       - bearerAuth: []
+ *     responses:
+ *       200:
+ *         description: Slow queries
+ *       403:
+ *         description: Admin access required
+ */
+router.get("/slow", queryStatsController.getSlowQueries);
+
+/**
+ * @swagger
+ * /api/v1/query-stats/reset:
+ *   post:
+ *     summary: Reset the per-route totals and the slow-query log
+ *     tags: [Query Stats]
+ *     security:
+ *       - bearerAuth: []
+ *     responses:
+ *       200:
+ *         description: Statistics reset
+ *       403:
+ *         description: Admin access required
+ */
+router.post("/reset", queryStatsController.reset);
+
+export default router;
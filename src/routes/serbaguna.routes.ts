@@ -192,6 +192,8 @@ const serbagunaController = new SerbagunaController();
  *       - $ref: '#/components/parameters/LimitParam'
  *       - $ref: '#/components/parameters/SortByParam'
  *       - $ref: '#/components/parameters/SortOrderParam'
+ *       - $ref: '#/components/parameters/CursorParam'
+ *       - $ref: '#/components/parameters/TotalParam'
  *     responses:
  *       200:
  *         description: Serbaguna bookings retrieved successfully
@@ -218,6 +220,11 @@ const serbagunaController = new SerbagunaController();
  *                       type: integer
  *                     totalPages:
  *                       type: integer
+ *                     approximate:
+ *                       type: boolean
+ *                     nextCursor:
+ *                       type: string
+ *                       nullable: true
  */
 router.get("/", serbagunaController.getAll);
 
@@ -602,4 +609,45 @@ router.get(
   serbagunaController.getAvailableTimeSlots
 );
 
+/**
+ * @swagger
+ * /api/v1/serbaguna/mark-past-done:
+ *   post:
+ *     tags: [Serbaguna]
+ *     summary: Mark past bookings as done
+ *     security:
+ *       - bearerAuth: []
+ *     description: |
+ *       Mark all Serbaguna bookings that have ended as done in a single update
+ *
+ *       **✨ Features:**
+ *       - Updates bookings where waktuBerakhir <= current time and isDone = false
+ *       - Returns the number of bookings updated
+ *     responses:
+ *       200:
+ *         description: Past bookings marked as done successfully
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: object
+ *               properties:
+ *                 success:
+ *                   type: boolean
+ *                   example: true
+ *                 data:
+ *                   type: object
+ *                   properties:
+ *                     updated:
+ *                       type: integer
+ *                       example: 12
+ *                 message:
+ *                   type: string
+ *                   example: "Past bookings berhasil di-mark sebagai done"
+ *       401:
+ *         $ref: '#/components/responses/Unauthorized'
+ *       500:
+ *         $ref: '#/components/responses/InternalServerError'
+ */
+router.post("/mark-past-done", serbagunaController.markPastBookingsAsDone);
+
 export default router;
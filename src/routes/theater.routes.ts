@@ -130,6 +130,8 @@ const theaterController = new TheaterController();
  *       - $ref: '#/components/parameters/LimitParam'
  *       - $ref: '#/components/parameters/SortByParam'
  *       - $ref: '#/components/parameters/SortOrderParam'
+ *       - $ref: '#/components/parameters/CursorParam'
+ *       - $ref: '#/components/parameters/TotalParam'
  *     responses:
  *       200:
  *         description: Theater bookings retrieved successfully
@@ -418,4 +420,45 @@ router.put("/:id", theaterController.update);
  */
 router.delete("/:id", theaterController.delete);
 
+/**
+ * @swagger
+ * /api/v1/theater/mark-past-done:
+ *   post:
+ *     tags: [Theater]
+ *     summary: Mark past bookings as done
+ *     security:
+ *       - bearerAuth: []
+ *     description: |
+ *       Mark all Theater bookings that have ended as done in a single update
+ *
+ *       **✨ Features:**
+ *       - Updates bookings where waktuBerakhir <= current time and isDone = false
+ *       - Returns the number of bookings updated
+ *     responses:
+ *       200:
+ *         description: Past bookings marked as done successfully
+ *         content:
+ *           application/json:
+ *             schema:
+ *               type: object
+ *               properties:
+ *                 success:
+ *                   type: boolean
+ *                   example: true
+ *                 data:
+ *                   type: object
+ *                   properties:
+ *                     updated:
+ *                       type: integer
+ *                       example: 12
+ *                 message:
+ *                   type: string
+ *                   example: "Past bookings berhasil di-mark sebagai done"
+ *       401:
+ *         $ref: '#/components/responses/Unauthorized'
+ *       500:
+ *         $ref: '#/components/responses/InternalServerError'
+ */
+router.post("/mark-past-done", theaterController.markPastBookingsAsDone);
+
 export default router;
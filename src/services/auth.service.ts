@@ -1,6 +1,6 @@
-import bcrypt from "bcryptjs";
 import { Users } from "@prisma/client";
 import DatabaseConnection from "../utils/database";
+import { PasswordHasher } from "../utils/password-hasher";
 import { AuthMiddleware } from "../middleware/auth.middleware";
 
 export interface LoginDTO {
@@ -41,21 +41,21 @@ export class AuthService {
   }
 
   /**
-   * Hash password
+   * Hash password (on the worker pool, off the event loop)
    */
   private async hashPassword(password: string): Promise<string> {
     const saltRounds = 12;
-    return bcrypt.hash(password, saltRounds);
+    return PasswordHasher.hash(password, saltRounds);
   }
 
   /**
-   * Verify password
+   * Verify password (on the worker pool, off the event loop)
    */
   private async verifyPassword(
     password: string,
     hashedPassword: string
   ): Promise<boolean> {
-    return bcrypt.compare(password, hashedPassword);
+    return PasswordHasher.compare(password, hashedPassword);
   }
 
   /**
@@ -225,4 +225,12 @@ export class AuthService {
       data: { password: hashedNewPassword },
     });
   }
+
+  /**
+   * Log out a token: the JWT stays stateless, but this process refuses it
+   * (and drops its cached verification) until it expires
+   */
+  logout(token: string): void {
+    AuthMiddleware.revokeToken(token);
+  }
 }
@@ -0,0 +1,91 @@
+import { CommunalService } from "./communal.service";
+import { SerbagunaService } from "./serbaguna.service";
+import { TheaterService } from "./theater.service";
+import { CWSService } from "./cws.service";
+import { DapurService } from "./dapur.service";
+import { MesinCuciCeweService } from "./mesin-cuci-cewe.service";
+import { MesinCuciCowoService } from "./mesin-cuci-cowo.service";
+import { AvailableTimeSlot } from "../utils/availability";
+
+export const FACILITIES = [
+  "communal",
+  "serbaguna",
+  "theater",
+  "cws",
+  "dapur",
+  "mesin-cuci-cewe",
+  "mesin-cuci-cowo",
+] as const;
+
+export type Facility = (typeof FACILITIES)[number];
+
+// Facilities whose slots only make sense per floor (communal) or area (serbaguna)
+export const UNIT_REQUIRED: ReadonlySet<Facility> = new Set<Facility>([
+  "communal",
+  "serbaguna",
+]);
+
+// Facilities booked as a whole, with no floor, area or machine to pick
+export const UNIT_LESS: ReadonlySet<Facility> = new Set<Facility>([
+  "theater",
+  "cws",
+]);
+
+export interface FacilityRequest {
+  facility: Facility;
+  // Floor, area or machine/stove id; all of them when left out
+  unit?: bigint;
+}
+
+export interface FacilityAvailability {
+  facility: Facility;
+  unit: string | null;
+  slots: AvailableTimeSlot[];
+}
+
+type SlotLookup = (date: string, unit?: bigint) => Promise<AvailableTimeSlot[]>;
+
+export class AvailabilityService {
+  private lookups: Record<Facility, SlotLookup>;
+
+  constructor() {
+    const communal = new CommunalService();
+    const serbaguna = new SerbagunaService();
+    const theater = new TheaterService();
+    const cws = new CWSService();
+    const dapur = new DapurService();
+    const mesinCuciCewe = new MesinCuciCeweService();
+    const mesinCuciCowo = new MesinCuciCowoService();
+
+    // Same calls, and so the same cache entries, as each module's own endpoint
+    this.lookups = {
+      communal: (date, unit) =>
+        communal.getAvailableTimeSlots(new Date(date), unit!),
+      serbaguna: (date, unit) =>
+        serbaguna.getAvailableTimeSlots(new Date(date), unit!),
+      theater: (date) => theater.getAvailableTimeSlots(new Date(date)),
+      cws: (date) => cws.getAvailableTimeSlots(new Date(date)),
+      dapur: (date, unit) => dapur.getAvailableTimeSlots(date, unit),
+      "mesin-cuci-cewe": (date, unit) =>
+        mesinCuciCewe.getAvailableTimeSlots(date, unit),
+      "mesin-cuci-cowo": (date, unit) =>
+        mesinCuciCowo.getAvailableTimeSlots(date, unit),
+    };
+  }
+
+  /**
+   * Slot grids of several facilities for one day, looked up concurrently
+   */
+  async getDay(
+    date: string,
+    requests: FacilityRequest[]
+  ): Promise<FacilityAvailability[]> {
+    return Promise.all(
+      requests.map(async ({ facility, unit }) => ({
+        facility,
+        unit: unit?.toString() ?? null,
+        slots: await this.lookups[facility](date, unit),
+      }))
+    );
+  }
+}
@@ -1,5 +1,13 @@
-import { IService, PaginationParams, PaginatedResponse } from "../types";
+import {
+  IService,
+  PaginationParams,
+  PaginatedResponse,
+  TimeRangeParams,
+  TimeRangeStream,
+  TotalMode,
+} from "../types";
 import { BaseRepository } from "../repositories/base.repository";
+import { TimeRangeUtil } from "../utils/time-range";
 
 export abstract class BaseService<
   T,
@@ -16,26 +24,119 @@ export abstract class BaseService<
   }
 
   async getAll(params?: PaginationParams): Promise<PaginatedResponse<T>> {
+    if (params?.cursor !== undefined) {
+      return this.getPage(params);
+    }
+
     const [data, total] = await Promise.all([
       this.repository.findMany(params),
-      this.repository.count(params),
+      this.countTotal(params?.total ?? "exact", params),
     ]);
 
     const limit = params?.limit || 10;
     const currentPage = params?.page || 1;
-    const totalPages = Math.max(1, Math.ceil(total / limit));
 
     return {
       data,
       pagination: {
         page: currentPage,
         limit,
-        total,
-        totalPages,
+        ...(total !== undefined && {
+          total,
+          totalPages: Math.max(1, Math.ceil(total / limit)),
+        }),
+        ...(params?.total === "approx" && { approximate: true }),
       },
     };
   }
 
+  // Keyset page: seeks past the cursor instead of skipping rows, so every page
+  // costs the same however deep it is. No total unless one is asked for
+  protected async getPage(
+    params: PaginationParams
+  ): Promise<PaginatedResponse<T>> {
+    const limit = params.limit || 10;
+    const [rows, total] = await Promise.all([
+      this.repository.findMany(params),
+      this.countTotal(params.total ?? "none", params),
+    ]);
+
+    const data = rows.slice(0, limit);
+    const last = data[data.length - 1];
+
+    return {
+      data,
+      pagination: {
+        limit,
+        ...(total !== undefined && { total }),
+        ...(params.total === "approx" && { approximate: true }),
+        nextCursor:
+          rows.length > limit && last
+            ? this.repository.cursorAfter(last, params)
+            : null,
+      },
+    };
+  }
+
+  /**
+   * A time-range listing of at most maxRows rows (or params.limit), fetched
+   * chunkRows at a time, each chunk seeking past the previous one's last row.
+   * Nothing is read until the chunks are iterated
+   */
+  protected streamRange(
+    fetch: (params: TimeRangeParams) => Promise<Partial<T>[]>,
+    params: TimeRangeParams
+  ): TimeRangeStream<Partial<T>> {
+    const limit = Math.min(
+      params.limit || TimeRangeUtil.maxRows,
+      TimeRangeUtil.maxRows
+    );
+    const pagination = { limit, nextCursor: null as string | null };
+    const repository = this.repository;
+
+    async function* chunks(): AsyncGenerator<Partial<T>[]> {
+      let cursor = params.cursor ?? "";
+      let remaining = limit;
+      while (remaining > 0) {
+        const take = Math.min(remaining, TimeRangeUtil.chunkRows);
+        const rows = await fetch({ ...params, cursor, limit: take });
+        const chunk = rows.slice(0, take);
+        const last = chunk[chunk.length - 1];
+        if (rows.length <= take || !last) {
+          pagination.nextCursor = null;
+          if (chunk.length > 0) {
+            yield chunk;
+          }
+          return;
+        }
+        // Stays as the response's nextCursor if the limit ends the listing here
+        cursor = repository.cursorAfter(last as T, {
+          sortBy: "waktuMulai",
+          cursor,
+        });
+        pagination.nextCursor = cursor;
+        remaining -= take;
+        yield chunk;
+      }
+    }
+
+    return { chunks: chunks(), pagination };
+  }
+
+  private async countTotal(
+    mode: TotalMode,
+    params?: PaginationParams
+  ): Promise<number | undefined> {
+    switch (mode) {
+      case "exact":
+        return this.repository.count(params);
+      case "approx":
+        return this.repository.estimateCount();
+      case "none":
+        return undefined;
+    }
+  }
+
   async getById(id: bigint): Promise<T> {
     const item = await this.repository.findById(id);
     if (!item) {
@@ -48,10 +149,14 @@ export abstract class BaseService<
   abstract update(id: bigint, data: UpdateDTO): Promise<T>;
 
   async delete(id: bigint): Promise<void> {
-    await this.getById(id); // Check if exists
+    const item = await this.getById(id); // Check if exists
     await this.repository.delete(id);
+    await this.invalidateCache(item);
   }
 
+  // Drop cached reads that depend on the given records; services that cache override it
+  protected async invalidateCache(..._items: T[]): Promise<void> {}
+
   // Helper method to transform DTO to repository input
   protected abstract mapCreateDTOToInput(dto: CreateDTO): CreateInput;
   protected abstract mapUpdateDTOToInput(dto: UpdateDTO): UpdateInput;
@@ -2,6 +2,8 @@ import { Communal, Prisma } from "@prisma/client";
 import { BaseService } from "./base.service";
 import { CommunalRepository } from "../repositories/communal.repository";
 import { TimeValidationUtil } from "../utils/time-validation";
+import { AvailabilityUtil, AvailableTimeSlot } from "../utils/availability";
+import { CacheUtil } from "../utils/cache";
 import { prisma } from "../utils/database";
 
 // DTOs
@@ -79,7 +81,9 @@ export class CommunalService extends BaseService<
     }
 
     const input = this.mapCreateDTOToInput(data);
-    return this.repository.create(input);
+    const booking = await this.repository.create(input);
+    await this.invalidateCache(booking);
+    return booking;
   }
 
   async update(id: bigint, data: UpdateCommunalDTO): Promise<Communal> {
@@ -135,7 +139,9 @@ export class CommunalService extends BaseService<
     }
 
     const input = this.mapUpdateDTOToInput(data);
-    return this.repository.update(id, input);
+    const booking = await this.repository.update(id, input);
+    await this.invalidateCache(existing, booking);
+    return booking;
   }
 
   // Custom methods
@@ -152,42 +158,28 @@ export class CommunalService extends BaseService<
   async getAvailableTimeSlots(
     date: Date,
     lantai: bigint
-  ): Promise<{ waktuMulai: Date; waktuBerakhir: Date; display: string; available: boolean }[]> {
-    const allSlots = TimeValidationUtil.getOneHourTimeSlots(date);
-    const bookedSlots = await this.communalRepository.findByTimeRange({
-      waktuMulai: {
-        gte: new Date(
-          date.getFullYear(),
-          date.getMonth(),
-          date.getDate(),
-          0,
-          0,
-          0
-        ),
-        lte: new Date(
-          date.getFullYear(),
-          date.getMonth(),
-          date.getDate(),
-          23,
-          59,
-          59
-        ),
-      },
-    });
+  ): Promise<AvailableTimeSlot[]> {
+    return CacheUtil.getOrLoad(
+      AvailabilityUtil.cacheKey("communal", date, lantai),
+      async () => {
+        const { start, end } = AvailabilityUtil.dayRange(date);
+        const bookedStarts = await this.communalRepository.findBookedStarts(
+          start,
+          end,
+          lantai
+        );
 
-    return allSlots.map((slot) => {
-      const isBooked = bookedSlots.some(
-        (booking) =>
-          booking.lantai === lantai &&
-          booking.waktuMulai.getTime() === slot.waktuMulai.getTime()
-      );
+        return AvailabilityUtil.build(
+          TimeValidationUtil.getOneHourTimeSlots(date),
+          bookedStarts
+        );
+      }
+    );
+  }
 
-      return {
-        ...slot,
-        display: `${slot.waktuMulai.toLocaleTimeString('id-ID', { hour: '2-digit', minute: '2-digit', timeZone: 'Asia/Jakarta' })} - ${slot.waktuBerakhir.toLocaleTimeString('id-ID', { hour: '2-digit', minute: '2-digit', timeZone: 'Asia/Jakarta' })}`,
-        available: !isBooked,
-      };
-    });
+  // Mark all bookings that have ended as done; returns how many were updated
+  async markPastBookingsAsDone(): Promise<number> {
+    return this.communalRepository.markPastAsDone(new Date());
   }
 
   protected mapCreateDTOToInput(
@@ -231,4 +223,12 @@ export class CommunalService extends BaseService<
 
     return input;
   }
+
+  // Bookings only change the slot grids of the days they start on
+  protected async invalidateCache(...bookings: Communal[]): Promise<void> {
+    await AvailabilityUtil.invalidate(
+      "communal",
+      ...bookings.map((booking) => booking.waktuMulai)
+    );
+  }
 }
@@ -5,6 +5,8 @@ import {
   CWSWithRelations,
 } from "../repositories/cws.repository";
 import { TimeValidationUtil } from "../utils/time-validation";
+import { AvailabilityUtil, AvailableTimeSlot } from "../utils/availability";
+import { CacheUtil } from "../utils/cache";
 import { prisma } from "../utils/database";
 
 // DTOs
@@ -86,7 +88,9 @@ export class CWSService extends BaseService<
     }
 
     const input = this.mapCreateDTOToInput(data);
-    return this.repository.create(input);
+    const booking = await this.repository.create(input);
+    await this.invalidateCache(booking);
+    return booking;
   }
 
   async update(id: bigint, data: UpdateCWSDTO): Promise<CWS> {
@@ -145,7 +149,9 @@ export class CWSService extends BaseService<
     }
 
     const input = this.mapUpdateDTOToInput(data);
-    return this.repository.update(id, input);
+    const booking = await this.repository.update(id, input);
+    await this.invalidateCache(existing, booking);
+    return booking;
   }
 
   // Custom methods
@@ -153,55 +159,19 @@ export class CWSService extends BaseService<
     return this.cwsRepository.findByPenanggungJawab(penanggungJawabId);
   }
 
-  async getAvailableTimeSlots(date: Date): Promise<
-    {
-      waktuMulai: Date;
-      waktuBerakhir: Date;
-      display: string;
-      available: boolean;
-    }[]
-  > {
-    const allSlots = TimeValidationUtil.getTwoHourTimeSlots(date);
-    const bookedSlots = await this.cwsRepository.findByTimeRange({
-      waktuMulai: {
-        gte: new Date(
-          date.getFullYear(),
-          date.getMonth(),
-          date.getDate(),
-          0,
-          0,
-          0
-        ),
-        lte: new Date(
-          date.getFullYear(),
-          date.getMonth(),
-          date.getDate(),
-          23,
-          59,
-          59
-        ),
-      },
-    });
-
-    return allSlots.map((slot) => {
-      const isBooked = bookedSlots.some(
-        (booking) => booking.waktuMulai.getTime() === slot.waktuMulai.getTime()
-      );
+  async getAvailableTimeSlots(date: Date): Promise<AvailableTimeSlot[]> {
+    return CacheUtil.getOrLoad(
+      AvailabilityUtil.cacheKey("cws", date),
+      async () => {
+        const { start, end } = AvailabilityUtil.dayRange(date);
+        const bookedStarts = await this.cwsRepository.findBookedStarts(start, end);
 
-      return {
-        ...slot,
-        display: `${slot.waktuMulai.toLocaleTimeString("id-ID", {
-          hour: "2-digit",
-          minute: "2-digit",
-          timeZone: "Asia/Jakarta", // WIB (UTC+7)
-        })} - ${slot.waktuBerakhir.toLocaleTimeString("id-ID", {
-          hour: "2-digit",
-          minute: "2-digit",
-          timeZone: "Asia/Jakarta", // WIB (UTC+7)
-        })}`,
-        available: !isBooked,
-      };
-    });
+        return AvailabilityUtil.build(
+          TimeValidationUtil.getTwoHourTimeSlots(date),
+          bookedStarts
+        );
+      }
+    );
   }
 
   protected mapCreateDTOToInput(dto: CreateCWSDTO): Prisma.CWSCreateInput {
@@ -262,22 +232,16 @@ export class CWSService extends BaseService<
     return this.cwsRepository.findByDateRange(startOfDay, endOfDay);
   }
 
-  async markPastBookingsAsDone(): Promise<void> {
-    const now = new Date();
-
-    // Find all bookings that have ended but are not marked as done
-    const pastBookings = await this.cwsRepository.findByTimeRange({
-      waktuBerakhir: {
-        lte: now,
-      },
-    });
-
-    // Filter only bookings that are not done yet
-    const undoneBookings = pastBookings.filter((booking) => !booking.isDone);
+  // Mark all bookings that have ended as done; returns how many were updated
+  async markPastBookingsAsDone(): Promise<number> {
+    return this.cwsRepository.markPastAsDone(new Date());
+  }
 
-    // Mark all past bookings as done
-    for (const booking of undoneBookings) {
-      await this.cwsRepository.update(booking.id, { isDone: true });
-    }
+  // Bookings only change the slot grids of the days they start on
+  protected async invalidateCache(...bookings: CWS[]): Promise<void> {
+    await AvailabilityUtil.invalidate(
+      "cws",
+      ...bookings.map((booking) => booking.waktuMulai)
+    );
   }
 }
@@ -2,7 +2,10 @@ import { Dapur, Prisma } from "@prisma/client";
 import { BaseService } from "./base.service";
 import { DapurRepository } from "../repositories/dapur.repository";
 import { TimeValidationUtil } from "../utils/time-validation";
+import { AvailabilityUtil, AvailableTimeSlot } from "../utils/availability";
+import { CacheUtil } from "../utils/cache";
 import { prisma } from "../utils/database";
+import { TimeRangeParams, TimeRangeStream } from "../types";
 
 // DTOs
 export interface CreateDapurDTO {
@@ -112,7 +115,9 @@ export class DapurService extends BaseService<
       },
     };
 
-    return this.repository.create(createInput);
+    const booking = await this.repository.create(createInput);
+    await this.invalidateCache(booking);
+    return booking;
   }
 
   async update(id: bigint, data: UpdateDapurDTO): Promise<Dapur> {
@@ -176,7 +181,9 @@ export class DapurService extends BaseService<
       }),
     };
 
-    return this.repository.update(id, updateInput);
+    const booking = await this.repository.update(id, updateInput);
+    await this.invalidateCache(existing, booking);
+    return booking;
   }
 
   private async validateForeignKeys(
@@ -209,78 +216,66 @@ export class DapurService extends BaseService<
     return this.dapurRepository.findByFasilitas(idFasilitas);
   }
 
-  async getDapurByTimeRange(startTime: Date, endTime: Date): Promise<Dapur[]> {
-    return this.dapurRepository.findByTimeRange(startTime, endTime);
+  getDapurByTimeRange(
+    startTime: Date,
+    endTime: Date,
+    params: TimeRangeParams = {}
+  ): TimeRangeStream<Partial<Dapur>> {
+    return this.streamRange(
+      (chunk) =>
+        this.dapurRepository.findByTimeRange(startTime, endTime, chunk),
+      params
+    );
   }
 
   async getAvailableFacilities(): Promise<any[]> {
-    const facilities = await prisma.fasilitasDapur.findMany({
-      select: {
-        id: true,
-        fasilitas: true,
+    return CacheUtil.getOrLoad(
+      "dapur:facilities",
+      async () => {
+        const facilities = await prisma.fasilitasDapur.findMany({
+          select: {
+            id: true,
+            fasilitas: true,
+          },
+        });
+
+        return facilities.map((facility) => ({
+          ...facility,
+          id: facility.id.toString(),
+        }));
       },
-    });
-
-    return facilities.map((facility) => ({
-      ...facility,
-      id: facility.id.toString(),
-    }));
+      CacheUtil.referenceTtlMs
+    );
   }
 
   async getAvailableTimeSlots(
     date: string,
     facilityId?: bigint
-  ): Promise<
-    {
-      waktuMulai: Date;
-      waktuBerakhir: Date;
-      display: string;
-      available: boolean;
-    }[]
-  > {
+  ): Promise<AvailableTimeSlot[]> {
     const dateObj = new Date(date);
-    const allSlots = TimeValidationUtil.getOneHourTimeSlots(dateObj);
-
-    // Get all bookings for the specified date
-    const startTime = new Date(
-      dateObj.getFullYear(),
-      dateObj.getMonth(),
-      dateObj.getDate(),
-      0,
-      0,
-      0
-    );
-    const endTime = new Date(
-      dateObj.getFullYear(),
-      dateObj.getMonth(),
-      dateObj.getDate(),
-      23,
-      59,
-      59
-    );
-    const bookedSlots = await this.dapurRepository.findByTimeRange(
-      startTime,
-      endTime
+    return CacheUtil.getOrLoad(
+      AvailabilityUtil.cacheKey("dapur", dateObj, facilityId),
+      async () => {
+        const { start, end } = AvailabilityUtil.dayRange(dateObj);
+        const bookedStarts = await this.dapurRepository.findBookedStarts(
+          start,
+          end,
+          facilityId
+        );
+
+        return AvailabilityUtil.build(
+          TimeValidationUtil.getOneHourTimeSlots(dateObj),
+          bookedStarts
+        );
+      }
     );
+  }
 
-    return allSlots.map((slot) => {
-      const isBooked = bookedSlots.some((booking) => {
-        // If facilityId is provided, check for that specific facility
-        if (facilityId) {
-          return (
-            booking.idFasilitas === facilityId &&
-            booking.waktuMulai.getTime() === slot.waktuMulai.getTime()
-          );
-        }
-        // If no facilityId provided, check if any facility is booked at this time
-        return booking.waktuMulai.getTime() === slot.waktuMulai.getTime();
-      });
-
-      return {
-        ...slot,
-        display: `${slot.waktuMulai.toLocaleTimeString('id-ID', { hour: '2-digit', minute: '2-digit', timeZone: 'Asia/Jakarta' })} - ${slot.waktuBerakhir.toLocaleTimeString('id-ID', { hour: '2-digit', minute: '2-digit', timeZone: 'Asia/Jakarta' })}`,
-        available: !isBooked,
-      };
-    });
+  // Bookings only change the slot grids of the days they start on
+  protected async invalidateCache(...bookings: Dapur[]): Promise<void> {
+    await AvailabilityUtil.invalidate(
+      "dapur",
+      ...bookings.map((booking) => booking.waktuMulai)
+    );
   }
 }
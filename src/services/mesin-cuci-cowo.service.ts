@@ -2,7 +2,10 @@ import { MesinCuciCowo, Prisma } from "@prisma/client";
 import { BaseService } from "./base.service";
 import { MesinCuciCowoRepository } from "../repositories/mesin-cuci-cowo.repository";
 import { TimeValidationUtil } from "../utils/time-validation";
+import { AvailabilityUtil, AvailableTimeSlot } from "../utils/availability";
+import { CacheUtil } from "../utils/cache";
 import { prisma } from "../utils/database";
+import { TimeRangeParams, TimeRangeStream } from "../types";
 
 // DTOs
 export interface CreateMesinCuciCowoDTO {
@@ -110,7 +113,9 @@ export class MesinCuciCowoService extends BaseService<
       },
     };
 
-    return this.repository.create(createInput);
+    const booking = await this.repository.create(createInput);
+    await this.invalidateCache(booking);
+    return booking;
   }
 
   async update(
@@ -175,7 +180,9 @@ export class MesinCuciCowoService extends BaseService<
       }),
     };
 
-    return this.repository.update(id, updateInput);
+    const booking = await this.repository.update(id, updateInput);
+    await this.invalidateCache(existing, booking);
+    return booking;
   }
 
   private async validateForeignKeys(
@@ -208,81 +215,66 @@ export class MesinCuciCowoService extends BaseService<
     return this.mesinCuciCowoRepository.findByFasilitas(idFasilitas);
   }
 
-  async getMesinCuciByTimeRange(
+  getMesinCuciByTimeRange(
     startTime: Date,
-    endTime: Date
-  ): Promise<MesinCuciCowo[]> {
-    return this.mesinCuciCowoRepository.findByTimeRange(startTime, endTime);
+    endTime: Date,
+    params: TimeRangeParams = {}
+  ): TimeRangeStream<Partial<MesinCuciCowo>> {
+    return this.streamRange(
+      (chunk) =>
+        this.mesinCuciCowoRepository.findByTimeRange(startTime, endTime, chunk),
+      params
+    );
   }
 
   async getAvailableFacilities(): Promise<any[]> {
-    const facilities = await prisma.fasilitasMcCowo.findMany({
-      select: {
-        id: true,
-        nama: true,
+    return CacheUtil.getOrLoad(
+      "mesin-cuci-cowo:facilities",
+      async () => {
+        const facilities = await prisma.fasilitasMcCowo.findMany({
+          select: {
+            id: true,
+            nama: true,
+          },
+        });
+
+        return facilities.map((facility) => ({
+          ...facility,
+          id: facility.id.toString(),
+        }));
       },
-    });
-
-    return facilities.map((facility) => ({
-      ...facility,
-      id: facility.id.toString(),
-    }));
+      CacheUtil.referenceTtlMs
+    );
   }
 
   async getAvailableTimeSlots(
     date: string,
     facilityId?: bigint
-  ): Promise<
-    {
-      waktuMulai: Date;
-      waktuBerakhir: Date;
-      display: string;
-      available: boolean;
-    }[]
-  > {
+  ): Promise<AvailableTimeSlot[]> {
     const dateObj = new Date(date);
-    const allSlots = TimeValidationUtil.getOneHourTimeSlots(dateObj);
-
-    // Get all bookings for the specified date
-    const startTime = new Date(
-      dateObj.getFullYear(),
-      dateObj.getMonth(),
-      dateObj.getDate(),
-      0,
-      0,
-      0
-    );
-    const endTime = new Date(
-      dateObj.getFullYear(),
-      dateObj.getMonth(),
-      dateObj.getDate(),
-      23,
-      59,
-      59
-    );
-    const bookedSlots = await this.mesinCuciCowoRepository.findByTimeRange(
-      startTime,
-      endTime
+    return CacheUtil.getOrLoad(
+      AvailabilityUtil.cacheKey("mesin-cuci-cowo", dateObj, facilityId),
+      async () => {
+        const { start, end } = AvailabilityUtil.dayRange(dateObj);
+        const bookedStarts = await this.mesinCuciCowoRepository.findBookedStarts(
+          start,
+          end,
+          facilityId
+        );
+
+        return AvailabilityUtil.build(
+          TimeValidationUtil.getOneHourTimeSlots(dateObj),
+          bookedStarts
+        );
+      }
     );
+  }
 
-    return allSlots.map((slot) => {
-      const isBooked = bookedSlots.some((booking) => {
-        // If facilityId is provided, check for that specific facility
-        if (facilityId) {
-          return (
-            booking.idFasilitas === facilityId &&
-            booking.waktuMulai.getTime() === slot.waktuMulai.getTime()
-          );
-        }
-        // If no facilityId provided, check if any facility is booked at this time
-        return booking.waktuMulai.getTime() === slot.waktuMulai.getTime();
-      });
-
-      return {
-        ...slot,
-        display: `${slot.waktuMulai.toLocaleTimeString('id-ID', { hour: '2-digit', minute: '2-digit', timeZone: 'Asia/Jakarta' })} - ${slot.waktuBerakhir.toLocaleTimeString('id-ID', { hour: '2-digit', minute: '2-digit', timeZone: 'Asia/Jakarta' })}`,
-        available: !isBooked,
-      };
-    });
+  // Bookings only change the slot grids of the days they start on
+  protected async invalidateCache(...bookings: MesinCuciCowo[]): Promise<void> {
+    await AvailabilityUtil.invalidate(
+      "mesin-cuci-cowo",
+      ...bookings.map((booking) => booking.waktuMulai)
+    );
   }
 }
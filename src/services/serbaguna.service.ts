@@ -2,6 +2,8 @@ import { Serbaguna, Prisma } from "@prisma/client";
 import { BaseService } from "./base.service";
 import { SerbagunaRepository } from "../repositories/serbaguna.repository";
 import { TimeValidationUtil } from "../utils/time-validation";
+import { AvailabilityUtil, AvailableTimeSlot } from "../utils/availability";
+import { CacheUtil } from "../utils/cache";
 import { prisma } from "../utils/database";
 
 // DTOs
@@ -85,7 +87,9 @@ export class SerbagunaService extends BaseService<
     }
 
     const input = this.mapCreateDTOToInput(data);
-    return this.repository.create(input);
+    const booking = await this.repository.create(input);
+    await this.invalidateCache(booking);
+    return booking;
   }
 
   async update(id: bigint, data: UpdateSerbagunaDTO): Promise<Serbaguna> {
@@ -147,7 +151,9 @@ export class SerbagunaService extends BaseService<
     }
 
     const input = this.mapUpdateDTOToInput(data);
-    return this.repository.update(id, input);
+    const booking = await this.repository.update(id, input);
+    await this.invalidateCache(existing, booking);
+    return booking;
   }
 
   // Custom methods
@@ -164,57 +170,49 @@ export class SerbagunaService extends BaseService<
   async getAvailableTimeSlots(
     date: Date,
     areaId: bigint
-  ): Promise<{ waktuMulai: Date; waktuBerakhir: Date; display: string; available: boolean }[]> {
-    const allSlots = TimeValidationUtil.getTwoHourTimeSlots(date);
-    const bookedSlots = await this.serbagunaRepository.findByTimeRange({
-      waktuMulai: {
-        gte: new Date(
-          date.getFullYear(),
-          date.getMonth(),
-          date.getDate(),
-          0,
-          0,
-          0
-        ),
-        lte: new Date(
-          date.getFullYear(),
-          date.getMonth(),
-          date.getDate(),
-          23,
-          59,
-          59
-        ),
-      },
-    });
-
-    return allSlots.map((slot) => {
-      const isBooked = bookedSlots.some(
-        (booking) =>
-          booking.idArea === areaId &&
-          booking.waktuMulai.getTime() === slot.waktuMulai.getTime()
-      );
+  ): Promise<AvailableTimeSlot[]> {
+    return CacheUtil.getOrLoad(
+      AvailabilityUtil.cacheKey("serbaguna", date, areaId),
+      async () => {
+        const { start, end } = AvailabilityUtil.dayRange(date);
+        const bookedStarts = await this.serbagunaRepository.findBookedStarts(
+          start,
+          end,
+          areaId
+        );
 
-      return {
-        ...slot,
-        display: `${slot.waktuMulai.toLocaleTimeString('id-ID', { hour: '2-digit', minute: '2-digit', timeZone: 'Asia/Jakarta' })} - ${slot.waktuBerakhir.toLocaleTimeString('id-ID', { hour: '2-digit', minute: '2-digit', timeZone: 'Asia/Jakarta' })}`,
-        available: !isBooked,
-      };
-    });
+        return AvailabilityUtil.build(
+          TimeValidationUtil.getTwoHourTimeSlots(date),
+          bookedStarts
+        );
+      }
+    );
   }
 
   async getAvailableAreas(): Promise<any[]> {
-    const areas = await prisma.areaSerbaguna.findMany({
-      select: {
-        id: true,
-        namaArea: true,
+    return CacheUtil.getOrLoad(
+      "serbaguna:areas",
+      async () => {
+        const areas = await prisma.areaSerbaguna.findMany({
+          select: {
+            id: true,
+            namaArea: true,
+          },
+        });
+
+        // Convert BigInt to string for JSON serialization
+        return areas.map((area) => ({
+          ...area,
+          id: area.id.toString(),
+        }));
       },
-    });
+      CacheUtil.referenceTtlMs
+    );
+  }
 
-    // Convert BigInt to string for JSON serialization
-    return areas.map((area) => ({
-      ...area,
-      id: area.id.toString(),
-    }));
+  // Mark all bookings that have ended as done; returns how many were updated
+  async markPastBookingsAsDone(): Promise<number> {
+    return this.serbagunaRepository.markPastAsDone(new Date());
   }
 
   protected mapCreateDTOToInput(
@@ -268,4 +266,12 @@ export class SerbagunaService extends BaseService<
 
     return input;
   }
+
+  // Bookings only change the slot grids of the days they start on
+  protected async invalidateCache(...bookings: Serbaguna[]): Promise<void> {
+    await AvailabilityUtil.invalidate(
+      "serbaguna",
+      ...bookings.map((booking) => booking.waktuMulai)
+    );
+  }
 }
@@ -2,6 +2,8 @@ import { Prisma, Theater } from "@prisma/client";
 import { BaseService } from "./base.service";
 import { TheaterRepository } from "../repositories/theater.repository";
 import { TimeValidationUtil } from "../utils/time-validation";
+import { AvailabilityUtil, AvailableTimeSlot } from "../utils/availability";
+import { CacheUtil } from "../utils/cache";
 import { prisma } from "../utils/database";
 
 export interface CreateTheaterDTO {
@@ -69,7 +71,9 @@ export class TheaterService extends BaseService<
     }
 
     const input = this.mapCreateDTOToInput(data);
-    return this.repository.create(input);
+    const booking = await this.repository.create(input);
+    await this.invalidateCache(booking);
+    return booking;
   }
 
   async update(id: bigint, data: UpdateTheaterDTO): Promise<Theater> {
@@ -117,7 +121,9 @@ export class TheaterService extends BaseService<
     }
 
     const input = this.mapUpdateDTOToInput(data);
-    return this.repository.update(id, input);
+    const booking = await this.repository.update(id, input);
+    await this.invalidateCache(existing, booking);
+    return booking;
   }
 
   async getTheaterByPenanggungJawab(
@@ -126,53 +132,27 @@ export class TheaterService extends BaseService<
     return this.theaterRepository.findByPenanggungJawab(penanggungJawabId);
   }
 
-  async getAvailableTimeSlots(
-    date: Date
-  ): Promise<
-    {
-      waktuMulai: Date;
-      waktuBerakhir: Date;
-      display: string;
-      available: boolean;
-    }[]
-  > {
-    const allSlots = TimeValidationUtil.getOneHourTimeSlots(date);
-
-    const startOfDay = new Date(
-      date.getFullYear(),
-      date.getMonth(),
-      date.getDate(),
-      0,
-      0,
-      0
-    );
-    const endOfDay = new Date(
-      date.getFullYear(),
-      date.getMonth(),
-      date.getDate(),
-      23,
-      59,
-      59
-    );
-
-    const bookedSlots = await this.theaterRepository.findByTimeRange({
-      waktuMulai: { gte: startOfDay, lte: endOfDay },
-    });
+  async getAvailableTimeSlots(date: Date): Promise<AvailableTimeSlot[]> {
+    return CacheUtil.getOrLoad(
+      AvailabilityUtil.cacheKey("theater", date),
+      async () => {
+        const { start, end } = AvailabilityUtil.dayRange(date);
+        const bookedStarts = await this.theaterRepository.findBookedStarts(
+          start,
+          end
+        );
 
-    return allSlots.map((slot) => {
-      const isBooked = bookedSlots.some(
-        (booking) => booking.waktuMulai.getTime() === slot.waktuMulai.getTime()
-      );
+        return AvailabilityUtil.build(
+          TimeValidationUtil.getOneHourTimeSlots(date),
+          bookedStarts
+        );
+      }
+    );
+  }
 
-      return {
-        ...slot,
-        display: TimeValidationUtil.formatTimeSlot(
-          slot.waktuMulai,
-          slot.waktuBerakhir
-        ),
-        available: !isBooked,
-      };
-    });
+  // Mark all bookings that have ended as done; returns how many were updated
+  async markPastBookingsAsDone(): Promise<number> {
+    return this.theaterRepository.markPastAsDone(new Date());
   }
 
   protected mapCreateDTOToInput(
@@ -214,4 +194,12 @@ export class TheaterService extends BaseService<
 
     return input;
   }
+
+  // Bookings only change the slot grids of the days they start on
+  protected async invalidateCache(...bookings: Theater[]): Promise<void> {
+    await AvailabilityUtil.invalidate(
+      "theater",
+      ...bookings.map((booking) => booking.waktuMulai)
+    );
+  }
 }
@@ -6,20 +6,28 @@ export interface ApiResponse<T = any> {
   errors?: string[];
 }
 
+// How a list response counts its rows: COUNT(*), the table-statistics estimate, or not at all
+export type TotalMode = "exact" | "approx" | "none";
+
 export interface PaginationParams {
   page?: number;
   limit?: number;
   sortBy?: string;
   sortOrder?: "asc" | "desc";
+  // Keyset pagination: "" for the first page, then the previous page's nextCursor
+  cursor?: string;
+  total?: TotalMode;
 }
 
 export interface PaginatedResponse<T> {
   data: T[];
   pagination: {
-    page: number;
+    page?: number;
     limit: number;
-    total: number;
-    totalPages: number;
+    total?: number;
+    totalPages?: number;
+    approximate?: boolean;
+    nextCursor?: string | null;
   };
 }
 
@@ -35,6 +43,24 @@ export interface TimeRangeFilter {
   };
 }
 
+// Time-range listing options: bookings come in (waktuMulai, id) order, at most
+// `limit` of them, after `cursor`; `fields` projects each row to those columns
+export interface TimeRangeParams {
+  limit?: number;
+  cursor?: string;
+  fields?: string[];
+}
+
+// A time-range listing read from the database a chunk at a time; `pagination`
+// is final once every chunk has been read
+export interface TimeRangeStream<T> {
+  chunks: AsyncIterable<T[]>;
+  pagination: {
+    limit: number;
+    nextCursor: string | null;
+  };
+}
+
 // Generic repository interface
 export interface IRepository<T, CreateInput, UpdateInput> {
   findMany(params?: any): Promise<T[]>;
@@ -0,0 +1,92 @@
+import { CacheUtil } from "./cache";
+
+export interface TimeSlot {
+  waktuMulai: Date;
+  waktuBerakhir: Date;
+}
+
+export interface AvailableTimeSlot extends TimeSlot {
+  display: string;
+  available: boolean;
+}
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+export class AvailabilityUtil {
+  // Building an Intl formatter is the expensive part of toLocaleTimeString, so build it once
+  private static readonly timeFormat = new Intl.DateTimeFormat("id-ID", {
+    hour: "2-digit",
+    minute: "2-digit",
+    hour12: false,
+    timeZone: "Asia/Jakarta", // WIB (UTC+7)
+  });
+
+  // Slot labels keyed by time of day; Jakarta has no DST, so a label never changes
+  private static readonly labels = new Map<string, string>();
+
+  /**
+   * First and last moment of the given day, for the per-day booking query
+   */
+  static dayRange(date: Date): { start: Date; end: Date } {
+    const year = date.getFullYear();
+    const month = date.getMonth();
+    const day = date.getDate();
+
+    return {
+      start: new Date(year, month, day, 0, 0, 0),
+      end: new Date(year, month, day, 23, 59, 59),
+    };
+  }
+
+  /**
+   * Local calendar day of a date (YYYY-MM-DD), the unit slot grids are cached by
+   */
+  static dayKey(date: Date): string {
+    const month = String(date.getMonth() + 1).padStart(2, "0");
+    const day = String(date.getDate()).padStart(2, "0");
+    return `${date.getFullYear()}-${month}-${day}`;
+  }
+
+  /**
+   * Cache key of a module's slot grid for one day, per floor/area/facility if given
+   */
+  static cacheKey(module: string, date: Date, unit?: bigint): string {
+    return `${module}:slots:${this.dayKey(date)}:${unit ?? "all"}`;
+  }
+
+  /**
+   * Drop the cached slot grids of every day the given booking times fall on
+   */
+  static async invalidate(module: string, ...dates: Date[]): Promise<void> {
+    const days = new Set(dates.map((date) => this.dayKey(date)));
+    await Promise.all(
+      [...days].map((day) => CacheUtil.invalidate(`${module}:slots:${day}:`))
+    );
+  }
+
+  /**
+   * Display label for a slot (e.g. "06.00 - 07.00" in WIB)
+   */
+  static label(waktuMulai: Date, waktuBerakhir: Date): string {
+    const key = `${waktuMulai.getTime() % DAY_MS}:${waktuBerakhir.getTime() % DAY_MS}`;
+    let label = this.labels.get(key);
+    if (label === undefined) {
+      label = `${this.timeFormat.format(waktuMulai)} - ${this.timeFormat.format(waktuBerakhir)}`;
+      this.labels.set(key, label);
+    }
+    return label;
+  }
+
+  /**
+   * Mark each slot available unless a booking starts at the same moment
+   */
+  static build(slots: TimeSlot[], bookedStarts: Date[]): AvailableTimeSlot[] {
+    const booked = new Set(bookedStarts.map((waktuMulai) => waktuMulai.getTime()));
+
+    return slots.map((slot) => ({
+      ...slot,
+      display: this.label(slot.waktuMulai, slot.waktuBerakhir),
+      available: !booked.has(slot.waktuMulai.getTime()),
+    }));
+  }
+}
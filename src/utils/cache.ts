@@ -0,0 +1,219 @@
+import { RequestContextUtil } from "./request-context";
+
+/**
+ * Storage behind CacheUtil. The in-process LRU is the default; a shared store
+ * (e.g. Redis) can be plugged in with CacheUtil.useBackend so that several API
+ * instances see each other's entries and invalidations
+ */
+export interface CacheBackend {
+  readonly name: string;
+  get<T>(key: string): Promise<T | undefined>;
+  set<T>(key: string, value: T, ttlMs: number): Promise<void>;
+  deletePrefix(prefix: string): Promise<number>;
+  clear(): Promise<void>;
+  size(): Promise<number>;
+}
+
+interface MemoryEntry {
+  value: unknown;
+  expiresAt: number;
+}
+
+export class MemoryCacheBackend implements CacheBackend {
+  readonly name = "memory";
+  evictions = 0;
+
+  // A Map iterates in insertion order; re-inserting on every hit keeps the
+  // least recently used key first
+  private readonly entries = new Map<string, MemoryEntry>();
+
+  constructor(private readonly maxEntries: number) {}
+
+  async get<T>(key: string): Promise<T | undefined> {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      return undefined;
+    }
+
+    this.entries.delete(key);
+    if (entry.expiresAt <= Date.now()) {
+      return undefined;
+    }
+    this.entries.set(key, entry);
+    return entry.value as T;
+  }
+
+  async set<T>(key: string, value: T, ttlMs: number): Promise<void> {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + ttlMs });
+
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+      this.evictions += 1;
+    }
+  }
+
+  async deletePrefix(prefix: string): Promise<number> {
+    let deleted = 0;
+    for (const key of [...this.entries.keys()]) {
+      if (key.startsWith(prefix)) {
+        this.entries.delete(key);
+        deleted += 1;
+      }
+    }
+    return deleted;
+  }
+
+  async clear(): Promise<void> {
+    this.entries.clear();
+  }
+
+  async size(): Promise<number> {
+    return this.entries.size;
+  }
+}
+
+export interface CacheStats {
+  enabled: boolean;
+  backend: string;
+  entries: number;
+  hits: number;
+  misses: number;
+  hitRate: number;
+  invalidations: number;
+  evictions?: number;
+  namespaces: Record<string, { hits: number; misses: number }>;
+}
+
+export class CacheUtil {
+  static readonly enabled = process.env.CACHE !== "false";
+  static readonly defaultTtlMs = Number(process.env.CACHE_TTL_MS) || 60_000;
+  // Reference data (facilities, areas) has no write path in the API
+  static readonly referenceTtlMs =
+    Number(process.env.CACHE_REFERENCE_TTL_MS) || 10 * 60_000;
+
+  private static backend: CacheBackend = new MemoryCacheBackend(
+    Number(process.env.CACHE_MAX_ENTRIES) || 1000
+  );
+  private static readonly loading = new Map<string, Promise<unknown>>();
+  private static readonly counters = new Map<
+    string,
+    { hits: number; misses: number }
+  >();
+  private static invalidations = 0;
+  // Bumped by every invalidation, so a load that started before it isn't stored
+  private static generation = 0;
+
+  static useBackend(backend: CacheBackend): void {
+    this.backend = backend;
+  }
+
+  /**
+   * Return the cached value for key, or load, store and return it.
+   * Concurrent misses on the same key share a single load
+   */
+  static async getOrLoad<T>(
+    key: string,
+    load: () => Promise<T>,
+    ttlMs: number = this.defaultTtlMs
+  ): Promise<T> {
+    if (!this.enabled) {
+      return load();
+    }
+
+    const cached = await this.backend.get<T>(key);
+    if (cached !== undefined) {
+      this.count(key, true);
+      return cached;
+    }
+    this.count(key, false);
+
+    const pending = this.loading.get(key) as Promise<T> | undefined;
+    if (pending) {
+      return pending;
+    }
+
+    const generation = this.generation;
+    const loaded = (async () => {
+      const value = await load();
+      if (generation === this.generation) {
+        await this.backend.set(key, value, ttlMs);
+      }
+      return value;
+    })().finally(() => {
+      if (this.loading.get(key) === loaded) {
+        this.loading.delete(key);
+      }
+    });
+    this.loading.set(key, loaded);
+    return loaded;
+  }
+
+  /**
+   * Drop every entry whose key starts with prefix
+   */
+  static async invalidate(prefix: string): Promise<number> {
+    this.generation += 1;
+    this.invalidations += 1;
+    for (const key of [...this.loading.keys()]) {
+      if (key.startsWith(prefix)) {
+        this.loading.delete(key);
+      }
+    }
+    return this.backend.deletePrefix(prefix);
+  }
+
+  static async flush(): Promise<void> {
+    this.generation += 1;
+    this.invalidations += 1;
+    this.loading.clear();
+    await this.backend.clear();
+  }
+
+  static async stats(): Promise<CacheStats> {
+    let hits = 0;
+    let misses = 0;
+    const namespaces: CacheStats["namespaces"] = {};
+    for (const [namespace, counter] of this.counters) {
+      hits += counter.hits;
+      misses += counter.misses;
+      namespaces[namespace] = { ...counter };
+    }
+
+    return {
+      enabled: this.enabled,
+      backend: this.backend.name,
+      entries: await this.backend.size(),
+      hits,
+      misses,
+      hitRate: hits + misses > 0 ? hits / (hits + misses) : 0,
+      invalidations: this.invalidations,
+      ...(this.backend instanceof MemoryCacheBackend && {
+        evictions: this.backend.evictions,
+      }),
+      namespaces,
+    };
+  }
+
+  static resetStats(): void {
+    this.counters.clear();
+    this.invalidations = 0;
+  }
+
+  // Counted per namespace, the key up to its first ":" (e.g. "dapur")
+  private static count(key: string, hit: boolean): void {
+    const namespace = key.split(":", 1)[0]!;
+    let counter = this.counters.get(namespace);
+    if (!counter) {
+      counter = { hits: 0, misses: 0 };
+      this.counters.set(namespace, counter);
+    }
+    if (hit) {
+      counter.hits += 1;
+    } else {
+      counter.misses += 1;
+    }
+    RequestContextUtil.recordCache(hit);
+  }
+}
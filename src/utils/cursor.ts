@@ -0,0 +1,45 @@
+// Position of the last row of a keyset page: its sort value and id (the tie-breaker)
+export interface CursorPosition {
+  sortBy: string;
+  sortOrder: "asc" | "desc";
+  value: string;
+  id: string;
+}
+
+export class CursorUtil {
+  /**
+   * Opaque token for the page after the given position (base64url JSON)
+   */
+  static encode(position: CursorPosition): string {
+    return Buffer.from(JSON.stringify(position)).toString("base64url");
+  }
+
+  static decode(cursor: string): CursorPosition {
+    let position: Partial<CursorPosition> | null;
+    try {
+      position = JSON.parse(Buffer.from(cursor, "base64url").toString("utf8"));
+    } catch {
+      throw this.invalid("Cursor tidak valid");
+    }
+
+    if (
+      typeof position?.sortBy !== "string" ||
+      (position.sortOrder !== "asc" && position.sortOrder !== "desc") ||
+      typeof position.value !== "string" ||
+      typeof position.id !== "string" ||
+      !/^\d+$/.test(position.id)
+    ) {
+      throw this.invalid("Cursor tidak valid");
+    }
+    return position as CursorPosition;
+  }
+
+  /**
+   * Error for a bad pagination request; ErrorMiddleware answers it with a 400
+   */
+  static invalid(message: string): Error {
+    const error = new Error(message);
+    error.name = "ValidationError";
+    return error;
+  }
+}
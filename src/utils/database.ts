@@ -1,4 +1,51 @@
-import { PrismaClient } from "@prisma/client";
+import { Prisma, PrismaClient } from "@prisma/client";
+import { RequestContextUtil } from "./request-context";
+import { QueryLogUtil } from "./query-log";
+
+// Times every query (model operations and raw SQL) into the current request
+// context, and keeps the ones over SLOW_QUERY_MS for the slow-query log
+const queryTiming = Prisma.defineExtension({
+  name: "query-timing",
+  query: {
+    async $allOperations({ model, operation, args, query }) {
+      const start = performance.now();
+      try {
+        return await query(args);
+      } finally {
+        const durationMs = performance.now() - start;
+        RequestContextUtil.recordQuery(durationMs);
+        if (QueryLogUtil.isSlow(durationMs)) {
+          QueryLogUtil.recordSlow(
+            RequestContextUtil.current(),
+            QueryLogUtil.describe(model, operation, args),
+            durationMs
+          );
+        }
+      }
+    },
+  },
+});
+
+// QUERY_LOG=all prints every query as before; sampled prints a share of them
+// (LOG_SAMPLE_RATE); off (the default) leaves only warnings and errors
+const createClient = (): PrismaClient => {
+  if (QueryLogUtil.queryLog === "all") {
+    return new PrismaClient({ log: ["query", "info", "warn", "error"] });
+  }
+  if (QueryLogUtil.queryLog === "off") {
+    return new PrismaClient({ log: ["warn", "error"] });
+  }
+
+  const client = new PrismaClient({
+    log: [{ emit: "event", level: "query" }, "warn", "error"],
+  });
+  client.$on("query", (event) => {
+    if (QueryLogUtil.sampled("sampled")) {
+      console.log(`prisma:query ${event.query} (${event.duration}ms)`);
+    }
+  });
+  return client;
+};
 
 // Singleton Prisma Client
 class DatabaseConnection {
@@ -6,9 +53,10 @@ class DatabaseConnection {
 
   public static getInstance(): PrismaClient {
     if (!DatabaseConnection.instance) {
-      DatabaseConnection.instance = new PrismaClient({
-        log: ["query", "info", "warn", "error"],
-      });
+      // The extension only wraps query execution, so the client keeps PrismaClient's API
+      DatabaseConnection.instance = createClient().$extends(
+        queryTiming
+      ) as unknown as PrismaClient;
     }
     return DatabaseConnection.instance;
   }
@@ -0,0 +1,408 @@
+import type { Response } from "express";
+
+// Writes objects of one key set; `fits` checks another object has that key set
+type ShapeWriter = ((value: any) => string) & {
+  fits: (value: object) => boolean;
+};
+
+const DAY_MS = 86_400_000;
+// toISOString's range for four-digit years, 0000-01-01 to 9999-12-31
+const MIN_ISO_MS = -62_167_219_200_000;
+const MAX_ISO_MS = 253_402_300_799_999;
+const PAD2 = Array.from({ length: 100 }, (_, i) => String(i).padStart(2, "0"));
+const PAD3 = Array.from({ length: 1000 }, (_, i) => String(i).padStart(3, "0"));
+const YEARS = Array.from({ length: 10000 }, (_, i) =>
+  String(i).padStart(4, "0")
+);
+
+// What JSON.stringify escapes (lone surrogates only; it checks the pairing)
+const NEEDS_ESCAPE = /["\\\u0000-\u001f\ud800-\udfff]/;
+
+const positiveInt = (value: string | undefined, fallback: number): number => {
+  const parsed = Number(value);
+  return value && Number.isInteger(parsed) && parsed > 0 ? parsed : fallback;
+};
+
+const isPlainObject = (value: object): boolean => {
+  const proto = Object.getPrototypeOf(value);
+  return proto === Object.prototype || proto === null;
+};
+
+/**
+ * JSON.stringify-compatible output (BigInt as string, like the global toJSON
+ * patch) from writers compiled once per object shape, so a list of Prisma rows
+ * pays for key lookup, escaping and Date formatting once rather than per row
+ */
+export class JsonSerializer {
+  // JSON_SERIALIZER=native sends every response through res.json instead
+  static readonly enabled = process.env.JSON_SERIALIZER !== "native";
+  // Lists longer than this are written in chunks, yielding between them
+  static readonly streamRows = positiveInt(process.env.JSON_STREAM_ROWS, 1000);
+  private static readonly chunkRows = 500;
+  private static readonly maxShapes = 500;
+  private static readonly writers = new Map<string, ShapeWriter>();
+
+  /**
+   * Send an API response body; a long `data` list is streamed
+   */
+  static send(res: Response, body: object): Response {
+    if (!this.enabled) {
+      return res.json(body);
+    }
+    if (!res.get("Content-Type")) {
+      res.set("Content-Type", "application/json; charset=utf-8");
+    }
+    const { data } = body as { data?: unknown };
+    if (Array.isArray(data) && data.length > this.streamRows) {
+      this.stream(res, body, data).catch((error) => res.destroy(error));
+      return res;
+    }
+    return res.send(this.stringify(body));
+  }
+
+  static stringify(value: unknown): string {
+    return this.value(value) ?? "null";
+  }
+
+  /**
+   * Send a list that arrives in chunks (a time-range listing read a chunk at a
+   * time). One that ends after its first chunk goes through send(); a longer
+   * one is written as each chunk comes in, so only a chunk or two is held at a
+   * time and the client starts reading before the last query has run. `tail`
+   * gives the fields after `data`, once every chunk has been read
+   */
+  static async sendChunks(
+    res: Response,
+    head: object,
+    chunks: AsyncIterable<unknown[]>,
+    tail: () => object
+  ): Promise<void> {
+    const iterator = chunks[Symbol.asyncIterator]();
+    const buffered: unknown[][] = [];
+    // Nothing is written before a second chunk, so a failed first query still
+    // reaches the error handler
+    while (buffered.length < 2 || !this.enabled) {
+      const next = await iterator.next();
+      if (next.done) {
+        this.send(res, { ...head, data: buffered.flat(), ...tail() });
+        return;
+      }
+      buffered.push(next.value);
+    }
+
+    if (!res.get("Content-Type")) {
+      res.set("Content-Type", "application/json; charset=utf-8");
+    }
+    res.write(this.envelope({ ...head, data: null })[0]);
+    let continued = false;
+    const write = async (rows: unknown[]): Promise<boolean> => {
+      const open = await this.writeRows(res, rows, continued);
+      continued ||= rows.length > 0;
+      return open;
+    };
+    try {
+      for (const rows of buffered) {
+        if (!(await write(rows))) {
+          await iterator.return?.();
+          return;
+        }
+      }
+      // Leaving the loop early (client gone) ends the iterator as well
+      for await (const rows of { [Symbol.asyncIterator]: () => iterator }) {
+        if (!(await write(rows))) {
+          return;
+        }
+      }
+    } catch (error) {
+      res.destroy(error as Error);
+      return;
+    }
+    res.end(this.envelope({ data: null, ...tail() })[1]);
+  }
+
+  /**
+   * Write the envelope around `data` once and the rows a chunk at a time, so a
+   * 100k-row list neither blocks the event loop for the whole serialization
+   * nor sits in memory as one string. It goes out chunked, so no Content-Length
+   * and no ETag
+   */
+  private static async stream(
+    res: Response,
+    body: object,
+    rows: unknown[]
+  ): Promise<void> {
+    const [open, close] = this.envelope(body);
+    res.write(open);
+    if (await this.writeRows(res, rows, false)) {
+      res.end(close);
+    }
+  }
+
+  // A body's JSON up to and including `"data":[`, and from the `]` after it
+  private static envelope(body: object): [string, string] {
+    const before: string[] = [];
+    const after: string[] = [];
+    let fields = before;
+    for (const [key, value] of Object.entries(body)) {
+      if (key === "data") {
+        fields = after;
+        continue;
+      }
+      const json = this.value(value);
+      if (json !== undefined) {
+        fields.push(`${JSON.stringify(key)}:${json}`);
+      }
+    }
+
+    const head = before.map((field) => `${field},`).join("");
+    return [
+      `{${head}"data":[`,
+      `]${after.map((field) => `,${field}`).join("")}}`,
+    ];
+  }
+
+  /**
+   * Rows chunkRows at a time, yielding to the event loop (or waiting for the
+   * socket to drain) between them; false once the client has gone.
+   * `continued` puts a comma before the first row
+   */
+  private static async writeRows(
+    res: Response,
+    rows: unknown[],
+    continued: boolean
+  ): Promise<boolean> {
+    for (let start = 0; start < rows.length; start += this.chunkRows) {
+      const end = Math.min(start + this.chunkRows, rows.length);
+      const chunk = this.items(rows, start, end);
+      const flushed = res.write(continued || start > 0 ? `,${chunk}` : chunk);
+      await (flushed
+        ? new Promise((resolve) => setImmediate(resolve))
+        : this.drained(res));
+      if (res.destroyed) {
+        return false;
+      }
+    }
+    return !res.destroyed;
+  }
+
+  private static drained(res: Response): Promise<void> {
+    return new Promise((resolve) => {
+      const done = () => {
+        res.off("drain", done);
+        res.off("close", done);
+        resolve();
+      };
+      res.on("drain", done);
+      res.on("close", done);
+    });
+  }
+
+  // undefined where JSON.stringify drops the value (functions, symbols, ...)
+  private static value(value: unknown): string | undefined {
+    switch (typeof value) {
+      case "string":
+        return this.string(value);
+      case "number":
+        return Number.isFinite(value) ? String(value) : "null";
+      case "bigint":
+        return `"${value}"`;
+      case "boolean":
+        return value ? "true" : "false";
+      case "object":
+        if (value === null) {
+          return "null";
+        }
+        if (Array.isArray(value)) {
+          return `[${this.items(value, 0, value.length)}]`;
+        }
+        if (value instanceof Date) {
+          return this.date(value);
+        }
+        if (
+          isPlainObject(value) &&
+          typeof (value as any).toJSON !== "function"
+        ) {
+          return this.writerFor(value)(value);
+        }
+        // Prisma Decimal, Buffer and anything else with its own toJSON
+        return JSON.stringify(value);
+      default:
+        return undefined;
+    }
+  }
+
+  private static items(list: unknown[], start: number, end: number): string {
+    const parts = new Array<string>(end - start);
+    let writer: ShapeWriter | undefined;
+    for (let i = start; i < end; i++) {
+      const item = list[i];
+      if (
+        item !== null &&
+        typeof item === "object" &&
+        !Array.isArray(item) &&
+        !(item instanceof Date) &&
+        isPlainObject(item) &&
+        typeof (item as any).toJSON !== "function"
+      ) {
+        // Rows of one query share a shape, so one writer nearly always fits
+        if (!writer || !writer.fits(item)) {
+          writer = this.writerFor(item);
+        }
+        const json = writer(item);
+        // Flatten now: left as a rope of every `+` piece, each row's string
+        // keeps its fragments alive until join(), and GC time grows with the
+        // list
+        json.charCodeAt(0);
+        parts[i - start] = json;
+      } else {
+        parts[i - start] = this.value(item) ?? "null";
+      }
+    }
+    return parts.join(",");
+  }
+
+  private static string(value: string): string {
+    return NEEDS_ESCAPE.test(value) ? JSON.stringify(value) : `"${value}"`;
+  }
+
+  /**
+   * Same text as Date.prototype.toJSON, computed from the timestamp; the
+   * built-in costs about a microsecond and a booking row carries four to six
+   * dates
+   */
+  private static date(date: Date): string {
+    const time = date.getTime();
+    if (!(time >= MIN_ISO_MS && time <= MAX_ISO_MS)) {
+      return Number.isNaN(time) ? "null" : `"${date.toISOString()}"`;
+    }
+    const days = Math.floor(time / DAY_MS);
+    let ms = time - days * DAY_MS;
+
+    // Civil date from days since 1970-01-01 (Howard Hinnant's civil_from_days)
+    const z = days + 719468;
+    const era = Math.floor(z / 146097);
+    const dayOfEra = z - era * 146097;
+    const yearOfEra = Math.floor(
+      (dayOfEra -
+        Math.floor(dayOfEra / 1460) +
+        Math.floor(dayOfEra / 36524) -
+        Math.floor(dayOfEra / 146096)) /
+        365
+    );
+    const dayOfYear =
+      dayOfEra -
+      (365 * yearOfEra +
+        Math.floor(yearOfEra / 4) -
+        Math.floor(yearOfEra / 100));
+    const monthIndex = Math.floor((5 * dayOfYear + 2) / 153);
+    const day = dayOfYear - Math.floor((153 * monthIndex + 2) / 5) + 1;
+    const month = monthIndex < 10 ? monthIndex + 3 : monthIndex - 9;
+    const year = yearOfEra + era * 400 + (month <= 2 ? 1 : 0);
+
+    const hours = Math.floor(ms / 3_600_000);
+    ms -= hours * 3_600_000;
+    const minutes = Math.floor(ms / 60_000);
+    ms -= minutes * 60_000;
+    const seconds = Math.floor(ms / 1000);
+    ms -= seconds * 1000;
+
+    const ymd = `${YEARS[year]}-${PAD2[month]}-${PAD2[day]}`;
+    const hms = `${PAD2[hours]}:${PAD2[minutes]}:${PAD2[seconds]}`;
+    return `"${ymd}T${hms}.${PAD3[ms]}Z"`;
+  }
+
+  private static writerFor(value: object): ShapeWriter {
+    const keys = Object.keys(value);
+    const shape = keys.join("\u0000");
+    let writer = this.writers.get(shape);
+    if (!writer) {
+      if (this.writers.size >= this.maxShapes) {
+        this.writers.clear();
+      }
+      writer = this.compile(value as Record<string, unknown>, keys);
+      this.writers.set(shape, writer);
+    }
+    return writer;
+  }
+
+  /**
+   * Build a writer for objects with the sample's keys, in its key order. Each
+   * field gets a fast path for the type it has in the sample and falls back to
+   * value() otherwise, so a later null or a different type stays correct
+   */
+  private static compile(
+    sample: Record<string, unknown>,
+    keys: string[]
+  ): ShapeWriter {
+    const nested: ShapeWriter[] = [];
+    let code = 'let s = "{", sep = "", v, out;\n';
+
+    keys.forEach((key, index) => {
+      const field = sample[key];
+      const prefix = JSON.stringify(`${JSON.stringify(key)}:`);
+      let fast = "value(v)";
+
+      if (typeof field === "bigint") {
+        fast = `typeof v === "bigint" ? '"' + v + '"' : value(v)`;
+      } else if (typeof field === "string") {
+        fast = `typeof v === "string" ? string(v) : value(v)`;
+      } else if (typeof field === "boolean") {
+        fast = `v === true ? "true" : v === false ? "false" : value(v)`;
+      } else if (field instanceof Date) {
+        fast = `v instanceof Date ? date(v) : value(v)`;
+      } else if (
+        field !== null &&
+        typeof field === "object" &&
+        !Array.isArray(field) &&
+        isPlainObject(field) &&
+        typeof (field as any).toJSON !== "function"
+      ) {
+        // Included relations: the nested writer is looked up once, not per row
+        nested.push(this.writerFor(field));
+        const slot = nested.length - 1;
+        fast =
+          `v !== null && typeof v === "object" && isPlain(v) &&` +
+          ` nested[${slot}].fits(v) ? nested[${slot}](v) : value(v)`;
+      }
+
+      code += `v = o[${JSON.stringify(key)}];\nout = ${fast};\n`;
+      code += `if (out !== undefined) { s += sep + ${prefix} + out; `;
+      code += 'sep = ","; }\n';
+      if (index === keys.length - 1) {
+        code += 'return s + "}";\n';
+      }
+    });
+    if (keys.length === 0) {
+      code += 'return "{}";\n';
+    }
+
+    const build = new Function(
+      "value",
+      "string",
+      "date",
+      "nested",
+      "isPlain",
+      `return function (o) {\n${code}};`
+    );
+    const write = build(
+      (v: unknown) => this.value(v),
+      (v: string) => this.string(v),
+      (v: Date) => this.date(v),
+      nested,
+      isPlainObject
+    ) as ShapeWriter;
+
+    // Same own keys in the same order; for..in also sees inherited keys, which
+    // is why only plain objects get here
+    write.fits = (value: object) => {
+      let index = 0;
+      for (const key in value) {
+        if (key !== keys[index++]) {
+          return false;
+        }
+      }
+      return index === keys.length;
+    };
+    return write;
+  }
+}
@@ -0,0 +1,241 @@
+import { QueryLogUtil } from "./query-log";
+import { TokenCache } from "./token-cache";
+import { PasswordHasher } from "./password-hasher";
+
+// Upper bounds in seconds, 1 ms to 10 s (the +Inf bucket is implicit)
+const BUCKETS = [
+  0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+];
+
+// Upper bounds in seconds for event-loop lag, 1 ms to 1 s
+const LAG_BUCKETS = [
+  0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1,
+];
+// The lag sampler's timer period; how late each timer fires is one sample
+const LAG_INTERVAL_MS = 10;
+
+interface RouteHistogram {
+  labels: string;
+  // Per bucket, not cumulative; the last slot is +Inf
+  counts: number[];
+  sum: number;
+  count: number;
+}
+
+const observe = (
+  histogram: RouteHistogram,
+  bounds: number[],
+  seconds: number
+): void => {
+  const bucket = bounds.findIndex((bound) => seconds <= bound);
+  histogram.counts[bucket === -1 ? bounds.length : bucket]! += 1;
+  histogram.sum += seconds;
+  histogram.count += 1;
+};
+
+const escapeLabel = (value: string): string =>
+  value.replace(/\\/g, "\\\\").replace(/"/g, '\\"').replace(/\n/g, "\\n");
+
+const labelSet = (labels: Record<string, string>): string =>
+  Object.entries(labels)
+    .map(([key, value]) => `${key}="${escapeLabel(value)}"`)
+    .join(",");
+
+export class MetricsUtil {
+  static readonly enabled = process.env.METRICS !== "false";
+
+  private static readonly histograms = new Map<string, RouteHistogram>();
+  private static inFlight = 0;
+  // Cumulative since start, so every scraper takes its own before/after delta
+  // and no scrape cuts another's window short
+  private static readonly loopLag = (() => {
+    const histogram: RouteHistogram = {
+      labels: "",
+      counts: new Array(LAG_BUCKETS.length + 1).fill(0),
+      sum: 0,
+      count: 0,
+    };
+    if (MetricsUtil.enabled) {
+      let expected = performance.now() + LAG_INTERVAL_MS;
+      const tick = () => {
+        const now = performance.now();
+        observe(histogram, LAG_BUCKETS, Math.max(now - expected, 0) / 1000);
+        expected = now + LAG_INTERVAL_MS;
+        setTimeout(tick, LAG_INTERVAL_MS).unref();
+      };
+      setTimeout(tick, LAG_INTERVAL_MS).unref();
+    }
+    return histogram;
+  })();
+
+  static requestStarted(): void {
+    this.inFlight += 1;
+  }
+
+  static requestFinished(
+    method: string,
+    route: string,
+    status: number,
+    seconds: number
+  ): void {
+    this.inFlight -= 1;
+
+    const labels = labelSet({ method, route, status: String(status) });
+    let histogram = this.histograms.get(labels);
+    if (!histogram) {
+      histogram = {
+        labels,
+        counts: new Array(BUCKETS.length + 1).fill(0),
+        sum: 0,
+        count: 0,
+      };
+      this.histograms.set(labels, histogram);
+    }
+    observe(histogram, BUCKETS, seconds);
+  }
+
+  /**
+   * Everything in Prometheus text exposition format (version 0.0.4)
+   */
+  static render(): string {
+    const lines: string[] = [];
+    const metric = (name: string, type: string, help: string) => {
+      lines.push(`# HELP ${name} ${help}`, `# TYPE ${name} ${type}`);
+    };
+
+    metric(
+      "kaizen_http_request_duration_seconds",
+      "histogram",
+      "Time from the request reaching Express to the response being sent"
+    );
+    for (const histogram of this.histograms.values()) {
+      lines.push(
+        ...this.histogramLines(
+          "kaizen_http_request_duration_seconds",
+          histogram,
+          BUCKETS
+        )
+      );
+    }
+
+    metric(
+      "kaizen_http_requests_in_flight",
+      "gauge",
+      "Requests received but not yet answered"
+    );
+    lines.push(`kaizen_http_requests_in_flight ${this.inFlight}`);
+
+    metric(
+      "kaizen_db_queries_total",
+      "counter",
+      "Database queries per route (reset by POST /api/v1/query-stats/reset)"
+    );
+    const routes = QueryLogUtil.stats().routes;
+    for (const stats of routes) {
+      lines.push(`kaizen_db_queries_total{${this.routeLabels(stats.route)}} ${stats.queries}`);
+    }
+    metric(
+      "kaizen_db_time_seconds_total",
+      "counter",
+      "Database time per route (reset by POST /api/v1/query-stats/reset)"
+    );
+    for (const stats of routes) {
+      lines.push(
+        `kaizen_db_time_seconds_total{${this.routeLabels(stats.route)}} ${stats.dbTimeMs / 1000}`
+      );
+    }
+
+    metric(
+      "kaizen_auth_token_cache_total",
+      "counter",
+      "Authenticated requests by verified-token cache result"
+    );
+    const auth = TokenCache.stats();
+    const authResults: [string, number][] = [
+      ["hit", auth.hits],
+      ["miss", auth.misses],
+      ["bypass", auth.bypassed],
+    ];
+    for (const [result, count] of authResults) {
+      lines.push(`kaizen_auth_token_cache_total{result="${result}"} ${count}`);
+    }
+
+    const passwords = PasswordHasher.stats();
+    metric(
+      "kaizen_password_hash_busy",
+      "gauge",
+      "Password workers hashing or comparing right now"
+    );
+    lines.push(`kaizen_password_hash_busy ${passwords.busy}`);
+    metric(
+      "kaizen_password_hash_queued",
+      "gauge",
+      "Password hashes and comparisons waiting for a worker"
+    );
+    lines.push(`kaizen_password_hash_queued ${passwords.queued}`);
+
+    metric(
+      "kaizen_event_loop_lag_seconds",
+      "histogram",
+      `How late a ${LAG_INTERVAL_MS} ms timer fires, sampled on every firing`
+    );
+    lines.push(
+      ...this.histogramLines(
+        "kaizen_event_loop_lag_seconds",
+        this.loopLag,
+        LAG_BUCKETS
+      )
+    );
+
+    const memory = process.memoryUsage();
+    metric("process_resident_memory_bytes", "gauge", "Resident set size");
+    lines.push(`process_resident_memory_bytes ${memory.rss}`);
+    metric("nodejs_heap_size_used_bytes", "gauge", "V8 heap in use");
+    lines.push(`nodejs_heap_size_used_bytes ${memory.heapUsed}`);
+    metric("nodejs_heap_size_total_bytes", "gauge", "V8 heap allocated");
+    lines.push(`nodejs_heap_size_total_bytes ${memory.heapTotal}`);
+    metric(
+      "nodejs_external_memory_bytes",
+      "gauge",
+      "Memory held outside the V8 heap (buffers)"
+    );
+    lines.push(`nodejs_external_memory_bytes ${memory.external}`);
+    metric("process_start_time_seconds", "gauge", "Process start, Unix time");
+    lines.push(
+      `process_start_time_seconds ${Math.round(Date.now() / 1000 - process.uptime())}`
+    );
+
+    return `${lines.join("\n")}\n`;
+  }
+
+  // _bucket (cumulative), _sum and _count lines of one labelled histogram
+  private static histogramLines(
+    name: string,
+    histogram: RouteHistogram,
+    bounds: number[]
+  ): string[] {
+    const labels = histogram.labels ? `${histogram.labels},` : "";
+    const lines: string[] = [];
+    let cumulative = 0;
+    bounds.forEach((bound, index) => {
+      cumulative += histogram.counts[index]!;
+      lines.push(`${name}_bucket{${labels}le="${bound}"} ${cumulative}`);
+    });
+    const suffix = histogram.labels ? `{${histogram.labels}}` : "";
+    lines.push(
+      `${name}_bucket{${labels}le="+Inf"} ${histogram.count}`,
+      `${name}_sum${suffix} ${histogram.sum}`,
+      `${name}_count${suffix} ${histogram.count}`
+    );
+    return lines;
+  }
+
+  // "GET /api/v1/communal/:id" as method and route labels
+  private static routeLabels(route: string): string {
+    const space = route.indexOf(" ");
+    return labelSet({
+      method: route.slice(0, space),
+      route: route.slice(space + 1),
+    });
+  }
+}
@@ -0,0 +1,141 @@
+import { Worker } from "node:worker_threads";
+import { availableParallelism } from "node:os";
+import bcrypt from "bcryptjs";
+
+type PasswordTask =
+  | { op: "hash"; password: string; rounds: number }
+  | { op: "compare"; password: string; hash: string };
+
+interface QueuedTask {
+  task: PasswordTask;
+  resolve: (value: any) => void;
+  reject: (error: Error) => void;
+}
+
+// Inline so the same source runs under ts-node and from dist/; bcryptjs is
+// loaded by the path the main thread resolved
+const WORKER_SOURCE = `
+const { parentPort, workerData } = require("node:worker_threads");
+const bcrypt = require(workerData.bcryptPath);
+parentPort.on("message", (task) => {
+  try {
+    const value =
+      task.op === "hash"
+        ? bcrypt.hashSync(task.password, task.rounds)
+        : bcrypt.compareSync(task.password, task.hash);
+    parentPort.postMessage({ value });
+  } catch (error) {
+    parentPort.postMessage({ error: String(error && error.message || error) });
+  }
+});
+`;
+
+const workerCount = (value: string | undefined): number => {
+  const parsed = Number(value);
+  if (value && Number.isInteger(parsed) && parsed >= 0) {
+    return parsed;
+  }
+  // Leave a core for the event loop where there is one to spare
+  return Math.max(1, Math.min(4, availableParallelism() - 1));
+};
+
+/**
+ * bcrypt hashing and comparison on a pool of worker threads. bcryptjs is pure
+ * JS, so a cost-12 compare on the event loop holds up every other request for
+ * its duration; in a worker it only occupies that worker
+ */
+export class PasswordHasher {
+  // PASSWORD_WORKERS=0 runs bcryptjs on the main thread, as before
+  static readonly size = workerCount(process.env.PASSWORD_WORKERS);
+
+  private static readonly idle: Worker[] = [];
+  private static readonly busy = new Map<Worker, QueuedTask>();
+  private static readonly queue: QueuedTask[] = [];
+  private static spawned = 0;
+
+  static hash(password: string, rounds: number): Promise<string> {
+    if (this.size === 0) {
+      return bcrypt.hash(password, rounds);
+    }
+    return this.run({ op: "hash", password, rounds });
+  }
+
+  static compare(password: string, hash: string): Promise<boolean> {
+    if (this.size === 0) {
+      return bcrypt.compare(password, hash);
+    }
+    return this.run({ op: "compare", password, hash });
+  }
+
+  static stats(): { workers: number; busy: number; queued: number } {
+    return {
+      workers: this.spawned,
+      busy: this.busy.size,
+      queued: this.queue.length,
+    };
+  }
+
+  private static run<T>(task: PasswordTask): Promise<T> {
+    return new Promise<T>((resolve, reject) => {
+      this.queue.push({ task, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  private static dispatch(): void {
+    while (this.queue.length > 0) {
+      const worker =
+        this.idle.pop() ??
+        (this.spawned < this.size ? this.spawn() : undefined);
+      if (!worker) {
+        return;
+      }
+      const queued = this.queue.shift() as QueuedTask;
+      this.busy.set(worker, queued);
+      worker.postMessage(queued.task);
+    }
+  }
+
+  private static spawn(): Worker {
+    const worker = new Worker(WORKER_SOURCE, {
+      eval: true,
+      workerData: { bcryptPath: require.resolve("bcryptjs") },
+    });
+    this.spawned += 1;
+
+    worker.on("message", (result: { value?: unknown; error?: string }) => {
+      const queued = this.busy.get(worker);
+      this.busy.delete(worker);
+      this.idle.push(worker);
+      if (result.error !== undefined) {
+        queued?.reject(new Error(result.error));
+      } else {
+        queued?.resolve(result.value);
+      }
+      this.dispatch();
+    });
+
+    // A crashed worker fails its task and is replaced on the next dispatch
+    const retire = (error: Error) => {
+      const queued = this.busy.get(worker);
+      if (!this.busy.delete(worker)) {
+        const index = this.idle.indexOf(worker);
+        if (index === -1) {
+          return;
+        }
+        this.idle.splice(index, 1);
+      }
+      this.spawned -= 1;
+      queued?.reject(error);
+      this.dispatch();
+    };
+    worker.on("error", retire);
+    worker.on("exit", (code) =>
+      retire(new Error(`Password worker exited with code ${code}`))
+    );
+    // An idle pool shouldn't keep the process alive; after the listeners,
+    // since adding a message listener refs the worker again
+    worker.unref();
+    return worker;
+  }
+}
@@ -0,0 +1,175 @@
+import type { RequestContext } from "./request-context";
+
+export type LogMode = "off" | "sampled" | "all";
+
+export interface SlowQuery {
+  at: string;
+  route: string;
+  query: string;
+  durationMs: number;
+}
+
+export interface RouteQueryStats {
+  route: string;
+  requests: number;
+  queries: number;
+  maxQueries: number;
+  dbTimeMs: number;
+  totalTimeMs: number;
+  slowQueries: number;
+}
+
+const logMode = (value: string | undefined, fallback: LogMode): LogMode =>
+  value === "off" || value === "sampled" || value === "all" ? value : fallback;
+
+const numberFrom = (value: string | undefined, fallback: number): number => {
+  const parsed = Number(value);
+  return value !== undefined && value !== "" && Number.isFinite(parsed)
+    ? parsed
+    : fallback;
+};
+
+export class QueryLogUtil {
+  // Prisma's own query log (SQL text on stdout)
+  static readonly queryLog = logMode(process.env.QUERY_LOG, "off");
+  // One line per request: method, path, status, time and query count
+  static readonly requestLog = logMode(process.env.REQUEST_LOG, "sampled");
+  static readonly sampleRate = numberFrom(process.env.LOG_SAMPLE_RATE, 0.01);
+  // 0 turns the slow-query log off
+  static readonly slowQueryMs = numberFrom(process.env.SLOW_QUERY_MS, 200);
+  private static readonly slowQueryBuffer = numberFrom(
+    process.env.SLOW_QUERY_BUFFER,
+    100
+  );
+
+  private static readonly routes = new Map<string, RouteQueryStats>();
+  private static slowQueries: SlowQuery[] = [];
+  private static since = new Date();
+
+  static sampled(mode: LogMode): boolean {
+    return (
+      mode === "all" || (mode === "sampled" && Math.random() < this.sampleRate)
+    );
+  }
+
+  static isSlow(durationMs: number): boolean {
+    return this.slowQueryMs > 0 && durationMs >= this.slowQueryMs;
+  }
+
+  /**
+   * Model operation and the shape of its arguments, values replaced by "?",
+   * so the log groups identical queries and never holds user data
+   */
+  static describe(
+    model: string | undefined,
+    operation: string,
+    args: unknown
+  ): string {
+    const name = model ? `${model}.${operation}` : operation;
+    return `${name} ${JSON.stringify(this.shape(args)) ?? ""}`.slice(0, 500);
+  }
+
+  /**
+   * Slow query seen inside a request: kept on the request until it finishes
+   * and its route is known. Outside a request it's logged right away
+   */
+  static recordSlow(
+    context: RequestContext | undefined,
+    query: string,
+    durationMs: number
+  ): void {
+    const slow = {
+      at: new Date().toISOString(),
+      query,
+      durationMs: Number(durationMs.toFixed(2)),
+    };
+    if (context) {
+      context.slowQueries.push(slow);
+    } else {
+      this.logSlow({ ...slow, route: "-" });
+    }
+  }
+
+  /**
+   * Add a finished request to its route's totals and log its slow queries
+   */
+  static finishRequest(
+    route: string,
+    context: RequestContext,
+    totalTimeMs: number
+  ): void {
+    let stats = this.routes.get(route);
+    if (!stats) {
+      stats = {
+        route,
+        requests: 0,
+        queries: 0,
+        maxQueries: 0,
+        dbTimeMs: 0,
+        totalTimeMs: 0,
+        slowQueries: 0,
+      };
+      this.routes.set(route, stats);
+    }
+    stats.requests += 1;
+    stats.queries += context.dbQueries;
+    stats.maxQueries = Math.max(stats.maxQueries, context.dbQueries);
+    stats.dbTimeMs += context.dbTimeMs;
+    stats.totalTimeMs += totalTimeMs;
+    stats.slowQueries += context.slowQueries.length;
+
+    for (const slow of context.slowQueries) {
+      this.logSlow({ ...slow, route });
+    }
+  }
+
+  static stats(): { since: string; routes: RouteQueryStats[] } {
+    return {
+      since: this.since.toISOString(),
+      routes: [...this.routes.values()]
+        .map((stats) => ({
+          ...stats,
+          dbTimeMs: Number(stats.dbTimeMs.toFixed(2)),
+          totalTimeMs: Number(stats.totalTimeMs.toFixed(2)),
+        }))
+        .sort((a, b) => b.dbTimeMs - a.dbTimeMs),
+    };
+  }
+
+  // Most recent first
+  static recentSlowQueries(): SlowQuery[] {
+    return [...this.slowQueries].reverse();
+  }
+
+  static reset(): void {
+    this.routes.clear();
+    this.slowQueries = [];
+    this.since = new Date();
+  }
+
+  private static logSlow(slow: SlowQuery): void {
+    console.warn(
+      `Slow query (${slow.durationMs.toFixed(1)}ms) on ${slow.route}: ${slow.query}`
+    );
+    this.slowQueries.push(slow);
+    if (this.slowQueries.length > this.slowQueryBuffer) {
+      this.slowQueries.shift();
+    }
+  }
+
+  private static shape(value: unknown): unknown {
+    if (value === null || typeof value !== "object" || value instanceof Date) {
+      return "?";
+    }
+    if (Array.isArray(value)) {
+      return value.length > 0 ? [this.shape(value[0])] : [];
+    }
+    return Object.fromEntries(
+      Object.entries(value).map(([key, child]) => [
+        key,
+        // Nested select/include trees are part of the query's shape
+        child === true ? true : this.shape(child),
+      ])
+    );
+  }
+}
@@ -0,0 +1,70 @@
+import { AsyncLocalStorage } from "node:async_hooks";
+import type { SlowQuery } from "./query-log";
+
+export interface RequestContext {
+  startedAt: bigint;
+  dbQueries: number;
+  dbTimeMs: number;
+  cacheHits: number;
+  cacheMisses: number;
+  // Slow queries waiting for the request to finish, when its route is known
+  slowQueries: Omit<SlowQuery, "route">[];
+}
+
+const storage = new AsyncLocalStorage<RequestContext>();
+
+/**
+ * Per-request state that follows the request through async calls
+ * (services, repositories, Prisma) without being passed around explicitly
+ */
+export class RequestContextUtil {
+  /**
+   * Run callback (and everything it awaits) inside a fresh request context
+   */
+  static run<T>(callback: () => T): T {
+    return storage.run(
+      {
+        startedAt: process.hrtime.bigint(),
+        dbQueries: 0,
+        dbTimeMs: 0,
+        cacheHits: 0,
+        cacheMisses: 0,
+        slowQueries: [],
+      },
+      callback
+    );
+  }
+
+  static current(): RequestContext | undefined {
+    return storage.getStore();
+  }
+
+  /**
+   * Add a finished database query to the current request, if there is one
+   */
+  static recordQuery(durationMs: number): void {
+    const context = storage.getStore();
+    if (context) {
+      context.dbQueries += 1;
+      context.dbTimeMs += durationMs;
+    }
+  }
+
+  /**
+   * Count a cache lookup against the current request, if there is one
+   */
+  static recordCache(hit: boolean): void {
+    const context = storage.getStore();
+    if (context) {
+      if (hit) {
+        context.cacheHits += 1;
+      } else {
+        context.cacheMisses += 1;
+      }
+    }
+  }
+
+  static elapsedMs(context: RequestContext): number {
+    return Number(process.hrtime.bigint() - context.startedAt) / 1e6;
+  }
+}
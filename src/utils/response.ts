@@ -1,5 +1,6 @@
 import { Response } from "express";
-import { ApiResponse, PaginatedResponse } from "../types";
+import { ApiResponse, PaginatedResponse, TimeRangeStream } from "../types";
+import { JsonSerializer } from "./json-serializer";
 
 export class ResponseUtil {
   static success<T>(res: Response, data: T, message = "Success"): Response {
@@ -8,7 +9,7 @@ export class ResponseUtil {
       data,
       message,
     };
-    return res.json(response);
+    return JsonSerializer.send(res, response);
   }
 
   static paginated<T>(
@@ -16,7 +17,7 @@ export class ResponseUtil {
     data: PaginatedResponse<T>,
     message = "Data retrieved successfully"
   ): Response {
-    return res.json({
+    return JsonSerializer.send(res, {
       success: true,
       data: data.data,
       pagination: data.pagination,
@@ -24,6 +25,20 @@ export class ResponseUtil {
     });
   }
 
+  // A time-range listing, sent as its chunks are read; same body as paginated()
+  static timeRange<T>(
+    res: Response,
+    range: TimeRangeStream<T>,
+    message = "Data retrieved successfully"
+  ): Promise<void> {
+    return JsonSerializer.sendChunks(
+      res,
+      { success: true },
+      range.chunks,
+      () => ({ pagination: range.pagination, message })
+    );
+  }
+
   static error(
     res: Response,
     message = "Internal Server Error",
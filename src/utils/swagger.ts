@@ -202,6 +202,18 @@ const options = {
                   type: "integer",
                   example: 10,
                 },
+                approximate: {
+                  type: "boolean",
+                  description: "Present when total is an estimate (total=approx)",
+                  example: true,
+                },
+                nextCursor: {
+                  type: "string",
+                  nullable: true,
+                  description:
+                    "Keyset pagination only: pass as cursor for the next page; null on the last page",
+                  example: "eyJzb3J0QnkiOiJpZCIsInNvcnRPcmRlciI6ImFzYyIsInZhbHVlIjoiMTAiLCJpZCI6IjEwIn0",
+                },
               },
             },
             message: {
@@ -379,6 +391,59 @@ const options = {
             default: "asc",
           },
         },
+        CursorParam: {
+          name: "cursor",
+          in: "query",
+          description:
+            "Keyset pagination: send it empty for the first page, then the previous page's nextCursor. Replaces page; sortBy must be id or waktuMulai",
+          required: false,
+          schema: {
+            type: "string",
+          },
+        },
+        TotalParam: {
+          name: "total",
+          in: "query",
+          description:
+            "How to count rows: exact (COUNT(*)), approx (table statistics) or none. Defaults to exact for page and none for cursor",
+          required: false,
+          schema: {
+            type: "string",
+            enum: ["exact", "approx", "none"],
+          },
+        },
+        RangeLimitParam: {
+          name: "limit",
+          in: "query",
+          description:
+            "Most bookings to return; capped at TIME_RANGE_MAX_ROWS (5000 by default), which is also the default",
+          required: false,
+          schema: {
+            type: "integer",
+            minimum: 1,
+          },
+        },
+        RangeCursorParam: {
+          name: "cursor",
+          in: "query",
+          description:
+            "pagination.nextCursor of the previous response, for the bookings after it",
+          required: false,
+          schema: {
+            type: "string",
+          },
+        },
+        FieldsParam: {
+          name: "fields",
+          in: "query",
+          description:
+            "Comma-separated columns (and relations, e.g. peminjam) to return instead of the whole booking; id and waktuMulai are always included",
+          required: false,
+          schema: {
+            type: "string",
+            example: "idFasilitas,waktuBerakhir",
+          },
+        },
       },
     },
   },
@@ -0,0 +1,62 @@
+import type { Request } from "express";
+import { TimeRangeParams } from "../types";
+import { CursorUtil } from "./cursor";
+
+const positiveInt = (value: string | undefined, fallback: number): number => {
+  const parsed = Number(value);
+  return value && Number.isInteger(parsed) && parsed > 0 ? parsed : fallback;
+};
+
+/**
+ * Bounds of the time-range listings: one request returns at most maxRows
+ * bookings (the rest through nextCursor), read from the database chunkRows at
+ * a time and written out as each chunk arrives
+ */
+export class TimeRangeUtil {
+  static readonly maxRows = positiveInt(process.env.TIME_RANGE_MAX_ROWS, 5000);
+  static readonly chunkRows = positiveInt(
+    process.env.TIME_RANGE_CHUNK_ROWS,
+    1000
+  );
+
+  /**
+   * startTime/endTime and the listing options of a time-range request; a bad
+   * value is a ValidationError, which ErrorMiddleware answers with a 400
+   */
+  static parse(query: Request["query"]): {
+    start: Date;
+    end: Date;
+    params: TimeRangeParams;
+  } {
+    const start = new Date(query.startTime as string);
+    const end = new Date(query.endTime as string);
+    if (Number.isNaN(start.getTime()) || Number.isNaN(end.getTime())) {
+      throw CursorUtil.invalid(
+        "startTime dan endTime harus berformat ISO 8601"
+      );
+    }
+    if (end < start) {
+      throw CursorUtil.invalid("endTime tidak boleh sebelum startTime");
+    }
+
+    const params: TimeRangeParams = {};
+    if (query.limit !== undefined) {
+      const limit = Number(query.limit);
+      if (!Number.isInteger(limit) || limit < 1) {
+        throw CursorUtil.invalid("limit harus bilangan bulat positif");
+      }
+      // Larger limits are cut to maxRows, which pagination.limit reports
+      params.limit = Math.min(limit, this.maxRows);
+    }
+    if (typeof query.cursor === "string" && query.cursor) {
+      params.cursor = query.cursor;
+    }
+    if (typeof query.fields === "string" && query.fields) {
+      params.fields = query.fields
+        .split(",")
+        .map((field) => field.trim())
+        .filter(Boolean);
+    }
+    return { start, end, params };
+  }
+}
@@ -117,17 +117,16 @@ export class TimeValidationUtil {
    * Format time slot for display
    */
   static formatTimeSlot(waktuMulai: Date, waktuBerakhir: Date): string {
-    const formatTime = (date: Date) => {
-      return date.toLocaleTimeString("id-ID", {
-        hour: "2-digit",
-        minute: "2-digit",
-        hour12: false,
-      });
-    };
-
-    return `${formatTime(waktuMulai)} - ${formatTime(waktuBerakhir)}`;
+    return `${this.timeFormat.format(waktuMulai)} - ${this.timeFormat.format(waktuBerakhir)}`;
   }
 
+  // Reused across calls; toLocaleTimeString would build a new formatter every time
+  private static readonly timeFormat = new Intl.DateTimeFormat("id-ID", {
+    hour: "2-digit",
+    minute: "2-digit",
+    hour12: false,
+  });
+
   /**
    * Check if time is in the past
    */
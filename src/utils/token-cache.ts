@@ -0,0 +1,156 @@
+import { createHash } from "node:crypto";
+import type { JwtPayload } from "../middleware/auth.middleware";
+
+interface VerifiedToken {
+  payload: JwtPayload;
+  expiresAt: number;
+}
+
+export type TokenRevokeHook = (tokenHash: string, expiresAt: number) => void;
+
+export interface TokenCacheStats {
+  enabled: boolean;
+  entries: number;
+  revoked: number;
+  hits: number;
+  misses: number;
+  bypassed: number;
+  hitRate: number;
+  evictions: number;
+}
+
+/**
+ * Payloads of tokens that already passed jwt.verify, keyed by a SHA-256 of
+ * the token so the cache never holds a usable credential. An entry lives no
+ * longer than AUTH_CACHE_TTL_MS and never past the token's own `exp`
+ */
+export class TokenCache {
+  static readonly enabled = process.env.AUTH_CACHE !== "false";
+  static readonly ttlMs = Number(process.env.AUTH_CACHE_TTL_MS) || 5 * 60_000;
+  static readonly maxEntries =
+    Number(process.env.AUTH_CACHE_MAX_ENTRIES) || 10_000;
+  // Revocations are never dropped before they expire; past this many, expired
+  // ones are swept out, and the next sweep waits for twice what was left
+  static readonly revokedMaxEntries =
+    Number(process.env.AUTH_REVOKED_MAX_ENTRIES) || 100_000;
+
+  // Insertion-ordered like MemoryCacheBackend: re-inserted on a hit, so the
+  // least recently used token is evicted first
+  private static readonly entries = new Map<string, VerifiedToken>();
+  // Logged-out tokens until they would have expired anyway
+  private static readonly revoked = new Map<string, number>();
+  private static revokedSweepAt = TokenCache.revokedMaxEntries;
+  private static readonly hooks: TokenRevokeHook[] = [];
+  private static hits = 0;
+  private static misses = 0;
+  private static bypassed = 0;
+  private static evictions = 0;
+
+  static hash(token: string): string {
+    return createHash("sha256").update(token).digest("base64url");
+  }
+
+  static get(tokenHash: string): JwtPayload | undefined {
+    const entry = this.entries.get(tokenHash);
+    if (!entry) {
+      this.misses += 1;
+      return undefined;
+    }
+
+    this.entries.delete(tokenHash);
+    if (entry.expiresAt <= Date.now()) {
+      this.misses += 1;
+      return undefined;
+    }
+    this.entries.set(tokenHash, entry);
+    this.hits += 1;
+    return entry.payload;
+  }
+
+  static set(tokenHash: string, payload: JwtPayload): void {
+    const ttlEnd = Date.now() + this.ttlMs;
+    const expiresAt =
+      payload.exp === undefined ? ttlEnd : Math.min(ttlEnd, payload.exp * 1000);
+    this.entries.delete(tokenHash);
+    this.entries.set(tokenHash, { payload, expiresAt });
+
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+      this.evictions += 1;
+    }
+  }
+
+  // A request that asked to skip the cache (X-Auth-Cache: bypass)
+  static recordBypass(): void {
+    this.bypassed += 1;
+  }
+
+  static isRevoked(tokenHash: string): boolean {
+    const expiresAt = this.revoked.get(tokenHash);
+    if (expiresAt === undefined) {
+      return false;
+    }
+    if (expiresAt <= Date.now()) {
+      this.revoked.delete(tokenHash);
+      return false;
+    }
+    return true;
+  }
+
+  /**
+   * Drop a token's cached verification and refuse it from now on in this
+   * process. Hooks let a multi-instance setup pass the revocation on
+   */
+  static revoke(tokenHash: string, expiresAt: number): void {
+    this.entries.delete(tokenHash);
+    if (this.revoked.size >= this.revokedSweepAt) {
+      const now = Date.now();
+      for (const [hash, until] of this.revoked) {
+        if (until <= now) {
+          this.revoked.delete(hash);
+        }
+      }
+      // Forgetting a live revocation would let a logged-out token back in,
+      // so a set still full of them grows instead; doubling keeps the sweeps
+      // amortized O(1) per logout
+      this.revokedSweepAt = Math.max(
+        this.revokedMaxEntries,
+        this.revoked.size * 2
+      );
+    }
+    this.revoked.set(tokenHash, expiresAt);
+    for (const hook of this.hooks) {
+      hook(tokenHash, expiresAt);
+    }
+  }
+
+  static onRevoke(hook: TokenRevokeHook): void {
+    this.hooks.push(hook);
+  }
+
+  static clear(): void {
+    this.entries.clear();
+  }
+
+  static stats(): TokenCacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      enabled: this.enabled,
+      entries: this.entries.size,
+      revoked: this.revoked.size,
+      hits: this.hits,
+      misses: this.misses,
+      bypassed: this.bypassed,
+      hitRate: lookups > 0 ? this.hits / lookups : 0,
+      evictions: this.evictions,
+    };
+  }
+
+  static resetStats(): void {
+    this.hits = 0;
+    this.misses = 0;
+    this.bypassed = 0;
+    this.evictions = 0;
+  }
+}